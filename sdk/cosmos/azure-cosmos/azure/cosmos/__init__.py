@@ -21,6 +21,9 @@
 
 from ._version import VERSION
 from ._retry_utility import ConnectionRetryPolicy
+from ._bulk_executor import BulkOperationType, BulkOperationResult
+from ._change_feed_processor import ChangeFeedProcessor
+from ._transactional_batch import TransactionalBatch, TransactionalBatchOperationResult, TransactionalBatchResponse
 from .container import ContainerProxy
 from .cosmos_client import CosmosClient
 from .database import DatabaseProxy
@@ -62,5 +65,11 @@ __all__ = (
     "TriggerOperation",
     "TriggerType",
     "ConnectionRetryPolicy",
+    "BulkOperationType",
+    "BulkOperationResult",
+    "ChangeFeedProcessor",
+    "TransactionalBatch",
+    "TransactionalBatchOperationResult",
+    "TransactionalBatchResponse",
 )
 __version__ = VERSION
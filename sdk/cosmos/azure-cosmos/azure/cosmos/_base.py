@@ -57,6 +57,8 @@ _COMMON_OPTIONS = {
     'offer_throughput': 'offerThroughput',
     'partition_key': 'partitionKey',
     'enable_cross_partition_query': 'enableCrossPartitionQuery',
+    'max_degree_of_parallelism': 'maxDegreeOfParallelism',
+    'max_distinct_results_in_memory': 'maxDistinctResultsInMemory',
     'populate_query_metrics': 'populateQueryMetrics',
     'enable_script_logging': 'enableScriptLogging',
     'offer_enable_ru_per_minute_throughput': 'offerEnableRUPerMinuteThroughput',
@@ -0,0 +1,346 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Internal class for bulk execution of item operations in the Azure Cosmos
+database service.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent import futures
+
+from . import exceptions
+from .partition_key import NonePartitionKeyValue, _get_effective_partition_key_string
+from .http_constants import HttpHeaders, StatusCodes
+
+# pylint: disable=protected-access
+
+# The default number of operations of a bulk execution that are sent at the same time.
+_DEFAULT_MAX_CONCURRENCY = 32
+# Operations read ahead from the caller's iterable, for each operation that can be sent at the same time.
+_READ_AHEAD_FACTOR = 4
+# The default number of times an operation is sent before its throttling or partition split error is returned.
+_DEFAULT_MAX_ATTEMPTS = 10
+# Operations queued while the routing map is reloaded share the same congestion control.
+_UNRESOLVED_RANGE = None
+
+
+class BulkOperationType(object):
+    """The item operations that can be executed in bulk with :func:`ContainerProxy.execute_bulk`.
+    """
+
+    Create = "create"
+    Upsert = "upsert"
+    Replace = "replace"
+    Delete = "delete"
+    Read = "read"
+
+
+class BulkOperationResult(object):
+    """The result of one operation of a bulk execution.
+
+    :ivar int index: The position of the operation in the operations that were executed.
+    :ivar tuple operation: The operation that was executed.
+    :ivar int status_code: The HTTP status code of the operation.
+    :ivar dict resource: The item returned by the operation, None for deletes and failed operations.
+    :ivar dict headers: The response headers of the operation.
+    :ivar error: The error raised by the operation, None if it succeeded.
+    :vartype error: ~azure.cosmos.exceptions.CosmosHttpResponseError
+    """
+
+    def __init__(self, index, operation, status_code, resource=None, headers=None, error=None):
+        self.index = index
+        self.operation = operation
+        self.status_code = status_code
+        self.resource = resource
+        self.headers = headers or {}
+        self.error = error
+
+    def __repr__(self):
+        return "<BulkOperationResult [{}: {}]>".format(self.index, self.status_code)
+
+    @property
+    def succeeded(self):
+        return self.error is None
+
+
+class _CongestionController(object):
+    """Additive increase, multiplicative decrease of the operations sent at the same time to a
+    partition key range.
+
+    The limit grows by one for every limit operations that succeed, is halved when the range
+    throttles a request, and no operation is sent until the retry after time of the throttled
+    request has elapsed.
+    """
+
+    def __init__(self, max_concurrency):
+        self.max_concurrency = max_concurrency
+        self.limit = 1.0
+        self.in_flight = 0
+        self.paused_until = 0.0
+
+    def can_dispatch(self, now):
+        return self.in_flight < int(self.limit) and now >= self.paused_until
+
+    def on_success(self):
+        self.limit = min(float(self.max_concurrency), self.limit + 1.0 / self.limit)
+
+    def on_throttle(self, retry_after_in_milliseconds, now):
+        self.limit = max(1.0, self.limit / 2)
+        self.paused_until = max(self.paused_until, now + retry_after_in_milliseconds / 1000.0)
+
+
+class _PartitionKeyRangeQueue(object):
+    """The operations waiting to be sent to one partition key range."""
+
+    def __init__(self, partition_key_range_id, max_concurrency):
+        self.partition_key_range_id = partition_key_range_id
+        self.operations = deque()
+        self.congestion = _CongestionController(max_concurrency)
+
+
+class _BulkExecutor(object):
+    """Executes item operations concurrently, grouped by the partition key range they target.
+
+    Each partition key range has its own queue and congestion control, so a throttled range slows
+    down without holding back the others. Throttled requests are retried by the retry utility; an
+    operation that is still throttled once its retries are exhausted, or whose partition key range
+    has been split, is queued again instead of failing, until it has been sent max_attempts times.
+
+    The partition key range of an operation is found by hashing its partition key into its effective
+    partition key and looking it up in the routing map of the container, so no request is needed to
+    route it. When a range is split the routing map is reloaded and the queued operations routed again.
+    """
+
+    def __init__(self, container, operations, max_concurrency=None, **kwargs):
+        self._container = container
+        self._client_connection = container.client_connection
+        self._operations = iter(enumerate(operations))
+        self._max_concurrency = max_concurrency or _DEFAULT_MAX_CONCURRENCY
+        self._max_attempts = kwargs.pop("max_attempts", None) or _DEFAULT_MAX_ATTEMPTS
+        self._options = kwargs
+        self._queues = {}
+        self._queued_count = 0
+        self._in_flight_count = 0
+        self._exhausted = False
+        self._partition_key_definition = None
+        self._is_system_key = False
+        self._routing_map = None
+        self._gone_partition_key_range_ids = set()
+        self._lock = threading.Lock()
+
+    def _get_partition_key(self, operation):
+        operation_type, item = operation[0], operation[1]
+        if operation_type in (BulkOperationType.Delete, BulkOperationType.Read):
+            if operation[2] == NonePartitionKeyValue:
+                return self._client_connection._return_undefined_or_empty_partition_key(self._is_system_key)
+            return operation[2]
+        if not self._partition_key_definition:
+            return None
+        return self._client_connection._ExtractPartitionKey(self._partition_key_definition, item)
+
+    def _get_partition_key_range_id(self, partition_key):
+        if self._routing_map is None:
+            return _UNRESOLVED_RANGE
+        if not self._partition_key_definition:
+            # The items of a non partitioned container are in its only partition key range
+            effective_partition_key = ""
+        else:
+            effective_partition_key = _get_effective_partition_key_string(self._partition_key_definition, partition_key)
+        return self._routing_map.get_range_by_effective_partition_key(effective_partition_key)["id"]
+
+    @staticmethod
+    def _validate(operation):
+        operation_type = operation[0]
+        if operation_type in (BulkOperationType.Delete, BulkOperationType.Read):
+            if len(operation) != 3:
+                raise ValueError("A {} operation requires the item and its partition key.".format(operation_type))
+        elif operation_type in (BulkOperationType.Create, BulkOperationType.Upsert, BulkOperationType.Replace):
+            if len(operation) != 2:
+                raise ValueError("A {} operation requires the item body only.".format(operation_type))
+        else:
+            raise ValueError("Unsupported bulk operation type: {}".format(operation_type))
+
+    def _get_queue(self, partition_key_range_id):
+        queue = self._queues.get(partition_key_range_id)
+        if queue is None:
+            queue = _PartitionKeyRangeQueue(partition_key_range_id, self._max_concurrency)
+            self._queues[partition_key_range_id] = queue
+        return queue
+
+    def _enqueue(self, index, operation, partition_key, attempts=0, first=False):
+        queue = self._get_queue(self._get_partition_key_range_id(partition_key))
+        entry = (index, operation, partition_key, attempts)
+        if first:
+            queue.operations.appendleft(entry)
+        else:
+            queue.operations.append(entry)
+        self._queued_count += 1
+
+    def _reroute(self):
+        """Queues the waiting operations again, by the partition key ranges of the current routing map."""
+        entries = []
+        for queue in self._queues.values():
+            entries.extend(queue.operations)
+            queue.operations.clear()
+        self._queued_count -= len(entries)
+        for index, operation, partition_key, attempts in entries:
+            self._enqueue(index, operation, partition_key, attempts)
+
+    def _read_ahead(self):
+        while not self._exhausted and self._queued_count < self._max_concurrency * _READ_AHEAD_FACTOR:
+            try:
+                index, operation = next(self._operations)
+            except StopIteration:
+                self._exhausted = True
+                return
+            self._validate(operation)
+            self._enqueue(index, operation, self._get_partition_key(operation))
+
+    def _dispatchable(self):
+        """Removes and returns the operations that can be sent now, with the queue they were taken from."""
+        now = time.time()
+        dispatchable = []
+        with self._lock:
+            for queue in list(self._queues.values()):
+                congestion = queue.congestion
+                while (
+                    queue.operations
+                    and congestion.can_dispatch(now)
+                    and self._in_flight_count < self._max_concurrency
+                ):
+                    dispatchable.append((queue.operations.popleft(), queue))
+                    congestion.in_flight += 1
+                    self._in_flight_count += 1
+                    self._queued_count -= 1
+        return dispatchable
+
+    def _next_resume_time(self):
+        with self._lock:
+            paused = [q.congestion.paused_until for q in self._queues.values() if q.operations]
+        return min(paused) if paused else time.time()
+
+    def _is_done(self):
+        return self._exhausted and not self._queued_count and not self._in_flight_count
+
+    def _response_hook(self, queue, response):
+        def on_response(pipeline_response):
+            http_response = pipeline_response.http_response
+            response["status_code"] = http_response.status_code
+            response["headers"] = dict(http_response.headers)
+            if http_response.status_code == StatusCodes.TOO_MANY_REQUESTS:
+                retry_after = int(http_response.headers.get(HttpHeaders.RetryAfterInMilliseconds, 0))
+                with self._lock:
+                    queue.congestion.on_throttle(retry_after, time.time())
+
+        return on_response
+
+    def _operation_call(self, operation, **kwargs):
+        operation_type, item = operation[0], operation[1]
+        container = self._container
+        if operation_type == BulkOperationType.Create:
+            return container.create_item(item, **kwargs)
+        if operation_type == BulkOperationType.Upsert:
+            return container.upsert_item(item, **kwargs)
+        if operation_type == BulkOperationType.Replace:
+            return container.replace_item(item["id"], item, **kwargs)
+        if operation_type == BulkOperationType.Delete:
+            return container.delete_item(item, operation[2], **kwargs)
+        return container.read_item(item, operation[2], **kwargs)
+
+    def _run_operation(self, operation, queue):
+        response = {}
+        kwargs = dict(self._options, raw_response_hook=self._response_hook(queue, response))
+        resource = self._operation_call(operation, **kwargs)
+        return resource, response
+
+    def _complete(self, entry, queue, resource=None, response=None, error=None):
+        """Records the outcome of an operation and returns its result, or None if it was queued again."""
+        index, operation, partition_key, attempts = entry
+        attempts += 1
+        with self._lock:
+            queue.congestion.in_flight -= 1
+            self._in_flight_count -= 1
+            if error is None:
+                queue.congestion.on_success()
+                return BulkOperationResult(
+                    index, operation, response.get("status_code"), resource, response.get("headers"))
+
+            if error.status_code == StatusCodes.TOO_MANY_REQUESTS:
+                queue.congestion.on_throttle(
+                    int(error.headers.get(HttpHeaders.RetryAfterInMilliseconds, 0)), time.time())
+            elif exceptions._partition_range_is_gone(error):
+                # The range was split or merged: the routing map is refreshed before the next operations are sent
+                self._routing_map = None
+                self._gone_partition_key_range_ids.add(queue.partition_key_range_id)
+            else:
+                return BulkOperationResult(index, operation, error.status_code, headers=error.headers, error=error)
+            if attempts >= self._max_attempts:
+                # sustained throttling or repeated splits fail the operation instead of retrying it forever
+                return BulkOperationResult(index, operation, error.status_code, headers=error.headers, error=error)
+            self._enqueue(index, operation, partition_key, attempts, first=True)
+        return None
+
+    def _prepare(self):
+        self._partition_key_definition = self._container._get_properties().get("partitionKey")
+        self._is_system_key = bool((self._partition_key_definition or {}).get("systemKey", False))
+
+    def _load_routing_map(self):
+        routing_map_provider = self._client_connection._routing_map_provider
+        routing_map = routing_map_provider.get_routing_map(self._container.container_link)
+        while self._gone_partition_key_range_ids:
+            routing_map = routing_map_provider.refresh_routing_map(
+                self._container.container_link, self._gone_partition_key_range_ids.pop())
+        with self._lock:
+            self._routing_map = routing_map
+            self._reroute()
+
+    def execute(self):
+        """Executes the operations and yields their results as they complete."""
+        self._prepare()
+        pending = {}
+        with futures.ThreadPoolExecutor(self._max_concurrency) as executor:
+            while True:
+                if self._routing_map is None:
+                    self._load_routing_map()
+                with self._lock:
+                    self._read_ahead()
+                for entry, queue in self._dispatchable():
+                    pending[executor.submit(self._run_operation, entry[1], queue)] = (entry, queue)
+                if self._is_done():
+                    return
+                if not pending:
+                    # every queue is paused by a throttled request
+                    time.sleep(max(0.0, self._next_resume_time() - time.time()))
+                    continue
+                done, _ = futures.wait(
+                    list(pending), timeout=max(0.0, self._next_resume_time() - time.time()) or None,
+                    return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    entry, queue = pending.pop(future)
+                    try:
+                        resource, response = future.result()
+                        result = self._complete(entry, queue, resource, response)
+                    except exceptions.CosmosHttpResponseError as error:
+                        result = self._complete(entry, queue, error=error)
+                    if result is not None:
+                        yield result
@@ -0,0 +1,439 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Change feed processor of the Azure Cosmos database service.
+"""
+
+import logging
+import math
+import threading
+import time
+import uuid
+from collections import Counter
+
+from azure.core import MatchConditions  # type: ignore
+
+from . import _base
+from . import exceptions
+from ._routing import routing_range
+from ._vector_session_token import VectorSessionToken
+from .http_constants import HttpHeaders, StatusCodes
+
+# pylint: disable=protected-access
+
+logger = logging.getLogger(__name__)
+
+# The If-None-Match value reading the changes made after the first read of a partition key range
+_START_FROM_NOW = "*"
+
+
+class _LeaseLostError(Exception):
+    """The lease is owned by another instance, or was deleted."""
+
+
+def _get_lease_id_prefix(container_link, lease_prefix):
+    # Lease ids can't contain '/', so the ids of the database and the container are joined with '_'
+    resource_ids = _base.TrimBeginningAndEndingSlashes(container_link).split("/")[1::2]
+    return "{}{}..".format(lease_prefix, "_".join(resource_ids))
+
+
+def _get_latest_lsn(session_token):
+    """Returns the latest LSN of a partition key range, from the session token of a response on it."""
+    latest_lsn = 0
+    for partition_session_token in session_token.split(","):
+        token = partition_session_token.split(":", 1)[-1]
+        vector_session_token = VectorSessionToken.create(token)
+        if vector_session_token is not None:
+            latest_lsn = max(latest_lsn, vector_session_token.global_lsn)
+        elif token.isdigit():
+            # the session token of a single region account without a version
+            latest_lsn = max(latest_lsn, int(token))
+    return latest_lsn
+
+
+def _select_leases_to_take(instance_name, leases, now, lease_expiration_interval):
+    """Returns the leases an instance takes to own its share of the leases.
+
+    The leases without an owner, or not renewed by their owner in time, are taken first. Otherwise
+    a lease is stolen from the instance owning the most leases, if it owns more than its share.
+    """
+    lease_counts = Counter()
+    expired_leases = []
+    for lease in leases:
+        owner = lease.get("owner")
+        if not owner or now - lease.get("timestamp", 0) > lease_expiration_interval:
+            expired_leases.append(lease)
+        else:
+            lease_counts[owner] += 1
+    lease_counts[instance_name] += 0
+
+    target = int(math.ceil(float(len(leases)) / len(lease_counts)))
+    needed = target - lease_counts[instance_name]
+    if needed <= 0:
+        return []
+    if expired_leases:
+        return expired_leases[:needed]
+    biggest_owner, biggest_count = max(lease_counts.items(), key=lambda item: item[1])
+    if biggest_count > target or (needed > 1 and biggest_count == target):
+        return [next(lease for lease in leases if lease.get("owner") == biggest_owner)]
+    return []
+
+
+class ChangeFeedProcessor(object):
+    """Processes the change feed of a container with one or more instances, each reading the changes
+    of its share of the partition key ranges of the container.
+
+    The progress on each partition key range is stored as a lease in a lease container, which must be
+    partitioned on ``/id`` and can be shared by the processors of several containers. The instances
+    renew the leases they own and balance the leases between them: an instance takes the leases that
+    are not renewed in time, then the leases of instances owning more than their share. When a
+    partition key range is split, its lease is replaced by leases on the new ranges, which continue
+    from the same point.
+
+    Changes are delivered at least once: they are checkpointed once the handler returns, and are
+    delivered again if it raises or the lease is lost before the checkpoint.
+
+    :param container: The container whose changes are processed.
+    :type container: ~azure.cosmos.ContainerProxy
+    :param lease_container: The container storing the leases, partitioned on ``/id``.
+    :type lease_container: ~azure.cosmos.ContainerProxy
+    :param handler: Called with the list of changes read from a partition key range, and the id
+        of the range.
+    :type handler: Callable[[list[dict[str, Any]], str], None]
+    :param str instance_name: The name of this instance, unique among the instances sharing the
+        leases. A random name is used by default.
+    :param str lease_prefix: A prefix of the ids of the leases, to run several processors on the
+        same container.
+    :param int max_item_count: The maximum number of changes passed to the handler at once.
+    :param float poll_interval: The seconds to wait before reading a partition key range again,
+        once all its changes are processed.
+    :param bool start_from_beginning: Whether to process the changes made before the leases are
+        created. By default only the changes made after are processed.
+    :param float lease_renew_interval: The seconds between the renewals of the leases.
+    :param float lease_acquire_interval: The seconds between the balancing of the leases.
+    :param float lease_expiration_interval: The seconds after which a lease not renewed by its
+        owner is taken by another instance.
+    """
+
+    def __init__(
+        self,
+        container,
+        lease_container,
+        handler,
+        instance_name=None,
+        lease_prefix="",
+        max_item_count=100,
+        poll_interval=5.0,
+        start_from_beginning=False,
+        lease_renew_interval=17.0,
+        lease_acquire_interval=13.0,
+        lease_expiration_interval=60.0,
+    ):
+        self._container = container
+        self._lease_container = lease_container
+        self._handler = handler
+        self.instance_name = instance_name or str(uuid.uuid4())
+        self._lease_id_prefix = _get_lease_id_prefix(container.container_link, lease_prefix)
+        self._max_item_count = max_item_count
+        self._poll_interval = poll_interval
+        self._start_from_beginning = start_from_beginning
+        self._lease_renew_interval = lease_renew_interval
+        self._lease_acquire_interval = lease_acquire_interval
+        self._lease_expiration_interval = lease_expiration_interval
+        # The leases owned by this instance, by id, and the stop event of the pump of each lease
+        self._leases = {}
+        self._pumps = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._coordinator = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def owned_partition_key_range_ids(self):
+        """The ids of the partition key ranges whose changes this instance processes.
+
+        :rtype: list[str]
+        """
+        with self._lock:
+            return sorted(lease["partitionKeyRangeId"] for lease in self._leases.values())
+
+    def start(self):
+        """Starts processing the changes of the leases this instance takes."""
+        if self._coordinator is not None:
+            raise RuntimeError("The change feed processor is already started.")
+        self._stopped.clear()
+        self._initialize_leases()
+        self._coordinator = threading.Thread(target=self._coordinate, name="ChangeFeedProcessor-" + self.instance_name)
+        self._coordinator.daemon = True
+        self._coordinator.start()
+
+    def stop(self):
+        """Stops processing changes, and releases the leases of this instance to the other instances."""
+        if self._coordinator is None:
+            return
+        self._stopped.set()
+        self._coordinator.join()
+        self._coordinator = None
+        with self._lock:
+            pumps = list(self._pumps.values())
+        for _, stop in pumps:
+            stop.set()
+        for pump, _ in pumps:
+            pump.join()
+        for lease_id in list(self._leases):
+            try:
+                self._update_lease(lease_id, lambda lease: lease.update(owner=None))
+            except (_LeaseLostError, exceptions.CosmosHttpResponseError):
+                pass
+        with self._lock:
+            self._leases.clear()
+            self._pumps.clear()
+
+    def estimate_lag(self):
+        """Estimates the number of changes not processed yet on each partition key range.
+
+        The estimate is the difference between the latest LSN of a range and the LSN of its first
+        change not processed, so it counts each change of a batch written in a transaction.
+
+        :returns: The estimated number of pending changes, by partition key range id.
+        :rtype: dict[str, int]
+        """
+        lag = {}
+        for lease in self._read_leases():
+            range_id = lease["partitionKeyRangeId"]
+            try:
+                changes, _, headers = self._read_changes(range_id, lease.get("continuationToken"), 1)
+            except exceptions.CosmosHttpResponseError as error:
+                if exceptions._partition_range_is_gone(error):
+                    # the range was split, its changes will be estimated once it is replaced
+                    continue
+                raise
+            lag[range_id] = self._get_lag(changes, headers)
+        return lag
+
+    @staticmethod
+    def _get_lag(changes, headers):
+        if not changes:
+            return 0
+        session_token = headers.get(HttpHeaders.SessionToken)
+        if not session_token:
+            return len(changes)
+        return max(len(changes), _get_latest_lsn(session_token) - int(changes[0]["_lsn"]) + 1)
+
+    def _new_lease(self, range_id, continuation, owner=None):
+        return {
+            "id": self._lease_id_prefix + range_id,
+            "partitionKeyRangeId": range_id,
+            "continuationToken": continuation,
+            "owner": owner,
+            "timestamp": time.time(),
+        }
+
+    def _get_partition_key_ranges(self):
+        full_range = routing_range.Range("", "FF", True, False)
+        return self._container.client_connection._routing_map_provider.get_overlapping_ranges(
+            self._container.container_link, [full_range])
+
+    def _get_child_partition_key_ranges(self, range_id):
+        # the routing map is refreshed to find the ranges the range was split into
+        self._container.client_connection._routing_map_provider.refresh_routing_map(
+            self._container.container_link, range_id)
+        return [r for r in self._get_partition_key_ranges() if range_id in (r.get("parents") or [])]
+
+    def _read_leases(self):
+        return list(self._lease_container.query_items(
+            "SELECT * FROM c WHERE STARTSWITH(c.id, @prefix)",
+            parameters=[{"name": "@prefix", "value": self._lease_id_prefix}],
+            enable_cross_partition_query=True))
+
+    def _create_lease(self, lease):
+        try:
+            return self._lease_container.create_item(lease)
+        except exceptions.CosmosResourceExistsError:
+            # the lease was created by another instance
+            return None
+
+    def _initialize_leases(self):
+        if self._read_leases():
+            return
+        for partition_key_range in self._get_partition_key_ranges():
+            self._create_lease(self._new_lease(partition_key_range["id"], None))
+
+    def _acquire_lease(self, lease):
+        """Takes a lease, unless another instance updated it since it was read."""
+        lease = dict(lease, owner=self.instance_name, timestamp=time.time())
+        try:
+            return self._lease_container.replace_item(
+                lease["id"], lease, etag=lease["_etag"], match_condition=MatchConditions.IfNotModified)
+        except exceptions.CosmosHttpResponseError as error:
+            if error.status_code in (StatusCodes.PRECONDITION_FAILED, StatusCodes.NOT_FOUND):
+                return None
+            raise
+
+    def _update_lease(self, lease_id, update):
+        """Applies an update to a lease owned by this instance, retrying on concurrent updates."""
+        with self._lock:
+            lease = self._leases.get(lease_id)
+        if lease is None:
+            raise _LeaseLostError(lease_id)
+        while True:
+            updated = dict(lease)
+            update(updated)
+            try:
+                lease = self._lease_container.replace_item(
+                    lease_id, updated, etag=lease["_etag"], match_condition=MatchConditions.IfNotModified)
+                break
+            except exceptions.CosmosHttpResponseError as error:
+                if error.status_code == StatusCodes.NOT_FOUND:
+                    raise _LeaseLostError(lease_id)
+                if error.status_code != StatusCodes.PRECONDITION_FAILED:
+                    raise
+            lease = self._lease_container.read_item(lease_id, partition_key=lease_id)
+            if lease.get("owner") != self.instance_name:
+                raise _LeaseLostError(lease_id)
+        with self._lock:
+            if lease_id in self._leases:
+                self._leases[lease_id] = lease
+        return lease
+
+    def _read_changes(self, range_id, continuation, max_item_count):
+        """Reads a page of changes of a partition key range, and returns it with the continuation
+        to read the next page and the response headers."""
+        if continuation is None and not self._start_from_beginning:
+            continuation = _START_FROM_NOW
+        headers = {}
+        options = {"partitionKeyRangeId": range_id, "maxItemCount": max_item_count, "continuation": continuation}
+        pages = self._container.client_connection.QueryItemsChangeFeed(
+            self._container.container_link, options=options,
+            response_hook=lambda response_headers, _: headers.update(response_headers)).by_page()
+        changes = list(next(pages, []))
+        return changes, headers.get(HttpHeaders.ETag) or continuation, headers
+
+    def _start_pump(self, lease):
+        stop = threading.Event()
+        name = "ChangeFeedProcessor-{}-{}".format(self.instance_name, lease["partitionKeyRangeId"])
+        pump = threading.Thread(target=self._pump, args=(lease["id"], stop), name=name)
+        pump.daemon = True
+        with self._lock:
+            self._leases[lease["id"]] = lease
+            if lease["id"] in self._pumps or self._stopped.is_set():
+                # the lease expired and was taken again by this instance
+                return
+            self._pumps[lease["id"]] = (pump, stop)
+        pump.start()
+
+    def _stop_pump(self, lease_id):
+        with self._lock:
+            self._leases.pop(lease_id, None)
+            _, stop = self._pumps.pop(lease_id, (None, None))
+        if stop is not None:
+            stop.set()
+
+    def _checkpoint(self, lease_id, continuation):
+        self._update_lease(lease_id, lambda lease: lease.update(continuationToken=continuation))
+
+    def _pump(self, lease_id, stop):
+        """Reads the changes of the partition key range of a lease and passes them to the handler,
+        until the lease is lost or the processor is stopped."""
+        with self._lock:
+            lease = self._leases[lease_id]
+        range_id = lease["partitionKeyRangeId"]
+        continuation = lease.get("continuationToken")
+        try:
+            while not stop.is_set():
+                try:
+                    changes, next_continuation, _ = self._read_changes(range_id, continuation, self._max_item_count)
+                except exceptions.CosmosHttpResponseError as error:
+                    if exceptions._partition_range_is_gone(error):
+                        self._split(lease_id, range_id, continuation)
+                        return
+                    logger.warning("Reading the changes of partition key range %s failed: %s", range_id, error)
+                    stop.wait(self._poll_interval)
+                    continue
+                if changes:
+                    try:
+                        self._handler(changes, range_id)
+                    except Exception:  # pylint: disable=broad-except
+                        logger.exception("The handler failed on the changes of partition key range %s", range_id)
+                        stop.wait(self._poll_interval)
+                        continue
+                if changes or continuation in (None, _START_FROM_NOW):
+                    self._checkpoint(lease_id, next_continuation)
+                continuation = next_continuation
+                if not changes:
+                    stop.wait(self._poll_interval)
+        except _LeaseLostError:
+            logger.info("The lease of partition key range %s was taken by another instance", range_id)
+            self._stop_pump(lease_id)
+        except Exception:  # pylint: disable=broad-except
+            # the lease is no longer renewed, so it is taken again once it expires
+            logger.exception("Processing the changes of partition key range %s failed", range_id)
+            self._stop_pump(lease_id)
+
+    def _split(self, lease_id, range_id, continuation):
+        """Replaces the lease of a split partition key range by leases on its child ranges."""
+        child_ranges = self._get_child_partition_key_ranges(range_id)
+        if not child_ranges:
+            raise _LeaseLostError(lease_id)
+        child_leases = []
+        for child_range in child_ranges:
+            child_lease = self._create_lease(self._new_lease(child_range["id"], continuation, self.instance_name))
+            if child_lease is not None:
+                child_leases.append(child_lease)
+        self._stop_pump(lease_id)
+        self._lease_container.delete_item(lease_id, partition_key=lease_id)
+        for child_lease in child_leases:
+            self._start_pump(child_lease)
+
+    def _renew_leases(self):
+        for lease_id in list(self._leases):
+            try:
+                self._update_lease(lease_id, lambda lease: lease.update(timestamp=time.time()))
+            except _LeaseLostError:
+                logger.info("The lease %s was taken by another instance", lease_id)
+                self._stop_pump(lease_id)
+
+    def _balance_leases(self):
+        leases = self._read_leases()
+        for lease in _select_leases_to_take(self.instance_name, leases, time.time(), self._lease_expiration_interval):
+            acquired = self._acquire_lease(lease)
+            if acquired is not None:
+                self._start_pump(acquired)
+
+    def _coordinate(self):
+        next_renewal = next_balancing = time.time()
+        while not self._stopped.is_set():
+            try:
+                if time.time() >= next_renewal:
+                    self._renew_leases()
+                    next_renewal = time.time() + self._lease_renew_interval
+                if time.time() >= next_balancing:
+                    self._balance_leases()
+                    next_balancing = time.time() + self._lease_acquire_interval
+            except exceptions.CosmosHttpResponseError as error:
+                logger.warning("Updating the leases of the change feed processor failed: %s", error)
+            self._stopped.wait(max(0.0, min(next_renewal, next_balancing) - time.time()))
@@ -56,6 +56,8 @@ from . import _global_endpoint_manager as global_endpoint_manager
 from ._routing import routing_map_provider
 from ._retry_utility import ConnectionRetryPolicy
 from . import _session
+from ._query_plan_cache import _QueryPlanCache
+from ._item_cache import _ItemCache, _can_use_item_cache
 from . import _utils
 from .partition_key import _Undefined, _Empty
 
@@ -204,6 +206,12 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
         # Routing map provider
         self._routing_map_provider = routing_map_provider.SmartRoutingMapProvider(self)
 
+        # Query plans of the cross partition queries
+        self._query_plan_cache = _QueryPlanCache(self.connection_policy.QueryPlanCacheSize)
+
+        # Items of the point reads
+        self._item_cache = _ItemCache(self.connection_policy.ItemCacheSize, self.connection_policy.ItemCacheTtlInMs)
+
         database_account = self._global_endpoint_manager._GetDatabaseAccount(**kwargs)
         self._global_endpoint_manager.force_refresh(database_account)
 
@@ -421,6 +429,11 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
         CosmosClientConnection.__ValidateResource(collection)
         path = base.GetPathFromLink(database_link, "colls")
         database_id = base.GetResourceIdOrFullNameFromLink(database_link)
+        # The query plans of a previous collection with the same id don't hold for the new one
+        self._query_plan_cache.invalidate(
+            base.TrimBeginningAndEndingSlashes(database_link) + "/colls/" + str(collection.get("id")))
+        self._item_cache.invalidate(
+            base.TrimBeginningAndEndingSlashes(database_link) + "/colls/" + str(collection.get("id")))
         return self.Create(collection, path, "colls", database_id, None, options, **kwargs)
 
     def ReplaceContainer(self, collection_link, collection, options=None, **kwargs):
@@ -445,6 +458,7 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
         CosmosClientConnection.__ValidateResource(collection)
         path = base.GetPathFromLink(collection_link)
         collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        self._query_plan_cache.invalidate(collection_link)
         return self.Replace(collection, path, "colls", collection_id, None, options, **kwargs)
 
     def ReadContainer(self, collection_link, options=None, **kwargs):
@@ -846,6 +860,7 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
         options=None,
         partition_key=None,
         response_hook=None,
+        container_properties_provider=None,
         **kwargs
     ):
         """Queries documents in a collection.
@@ -859,6 +874,8 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
             Partition key for the query(default value None)
         :param response_hook:
             A callable invoked with the response metadata
+        :param container_properties_provider:
+            A callable returning the properties of the container, used to cache the query plans of the container
 
         :return:
             Query Iterable of Documents.
@@ -906,6 +923,7 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
             options,
             fetch_function=fetch_fn,
             collection_link=database_or_container_link,
+            container_properties_provider=container_properties_provider,
             page_iterator_class=query_iterable.QueryIterable
         )
 
@@ -1086,7 +1104,11 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
         collection_id, document, path = self._GetContainerIdWithPathForItem(
             database_or_container_link, document, options
         )
-        return self.Create(document, path, "docs", collection_id, None, options, **kwargs)
+        try:
+            return self.Create(document, path, "docs", collection_id, None, options, **kwargs)
+        finally:
+            # the item may have been written even though the request failed
+            self._item_cache.invalidate(database_or_container_link, [document.get("id")])
 
     def UpsertItem(self, database_or_container_link, document, options=None, **kwargs):
         """Upserts a document in a collection.
@@ -1125,7 +1147,11 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
         collection_id, document, path = self._GetContainerIdWithPathForItem(
             database_or_container_link, document, options
         )
-        return self.Upsert(document, path, "docs", collection_id, None, options, **kwargs)
+        try:
+            return self.Upsert(document, path, "docs", collection_id, None, options, **kwargs)
+        finally:
+            # the item may have been written even though the request failed
+            self._item_cache.invalidate(database_or_container_link, [document.get("id")])
 
     PartitionResolverErrorMessage = (
         "Couldn't find any partition resolvers for the database link provided. "
@@ -1181,7 +1207,24 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
 
         path = base.GetPathFromLink(document_link)
         document_id = base.GetResourceIdOrFullNameFromLink(document_link)
-        return self.Read(path, "docs", document_id, None, options, **kwargs)
+        if not self._item_cache.enabled or not _can_use_item_cache(options, self.session):
+            return self.Read(path, "docs", document_id, None, options, **kwargs)
+
+        partition_key = options.get("partitionKey")
+        cached_item = self._item_cache.get(document_link, partition_key)
+        if cached_item is not None:
+            if self._item_cache.is_fresh(cached_item, self.session, document_link):
+                self.last_response_headers = cached_item.get_headers()
+                return cached_item.get_item()
+            options = dict(options, accessCondition={"type": "IfNoneMatch", "condition": cached_item.etag})
+
+        result = self.Read(path, "docs", document_id, None, options, **kwargs)
+        if result is None and cached_item is not None:
+            # not modified since it was cached
+            self._item_cache.refresh(cached_item, self.last_response_headers)
+            return cached_item.get_item()
+        self._item_cache.set(document_link, partition_key, result, self.last_response_headers)
+        return result
 
     def ReadTriggers(self, collection_link, options=None, **kwargs):
         """Reads all triggers in a collection.
@@ -1656,6 +1699,8 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
 
         path = base.GetPathFromLink(collection_link)
         collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        self._query_plan_cache.invalidate(collection_link)
+        self._item_cache.invalidate(collection_link)
         return self.DeleteResource(path, "colls", collection_id, None, options, **kwargs)
 
     def ReplaceItem(self, document_link, new_document, options=None, **kwargs):
@@ -1691,7 +1736,10 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
         collection_link = base.GetItemContainerLink(document_link)
         options = self._AddPartitionKey(collection_link, new_document, options)
 
-        return self.Replace(new_document, path, "docs", document_id, None, options, **kwargs)
+        try:
+            return self.Replace(new_document, path, "docs", document_id, None, options, **kwargs)
+        finally:
+            self._item_cache.invalidate_item(document_link)
 
     def DeleteItem(self, document_link, options=None, **kwargs):
         """Deletes a document.
@@ -1712,7 +1760,10 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
 
         path = base.GetPathFromLink(document_link)
         document_id = base.GetResourceIdOrFullNameFromLink(document_link)
-        return self.DeleteResource(path, "docs", document_id, None, options, **kwargs)
+        try:
+            return self.DeleteResource(path, "docs", document_id, None, options, **kwargs)
+        finally:
+            self._item_cache.invalidate_item(document_link)
 
     def ReplaceTrigger(self, trigger_link, trigger, options=None, **kwargs):
         """Replaces a trigger and returns it.
@@ -2043,6 +2094,20 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
         )
         return database_account
 
+    def ProbeEndpoint(self, url_connection, **kwargs):
+        """Reads the database account from an endpoint once, without retries, to measure its latency.
+
+        :param str url_connection:
+            The endpoint to probe.
+
+        """
+        headers = base.GetHeaders(self, dict(self.default_headers), "get", "", "", "", {})  # path  # id  # type
+        request_params = _request_object.RequestObject("databaseaccount", documents._OperationType.Read, url_connection)
+        request = self.pipeline_client.get(url="", headers=headers)
+        synchronized_request._Request(
+            self._global_endpoint_manager, request_params, self.connection_policy, self.pipeline_client, request, **kwargs
+        )
+
     def Create(self, body, path, typ, id, initial_headers, options=None, **kwargs):  # pylint: disable=redefined-builtin
         """Creates a Azure Cosmos resource and returns it.
 
@@ -2106,6 +2171,45 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
         self._UpdateSessionIfRequired(headers, result, self.last_response_headers)
         return result
 
+    def Batch(self, collection_link, batch_body, options=None, **kwargs):
+        """Executes a transactional batch of item operations on one partition key.
+
+        :param str collection_link:
+            The link to the document collection.
+        :param str batch_body:
+            The operations of the batch, serialized in the batch format of the service.
+        :param dict options:
+            The request options for the request, with the partition key of the batch.
+
+        :return:
+            The results of the operations.
+        :rtype:
+            list[dict]
+
+        """
+        if options is None:
+            options = {}
+
+        path = base.GetPathFromLink(collection_link, "docs")
+        collection_id = base.GetResourceIdOrFullNameFromLink(collection_link)
+        headers = base.GetHeaders(self, self.default_headers, "post", path, collection_id, "docs", options)
+        headers[http_constants.HttpHeaders.IsBatchRequest] = True
+        headers[http_constants.HttpHeaders.IsBatchAtomic] = True
+        headers[http_constants.HttpHeaders.ShouldBatchContinueOnError] = False
+
+        # Batch will use WriteEndpoint since it uses POST operation. A batch failed by one of its operations
+        # is returned with status 207 (multi-status) and the results of all its operations, so it isn't raised.
+        request_params = _request_object.RequestObject("docs", documents._OperationType.Batch)
+        try:
+            result, self.last_response_headers = self.__Post(
+                path, request_params, batch_body, headers, **kwargs)
+        finally:
+            self._item_cache.invalidate_batch(collection_link, batch_body)
+        # update session from an item written by the batch, the results themselves are not a resource
+        written = next((r["resourceBody"] for r in result or [] if "_self" in (r.get("resourceBody") or {})), None)
+        self._UpdateSessionIfRequired(headers, written, self.last_response_headers)
+        return result
+
     def Replace(self, resource, path, typ, id, initial_headers, options=None, **kwargs):  # pylint: disable=redefined-builtin
         """Replaces a Azure Cosmos resource and returns it.
 
@@ -2310,20 +2414,29 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
             tuple
 
         """
-        return (
-            self.__QueryFeed(
-                path,
-                "docs",
-                collection_id,
-                lambda r: r["Documents"],
-                lambda _, b: b,
-                query,
-                options,
-                partition_key_range_id,
-                **kwargs
-            ),
-            self.last_response_headers,
+        # Pages of a cross partition query may be fetched concurrently, so the headers
+        # are taken from this request rather than from last_response_headers
+        response_hook = kwargs.pop("response_hook", None)
+        response_headers = []
+
+        def _capture_response_headers(headers, result):
+            response_headers.append(headers)
+            if response_hook:
+                response_hook(headers, result)
+
+        result = self.__QueryFeed(
+            path,
+            "docs",
+            collection_id,
+            lambda r: r["Documents"],
+            lambda _, b: b,
+            query,
+            options,
+            partition_key_range_id,
+            response_hook=_capture_response_headers,
+            **kwargs
         )
+        return result, response_headers[0]
 
     def __QueryFeed(
         self,
@@ -2382,9 +2495,10 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
             request_params = _request_object.RequestObject(typ,
                         documents._OperationType.QueryPlan if is_query_plan else documents._OperationType.ReadFeed)
             headers = base.GetHeaders(self, initial_headers, "get", path, id_, typ, options, partition_key_range_id)
-            result, self.last_response_headers = self.__Get(path, request_params, headers, **kwargs)
+            result, last_response_headers = self.__Get(path, request_params, headers, **kwargs)
+            self.last_response_headers = last_response_headers
             if response_hook:
-                response_hook(self.last_response_headers, result)
+                response_hook(last_response_headers, result)
             return __GetBodiesFromQueryResult(result)
 
         query = self.__CheckAndUnifyQueryFormat(query)
@@ -2406,17 +2520,19 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
         # Query operations will use ReadEndpoint even though it uses POST(for regular query operations)
         request_params = _request_object.RequestObject(typ, documents._OperationType.SqlQuery)
         req_headers = base.GetHeaders(self, initial_headers, "post", path, id_, typ, options, partition_key_range_id)
-        result, self.last_response_headers = self.__Post(path, request_params, query, req_headers, **kwargs)
+        result, last_response_headers = self.__Post(path, request_params, query, req_headers, **kwargs)
+        self.last_response_headers = last_response_headers
 
         if response_hook:
-            response_hook(self.last_response_headers, result)
+            response_hook(last_response_headers, result)
 
         return __GetBodiesFromQueryResult(result)
 
-    def _GetQueryPlanThroughGateway(self, query, resource_link, **kwargs):
+    def _GetQueryPlanThroughGateway(self, query, resource_link, container_properties=None, **kwargs):
         supported_query_features = (documents._QueryFeature.Aggregate + "," +
                                     documents._QueryFeature.CompositeAggregate + "," +
                                     documents._QueryFeature.Distinct + "," +
+                                    documents._QueryFeature.GroupBy + "," +
                                     documents._QueryFeature.MultipleOrderBy + "," +
                                     documents._QueryFeature.OffsetAndLimit + "," +
                                     documents._QueryFeature.OrderBy + "," +
@@ -2433,15 +2549,21 @@ class CosmosClientConnection(object):  # pylint: disable=too-many-public-methods
         path = base.GetPathFromLink(resource_link, "docs")
         resource_id = base.GetResourceIdOrFullNameFromLink(resource_link)
 
-        return self.__QueryFeed(path,
-                                "docs",
-                                resource_id,
-                                lambda r: r,
-                                None,
-                                query,
-                                options,
-                                is_query_plan=True,
-                                **kwargs)
+        # plans are cached by the resource id of the container, with its partition key definition
+        query_plan = self._query_plan_cache.get(container_properties, query)
+        if query_plan is not None:
+            return query_plan
+        query_plan = self.__QueryFeed(path,
+                                      "docs",
+                                      resource_id,
+                                      lambda r: r,
+                                      None,
+                                      query,
+                                      options,
+                                      is_query_plan=True,
+                                      **kwargs)
+        self._query_plan_cache.set(resource_link, container_properties, query, query_plan)
+        return query_plan
 
     def __CheckAndUnifyQueryFormat(self, query_body):
         """Checks and unifies the format of the query body.
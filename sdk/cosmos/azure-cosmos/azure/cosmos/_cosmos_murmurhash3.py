@@ -0,0 +1,160 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""MurmurHash3 implementation used to compute effective partition keys in the
+Azure Cosmos database service.
+
+The 32 bit variant (x86) hashes the partition keys of version 1 containers, the
+128 bit variant (x64) hashes the partition keys of version 2 containers.
+"""
+
+import struct
+
+_MASK_32 = 0xFFFFFFFF
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def _rotate_left_32(value, shift):
+    return ((value << shift) | (value >> (32 - shift))) & _MASK_32
+
+
+def _rotate_left_64(value, shift):
+    return ((value << shift) | (value >> (64 - shift))) & _MASK_64
+
+
+def _fmix_32(h):
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & _MASK_32
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & _MASK_32
+    h ^= h >> 16
+    return h
+
+
+def _fmix_64(k):
+    k ^= k >> 33
+    k = (k * 0xFF51AFD7ED558CCD) & _MASK_64
+    k ^= k >> 33
+    k = (k * 0xC4CEB9FE1A85EC53) & _MASK_64
+    k ^= k >> 33
+    return k
+
+
+def murmurhash3_32(data, seed=0):
+    """Computes the 32 bit MurmurHash3 (x86) of the data.
+
+    :param bytes data: The data to hash.
+    :param int seed: The seed of the hash.
+    :return: The hash, as an unsigned integer.
+    :rtype: int
+    """
+    data = bytearray(data)
+    c1 = 0xCC9E2D51
+    c2 = 0x1B873593
+    length = len(data)
+    h1 = seed & _MASK_32
+    block_end = length - length % 4
+
+    for i in range(0, block_end, 4):
+        k1 = struct.unpack_from("<I", bytes(data[i:i + 4]))[0]
+        k1 = (k1 * c1) & _MASK_32
+        k1 = _rotate_left_32(k1, 15)
+        k1 = (k1 * c2) & _MASK_32
+        h1 ^= k1
+        h1 = _rotate_left_32(h1, 13)
+        h1 = (h1 * 5 + 0xE6546B64) & _MASK_32
+
+    k1 = 0
+    tail = data[block_end:]
+    for i in reversed(range(len(tail))):
+        k1 ^= tail[i] << (8 * i)
+    if tail:
+        k1 = (k1 * c1) & _MASK_32
+        k1 = _rotate_left_32(k1, 15)
+        k1 = (k1 * c2) & _MASK_32
+        h1 ^= k1
+
+    h1 ^= length
+    return _fmix_32(h1)
+
+
+def murmurhash3_128(data, seed=0):
+    """Computes the 128 bit MurmurHash3 (x64) of the data.
+
+    :param bytes data: The data to hash.
+    :param int seed: The seed of the hash.
+    :return: The low and the high 64 bits of the hash, as unsigned integers.
+    :rtype: tuple[int, int]
+    """
+    data = bytearray(data)
+    c1 = 0x87C37B91114253D5
+    c2 = 0x4CF5AD432745937F
+    length = len(data)
+    h1 = seed & _MASK_64
+    h2 = seed & _MASK_64
+    block_end = length - length % 16
+
+    for i in range(0, block_end, 16):
+        k1, k2 = struct.unpack_from("<QQ", bytes(data[i:i + 16]))
+
+        k1 = (k1 * c1) & _MASK_64
+        k1 = _rotate_left_64(k1, 31)
+        k1 = (k1 * c2) & _MASK_64
+        h1 ^= k1
+        h1 = _rotate_left_64(h1, 27)
+        h1 = (h1 + h2) & _MASK_64
+        h1 = (h1 * 5 + 0x52DCE729) & _MASK_64
+
+        k2 = (k2 * c2) & _MASK_64
+        k2 = _rotate_left_64(k2, 33)
+        k2 = (k2 * c1) & _MASK_64
+        h2 ^= k2
+        h2 = _rotate_left_64(h2, 31)
+        h2 = (h2 + h1) & _MASK_64
+        h2 = (h2 * 5 + 0x38495AB5) & _MASK_64
+
+    tail = data[block_end:]
+    k1 = 0
+    k2 = 0
+    for i in reversed(range(8, len(tail))):
+        k2 ^= tail[i] << (8 * (i - 8))
+    for i in reversed(range(min(8, len(tail)))):
+        k1 ^= tail[i] << (8 * i)
+    if len(tail) > 8:
+        k2 = (k2 * c2) & _MASK_64
+        k2 = _rotate_left_64(k2, 33)
+        k2 = (k2 * c1) & _MASK_64
+        h2 ^= k2
+    if tail:
+        k1 = (k1 * c1) & _MASK_64
+        k1 = _rotate_left_64(k1, 31)
+        k1 = (k1 * c2) & _MASK_64
+        h1 ^= k1
+
+    h1 ^= length
+    h2 ^= length
+    h1 = (h1 + h2) & _MASK_64
+    h2 = (h2 + h1) & _MASK_64
+    h1 = _fmix_64(h1)
+    h2 = _fmix_64(h2)
+    h1 = (h1 + h2) & _MASK_64
+    h2 = (h2 + h1) & _MASK_64
+    return h1, h2
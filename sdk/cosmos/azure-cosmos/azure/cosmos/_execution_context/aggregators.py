@@ -113,3 +113,38 @@ class _SumAggregator(_Aggregator):
 
     def get_result(self):
         return self.sum
+
+
+class _StaticValueAggregator(_Aggregator):
+    """Returns the value of a projection that isn't aggregated, such as a GROUP BY expression.
+
+    The value is the same in every partial result of a group, so the first one is kept.
+    """
+    def __init__(self):
+        self.value = None
+        self.has_value = False
+
+    def aggregate(self, other):
+        if not self.has_value:
+            self.value = other
+            self.has_value = True
+
+    def get_result(self):
+        return self.value
+
+
+_AGGREGATORS = {
+    "Average": _AverageAggregator,
+    "Count": _CountAggregator,
+    "Max": _MaxAggregator,
+    "Min": _MinAggregator,
+    "Sum": _SumAggregator,
+}
+
+
+def _create_aggregator(aggregate_type):
+    """Returns the aggregator of an aggregate function, or of a value that isn't aggregated if it is None.
+    """
+    if aggregate_type is None:
+        return _StaticValueAggregator()
+    return _AGGREGATORS[aggregate_type]()
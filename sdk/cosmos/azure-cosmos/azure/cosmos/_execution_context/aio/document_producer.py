@@ -0,0 +1,194 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Internal class for asynchronous document producer implementation in the Azure
+Cosmos database service.
+"""
+
+import asyncio
+from collections import deque
+
+from azure.cosmos import _base
+from azure.cosmos._execution_context import document_producer
+from azure.cosmos._execution_context.document_producer import _OrderByHelper, _peek_order_by_items
+from azure.cosmos._execution_context.aio.base_execution_context import _DefaultQueryExecutionContext
+
+# pylint: disable=protected-access
+
+
+class _DocumentProducer(object):
+    """This class takes care of handling of the results for one single partition
+    key range.
+
+    When handling an orderby query, MultiExecutionContextAggregator instantiates
+    one instance of this class per target partition key range and aggregates the
+    result of each.
+
+    When a semaphore is given, the next page is prefetched in a task while the
+    current one is consumed, so at most one page is buffered and one page is in
+    flight for each partition key range, and at most as many pages as the
+    semaphore allows are fetched at the same time across all partition key ranges.
+    """
+
+    def __init__(self, partition_key_target_range, client, collection_link, query, document_producer_comp, options,
+                 semaphore=None, continuation=None):
+        """
+        Constructor
+
+        The continuation resumes the query of a partition key range that was split on one of its child ranges.
+        """
+        # the continuation of each partition key range is kept in its own copy of the options
+        self._options = dict(options)
+        self._partition_key_target_range = partition_key_target_range
+        self._doc_producer_comp = document_producer_comp
+        self._client = client
+        self._semaphore = semaphore
+        self._prefetched_page = None
+        self._buffer = deque()
+
+        self._cur_item = None
+        # initiate execution context
+
+        path = _base.GetPathFromLink(collection_link, "docs")
+        collection_id = _base.GetResourceIdOrFullNameFromLink(collection_link)
+
+        async def fetch_fn(options):
+            return await self._client.QueryFeed(path, collection_id, query, options, partition_key_target_range["id"])
+
+        self._ex_context = _DefaultQueryExecutionContext(client, self._options, fetch_fn)
+        self._ex_context._continuation = continuation
+
+    def get_continuation(self):
+        """Returns the continuation of the next page of the target partition key range.
+            :return:
+                The continuation, or None to read from the first page.
+            :rtype: str
+        """
+        return self._ex_context._continuation
+
+    def get_target_range(self):
+        """Returns the target partition key range.
+            :return:
+                Target partition key range.
+            :rtype: dict
+        """
+        return self._partition_key_target_range
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        """
+        :return: The next result item.
+        :rtype: dict
+        :raises StopAsyncIteration: If there is no more result.
+
+        """
+        if self._cur_item is not None:
+            res = self._cur_item
+            self._cur_item = None
+            return res
+
+        return await self._next_item()
+
+    async def peek(self):
+        """
+        :return: The current result item.
+        :rtype: dict.
+        :raises StopAsyncIteration: If there is no current item.
+
+        """
+        if self._cur_item is None:
+            self._cur_item = await self._next_item()
+
+        return self._cur_item
+
+    def prefetch(self):
+        """Starts fetching the next page in a task, unless a page is already
+        being fetched or there are no more pages.
+        """
+        if self._semaphore is None or self._prefetched_page is not None:
+            return
+        if self._ex_context._has_more_pages():
+            self._prefetched_page = asyncio.ensure_future(self._fetch_page())
+
+    def cancel_prefetch(self):
+        if self._prefetched_page is not None:
+            self._prefetched_page.cancel()
+            self._prefetched_page = None
+
+    async def _fetch_page(self):
+        async with self._semaphore:
+            return await self._ex_context.fetch_next_block()
+
+    async def _next_item(self):
+        if self._semaphore is None:
+            return await self._ex_context.__anext__()
+
+        self.prefetch()
+        while not self._buffer and self._prefetched_page is not None:
+            page = await self._prefetched_page
+            self._prefetched_page = None
+            self._buffer.extend(page)
+            self.prefetch()
+
+        if not self._buffer:
+            raise StopAsyncIteration
+        return self._buffer.popleft()
+
+    def __lt__(self, other):
+        return self._doc_producer_comp.compare(self, other) < 0
+
+
+class _OrderByDocumentProducerComparator(document_producer._OrderByDocumentProducerComparator):
+    """Provide a Comparator for document producers which respects orderby sort order.
+
+    Peeking a document producer is asynchronous, so only document producers whose
+    current item has already been peeked can be compared.
+    """
+
+    def compare(self, doc_producer1, doc_producer2):
+        """Compares the given two instances of DocumentProducers.
+
+        :param _DocumentProducer doc_producers1: first instance
+        :param _DocumentProducer doc_producers2: first instance
+        :return:
+            Integer value of compare result.
+                positive integer if doc_producers1 > doc_producers2
+                negative integer if doc_producers1 < doc_producers2
+        :rtype: int
+        """
+
+        res1 = _peek_order_by_items(doc_producer1._cur_item)
+        res2 = _peek_order_by_items(doc_producer2._cur_item)
+
+        self._validate_orderby_items(res1, res2)
+
+        for i, (elt1, elt2) in enumerate(zip(res1, res2)):
+            res = _OrderByHelper.compare(elt1, elt2)
+            if res != 0:
+                if self._sort_order[i] == "Ascending":
+                    return res
+                if self._sort_order[i] == "Descending":
+                    return -res
+
+        return document_producer._PartitionKeyRangeDocumentProduerComparator.compare(
+            self, doc_producer1, doc_producer2)
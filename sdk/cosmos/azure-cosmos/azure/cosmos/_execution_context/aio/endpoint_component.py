@@ -0,0 +1,205 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Internal class for asynchronous query execution endpoint component implementation
+in the Azure Cosmos database service.
+"""
+import numbers
+
+from azure.cosmos._execution_context.aggregators import (
+    _AverageAggregator,
+    _CountAggregator,
+    _MaxAggregator,
+    _MinAggregator,
+    _SumAggregator,
+)
+from azure.cosmos._execution_context.endpoint_component import (
+    _DistinctResultSet,
+    _GroupByAggregation,
+    _QueryExecutionDistinctUnorderedEndpointComponent as _SyncDistinctUnorderedEndpointComponent,
+)
+
+
+class _QueryExecutionEndpointComponent(object):
+    def __init__(self, execution_context):
+        self._execution_context = execution_context
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self._execution_context.__anext__()
+
+
+class _QueryExecutionOrderByEndpointComponent(_QueryExecutionEndpointComponent):
+    """Represents an endpoint in handling an order by query.
+
+    For each processed orderby result it returns 'payload' item of the result.
+    """
+
+    async def __anext__(self):
+        return (await self._execution_context.__anext__())["payload"]
+
+
+class _QueryExecutionTopEndpointComponent(_QueryExecutionEndpointComponent):
+    """Represents an endpoint in handling top query.
+
+    It only returns as many results as top arg specified.
+    """
+
+    def __init__(self, execution_context, top_count):
+        super(_QueryExecutionTopEndpointComponent, self).__init__(execution_context)
+        self._top_count = top_count
+
+    async def __anext__(self):
+        if self._top_count > 0:
+            res = await self._execution_context.__anext__()
+            self._top_count -= 1
+            return res
+        raise StopAsyncIteration
+
+
+class _QueryExecutionDistinctOrderedEndpointComponent(_QueryExecutionEndpointComponent):
+    """Represents an endpoint in handling distinct query.
+
+    It returns only those values not already returned.
+    """
+    def __init__(self, execution_context):
+        super(_QueryExecutionDistinctOrderedEndpointComponent, self).__init__(execution_context)
+        self.last_result = None
+
+    async def __anext__(self):
+        res = await self._execution_context.__anext__()
+        while self.last_result == res:
+            res = await self._execution_context.__anext__()
+        self.last_result = res
+        return res
+
+
+class _QueryExecutionDistinctUnorderedEndpointComponent(_QueryExecutionEndpointComponent):
+    """Represents an endpoint in handling distinct query.
+
+    It returns only those values not already returned, by keeping the digest of each returned value.
+    """
+    def __init__(self, execution_context, max_in_memory=None):
+        super(_QueryExecutionDistinctUnorderedEndpointComponent, self).__init__(execution_context)
+        self.last_result = _DistinctResultSet(max_in_memory)
+
+    # the hashing of results is shared with the sync endpoint component
+    make_hash = _SyncDistinctUnorderedEndpointComponent.make_hash
+
+    async def __anext__(self):
+        try:
+            res = await self._execution_context.__anext__()
+            hashed_result = self.make_hash(res)
+
+            while hashed_result in self.last_result:
+                res = await self._execution_context.__anext__()
+                hashed_result = self.make_hash(res)
+        except StopAsyncIteration:
+            self.last_result.close()
+            raise
+        self.last_result.add(hashed_result)
+        return res
+
+
+class _QueryExecutionOffsetEndpointComponent(_QueryExecutionEndpointComponent):
+    """Represents an endpoint in handling offset query.
+
+    It returns results offset by as many results as offset arg specified.
+    """
+    def __init__(self, execution_context, offset_count):
+        super(_QueryExecutionOffsetEndpointComponent, self).__init__(execution_context)
+        self._offset_count = offset_count
+
+    async def __anext__(self):
+        while self._offset_count > 0:
+            res = await self._execution_context.__anext__()
+            if res is not None:
+                self._offset_count -= 1
+            else:
+                raise StopAsyncIteration
+        return await self._execution_context.__anext__()
+
+
+class _QueryExecutionGroupByEndpointComponent(_QueryExecutionEndpointComponent):
+    """Represents an endpoint in handling a cross partition GROUP BY query.
+
+    It merges the groups of all the partition key ranges, then returns one result per group.
+    """
+
+    def __init__(self, execution_context, alias_to_aggregate_type, select_value=False, aggregates=None):
+        super(_QueryExecutionGroupByEndpointComponent, self).__init__(execution_context)
+        value_aggregate_type = aggregates[0] if select_value and aggregates else None
+        self._groups = _GroupByAggregation(alias_to_aggregate_type, select_value, value_aggregate_type)
+        self._results = None
+
+    async def __anext__(self):
+        if self._results is None:
+            async for res in self._execution_context:
+                self._groups.add(res)
+            self._results = self._groups.get_results()
+        try:
+            return next(self._results)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _QueryExecutionAggregateEndpointComponent(_QueryExecutionEndpointComponent):
+    """Represents an endpoint in handling aggregate query.
+
+    It returns only aggreated values.
+    """
+
+    def __init__(self, execution_context, aggregate_operators):
+        super(_QueryExecutionAggregateEndpointComponent, self).__init__(execution_context)
+        self._local_aggregators = []
+        self._results = None
+        self._result_index = 0
+        for operator in aggregate_operators:
+            if operator == "Average":
+                self._local_aggregators.append(_AverageAggregator())
+            elif operator == "Count":
+                self._local_aggregators.append(_CountAggregator())
+            elif operator == "Max":
+                self._local_aggregators.append(_MaxAggregator())
+            elif operator == "Min":
+                self._local_aggregators.append(_MinAggregator())
+            elif operator == "Sum":
+                self._local_aggregators.append(_SumAggregator())
+
+    async def __anext__(self):
+        async for res in self._execution_context:
+            for item in res:
+                for operator in self._local_aggregators:
+                    if isinstance(item, dict) and item:
+                        operator.aggregate(item["item"])
+                    elif isinstance(item, numbers.Number):
+                        operator.aggregate(item)
+        if self._results is None:
+            self._results = []
+            for operator in self._local_aggregators:
+                self._results.append(operator.get_result())
+        if self._result_index < len(self._results):
+            res = self._results[self._result_index]
+            self._result_index += 1
+            return res
+        raise StopAsyncIteration
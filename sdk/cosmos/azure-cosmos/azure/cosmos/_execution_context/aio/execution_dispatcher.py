@@ -0,0 +1,212 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Internal class for asynchronous proxy query execution context implementation in
+the Azure Cosmos database service.
+"""
+
+from azure.cosmos.exceptions import CosmosHttpResponseError
+from azure.cosmos._query_plan_cache import _is_stale_container_error
+from azure.cosmos._execution_context.aio import multi_execution_aggregator
+from azure.cosmos._execution_context.aio.base_execution_context import _QueryExecutionContextBase
+from azure.cosmos._execution_context.aio.base_execution_context import _DefaultQueryExecutionContext
+from azure.cosmos._execution_context.execution_dispatcher import _is_partitioned_execution_info
+from azure.cosmos._execution_context.query_execution_info import _PartitionedQueryExecutionInfo
+from azure.cosmos._execution_context.aio import endpoint_component
+from azure.cosmos.documents import _DistinctType
+from azure.cosmos.http_constants import StatusCodes
+
+# pylint: disable=protected-access
+
+
+class _ProxyQueryExecutionContext(_QueryExecutionContextBase):  # pylint: disable=abstract-method
+    """Represents a proxy execution context wrapper.
+
+    By default, uses _DefaultQueryExecutionContext.
+
+    If backend responds a 400 error code with a Query Execution Info, switches
+    to _MultiExecutionContextAggregator
+    """
+
+    def __init__(self, client, resource_link, query, options, fetch_function, container_properties_provider=None):
+        """
+        Constructor
+        """
+        super(_ProxyQueryExecutionContext, self).__init__(client, options)
+
+        self._execution_context = _DefaultQueryExecutionContext(client, options, fetch_function)
+        self._resource_link = resource_link
+        self._query = query
+        self._fetch_function = fetch_function
+        self._container_properties_provider = container_properties_provider
+
+    async def __anext__(self):
+        """Returns the next query result.
+
+        :return: The next query result.
+        :rtype: dict
+        :raises StopAsyncIteration: If no more result is left.
+
+        """
+        try:
+            try:
+                return await self._execution_context.__anext__()
+            except CosmosHttpResponseError as e:
+                if not _is_partitioned_execution_info(e):
+                    raise
+                await self._switch_to_pipelined_execution_context()
+
+            return await self._execution_context.__anext__()
+        except CosmosHttpResponseError as e:
+            self._invalidate_query_plan(e)
+            raise
+
+    async def fetch_next_block(self):
+        """Returns a block of results.
+
+        :return: List of results.
+        :rtype: list
+        """
+        try:
+            try:
+                return await self._execution_context.fetch_next_block()
+            except CosmosHttpResponseError as e:
+                if not _is_partitioned_execution_info(e):
+                    raise
+                await self._switch_to_pipelined_execution_context()
+
+            return await self._execution_context.fetch_next_block()
+        except CosmosHttpResponseError as e:
+            self._invalidate_query_plan(e)
+            raise
+
+    async def _switch_to_pipelined_execution_context(self):
+        query_to_use = self._query if self._query is not None else "Select * from root r"
+        container_properties = None
+        if self._container_properties_provider:
+            container_properties = await self._container_properties_provider()
+        query_execution_info = _PartitionedQueryExecutionInfo(await self._client._GetQueryPlanThroughGateway
+                                                              (query_to_use, self._resource_link,
+                                                               container_properties=container_properties))
+        self._execution_context = self._create_pipelined_execution_context(query_execution_info)
+
+    def _invalidate_query_plan(self, error):
+        # the cached plans of the container were planned for a container or ranges that no longer exist
+        if self._resource_link and _is_stale_container_error(error):
+            self._client._query_plan_cache.invalidate(self._resource_link)
+
+    def _create_pipelined_execution_context(self, query_execution_info):
+
+        assert self._resource_link, "code bug, resource_link is required."
+        if (query_execution_info.has_aggregates() and not query_execution_info.has_select_value()
+                and not query_execution_info.has_group_by()):
+            if self._options and ("enableCrossPartitionQuery" in self._options
+                                  and self._options["enableCrossPartitionQuery"]):
+                raise CosmosHttpResponseError(StatusCodes.BAD_REQUEST,
+                                  "Cross partition query only supports 'VALUE <AggreateFunc>' for aggregates")
+
+        execution_context_aggregator = multi_execution_aggregator._MultiExecutionContextAggregator(self._client,
+                                                                                                   self._resource_link,
+                                                                                                   self._query,
+                                                                                                   self._options,
+                                                                                                   query_execution_info)
+        return _PipelineExecutionContext(self._client, self._options, execution_context_aggregator,
+                                         query_execution_info)
+
+
+class _PipelineExecutionContext(_QueryExecutionContextBase):  # pylint: disable=abstract-method
+
+    DEFAULT_PAGE_SIZE = 1000
+
+    def __init__(self, client, options, execution_context, query_execution_info):
+        super(_PipelineExecutionContext, self).__init__(client, options)
+
+        if options.get("maxItemCount"):
+            self._page_size = options["maxItemCount"]
+        else:
+            self._page_size = _PipelineExecutionContext.DEFAULT_PAGE_SIZE
+
+        self._execution_context = execution_context
+
+        self._endpoint = endpoint_component._QueryExecutionEndpointComponent(execution_context)
+
+        order_by = query_execution_info.get_order_by()
+        if order_by:
+            self._endpoint = endpoint_component._QueryExecutionOrderByEndpointComponent(self._endpoint)
+
+        aggregates = query_execution_info.get_aggregates()
+        if query_execution_info.has_group_by():
+            self._endpoint = endpoint_component._QueryExecutionGroupByEndpointComponent(
+                self._endpoint,
+                query_execution_info.get_group_by_alias_to_aggregate_type(),
+                query_execution_info.has_select_value(),
+                aggregates,
+            )
+        elif aggregates:
+            self._endpoint = endpoint_component._QueryExecutionAggregateEndpointComponent(self._endpoint, aggregates)
+
+        offset = query_execution_info.get_offset()
+        if offset is not None:
+            self._endpoint = endpoint_component._QueryExecutionOffsetEndpointComponent(self._endpoint, offset)
+
+        top = query_execution_info.get_top()
+        if top is not None:
+            self._endpoint = endpoint_component._QueryExecutionTopEndpointComponent(self._endpoint, top)
+
+        limit = query_execution_info.get_limit()
+        if limit is not None:
+            self._endpoint = endpoint_component._QueryExecutionTopEndpointComponent(self._endpoint, limit)
+
+        distinct_type = query_execution_info.get_distinct_type()
+        if distinct_type != _DistinctType.NoneType:
+            if distinct_type == _DistinctType.Ordered:
+                self._endpoint = endpoint_component._QueryExecutionDistinctOrderedEndpointComponent(self._endpoint)
+            else:
+                self._endpoint = endpoint_component._QueryExecutionDistinctUnorderedEndpointComponent(
+                    self._endpoint, options.get("maxDistinctResultsInMemory"))
+
+    async def __anext__(self):
+        """Returns the next query result.
+
+        :return: The next query result.
+        :rtype: dict
+        :raises StopAsyncIteration: If no more result is left.
+        """
+        return await self._endpoint.__anext__()
+
+    async def fetch_next_block(self):
+        """Returns a block of results.
+
+        This method internally invokes __anext__() as many times required to collect
+        the requested fetch size.
+
+        :return: List of results.
+        :rtype: list
+        """
+
+        results = []
+        for _ in range(self._page_size):
+            try:
+                results.append(await self.__anext__())
+            except StopAsyncIteration:
+                # no more results
+                break
+        return results
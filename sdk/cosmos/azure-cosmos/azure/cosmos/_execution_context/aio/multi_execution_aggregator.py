@@ -0,0 +1,234 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Internal class for asynchronous multi execution context aggregator implementation
+in the Azure Cosmos database service.
+"""
+
+import asyncio
+import heapq
+from azure.cosmos import exceptions
+from azure.cosmos._execution_context.aio.base_execution_context import _QueryExecutionContextBase
+from azure.cosmos._execution_context.aio import document_producer
+from azure.cosmos._execution_context.document_producer import _PartitionKeyRangeDocumentProduerComparator
+from azure.cosmos._execution_context.multi_execution_aggregator import _get_child_ranges
+from azure.cosmos._routing import routing_range
+
+# pylint: disable=protected-access
+
+
+class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
+    """This class is capable of queries which requires rewriting based on
+    backend's returned query execution info.
+
+    This class maintains the execution context for each partition key range
+    and aggregates the corresponding results from each execution context.
+
+    When handling an orderby query, _MultiExecutionContextAggregator
+    instantiates one instance of DocumentProducer per target partition key range
+    and aggregates the result of each.
+
+    With the maxDegreeOfParallelism option, the pages of the document producers
+    are fetched concurrently, at most that many at a time (or all target partition
+    key ranges at once when it is negative), and each producer prefetches its next
+    page while the merged results are consumed.
+
+    The target partition key ranges are only looked up on the first iteration,
+    as this requires awaiting the routing map.
+
+    When a target partition key range is split while it is queried, the routing
+    map is refreshed and its document producer is replaced by document producers
+    on the child ranges, which resume from its continuation.
+    """
+
+    class PriorityQueue:
+        """Provides a Priority Queue abstraction data structure"""
+
+        def __init__(self):
+            self._heap = []
+
+        def pop(self):
+            return heapq.heappop(self._heap)
+
+        def push(self, item):
+            heapq.heappush(self._heap, item)
+
+        def peek(self):
+            return self._heap[0]
+
+        def size(self):
+            return len(self._heap)
+
+    def __init__(self, client, resource_link, query, options, partitioned_query_ex_info):
+        super(_MultiExecutionContextAggregator, self).__init__(client, options)
+
+        # use the routing provider in the client
+        self._routing_provider = client._routing_map_provider
+        self._client = client
+        self._resource_link = resource_link
+        self._query = query
+        self._partitioned_query_ex_info = partitioned_query_ex_info
+        self._sort_orders = partitioned_query_ex_info.get_order_by()
+
+        if self._sort_orders:
+            self._document_producer_comparator = document_producer._OrderByDocumentProducerComparator(self._sort_orders)
+        else:
+            self._document_producer_comparator = _PartitionKeyRangeDocumentProduerComparator()
+
+        self._orderByPQ = _MultiExecutionContextAggregator.PriorityQueue()
+        self._document_producers = None
+        self._semaphore = None
+
+    async def _configure_partition_ranges(self):
+        # will be a list of (parition_min, partition_max) tuples
+        targetPartitionRanges = await self._get_target_parition_key_range()
+        self._semaphore = self._create_semaphore(len(targetPartitionRanges))
+
+        self._document_producers = []
+        for partitionTargetRange in targetPartitionRanges:
+            # create and add the child execution context for the target range
+            self._document_producers.append(
+                self._createTargetPartitionQueryExecutionContext(partitionTargetRange, self._semaphore)
+            )
+
+        # start fetching the first page of every target range before waiting on any of them
+        for targetQueryExContext in self._document_producers:
+            targetQueryExContext.prefetch()
+
+        try:
+            for targetQueryExContext in list(self._document_producers):
+                await self._push_document_producer(targetQueryExContext)
+        except BaseException:
+            self._cancel_prefetch()
+            raise
+
+    async def __anext__(self):
+        """Returns the next result
+
+        :return: The next result.
+        :rtype: dict
+        :raises StopAsyncIteration: If no more result is left.
+        """
+        if self._document_producers is None:
+            await self._configure_partition_ranges()
+
+        if self._orderByPQ.size() > 0:
+
+            targetRangeExContext = self._orderByPQ.pop()
+            try:
+                res = await targetRangeExContext.__anext__()
+                await self._push_document_producer(targetRangeExContext)
+            except BaseException:
+                self._cancel_prefetch()
+                raise
+
+            return res
+        raise StopAsyncIteration
+
+    def __del__(self):
+        # the prefetch tasks of an iterator that is abandoned before its last result are cancelled when it is collected
+        self._cancel_prefetch()
+
+    def close(self):
+        """Stops fetching the results of the target partition key ranges."""
+        self._cancel_prefetch()
+
+    async def fetch_next_block(self):
+
+        raise NotImplementedError("You should use pipeline's fetch_next_block.")
+
+    async def _push_document_producer(self, targetQueryExContext):
+        """Adds a document producer to the priority queue if it has more results.
+
+        If its partition key range is gone, the document producers of the child ranges are added instead.
+        """
+        try:
+            await targetQueryExContext.peek()
+        except StopAsyncIteration:
+            return
+        except exceptions.CosmosHttpResponseError as e:
+            if not exceptions._partition_range_is_gone(e):
+                raise
+            child_contexts = await self._create_child_query_execution_contexts(targetQueryExContext, e)
+            self._document_producers.extend(child_contexts)
+            for child_context in child_contexts:
+                child_context.prefetch()
+            for child_context in child_contexts:
+                await self._push_document_producer(child_context)
+            return
+        # if there are matching results in the target ex range add it to the priority queue
+        self._orderByPQ.push(targetQueryExContext)
+
+    async def _create_child_query_execution_contexts(self, targetQueryExContext, error):
+        parent_range = targetQueryExContext.get_target_range()
+        await self._routing_provider.refresh_routing_map(self._resource_link, parent_range["id"])
+        child_ranges = _get_child_ranges(parent_range, await self._get_target_parition_key_range())
+        if any(r["id"] == parent_range["id"] for r in child_ranges):
+            # the partition key range is still in the routing map, so the query can't be resumed
+            raise error
+        return [
+            self._createTargetPartitionQueryExecutionContext(
+                r, self._semaphore, targetQueryExContext.get_continuation())
+            for r in child_ranges
+        ]
+
+    def _createTargetPartitionQueryExecutionContext(self, partition_key_target_range, semaphore, continuation=None):
+
+        rewritten_query = self._partitioned_query_ex_info.get_rewritten_query()
+        if rewritten_query:
+            if isinstance(self._query, dict):
+                # this is a parameterized query, collect all the parameters
+                query = dict(self._query)
+                query["query"] = rewritten_query
+            else:
+                query = rewritten_query
+        else:
+            query = self._query
+
+        return document_producer._DocumentProducer(
+            partition_key_target_range,
+            self._client,
+            self._resource_link,
+            query,
+            self._document_producer_comparator,
+            self._options,
+            semaphore,
+            continuation,
+        )
+
+    def _create_semaphore(self, target_range_count):
+        max_degree_of_parallelism = self._options.get("maxDegreeOfParallelism")
+        if not max_degree_of_parallelism or max_degree_of_parallelism == 1 or target_range_count <= 1:
+            return None
+        if max_degree_of_parallelism < 0:
+            return asyncio.Semaphore(target_range_count)
+        return asyncio.Semaphore(min(max_degree_of_parallelism, target_range_count))
+
+    def _cancel_prefetch(self):
+        for targetQueryExContext in getattr(self, "_document_producers", None) or []:
+            targetQueryExContext.cancel_prefetch()
+
+    async def _get_target_parition_key_range(self):
+
+        query_ranges = self._partitioned_query_ex_info.get_query_ranges()
+        return await self._routing_provider.get_overlapping_ranges(
+            self._resource_link, [routing_range.Range.ParseFromDict(range_as_dict) for range_as_dict in query_ranges]
+        )
@@ -31,6 +31,8 @@ import six
 from azure.cosmos import _base
 from azure.cosmos._execution_context.base_execution_context import _DefaultQueryExecutionContext
 
+# pylint: disable=protected-access
+
 
 class _DocumentProducer(object):
     """This class takes care of handling of the results for one single partition
@@ -39,16 +41,26 @@ class _DocumentProducer(object):
     When handling an orderby query, MultiExecutionContextAggregator instantiates
     one instance of this class per target partition key range and aggregates the
     result of each.
+
+    When an executor is given, pages are fetched on the executor and the next page
+    is prefetched while the current one is consumed, so at most one page is buffered
+    and one page is in flight for each partition key range.
     """
 
-    def __init__(self, partition_key_target_range, client, collection_link, query, document_producer_comp, options):
+    def __init__(self, partition_key_target_range, client, collection_link, query, document_producer_comp, options,
+                 executor=None, continuation=None):
         """
         Constructor
+
+        The continuation resumes the query of a partition key range that was split on one of its child ranges.
         """
-        self._options = options
+        # the continuation of each partition key range is kept in its own copy of the options
+        self._options = dict(options)
         self._partition_key_target_range = partition_key_target_range
         self._doc_producer_comp = document_producer_comp
         self._client = client
+        self._executor = executor
+        self._prefetched_page = None
         self._buffer = deque()
 
         self._is_finished = False
@@ -63,6 +75,15 @@ class _DocumentProducer(object):
             return self._client.QueryFeed(path, collection_id, query, options, partition_key_target_range["id"])
 
         self._ex_context = _DefaultQueryExecutionContext(client, self._options, fetch_fn)
+        self._ex_context._continuation = continuation
+
+    def get_continuation(self):
+        """Returns the continuation of the next page of the target partition key range.
+            :return:
+                The continuation, or None to read from the first page.
+            :rtype: str
+        """
+        return self._ex_context._continuation
 
     def get_target_range(self):
         """Returns the target partition key range.
@@ -87,7 +108,7 @@ class _DocumentProducer(object):
             self._cur_item = None
             return res
 
-        return next(self._ex_context)
+        return self._next_item()
 
     def __next__(self):
         # supports python 3 iterator
@@ -102,10 +123,34 @@ class _DocumentProducer(object):
 
         """
         if self._cur_item is None:
-            self._cur_item = next(self._ex_context)
+            self._cur_item = self._next_item()
 
         return self._cur_item
 
+    def prefetch(self):
+        """Starts fetching the next page on the executor, unless a page is
+        already being fetched or there are no more pages.
+        """
+        if self._executor is None or self._prefetched_page is not None:
+            return
+        if self._ex_context._has_more_pages():
+            self._prefetched_page = self._executor.submit(self._ex_context.fetch_next_block)
+
+    def _next_item(self):
+        if self._executor is None:
+            return next(self._ex_context)
+
+        self.prefetch()
+        while not self._buffer and self._prefetched_page is not None:
+            page = self._prefetched_page.result()
+            self._prefetched_page = None
+            self._buffer.extend(page)
+            self.prefetch()
+
+        if not self._buffer:
+            raise StopIteration
+        return self._buffer.popleft()
+
     def __lt__(self, other):
         return self._doc_producer_comp.compare(self, other) < 0
 
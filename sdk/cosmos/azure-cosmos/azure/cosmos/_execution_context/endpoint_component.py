@@ -22,10 +22,11 @@
 """Internal class for query execution endpoint component implementation in the
 Azure Cosmos database service.
 """
+from collections import OrderedDict
 import numbers
-import copy
+import sqlite3
 import hashlib
-import json
+import struct
 import six
 
 from azure.cosmos._execution_context.aggregators import (
@@ -34,9 +35,200 @@ from azure.cosmos._execution_context.aggregators import (
     _MaxAggregator,
     _MinAggregator,
     _SumAggregator,
+    _create_aggregator,
 )
 
 
+# The type tags of the canonical encoding of the results of a distinct query
+_NULL = b"\x00"
+_FALSE = b"\x01"
+_TRUE = b"\x02"
+_NUMBER = b"\x03"
+_STRING = b"\x04"
+_ARRAY = b"\x05"
+_OBJECT = b"\x06"
+
+_pack_number = struct.Struct("<d").pack
+_pack_length = struct.Struct("<I").pack
+
+
+def _write_string(value, parts):
+    encoded = value.encode("utf-8") if isinstance(value, six.text_type) else value
+    parts.append(_STRING + _pack_length(len(encoded)))
+    parts.append(encoded)
+
+
+def _write_number(value, parts):
+    # integers and floats of the same value are the same JSON number
+    parts.append(_NUMBER + _pack_number(float(value)))
+
+
+def _write_array(value, parts):
+    parts.append(_ARRAY + _pack_length(len(value)))
+    for item in value:
+        _write_canonical(item, parts)
+
+
+def _write_object(value, parts):
+    # the properties of equal objects may be in any order
+    parts.append(_OBJECT + _pack_length(len(value)))
+    for key in sorted(value):
+        _write_string(key, parts)
+        _write_canonical(value[key], parts)
+
+
+_WRITERS = {
+    type(None): lambda value, parts: parts.append(_NULL),
+    bool: lambda value, parts: parts.append(_TRUE if value else _FALSE),
+    float: _write_number,
+    dict: _write_object,
+    list: _write_array,
+    tuple: _write_array,
+}
+for _string_type in six.string_types + (six.text_type,):
+    _WRITERS[_string_type] = _write_string
+for _integer_type in six.integer_types:
+    _WRITERS[_integer_type] = _write_number
+
+
+def _write_canonical(value, parts):
+    """Appends the canonical encoding of a JSON value to a list of byte strings.
+
+    Equal values have the same encoding, and values of different JSON types have different ones.
+    """
+    writer = _WRITERS.get(type(value))
+    if writer is not None:
+        writer(value, parts)
+    elif isinstance(value, bool):
+        parts.append(_TRUE if value else _FALSE)
+    elif isinstance(value, numbers.Number):
+        _write_number(value, parts)
+    elif isinstance(value, six.string_types):
+        _write_string(value, parts)
+    elif isinstance(value, dict):
+        _write_object(value, parts)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        _write_array(value, parts)
+    else:
+        raise TypeError("Unsupported type in a distinct query result: {}".format(type(value).__name__))
+
+
+def _make_hash(value):
+    """Returns the digest of the canonical encoding of a JSON value."""
+    parts = []
+    _write_canonical(value, parts)
+    return hashlib.sha1(b"".join(parts)).digest()
+
+
+class _DistinctResultSet(object):
+    """The digests of the results returned by an unordered distinct query.
+
+    With a maximum number of digests in memory, the digests are moved to a temporary database on
+    disk whenever the maximum is reached, so the memory used doesn't grow with the results.
+    """
+
+    def __init__(self, max_in_memory=None):
+        self._max_in_memory = max_in_memory
+        self._digests = set()
+        self._spilled = None
+        self._spilled_count = 0
+
+    def __len__(self):
+        return len(self._digests) + self._spilled_count
+
+    def __contains__(self, digest):
+        if digest in self._digests:
+            return True
+        if self._spilled is None:
+            return False
+        return self._spilled.execute(
+            "SELECT 1 FROM digests WHERE digest = ?", (sqlite3.Binary(digest),)).fetchone() is not None
+
+    def add(self, digest):
+        self._digests.add(digest)
+        if self._max_in_memory and len(self._digests) >= self._max_in_memory:
+            self._spill()
+
+    def _spill(self):
+        if self._spilled is None:
+            # an empty name opens a temporary database, deleted when it is closed
+            self._spilled = sqlite3.connect("", check_same_thread=False)
+            self._spilled.execute("CREATE TABLE digests (digest BLOB PRIMARY KEY) WITHOUT ROWID")
+        self._spilled.executemany(
+            "INSERT OR IGNORE INTO digests VALUES (?)", [(sqlite3.Binary(digest),) for digest in self._digests])
+        self._spilled_count += len(self._digests)
+        self._digests.clear()
+
+    def close(self):
+        if self._spilled is not None:
+            self._spilled.close()
+            self._spilled = None
+
+
+_UNDEFINED = object()
+
+
+def _extract_aggregate_result(payload):
+    """Returns the partial aggregate in the payload of a group, or _UNDEFINED if the aggregate is undefined.
+    """
+    if isinstance(payload, list):
+        payload = payload[0] if payload else None
+    if isinstance(payload, dict):
+        if "item2" in payload:
+            return payload["item2"]
+        return payload.get("item", _UNDEFINED)
+    if payload is None:
+        return _UNDEFINED
+    return payload
+
+
+class _GroupByAggregation(object):
+    """The groups of a cross partition GROUP BY query.
+
+    The rewritten query returns, for each group found in a partition key range, the values of the GROUP BY
+    expressions and the partial aggregates of the group. The partial aggregates of the groups with the same
+    values are merged as they are received, so the memory used grows with the number of groups only.
+    """
+
+    def __init__(self, alias_to_aggregate_type, select_value=False, value_aggregate_type=None):
+        self._alias_to_aggregate_type = alias_to_aggregate_type or {}
+        self._select_value = select_value
+        self._value_aggregate_type = value_aggregate_type
+        self._groups = OrderedDict()
+
+    def add(self, result):
+        group = _make_hash(result.get("groupByItems", []))
+        aggregators = self._groups.get(group)
+        if aggregators is None:
+            aggregators = self._groups[group] = OrderedDict()
+        payload = result.get("payload")
+        if self._select_value:
+            self._aggregate(aggregators, None, self._value_aggregate_type, payload)
+        else:
+            for alias, value in payload.items():
+                self._aggregate(aggregators, alias, self._alias_to_aggregate_type.get(alias), value)
+
+    @staticmethod
+    def _aggregate(aggregators, alias, aggregate_type, value):
+        if aggregate_type is not None:
+            value = _extract_aggregate_result(value)
+            if value is _UNDEFINED:
+                return
+        aggregator = aggregators.get(alias)
+        if aggregator is None:
+            aggregator = aggregators[alias] = _create_aggregator(aggregate_type)
+        aggregator.aggregate(value)
+
+    def get_results(self):
+        """Returns a generator of the result of each group, in the order the groups were first received.
+        """
+        for aggregators in self._groups.values():
+            if not self._select_value:
+                yield dict((alias, aggregator.get_result()) for alias, aggregator in aggregators.items())
+            elif None in aggregators:
+                yield aggregators[None].get_result()
+
+
 class _QueryExecutionEndpointComponent(object):
     def __init__(self, execution_context):
         self._execution_context = execution_context
@@ -100,43 +292,27 @@ class _QueryExecutionDistinctOrderedEndpointComponent(_QueryExecutionEndpointCom
 class _QueryExecutionDistinctUnorderedEndpointComponent(_QueryExecutionEndpointComponent):
     """Represents an endpoint in handling distinct query.
 
-    It returns only those values not already returned.
+    It returns only those values not already returned, by keeping the digest of each returned value.
     """
-    def __init__(self, execution_context):
+    def __init__(self, execution_context, max_in_memory=None):
         super(_QueryExecutionDistinctUnorderedEndpointComponent, self).__init__(execution_context)
-        self.last_result = set()
-
-    def make_hash(self, value):
-        if isinstance(value, (set, tuple, list)):
-            return tuple([self.make_hash(v) for v in value])
-        if not isinstance(value, dict):
-            if isinstance(value, numbers.Number):
-                return float(value)
-            return value
-        new_value = copy.deepcopy(value)
-        for k, v in new_value.items():
-            new_value[k] = self.make_hash(v)
+        self.last_result = _DistinctResultSet(max_in_memory)
 
-        return tuple(frozenset(sorted(new_value.items())))
+    @staticmethod
+    def make_hash(value):
+        return _make_hash(value)
 
     def next(self):
-        res = next(self._execution_context)
-
-        json_repr = json.dumps(self.make_hash(res))
-        if six.PY3:
-            json_repr = json_repr.encode("utf-8")
-
-        hash_object = hashlib.sha1(json_repr)
-        hashed_result = hash_object.hexdigest()
-
-        while hashed_result in self.last_result:
+        try:
             res = next(self._execution_context)
-            json_repr = json.dumps(self.make_hash(res))
-            if six.PY3:
-                json_repr = json_repr.encode("utf-8")
-
-            hash_object = hashlib.sha1(json_repr)
-            hashed_result = hash_object.hexdigest()
+            hashed_result = self.make_hash(res)
+
+            while hashed_result in self.last_result:
+                res = next(self._execution_context)
+                hashed_result = self.make_hash(res)
+        except StopIteration:
+            self.last_result.close()
+            raise
         self.last_result.add(hashed_result)
         return res
 
@@ -160,6 +336,26 @@ class _QueryExecutionOffsetEndpointComponent(_QueryExecutionEndpointComponent):
         return next(self._execution_context)
 
 
+class _QueryExecutionGroupByEndpointComponent(_QueryExecutionEndpointComponent):
+    """Represents an endpoint in handling a cross partition GROUP BY query.
+
+    It merges the groups of all the partition key ranges, then returns one result per group.
+    """
+
+    def __init__(self, execution_context, alias_to_aggregate_type, select_value=False, aggregates=None):
+        super(_QueryExecutionGroupByEndpointComponent, self).__init__(execution_context)
+        value_aggregate_type = aggregates[0] if select_value and aggregates else None
+        self._groups = _GroupByAggregation(alias_to_aggregate_type, select_value, value_aggregate_type)
+        self._results = None
+
+    def next(self):
+        if self._results is None:
+            for res in self._execution_context:
+                self._groups.add(res)
+            self._results = self._groups.get_results()
+        return next(self._results)
+
+
 class _QueryExecutionAggregateEndpointComponent(_QueryExecutionEndpointComponent):
     """Represents an endpoint in handling aggregate query.
 
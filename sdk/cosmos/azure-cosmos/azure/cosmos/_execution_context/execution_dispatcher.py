@@ -26,6 +26,7 @@ Cosmos database service.
 import json
 from six.moves import xrange
 from azure.cosmos.exceptions import CosmosHttpResponseError
+from azure.cosmos._query_plan_cache import _is_stale_container_error
 from azure.cosmos._execution_context import multi_execution_aggregator
 from azure.cosmos._execution_context.base_execution_context import _QueryExecutionContextBase
 from azure.cosmos._execution_context.base_execution_context import _DefaultQueryExecutionContext
@@ -57,7 +58,7 @@ class _ProxyQueryExecutionContext(_QueryExecutionContextBase):  # pylint: disabl
     to _MultiExecutionContextAggregator
     """
 
-    def __init__(self, client, resource_link, query, options, fetch_function):
+    def __init__(self, client, resource_link, query, options, fetch_function, container_properties_provider=None):
         """
         Constructor
         """
@@ -67,6 +68,7 @@ class _ProxyQueryExecutionContext(_QueryExecutionContextBase):  # pylint: disabl
         self._resource_link = resource_link
         self._query = query
         self._fetch_function = fetch_function
+        self._container_properties_provider = container_properties_provider
 
     def next(self):
         """Returns the next query result.
@@ -77,17 +79,17 @@ class _ProxyQueryExecutionContext(_QueryExecutionContextBase):  # pylint: disabl
 
         """
         try:
+            try:
+                return next(self._execution_context)
+            except CosmosHttpResponseError as e:
+                if not _is_partitioned_execution_info(e):
+                    raise
+                self._switch_to_pipelined_execution_context()
+
             return next(self._execution_context)
         except CosmosHttpResponseError as e:
-            if _is_partitioned_execution_info(e):
-                query_to_use = self._query if self._query is not None else "Select * from root r"
-                query_execution_info = _PartitionedQueryExecutionInfo(self._client._GetQueryPlanThroughGateway
-                                                                      (query_to_use, self._resource_link))
-                self._execution_context = self._create_pipelined_execution_context(query_execution_info)
-            else:
-                raise e
-
-        return next(self._execution_context)
+            self._invalidate_query_plan(e)
+            raise
 
     def fetch_next_block(self):
         """Returns a block of results.
@@ -99,22 +101,38 @@ class _ProxyQueryExecutionContext(_QueryExecutionContextBase):  # pylint: disabl
         :rtype: list
         """
         try:
+            try:
+                return self._execution_context.fetch_next_block()
+            except CosmosHttpResponseError as e:
+                if not _is_partitioned_execution_info(e):
+                    raise
+                self._switch_to_pipelined_execution_context()
+
             return self._execution_context.fetch_next_block()
         except CosmosHttpResponseError as e:
-            if _is_partitioned_execution_info(e):
-                query_to_use = self._query if self._query is not None else "Select * from root r"
-                query_execution_info = _PartitionedQueryExecutionInfo(self._client._GetQueryPlanThroughGateway
-                                                                      (query_to_use, self._resource_link))
-                self._execution_context = self._create_pipelined_execution_context(query_execution_info)
-            else:
-                raise e
-
-        return self._execution_context.fetch_next_block()
+            self._invalidate_query_plan(e)
+            raise
+
+    def _switch_to_pipelined_execution_context(self):
+        query_to_use = self._query if self._query is not None else "Select * from root r"
+        container_properties = None
+        if self._container_properties_provider:
+            container_properties = self._container_properties_provider()
+        query_execution_info = _PartitionedQueryExecutionInfo(self._client._GetQueryPlanThroughGateway
+                                                              (query_to_use, self._resource_link,
+                                                               container_properties=container_properties))
+        self._execution_context = self._create_pipelined_execution_context(query_execution_info)
+
+    def _invalidate_query_plan(self, error):
+        # the cached plans of the container were planned for a container or ranges that no longer exist
+        if self._resource_link and _is_stale_container_error(error):
+            self._client._query_plan_cache.invalidate(self._resource_link)
 
     def _create_pipelined_execution_context(self, query_execution_info):
 
         assert self._resource_link, "code bug, resource_link is required."
-        if query_execution_info.has_aggregates() and not query_execution_info.has_select_value():
+        if (query_execution_info.has_aggregates() and not query_execution_info.has_select_value()
+                and not query_execution_info.has_group_by()):
             if self._options and ("enableCrossPartitionQuery" in self._options
                                   and self._options["enableCrossPartitionQuery"]):
                 raise CosmosHttpResponseError(StatusCodes.BAD_REQUEST,
@@ -149,7 +167,14 @@ class _PipelineExecutionContext(_QueryExecutionContextBase):  # pylint: disable=
             self._endpoint = endpoint_component._QueryExecutionOrderByEndpointComponent(self._endpoint)
 
         aggregates = query_execution_info.get_aggregates()
-        if aggregates:
+        if query_execution_info.has_group_by():
+            self._endpoint = endpoint_component._QueryExecutionGroupByEndpointComponent(
+                self._endpoint,
+                query_execution_info.get_group_by_alias_to_aggregate_type(),
+                query_execution_info.has_select_value(),
+                aggregates,
+            )
+        elif aggregates:
             self._endpoint = endpoint_component._QueryExecutionAggregateEndpointComponent(self._endpoint, aggregates)
 
         offset = query_execution_info.get_offset()
@@ -169,7 +194,8 @@ class _PipelineExecutionContext(_QueryExecutionContextBase):  # pylint: disable=
             if distinct_type == _DistinctType.Ordered:
                 self._endpoint = endpoint_component._QueryExecutionDistinctOrderedEndpointComponent(self._endpoint)
             else:
-                self._endpoint = endpoint_component._QueryExecutionDistinctUnorderedEndpointComponent(self._endpoint)
+                self._endpoint = endpoint_component._QueryExecutionDistinctUnorderedEndpointComponent(
+                    self._endpoint, options.get("maxDistinctResultsInMemory"))
 
     def next(self):
         """Returns the next query result.
@@ -23,6 +23,8 @@
 """
 
 import heapq
+from concurrent import futures
+from azure.cosmos import exceptions
 from azure.cosmos._execution_context.base_execution_context import _QueryExecutionContextBase
 from azure.cosmos._execution_context import document_producer
 from azure.cosmos._routing import routing_range
@@ -40,9 +42,16 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
     When handling an orderby query, _MultiExecutionContextAggregator
     instantiates one instance of DocumentProducer per target partition key range
     and aggregates the result of each.
-    """
 
-    # TODO improvement: this class needs to be parallelized
+    With the maxDegreeOfParallelism option, the pages of the document producers
+    are fetched concurrently on a thread pool of that size (or of one thread per
+    target partition key range when it is negative), and each producer prefetches
+    its next page while the merged results are consumed.
+
+    When a target partition key range is split while it is queried, the routing
+    map is refreshed and its document producer is replaced by document producers
+    on the child ranges, which resume from its continuation.
+    """
 
     class PriorityQueue:
         """Provides a Priority Queue abstraction data structure"""
@@ -64,6 +73,7 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
 
     def __init__(self, client, resource_link, query, options, partitioned_query_ex_info):
         super(_MultiExecutionContextAggregator, self).__init__(client, options)
+        self._executor = None
 
         # use the routing provider in the client
         self._routing_provider = client._routing_map_provider
@@ -80,27 +90,31 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
 
         # will be a list of (parition_min, partition_max) tuples
         targetPartitionRanges = self._get_target_parition_key_range()
+        self._executor = self._create_executor(len(targetPartitionRanges))
 
-        targetPartitionQueryExecutionContextList = []
-        for partitionTargetRange in targetPartitionRanges:
-            # create and add the child execution context for the target range
-            targetPartitionQueryExecutionContextList.append(
-                self._createTargetPartitionQueryExecutionContext(partitionTargetRange)
-            )
-
-        self._orderByPQ = _MultiExecutionContextAggregator.PriorityQueue()
+        try:
+            targetPartitionQueryExecutionContextList = []
+            for partitionTargetRange in targetPartitionRanges:
+                # create and add the child execution context for the target range
+                targetPartitionQueryExecutionContextList.append(
+                    self._createTargetPartitionQueryExecutionContext(partitionTargetRange)
+                )
 
-        for targetQueryExContext in targetPartitionQueryExecutionContextList:
+            self._orderByPQ = _MultiExecutionContextAggregator.PriorityQueue()
 
-            try:
-                # TODO: we can also use more_itertools.peekable to be more python friendly
-                targetQueryExContext.peek()
-                # if there are matching results in the target ex range add it to the priority queue
+            # start fetching the first page of every target range before waiting on any of them
+            for targetQueryExContext in targetPartitionQueryExecutionContextList:
+                targetQueryExContext.prefetch()
 
-                self._orderByPQ.push(targetQueryExContext)
+            for targetQueryExContext in targetPartitionQueryExecutionContextList:
+                self._push_document_producer(targetQueryExContext)
+        except BaseException:
+            self._shutdown_executor()
+            raise
 
-            except StopIteration:
-                continue
+    def __del__(self):
+        # the threads of an iterator that is abandoned before its last result are released when it is collected
+        self._shutdown_executor()
 
     def next(self):
         """Returns the next result
@@ -112,24 +126,59 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
         if self._orderByPQ.size() > 0:
 
             targetRangeExContext = self._orderByPQ.pop()
-            res = next(targetRangeExContext)
-
             try:
-                # TODO: we can also use more_itertools.peekable to be more python friendly
-                targetRangeExContext.peek()
-                self._orderByPQ.push(targetRangeExContext)
-
-            except StopIteration:
-                pass
-
+                res = next(targetRangeExContext)
+                self._push_document_producer(targetRangeExContext)
+            except BaseException:
+                self._shutdown_executor()
+                raise
             return res
+        self._shutdown_executor()
         raise StopIteration
 
+    def close(self):
+        """Stops fetching the results of the target partition key ranges and releases their threads."""
+        self._shutdown_executor()
+
     def fetch_next_block(self):
 
         raise NotImplementedError("You should use pipeline's fetch_next_block.")
 
-    def _createTargetPartitionQueryExecutionContext(self, partition_key_target_range):
+    def _push_document_producer(self, targetQueryExContext):
+        """Adds a document producer to the priority queue if it has more results.
+
+        If its partition key range is gone, the document producers of the child ranges are added instead.
+        """
+        try:
+            # TODO: we can also use more_itertools.peekable to be more python friendly
+            targetQueryExContext.peek()
+        except StopIteration:
+            return
+        except exceptions.CosmosHttpResponseError as e:
+            if not exceptions._partition_range_is_gone(e):
+                raise
+            child_contexts = self._create_child_query_execution_contexts(targetQueryExContext, e)
+            for child_context in child_contexts:
+                child_context.prefetch()
+            for child_context in child_contexts:
+                self._push_document_producer(child_context)
+            return
+        # if there are matching results in the target ex range add it to the priority queue
+        self._orderByPQ.push(targetQueryExContext)
+
+    def _create_child_query_execution_contexts(self, targetQueryExContext, error):
+        parent_range = targetQueryExContext.get_target_range()
+        self._routing_provider.refresh_routing_map(self._resource_link, parent_range["id"])
+        child_ranges = _get_child_ranges(parent_range, self._get_target_parition_key_range())
+        if any(r["id"] == parent_range["id"] for r in child_ranges):
+            # the partition key range is still in the routing map, so the query can't be resumed
+            raise error
+        return [
+            self._createTargetPartitionQueryExecutionContext(r, targetQueryExContext.get_continuation())
+            for r in child_ranges
+        ]
+
+    def _createTargetPartitionQueryExecutionContext(self, partition_key_target_range, continuation=None):
 
         rewritten_query = self._partitioned_query_ex_info.get_rewritten_query()
         if rewritten_query:
@@ -149,11 +198,35 @@ class _MultiExecutionContextAggregator(_QueryExecutionContextBase):
             query,
             self._document_producer_comparator,
             self._options,
+            self._executor,
+            continuation,
         )
 
+    def _create_executor(self, target_range_count):
+        max_degree_of_parallelism = self._options.get("maxDegreeOfParallelism")
+        if not max_degree_of_parallelism or max_degree_of_parallelism == 1 or target_range_count <= 1:
+            return None
+        if max_degree_of_parallelism < 0:
+            return futures.ThreadPoolExecutor(target_range_count)
+        return futures.ThreadPoolExecutor(min(max_degree_of_parallelism, target_range_count))
+
+    def _shutdown_executor(self):
+        if getattr(self, "_executor", None) is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
     def _get_target_parition_key_range(self):
 
         query_ranges = self._partitioned_query_ex_info.get_query_ranges()
         return self._routing_provider.get_overlapping_ranges(
             self._resource_link, [routing_range.Range.ParseFromDict(range_as_dict) for range_as_dict in query_ranges]
         )
+
+
+def _get_child_ranges(parent_range, target_ranges):
+    """Returns the target partition key ranges that overlap a partition key range that is gone."""
+    min_inclusive = parent_range[routing_range.PartitionKeyRange.MinInclusive]
+    max_exclusive = parent_range[routing_range.PartitionKeyRange.MaxExclusive]
+    return [r for r in target_ranges
+            if r[routing_range.PartitionKeyRange.MinInclusive] < max_exclusive
+            and min_inclusive < r[routing_range.PartitionKeyRange.MaxExclusive]]
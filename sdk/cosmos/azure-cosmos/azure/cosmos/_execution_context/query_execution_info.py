@@ -39,6 +39,8 @@ class _PartitionedQueryExecutionInfo(object):
     DistinctTypePath = [QueryInfoPath, "distinctType"]
     OrderByPath = [QueryInfoPath, "orderBy"]
     AggregatesPath = [QueryInfoPath, "aggregates"]
+    GroupByExpressionsPath = [QueryInfoPath, "groupByExpressions"]
+    GroupByAliasToAggregateTypePath = [QueryInfoPath, "groupByAliasToAggregateType"]
     QueryRangesPath = "queryRanges"
     RewrittenQueryPath = [QueryInfoPath, "rewrittenQuery"]
 
@@ -78,6 +80,16 @@ class _PartitionedQueryExecutionInfo(object):
         """
         return self._extract(_PartitionedQueryExecutionInfo.AggregatesPath)
 
+    def get_group_by_expressions(self):
+        """Returns GROUP BY expressions (if any) or None.
+        """
+        return self._extract(_PartitionedQueryExecutionInfo.GroupByExpressionsPath)
+
+    def get_group_by_alias_to_aggregate_type(self):
+        """Returns the aggregate function of each projection of a GROUP BY query (if any) or None.
+        """
+        return self._extract(_PartitionedQueryExecutionInfo.GroupByAliasToAggregateTypePath)
+
     def get_query_ranges(self):
         """Returns query partition ranges (if any) or None.
         """
@@ -115,6 +127,10 @@ class _PartitionedQueryExecutionInfo(object):
         aggregates = self.get_aggregates()
         return aggregates is not None and len(aggregates) > 0
 
+    def has_group_by(self):
+        group_by_expressions = self.get_group_by_expressions()
+        return group_by_expressions is not None and len(group_by_expressions) > 0
+
     def has_rewritten_query(self):
         return self.get_rewritten_query() is not None
 
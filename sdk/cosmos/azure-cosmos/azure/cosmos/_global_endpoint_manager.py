@@ -29,7 +29,7 @@ from six.moves.urllib.parse import urlparse
 
 from . import _constants as constants
 from . import exceptions
-from ._location_cache import LocationCache
+from ._location_cache import LocationCache, _EndpointLatencyTracker
 
 # pylint: disable=protected-access
 
@@ -52,10 +52,18 @@ class _GlobalEndpointManager(object):
             self.EnableEndpointDiscovery,
             client.connection_policy.UseMultipleWriteLocations,
             self.refresh_time_interval_in_ms,
+            latency_tracker=(
+                _EndpointLatencyTracker(client.connection_policy.LatencyRoutingToleranceInMs)
+                if client.connection_policy.EnableLatencyBasedRouting
+                else None
+            ),
         )
         self.refresh_needed = False
         self.refresh_lock = threading.RLock()
         self.last_refresh_time = 0
+        self.latency_probe_interval_in_ms = client.connection_policy.LatencyProbeIntervalInMs
+        self.last_latency_probe_time = 0
+        self.latency_probe_lock = threading.Lock()
 
     def get_refresh_time_interval_in_ms_stub(self):  # pylint: disable=no-self-use
         return constants._Constants.DefaultUnavailableLocationExpirationTime
@@ -81,6 +89,12 @@ class _GlobalEndpointManager(object):
     def get_ordered_read_endpoints(self):
         return self.location_cache.get_ordered_read_endpoints()
 
+    def record_latency(self, endpoint, latency_in_ms):
+        self.location_cache.record_latency(endpoint, latency_in_ms)
+
+    def get_read_endpoint_latencies(self):
+        return self.location_cache.get_read_endpoint_latencies()
+
     def can_use_multiple_write_locations(self, request):
         return self.location_cache.can_use_multiple_write_locations_for_request(request)
 
@@ -90,13 +104,16 @@ class _GlobalEndpointManager(object):
 
     def refresh_endpoint_list(self, database_account, **kwargs):
         with self.refresh_lock:
-            # if refresh is not needed or refresh is already taking place, return
-            if not self.refresh_needed:
-                return
-            try:
-                self._refresh_endpoint_list_private(database_account, **kwargs)
-            except Exception as e:
-                raise e
+            # if refresh is not needed or refresh is already taking place, don't refresh
+            if self.refresh_needed:
+                try:
+                    self._refresh_endpoint_list_private(database_account, **kwargs)
+                except Exception as e:
+                    raise e
+        if self._should_probe_latencies():
+            probe = threading.Thread(target=self._probe_latencies, name="cosmos-latency-probe")
+            probe.daemon = True
+            probe.start()
 
     def _refresh_endpoint_list_private(self, database_account=None, **kwargs):
         if database_account:
@@ -113,6 +130,47 @@ class _GlobalEndpointManager(object):
                 self.last_refresh_time = self.location_cache.current_time_millis()
                 self.refresh_needed = False
 
+    def _should_probe_latencies(self):
+        # there is nothing to choose from until the database account lists several read locations
+        if (
+            not self.location_cache.latency_tracker
+            or not self.latency_probe_interval_in_ms
+            or len(self.location_cache.preferred_read_endpoints) < 2
+        ):
+            return False
+        now = self.location_cache.current_time_millis()
+        with self.latency_probe_lock:
+            if now - self.last_latency_probe_time < self.latency_probe_interval_in_ms:
+                return False
+            self.last_latency_probe_time = now
+        return True
+
+    def _get_endpoints_to_probe(self):
+        """Returns the read endpoints that no request measured during the last probe interval."""
+        now = self.location_cache.current_time_millis()
+        endpoints = []
+        for endpoint in self.location_cache.preferred_read_endpoints:
+            last_sample_time = self.location_cache.latency_tracker.last_sample_time(endpoint)
+            if last_sample_time is None or now - last_sample_time >= self.latency_probe_interval_in_ms:
+                endpoints.append(endpoint)
+        return endpoints
+
+    def _probe_latencies(self):
+        for endpoint in self._get_endpoints_to_probe():
+            try:
+                # the latency of the probe is recorded like the latency of any other request
+                self._ProbeEndpointStub(endpoint)
+            except Exception:  # pylint: disable=broad-except
+                # endpoints that fail are marked unavailable by the requests they fail
+                pass
+
+    def _ProbeEndpointStub(self, endpoint):
+        """Stub for probing the latency of an endpoint with the client.
+
+        This can be used for mocking purposes as well.
+        """
+        self.Client.ProbeEndpoint(endpoint)
+
     def _GetDatabaseAccount(self, **kwargs):
         """Gets the database account.
 
@@ -0,0 +1,225 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Internal class for caching the items read by point reads in the Azure Cosmos
+database service.
+"""
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from . import _base
+from . import http_constants
+from ._session import SessionContainer
+from .partition_key import _Undefined, _Empty
+
+
+def _is_at_least(session_token, other):
+    """Returns whether a session token has made at least the progress of another one."""
+    if session_token.version < other.version or session_token.global_lsn < other.global_lsn:
+        return False
+    return all(
+        session_token.local_lsn_by_region.get(region_id, -1) >= local_lsn
+        for region_id, local_lsn in other.local_lsn_by_region.items()
+    )
+
+
+def _can_use_item_cache(options, session):
+    """Returns whether a point read with the given options can be served from the item cache.
+
+    The cache is only used with session consistency, and not for reads with their own access
+    condition, consistency level or session token.
+    """
+    if session is None:
+        return False
+    return not any(options.get(key) for key in ("accessCondition", "consistencyLevel", "sessionToken"))
+
+
+class _CachedItem(object):
+    """An item read by a point read, with the session token of the partition key range it was
+    read from.
+    """
+
+    __slots__ = ("item", "etag", "headers", "partition_key_range_id", "session_token", "expiry_time")
+
+    def __init__(self, item, headers, partition_key_range_id, session_token, expiry_time):
+        self.item = item
+        self.etag = item.get("_etag")
+        self.headers = headers
+        self.partition_key_range_id = partition_key_range_id
+        self.session_token = session_token
+        self.expiry_time = expiry_time
+
+    def get_item(self):
+        return copy.deepcopy(self.item)
+
+    def get_headers(self):
+        """Returns the headers of the read of the item, without the request charge of the read."""
+        headers = dict(self.headers)
+        headers[http_constants.HttpHeaders.RequestCharge] = "0"
+        return headers
+
+
+class _ItemCache(object):
+    """Least recently used cache of the items read by the point reads of a client, by container,
+    item id and partition key.
+
+    A cached item is returned without a request while it is younger than the time to live, and
+    while the session of the client has not seen a write to its partition key range after it was
+    read. Otherwise it is revalidated by a read conditional on its etag, which costs little when
+    the item has not changed. The items written by the client are removed from the cache.
+    """
+
+    def __init__(self, max_size, ttl_in_ms):
+        self._max_size = max_size
+        self._ttl = ttl_in_ms / 1000.0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return bool(self._max_size)
+
+    @staticmethod
+    def _get_collection_id(link):
+        return _base.GetResourceIdOrFullNameFromLink(_base.GetItemContainerLink(link))
+
+    @staticmethod
+    def _get_key(document_link, partition_key):
+        if isinstance(partition_key, (_Undefined, _Empty)):
+            partition_key = partition_key.__class__.__name__
+        else:
+            partition_key = json.dumps(partition_key, sort_keys=True)
+        item_id = _base.TrimBeginningAndEndingSlashes(document_link).split("/")[-1]
+        return _ItemCache._get_collection_id(document_link), item_id, partition_key
+
+    def get(self, document_link, partition_key):
+        """Returns the cached item of a point read, or None.
+
+        Only the items of name based links are cached.
+
+        :param str document_link: The link to the item.
+        :param partition_key: The partition key of the item.
+        :rtype: _CachedItem
+        """
+        if not self._max_size or not _base.IsNameBased(document_link):
+            return None
+        key = self._get_key(document_link, partition_key)
+        with self._lock:
+            cached_item = self._items.pop(key, None)
+            if cached_item is not None:
+                self._items[key] = cached_item
+            return cached_item
+
+    def is_fresh(self, cached_item, session, document_link):
+        """Returns whether a cached item can be returned without revalidating it.
+
+        :param _CachedItem cached_item: The cached item.
+        :param _session.Session session: The session of the client.
+        :param str document_link: The link to the item.
+        :rtype: bool
+        """
+        if time.time() >= cached_item.expiry_time:
+            return False
+        session_token = session.get_partition_session_token(document_link, cached_item.partition_key_range_id)
+        return session_token is None or _is_at_least(cached_item.session_token, session_token)
+
+    def set(self, document_link, partition_key, item, headers):
+        """Caches the item of a point read, evicting the least recently used item if the cache is full.
+
+        :param str document_link: The link to the item.
+        :param partition_key: The partition key of the item.
+        :param dict item: The item returned by the read.
+        :param dict headers: The response headers of the read.
+        """
+        if not self._max_size or not item or not item.get("_etag") or not _base.IsNameBased(document_link):
+            return
+        session_tokens = SessionContainer.parse_session_token(headers)
+        if len(session_tokens) != 1:
+            return
+        partition_key_range_id, session_token = next(iter(session_tokens.items()))
+        cached_item = _CachedItem(
+            copy.deepcopy(item), dict(headers), partition_key_range_id, session_token, time.time() + self._ttl)
+        key = self._get_key(document_link, partition_key)
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = cached_item
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+
+    def refresh(self, cached_item, headers):
+        """Renews a cached item after a read conditional on its etag found it unchanged.
+
+        :param _CachedItem cached_item: The cached item.
+        :param dict headers: The response headers of the conditional read.
+        """
+        session_token = SessionContainer.parse_session_token(headers).get(cached_item.partition_key_range_id)
+        with self._lock:
+            if session_token is not None:
+                cached_item.session_token = session_token
+            cached_item.expiry_time = time.time() + self._ttl
+
+    def invalidate(self, link, item_ids=None):
+        """Removes cached items of a container.
+
+        Every item is removed for a link that isn't the name based link of a container or an item,
+        since it can't be matched with the cached items.
+
+        :param str link: The link to the container, or to the item.
+        :param list[str] item_ids: The ids of the items to remove, all the items of the container
+            when not given.
+        """
+        if not self._max_size:
+            return
+        try:
+            collection_id = self._get_collection_id(link) if _base.IsNameBased(link) else None
+        except ValueError:
+            collection_id = None
+        with self._lock:
+            if collection_id is None:
+                self._items.clear()
+                return
+            for key in [key for key in self._items
+                        if key[0] == collection_id and (item_ids is None or key[1] in item_ids)]:
+                del self._items[key]
+
+    def invalidate_item(self, document_link):
+        """Removes the cached item of a link, for all its partition keys.
+
+        :param str document_link: The link to the item.
+        """
+        item_id = _base.TrimBeginningAndEndingSlashes(document_link).split("/")[-1]
+        self.invalidate(document_link, [item_id])
+
+    def invalidate_batch(self, collection_link, batch_body):
+        """Removes the cached items of the operations of a transactional batch.
+
+        :param str collection_link: The link to the container.
+        :param str batch_body: The operations of the batch, serialized in the batch format of the service.
+        """
+        if not self._max_size:
+            return
+        item_ids = [operation.get("id") or (operation.get("resourceBody") or {}).get("id")
+                    for operation in json.loads(batch_body)]
+        self.invalidate(collection_link, item_ids)
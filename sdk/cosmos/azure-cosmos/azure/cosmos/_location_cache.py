@@ -23,6 +23,7 @@
 DatabaseAccount with multiple writable and readable locations.
 """
 import collections
+import threading
 import time
 
 from . import documents
@@ -55,7 +56,69 @@ def get_endpoint_by_location(locations):
     return endpoints_by_location, parsed_locations
 
 
+class _EndpointLatencyTracker(object):
+    """Tracks the latency of the recent requests to each endpoint, and orders endpoints by it.
+
+    An endpoint is scored by the mean of the median and the 99th percentile of its recent latencies,
+    so that both typical and tail latency count. Endpoints are ordered by preference, except that an
+    endpoint is moved ahead of the more preferred ones whose score is more than the tolerance above
+    its own. Endpoints with too few recent samples, like endpoints that fail their probes, come after
+    the measured ones.
+    """
+
+    def __init__(self, tolerance_in_ms, window_size=100, min_sample_count=5, sample_expiration_in_ms=5 * 60 * 1000):
+        self.tolerance_in_ms = tolerance_in_ms
+        self.window_size = window_size
+        self.min_sample_count = min_sample_count
+        self.sample_expiration_in_ms = sample_expiration_in_ms
+        self._samples_by_endpoint = {}
+        self._lock = threading.Lock()
+
+    def add(self, endpoint, latency_in_ms, now):
+        with self._lock:
+            samples = self._samples_by_endpoint.get(endpoint)
+            if samples is None:
+                samples = self._samples_by_endpoint[endpoint] = collections.deque(maxlen=self.window_size)
+            samples.append((now, latency_in_ms))
+
+    def last_sample_time(self, endpoint):
+        with self._lock:
+            samples = self._samples_by_endpoint.get(endpoint)
+            return samples[-1][0] if samples else None
+
+    def get_latency(self, endpoint, now):
+        """Returns the median and 99th percentile of the unexpired latencies of the endpoint, and their count."""
+        with self._lock:
+            samples = self._samples_by_endpoint.get(endpoint, ())
+            latencies = sorted(latency for time_stamp, latency in samples
+                               if now - time_stamp <= self.sample_expiration_in_ms)
+        if not latencies:
+            return None, None, 0
+        return (latencies[(len(latencies) - 1) // 2],
+                latencies[min(int(len(latencies) * 0.99), len(latencies) - 1)],
+                len(latencies))
+
+    def order(self, endpoints, now):
+        scores = {}
+        for endpoint in endpoints:
+            p50, p99, count = self.get_latency(endpoint, now)
+            scores[endpoint] = (p50 + p99) / 2.0 if count >= self.min_sample_count else None
+        ordered = []
+        remaining = list(endpoints)
+        while remaining:
+            measured = [scores[endpoint] for endpoint in remaining if scores[endpoint] is not None]
+            best = min(measured) if measured else None
+            endpoint = next(e for e in remaining
+                            if best is None or (scores[e] is not None and scores[e] <= best + self.tolerance_in_ms))
+            ordered.append(endpoint)
+            remaining.remove(endpoint)
+        return ordered
+
+
 class LocationCache(object):  # pylint: disable=too-many-public-methods,too-many-instance-attributes
+    # the read endpoints are ordered by latency again at most this often
+    latency_ordering_interval_in_ms = 1000
+
     def current_time_millis(self):  # pylint: disable=no-self-use
         return int(round(time.time() * 1000))
 
@@ -66,6 +129,7 @@ class LocationCache(object):  # pylint: disable=too-many-public-methods,too-many
         enable_endpoint_discovery,
         use_multiple_write_locations,
         refresh_time_interval_in_ms,
+        latency_tracker=None,
     ):
         self.preferred_locations = preferred_locations
         self.default_endpoint = default_endpoint
@@ -81,6 +145,10 @@ class LocationCache(object):  # pylint: disable=too-many-public-methods,too-many
         self.available_write_endpoint_by_locations = {}
         self.available_write_locations = []
         self.available_read_locations = []
+        # with a latency tracker the available read endpoints are ordered by latency, within its tolerance
+        self.latency_tracker = latency_tracker
+        self.preferred_read_endpoints = self.read_endpoints
+        self.last_latency_ordering_time_stamp = 0
 
     def check_and_update_cache(self):
         if (
@@ -95,6 +163,10 @@ class LocationCache(object):  # pylint: disable=too-many-public-methods,too-many
 
     def get_read_endpoints(self):
         self.check_and_update_cache()
+        if self.latency_tracker and (
+            self.current_time_millis() - self.last_latency_ordering_time_stamp > self.latency_ordering_interval_in_ms
+        ):
+            self.read_endpoints = self.order_read_endpoints_by_latency(self.preferred_read_endpoints)
         return self.read_endpoints
 
     def get_write_endpoint(self):
@@ -122,6 +194,28 @@ class LocationCache(object):  # pylint: disable=too-many-public-methods,too-many
     def get_ordered_read_endpoints(self):
         return self.available_read_locations
 
+    def record_latency(self, endpoint, latency_in_ms):
+        if self.latency_tracker:
+            self.latency_tracker.add(endpoint, latency_in_ms, self.current_time_millis())
+
+    def order_read_endpoints_by_latency(self, endpoints):
+        now = self.current_time_millis()
+        self.last_latency_ordering_time_stamp = now
+        # unavailable endpoints stay last, whatever their latency
+        available = [e for e in endpoints if not self.is_endpoint_unavailable(e, EndpointOperationType.ReadType)]
+        return self.latency_tracker.order(available, now) + [e for e in endpoints if e not in available]
+
+    def get_read_endpoint_latencies(self):
+        """Returns the read endpoints in the order they are used, with their recent latencies."""
+        now = self.current_time_millis()
+        latencies = []
+        for endpoint in self.get_read_endpoints():
+            p50, p99, count = (
+                self.latency_tracker.get_latency(endpoint, now) if self.latency_tracker else (None, None, 0)
+            )
+            latencies.append({"endpoint": endpoint, "p50": p50, "p99": p99, "sampleCount": count})
+        return latencies
+
     def resolve_service_endpoint(self, request):
         if request.location_endpoint_to_route:
             return request.location_endpoint_to_route
@@ -268,12 +362,14 @@ class LocationCache(object):  # pylint: disable=too-many-public-methods,too-many
             EndpointOperationType.WriteType,
             self.default_endpoint,
         )
-        self.read_endpoints = self.get_preferred_available_endpoints(
+        self.preferred_read_endpoints = self.read_endpoints = self.get_preferred_available_endpoints(
             self.available_read_endpoint_by_locations,
             self.available_read_locations,
             EndpointOperationType.ReadType,
             self.write_endpoints[0],
         )
+        if self.latency_tracker:
+            self.read_endpoints = self.order_read_endpoints_by_latency(self.preferred_read_endpoints)
         self.last_cache_update_timestamp = self.current_time_millis()  # pylint: disable=attribute-defined-outside-init
 
     def get_preferred_available_endpoints(
@@ -43,6 +43,7 @@ class QueryIterable(PageIterator):
         database_link=None,
         partition_key=None,
         continuation_token=None,
+        container_properties_provider=None,
     ):
         """Instantiates a QueryIterable for non-client side partitioning queries.
 
@@ -55,6 +56,7 @@ class QueryIterable(PageIterator):
         :param method fetch_function:
         :param method resource_type: The type of the resource being queried
         :param str resource_link: If this is a Document query/feed collection_link is required.
+        :param method container_properties_provider: Returns the properties of the queried container.
 
         Example of `fetch_function`:
 
@@ -73,7 +75,8 @@ class QueryIterable(PageIterator):
         self._database_link = database_link
         self._partition_key = partition_key
         self._ex_context = execution_dispatcher._ProxyQueryExecutionContext(
-            self._client, self._collection_link, self._query, self._options, self._fetch_function
+            self._client, self._collection_link, self._query, self._options, self._fetch_function,
+            container_properties_provider
         )
         super(QueryIterable, self).__init__(self._fetch_next, self._unpack, continuation_token=continuation_token)
 
@@ -0,0 +1,153 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Internal class for caching the query plans of queries in the Azure Cosmos
+database service.
+"""
+
+import json
+import re
+import threading
+from collections import OrderedDict
+
+from . import _base
+from . import exceptions
+from .http_constants import StatusCodes, SubStatusCodes
+
+# The string literals, whitespace and other text of a query
+_QUERY_TOKEN = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|\s+|[^'\"\s]+|['\"]")
+_FULL_RANGE = {"min": "", "max": "FF", "isMinInclusive": True, "isMaxInclusive": False}
+
+
+def _normalize_query_text(query_text):
+    """Collapses the whitespace of a query outside of its string literals."""
+    tokens = _QUERY_TOKEN.findall(query_text)
+    return "".join(" " if token.isspace() else token for token in tokens).strip()
+
+
+def _is_parameter_independent(query_plan):
+    """Returns whether a query plan holds for any value of the parameters of its query.
+
+    The parameter values are resolved by the gateway in the ranges a query targets and in its
+    top, offset and limit; a plan targeting all the ranges without them is valid for any value.
+    """
+    query_info = query_plan.get("queryInfo") or {}
+    if any(query_info.get(key) is not None for key in ("top", "offset", "limit")):
+        return False
+    return query_plan.get("queryRanges") == [_FULL_RANGE]
+
+
+class _QueryPlanCache(object):
+    """Least recently used cache of the query plans of the queries of a client, by container
+    resource id and normalized query text.
+
+    The plan of a parameterized query is cached for its parameter values, unless it does not
+    depend on them. Each plan is stored with the partition key definition of its container, and
+    is dropped when the container has another partition key definition. Containers are keyed by
+    resource id, so the plans of a container are not used for a container recreated with the same
+    name; they are also dropped by link when the name of the container no longer resolves to it.
+    """
+
+    def __init__(self, max_size):
+        self._max_size = max_size
+        # (resource id, query text, parameters) -> (container link, partition key definition, query plan)
+        self._query_plans = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_keys(collection_rid, query):
+        if isinstance(query, dict):
+            query_text = _normalize_query_text(query.get("query", ""))
+            parameters = query.get("parameters")
+        else:
+            query_text = _normalize_query_text(query)
+            parameters = None
+        key = (collection_rid, query_text, None)
+        if not parameters:
+            return key, key
+        return key, (collection_rid, query_text, json.dumps(parameters, sort_keys=True))
+
+    def get(self, collection_properties, query):
+        """Returns the cached plan of a query, or None.
+
+        :param dict collection_properties: The properties of the container the query targets, with
+            its resource id and partition key definition.
+        :param (str or dict) query: The query, with its parameters.
+        :rtype: dict
+        """
+        if not self._max_size or not collection_properties:
+            return None
+        partition_key_definition = collection_properties.get("partitionKey")
+        with self._lock:
+            for key in self._get_keys(collection_properties.get("_rid"), query):
+                entry = self._query_plans.pop(key, None)
+                if entry is None:
+                    continue
+                if entry[1] != partition_key_definition:
+                    # the partition key definition changed, the query ranges of the plan no longer hold
+                    continue
+                self._query_plans[key] = entry
+                return entry[2]
+        return None
+
+    def set(self, collection_link, collection_properties, query, query_plan):
+        """Caches the plan of a query, evicting the least recently used plan if the cache is full.
+
+        Plans are only cached when the resource id of their container is known.
+
+        :param str collection_link: The link to the container the query targets.
+        :param dict collection_properties: The properties of the container the query targets, with
+            its resource id and partition key definition.
+        :param (str or dict) query: The query, with its parameters.
+        :param dict query_plan: The query plan returned by the gateway.
+        """
+        if not self._max_size or not collection_properties or not collection_properties.get("_rid"):
+            return
+        parameter_independent_key, key = self._get_keys(collection_properties["_rid"], query)
+        if _is_parameter_independent(query_plan):
+            key = parameter_independent_key
+        entry = (
+            _base.GetResourceIdOrFullNameFromLink(collection_link),
+            collection_properties.get("partitionKey"),
+            query_plan,
+        )
+        with self._lock:
+            self._query_plans.pop(key, None)
+            self._query_plans[key] = entry
+            while len(self._query_plans) > self._max_size:
+                self._query_plans.popitem(last=False)
+
+    def invalidate(self, collection_link):
+        """Removes the cached plans of the queries of a container.
+
+        :param str collection_link: The link to the container.
+        """
+        collection_id = _base.GetResourceIdOrFullNameFromLink(collection_link)
+        with self._lock:
+            for key in [key for key, entry in self._query_plans.items() if entry[0] == collection_id]:
+                del self._query_plans[key]
+
+
+def _is_stale_container_error(error):
+    """Whether a query failed because the container or the partition key ranges it was planned for changed."""
+    return (
+        error.status_code == StatusCodes.NOT_FOUND and error.sub_status == SubStatusCodes.NAME_CACHE_IS_STALE
+    ) or exceptions._partition_range_is_gone(error)  # pylint: disable=protected-access
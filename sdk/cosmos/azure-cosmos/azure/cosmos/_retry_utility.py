@@ -27,6 +27,7 @@ import time
 from azure.core.exceptions import AzureError, ClientAuthenticationError
 from azure.core.pipeline.policies import RetryPolicy
 
+from . import diagnostics
 from . import exceptions
 from . import _endpoint_discovery_retry_policy
 from . import _resource_throttle_retry_policy
@@ -65,6 +66,11 @@ def Execute(client, global_endpoint_manager, function, *args, **kwargs):
     sessionRetry_policy = _session_retry_policy._SessionRetryPolicy(
         client.connection_policy.EnableEndpointDiscovery, global_endpoint_manager, *args
     )
+    # only the requests to the service are recorded, a single check keeps the overhead negligible without a collector
+    diagnostics_collector = client.connection_policy.DiagnosticsCollector if args else None
+    if diagnostics_collector is not None:
+        operation_start_time = time.time()
+        request_charge = 0.0
     while True:
         try:
             client_timeout = kwargs.get('timeout')
@@ -73,6 +79,11 @@ def Execute(client, global_endpoint_manager, function, *args, **kwargs):
                 result = ExecuteFunction(function, global_endpoint_manager, *args, **kwargs)
             else:
                 result = ExecuteFunction(function, *args, **kwargs)
+            if diagnostics_collector is not None:
+                request_charge += diagnostics._request_charge(result[1])
+                diagnostics._record_request(
+                    diagnostics_collector, args, operation_start_time, request_charge,
+                    (endpointDiscovery_retry_policy, resourceThrottle_retry_policy, sessionRetry_policy))
             if not client.last_response_headers:
                 client.last_response_headers = {}
 
@@ -86,6 +97,8 @@ def Execute(client, global_endpoint_manager, function, *args, **kwargs):
 
             return result
         except exceptions.CosmosHttpResponseError as e:
+            if diagnostics_collector is not None:
+                request_charge += diagnostics._request_charge(e.headers)
             retry_policy = None
             if e.status_code == StatusCodes.FORBIDDEN and e.sub_status == SubStatusCodes.WRITE_FORBIDDEN:
                 retry_policy = endpointDiscovery_retry_policy
@@ -114,6 +127,10 @@ def Execute(client, global_endpoint_manager, function, *args, **kwargs):
                 ] = resourceThrottle_retry_policy.cummulative_wait_time_in_milliseconds
                 if args and args[0].should_clear_session_token_on_session_read_failure:
                     client.session.clear_session_token(client.last_response_headers)
+                if diagnostics_collector is not None:
+                    diagnostics._record_request(
+                        diagnostics_collector, args, operation_start_time, request_charge,
+                        (endpointDiscovery_retry_policy, resourceThrottle_retry_policy, sessionRetry_policy), e)
                 raise
 
             # Wait for retry_after_in_milliseconds time before the next retry
@@ -121,7 +138,20 @@ def Execute(client, global_endpoint_manager, function, *args, **kwargs):
             if client_timeout:
                 kwargs['timeout'] = client_timeout - (time.time() - start_time)
                 if kwargs['timeout'] <= 0:
-                    raise exceptions.CosmosClientTimeoutError()
+                    timeout_error = exceptions.CosmosClientTimeoutError()
+                    if diagnostics_collector is not None:
+                        diagnostics._record_request(
+                            diagnostics_collector, args, operation_start_time, request_charge,
+                            (endpointDiscovery_retry_policy, resourceThrottle_retry_policy, sessionRetry_policy),
+                            timeout_error)
+                    raise timeout_error
+        except Exception as e:  # pylint: disable=broad-except
+            # errors raised before a response is received, e.g. connection errors and client timeouts
+            if diagnostics_collector is not None:
+                diagnostics._record_request(
+                    diagnostics_collector, args, operation_start_time, request_charge,
+                    (endpointDiscovery_retry_policy, resourceThrottle_retry_policy, sessionRetry_policy), e)
+            raise
 
 
 def ExecuteFunction(function, *args, **kwargs):
@@ -0,0 +1,222 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Internal class for partition key range cache implementation in the Azure
+Cosmos database service, for use with the asyncio client.
+"""
+
+import asyncio
+
+from ... import _base
+from ... import http_constants
+from ..collection_routing_map import CollectionRoutingMap
+from .. import routing_range
+from .. import routing_map_provider
+from ..routing_map_provider import (
+    _is_sorted_and_non_overlapping,
+    _partition_key_ranges_feed_options,
+    _subtract_range,
+)
+
+# pylint: disable=protected-access
+
+
+class PartitionKeyRangeCache(object):
+    """
+    PartitionKeyRangeCache provides list of effective partition key ranges for a
+    collection.
+
+    This implementation loads and caches the collection routing map per
+    collection on demand. When a partition key range is gone, the routing map
+    is refreshed with the partition key ranges changed since it was loaded.
+    """
+
+    def __init__(self, client):
+        """
+        Constructor
+        """
+
+        self._documentClient = client
+
+        # keeps the cached collection routing map by collection id
+        self._collection_routing_map_by_item = {}
+        # created on the first refresh, on the event loop of the client
+        self._refresh_lock = None
+
+    async def get_overlapping_ranges(self, collection_link, partition_key_ranges):
+        """Given a partition key range and a collection, return the list of
+        overlapping partition key ranges.
+
+        :param str collection_link: The name of the collection.
+        :param list partition_key_range: List of partition key range.
+        :return: List of overlapping partition key ranges.
+        :rtype: list
+        """
+        collection_routing_map = await self.get_routing_map(collection_link)
+        return collection_routing_map.get_overlapping_ranges(partition_key_ranges)
+
+    async def get_routing_map(self, collection_link):
+        """Return the routing map of a collection, loading it on the first call.
+
+        :param str collection_link: The name of the collection.
+        :return: The routing map of the collection.
+        :rtype: ~azure.cosmos._routing.collection_routing_map.CollectionRoutingMap
+        """
+        collection_id = _base.GetResourceIdOrFullNameFromLink(collection_link)
+
+        collection_routing_map = self._collection_routing_map_by_item.get(collection_id)
+        if collection_routing_map is None:
+            collection_routing_map = await self._load_routing_map(collection_link, collection_id)
+            self._collection_routing_map_by_item[collection_id] = collection_routing_map
+        return collection_routing_map
+
+    async def refresh_routing_map(self, collection_link, gone_partition_key_range_id=None):
+        """Refresh the routing map of a collection after a partition key range is gone, and return it.
+
+        Only the partition key ranges changed since the routing map was loaded are read, and the
+        refreshed routing map replaces the cached one at once. The routing map isn't refreshed if
+        the gone partition key range was already removed from it by another refresh.
+
+        :param str collection_link: The name of the collection.
+        :param str gone_partition_key_range_id: The id of the partition key range that is gone.
+        :return: The refreshed routing map of the collection.
+        :rtype: ~azure.cosmos._routing.collection_routing_map.CollectionRoutingMap
+        """
+        collection_id = _base.GetResourceIdOrFullNameFromLink(collection_link)
+
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            previous_routing_map = self._collection_routing_map_by_item.get(collection_id)
+            if (
+                previous_routing_map is not None
+                and gone_partition_key_range_id is not None
+                and previous_routing_map.get_range_by_partition_key_range_id(gone_partition_key_range_id) is None
+            ):
+                return previous_routing_map
+            collection_routing_map = await self._load_routing_map(collection_link, collection_id, previous_routing_map)
+            self._collection_routing_map_by_item[collection_id] = collection_routing_map
+        return collection_routing_map
+
+    async def _load_routing_map(self, collection_link, collection_id, previous_routing_map=None):
+        if previous_routing_map is not None and previous_routing_map.change_feed_next_if_none_match:
+            changed_pk_ranges, etag = await self._read_partition_key_ranges(
+                collection_link, previous_routing_map.change_feed_next_if_none_match)
+            collection_routing_map = previous_routing_map.try_combine(changed_pk_ranges, etag)
+            if collection_routing_map is not None:
+                return collection_routing_map
+
+        collection_pk_ranges, etag = await self._read_partition_key_ranges(collection_link)
+        # for large collections, a split may complete between the read partition key ranges query page responses,
+        # causing the partitionKeyRanges to have both the children ranges and their parents. Therefore, we need
+        # to discard the parent ranges to have a valid routing map.
+        collection_pk_ranges = routing_map_provider.PartitionKeyRangeCache._discard_parent_ranges(collection_pk_ranges)
+        return CollectionRoutingMap.CompleteRoutingMap([(r, True) for r in collection_pk_ranges], collection_id, etag)
+
+    async def _read_partition_key_ranges(self, collection_link, if_none_match=None):
+        """Read the partition key ranges of a collection from their change feed.
+
+        :param str collection_link: The name of the collection.
+        :param str if_none_match: The ETag to read the changes from, or None to read all the ranges.
+        :return: The partition key ranges, and the ETag to read the next changes from.
+        :rtype: tuple[list, str]
+        """
+        feed_options = _partition_key_ranges_feed_options(if_none_match)
+        etag = if_none_match
+
+        def capture_etag(response_headers, _):
+            nonlocal etag
+            etag = response_headers.get(http_constants.HttpHeaders.ETag) or etag
+
+        collection_pk_ranges = [
+            r async for r in self._documentClient._ReadPartitionKeyRanges(
+                collection_link, feed_options, response_hook=capture_etag)
+        ]
+        return collection_pk_ranges, etag
+
+
+class SmartRoutingMapProvider(PartitionKeyRangeCache):
+    """
+    Efficiently uses PartitionKeyRangeCach and minimizes the unnecessary
+    invocation of CollectionRoutingMap.get_overlapping_ranges()
+    """
+
+    async def get_overlapping_ranges(self, collection_link, partition_key_ranges):
+        """
+        Given the sorted ranges and a collection,
+        Returns the list of overlapping partition key ranges
+
+        :param str collection_link: The collection link.
+        :param (list of routing_range.Range) partition_key_ranges:
+            The sorted list of non-overlapping ranges.
+        :return: List of partition key ranges.
+        :rtype: list of dict
+        :raises ValueError:
+            If two ranges in partition_key_ranges overlap or if the list is not sorted
+        """
+
+        # validate if the list is non-overlapping and sorted
+        if not _is_sorted_and_non_overlapping(partition_key_ranges):
+            raise ValueError("the list of ranges is not a non-overlapping sorted ranges")
+
+        target_partition_key_ranges = []
+
+        it = iter(partition_key_ranges)
+        try:
+            currentProvidedRange = next(it)
+            while True:
+                if currentProvidedRange.isEmpty():
+                    # skip and go to the next item\
+                    currentProvidedRange = next(it)
+                    continue
+
+                if target_partition_key_ranges:
+                    queryRange = _subtract_range(currentProvidedRange, target_partition_key_ranges[-1])
+                else:
+                    queryRange = currentProvidedRange
+
+                overlappingRanges = await PartitionKeyRangeCache.get_overlapping_ranges(
+                    self, collection_link, queryRange)
+                assert overlappingRanges, "code bug: returned overlapping ranges for queryRange {} is empty".format(
+                    queryRange
+                )
+                target_partition_key_ranges.extend(overlappingRanges)
+
+                lastKnownTargetRange = routing_range.Range.PartitionKeyRangeToRange(target_partition_key_ranges[-1])
+
+                # the overlapping ranges must contain the requested range
+                assert (
+                    currentProvidedRange.max <= lastKnownTargetRange.max
+                ), "code bug: returned overlapping ranges {} does not contain the requested range {}".format(
+                    overlappingRanges, queryRange
+                )
+
+                # the current range is contained in target_partition_key_ranges just move forward
+                currentProvidedRange = next(it)
+
+                while currentProvidedRange.max <= lastKnownTargetRange.max:
+                    # the current range is covered too. just move forward
+                    currentProvidedRange = next(it)
+        except StopIteration:
+            # when the iteration is exhausted we get here. There is nothing else to be done
+            pass
+
+        return target_partition_key_ranges
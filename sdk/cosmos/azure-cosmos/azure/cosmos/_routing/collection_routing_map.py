@@ -40,7 +40,8 @@ class CollectionRoutingMap(object):
     MaximumExclusiveEffectivePartitionKey = "FF"
 
     def __init__(
-        self, range_by_id, range_by_info, ordered_partition_key_ranges, ordered_partition_info, collection_unique_id
+        self, range_by_id, range_by_info, ordered_partition_key_ranges, ordered_partition_info, collection_unique_id,
+        change_feed_next_if_none_match=None
     ):
         self._rangeById = range_by_id
         self._rangeByInfo = range_by_info
@@ -50,11 +51,17 @@ class CollectionRoutingMap(object):
             routing_range.Range(pkr[PartitionKeyRange.MinInclusive], pkr[PartitionKeyRange.MaxExclusive], True, False)
             for pkr in ordered_partition_key_ranges
         ]
+        # The lower bounds of the ranges, for the binary search of the range of an effective partition key
+        self._orderedRangeLows = [(r.min, not r.isMinInclusive) for r in self._orderedRanges]
         self._orderedPartitionInfo = ordered_partition_info
         self._collectionUniqueId = collection_unique_id
+        # The ETag to read the partition key ranges changed since the routing map was loaded
+        self.change_feed_next_if_none_match = change_feed_next_if_none_match
 
     @classmethod
-    def CompleteRoutingMap(cls, partition_key_range_info_tupple_list, collection_unique_id):
+    def CompleteRoutingMap(
+        cls, partition_key_range_info_tupple_list, collection_unique_id, change_feed_next_if_none_match=None
+    ):
         rangeById = {}
         rangeByInfo = {}
 
@@ -70,7 +77,40 @@ class CollectionRoutingMap(object):
 
         if not CollectionRoutingMap.is_complete_set_of_range(partitionKeyOrderedRange):
             return None
-        return cls(rangeById, rangeByInfo, partitionKeyOrderedRange, orderedPartitionInfo, collection_unique_id)
+        return cls(
+            rangeById,
+            rangeByInfo,
+            partitionKeyOrderedRange,
+            orderedPartitionInfo,
+            collection_unique_id,
+            change_feed_next_if_none_match,
+        )
+
+    def try_combine(self, partition_key_ranges, change_feed_next_if_none_match):
+        """Returns a new routing map with the given changed partition key ranges.
+
+        The ranges the changed ranges were split from are removed.
+
+        :param list partition_key_ranges: The partition key ranges changed since the routing map was loaded.
+        :param str change_feed_next_if_none_match: The ETag to read the next changes from.
+        :return: The new routing map, or None if the ranges don't make a complete routing map.
+        :rtype: ~azure.cosmos._routing.collection_routing_map.CollectionRoutingMap
+        """
+        range_by_id = dict(self._rangeById)
+        gone_range_ids = set()
+        for r in partition_key_ranges:
+            gone_range_ids.update(r.get(PartitionKeyRange.Parents) or [])
+            range_by_id[r[PartitionKeyRange.Id]] = (r, True)
+        for range_id in gone_range_ids:
+            range_by_id.pop(range_id, None)
+
+        try:
+            return CollectionRoutingMap.CompleteRoutingMap(
+                list(range_by_id.values()), self._collectionUniqueId, change_feed_next_if_none_match
+            )
+        except ValueError:
+            # the changes are inconsistent with the routing map, which has to be loaded again
+            return None
 
     def get_ordered_partition_key_ranges(self):
         """Gets the ordered partition key ranges
@@ -93,9 +133,7 @@ class CollectionRoutingMap(object):
         if CollectionRoutingMap.MaximumExclusiveEffectivePartitionKey == effective_partition_key_value:
             return None
 
-        sortedLow = [(r.min, not r.isMinInclusive) for r in self._orderedRanges]
-
-        index = bisect.bisect_right(sortedLow, (effective_partition_key_value, True))
+        index = bisect.bisect_right(self._orderedRangeLows, (effective_partition_key_value, True))
         if index > 0:
             index = index - 1
         return self._orderedPartitionKeyRanges[index]
@@ -23,7 +23,10 @@
 Cosmos database service.
 """
 
+import threading
+
 from .. import _base
+from .. import http_constants
 from .collection_routing_map import CollectionRoutingMap
 from . import routing_range
 from .routing_range import PartitionKeyRange
@@ -37,7 +40,8 @@ class PartitionKeyRangeCache(object):
     collection.
 
     This implementation loads and caches the collection routing map per
-    collection on demand.
+    collection on demand. When a partition key range is gone, the routing map
+    is refreshed with the partition key ranges changed since it was loaded.
     """
 
     def __init__(self, client):
@@ -49,6 +53,7 @@ class PartitionKeyRangeCache(object):
 
         # keeps the cached collection routing map by collection id
         self._collection_routing_map_by_item = {}
+        self._refresh_lock = threading.Lock()
 
     def get_overlapping_ranges(self, collection_link, partition_key_ranges):
         """Given a partition key range and a collection, return the list of
@@ -59,22 +64,82 @@ class PartitionKeyRangeCache(object):
         :return: List of overlapping partition key ranges.
         :rtype: list
         """
-        cl = self._documentClient
+        collection_routing_map = self.get_routing_map(collection_link)
+        return collection_routing_map.get_overlapping_ranges(partition_key_ranges)
+
+    def get_routing_map(self, collection_link):
+        """Return the routing map of a collection, loading it on the first call.
 
+        :param str collection_link: The name of the collection.
+        :return: The routing map of the collection.
+        :rtype: ~azure.cosmos._routing.collection_routing_map.CollectionRoutingMap
+        """
         collection_id = _base.GetResourceIdOrFullNameFromLink(collection_link)
 
         collection_routing_map = self._collection_routing_map_by_item.get(collection_id)
         if collection_routing_map is None:
-            collection_pk_ranges = list(cl._ReadPartitionKeyRanges(collection_link))
-            # for large collections, a split may complete between the read partition key ranges query page responses,
-            # causing the partitionKeyRanges to have both the children ranges and their parents. Therefore, we need
-            # to discard the parent ranges to have a valid routing map.
-            collection_pk_ranges = PartitionKeyRangeCache._discard_parent_ranges(collection_pk_ranges)
-            collection_routing_map = CollectionRoutingMap.CompleteRoutingMap(
-                [(r, True) for r in collection_pk_ranges], collection_id
-            )
+            collection_routing_map = self._load_routing_map(collection_link, collection_id)
             self._collection_routing_map_by_item[collection_id] = collection_routing_map
-        return collection_routing_map.get_overlapping_ranges(partition_key_ranges)
+        return collection_routing_map
+
+    def refresh_routing_map(self, collection_link, gone_partition_key_range_id=None):
+        """Refresh the routing map of a collection after a partition key range is gone, and return it.
+
+        Only the partition key ranges changed since the routing map was loaded are read, and the
+        refreshed routing map replaces the cached one at once. The routing map isn't refreshed if
+        the gone partition key range was already removed from it by another refresh.
+
+        :param str collection_link: The name of the collection.
+        :param str gone_partition_key_range_id: The id of the partition key range that is gone.
+        :return: The refreshed routing map of the collection.
+        :rtype: ~azure.cosmos._routing.collection_routing_map.CollectionRoutingMap
+        """
+        collection_id = _base.GetResourceIdOrFullNameFromLink(collection_link)
+
+        with self._refresh_lock:
+            previous_routing_map = self._collection_routing_map_by_item.get(collection_id)
+            if (
+                previous_routing_map is not None
+                and gone_partition_key_range_id is not None
+                and previous_routing_map.get_range_by_partition_key_range_id(gone_partition_key_range_id) is None
+            ):
+                return previous_routing_map
+            collection_routing_map = self._load_routing_map(collection_link, collection_id, previous_routing_map)
+            self._collection_routing_map_by_item[collection_id] = collection_routing_map
+        return collection_routing_map
+
+    def _load_routing_map(self, collection_link, collection_id, previous_routing_map=None):
+        if previous_routing_map is not None and previous_routing_map.change_feed_next_if_none_match:
+            changed_pk_ranges, etag = self._read_partition_key_ranges(
+                collection_link, previous_routing_map.change_feed_next_if_none_match)
+            collection_routing_map = previous_routing_map.try_combine(changed_pk_ranges, etag)
+            if collection_routing_map is not None:
+                return collection_routing_map
+
+        collection_pk_ranges, etag = self._read_partition_key_ranges(collection_link)
+        # for large collections, a split may complete between the read partition key ranges query page responses,
+        # causing the partitionKeyRanges to have both the children ranges and their parents. Therefore, we need
+        # to discard the parent ranges to have a valid routing map.
+        collection_pk_ranges = PartitionKeyRangeCache._discard_parent_ranges(collection_pk_ranges)
+        return CollectionRoutingMap.CompleteRoutingMap([(r, True) for r in collection_pk_ranges], collection_id, etag)
+
+    def _read_partition_key_ranges(self, collection_link, if_none_match=None):
+        """Read the partition key ranges of a collection from their change feed.
+
+        :param str collection_link: The name of the collection.
+        :param str if_none_match: The ETag to read the changes from, or None to read all the ranges.
+        :return: The partition key ranges, and the ETag to read the next changes from.
+        :rtype: tuple[list, str]
+        """
+        feed_options = _partition_key_ranges_feed_options(if_none_match)
+        etag = [if_none_match]
+
+        def capture_etag(response_headers, _):
+            etag[0] = response_headers.get(http_constants.HttpHeaders.ETag) or etag[0]
+
+        collection_pk_ranges = list(
+            self._documentClient._ReadPartitionKeyRanges(collection_link, feed_options, response_hook=capture_etag))
+        return collection_pk_ranges, etag[0]
 
     @staticmethod
     def _discard_parent_ranges(partitionKeyRanges):
@@ -86,6 +151,13 @@ class PartitionKeyRangeCache(object):
         return (r for r in partitionKeyRanges if r[PartitionKeyRange.Id] not in parentIds)
 
 
+def _partition_key_ranges_feed_options(if_none_match):
+    feed_options = {"changeFeed": True}
+    if if_none_match:
+        feed_options["continuation"] = if_none_match
+    return feed_options
+
+
 def _second_range_is_after_first_range(range1, range2):
     if range1.max > range2.min:
         ##r.min < #previous_r.max
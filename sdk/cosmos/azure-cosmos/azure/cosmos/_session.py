@@ -72,6 +72,25 @@ class SessionContainer(object):
             except Exception:  # pylint: disable=broad-except
                 return ""
 
+    def get_partition_session_token(self, resource_path, partition_key_range_id):
+        """Get the Session Token of a partition key range of the collection of a resource.
+
+        :param str resource_path: Self link / path to the resource
+        :param str partition_key_range_id: Id of the partition key range
+        :return: Session Token of the partition key range, or None if the session has none
+        :rtype: VectorSessionToken
+        """
+
+        with self.session_lock:
+            try:
+                if _base.IsNameBased(resource_path):
+                    collection_rid = self.collection_name_to_rid[_base.GetItemContainerLink(resource_path)]
+                else:
+                    collection_rid = _base.GetItemContainerLink(resource_path)
+                return self.rid_to_session_token[collection_rid].get(partition_key_range_id)
+            except Exception:  # pylint: disable=broad-except
+                return None
+
     def set_session_token(self, response_result, response_headers):
         """Session token must only be updated from response of requests that
         successfully mutate resource on the server side (write, replace, delete etc).
@@ -214,3 +233,6 @@ class Session(object):
 
     def get_session_token(self, resource_path):
         return self.session_container.get_session_token(resource_path)
+
+    def get_partition_session_token(self, resource_path, partition_key_range_id):
+        return self.session_container.get_partition_session_token(resource_path, partition_key_range_id)
@@ -29,6 +29,7 @@ from six.moves.urllib.parse import urlparse
 import six
 from azure.core.exceptions import DecodeError  # type: ignore
 
+from . import documents
 from . import exceptions
 from . import http_constants
 from . import _retry_utility
@@ -119,6 +120,7 @@ def _Request(global_endpoint_manager, request_params, connection_policy, pipelin
         and not connection_policy.DisableSSLVerification
     )
 
+    request_start_time = time.time()
     if connection_policy.SSLConfiguration or "connection_cert" in kwargs:
         ca_certs = connection_policy.SSLConfiguration.SSLCaCerts
         cert_files = (connection_policy.SSLConfiguration.SSLCertFile, connection_policy.SSLConfiguration.SSLKeyFile)
@@ -139,6 +141,10 @@ def _Request(global_endpoint_manager, request_params, connection_policy, pipelin
             connection_verify=kwargs.pop("connection_verify", is_ssl_enabled),
             **kwargs
         )
+    if connection_policy.EnableLatencyBasedRouting and not documents._OperationType.IsWriteOperation(
+        request_params.operation_type
+    ):
+        global_endpoint_manager.record_latency(base_url, (time.time() - request_start_time) * 1000.0)
 
     response = response.http_response
     headers = dict(response.headers)
@@ -0,0 +1,221 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Transactional batches of item operations on one partition key in the Azure Cosmos
+database service.
+"""
+
+import json
+
+import six
+
+from . import _base
+from .documents import _OperationType
+from .http_constants import HttpHeaders, StatusCodes
+
+# The service executes at most this many operations in a batch.
+_MAX_OPERATION_COUNT = 100
+# The service accepts batch requests of at most this many bytes.
+_MAX_PAYLOAD_SIZE = 2 * 1024 * 1024
+
+
+class TransactionalBatch(object):
+    """Item operations on one partition key, executed atomically in a single request with
+    :func:`ContainerProxy.execute_transactional_batch`.
+
+    Either all the operations of the batch are applied, or none of them is. The operations are
+    executed in the order they were added, and each method returns the batch so that calls can be
+    chained.
+
+    :param partition_key: The partition key of all the items of the batch.
+    """
+
+    def __init__(self, partition_key):
+        self.partition_key = partition_key
+        self._operations = []
+
+    def __len__(self):
+        return len(self._operations)
+
+    def __repr__(self):
+        return "<TransactionalBatch [{} operations]>".format(len(self._operations))
+
+    def create_item(self, body):
+        """Adds the creation of an item to the batch.
+
+        :param dict body: A dict-like object representing the item to create.
+        :returns: The batch.
+        :rtype: ~azure.cosmos.TransactionalBatch
+        """
+        return self._add(_OperationType.Create, resource_body=body)
+
+    def upsert_item(self, body, **kwargs):
+        """Adds the insertion or replacement of an item to the batch.
+
+        :param dict body: A dict-like object representing the item to upsert.
+        :keyword str etag: An ETag value, or the wildcard character (*). Used to check if the resource
+            has changed, and act according to the condition specified by the `match_condition` parameter.
+        :keyword ~azure.core.MatchConditions match_condition: The match condition to use upon the etag.
+        :returns: The batch.
+        :rtype: ~azure.cosmos.TransactionalBatch
+        """
+        return self._add(_OperationType.Upsert, resource_body=body, **kwargs)
+
+    def replace_item(self, item, body, **kwargs):
+        """Adds the replacement of an item to the batch.
+
+        :param item: The ID (name) or dict representing item to be replaced.
+        :param dict body: A dict-like object representing the item to replace.
+        :keyword str etag: An ETag value, or the wildcard character (*). Used to check if the resource
+            has changed, and act according to the condition specified by the `match_condition` parameter.
+        :keyword ~azure.core.MatchConditions match_condition: The match condition to use upon the etag.
+        :returns: The batch.
+        :rtype: ~azure.cosmos.TransactionalBatch
+        """
+        return self._add(_OperationType.Replace, item=item, resource_body=body, **kwargs)
+
+    def delete_item(self, item, **kwargs):
+        """Adds the deletion of an item to the batch.
+
+        :param item: The ID (name) or dict representing item to be deleted.
+        :keyword str etag: An ETag value, or the wildcard character (*). Used to check if the resource
+            has changed, and act according to the condition specified by the `match_condition` parameter.
+        :keyword ~azure.core.MatchConditions match_condition: The match condition to use upon the etag.
+        :returns: The batch.
+        :rtype: ~azure.cosmos.TransactionalBatch
+        """
+        return self._add(_OperationType.Delete, item=item, **kwargs)
+
+    def read_item(self, item, **kwargs):
+        """Adds the read of an item to the batch.
+
+        :param item: The ID (name) or dict representing item to be read.
+        :keyword str etag: An ETag value, or the wildcard character (*). Used to check if the resource
+            has changed, and act according to the condition specified by the `match_condition` parameter.
+        :keyword ~azure.core.MatchConditions match_condition: The match condition to use upon the etag.
+        :returns: The batch.
+        :rtype: ~azure.cosmos.TransactionalBatch
+        """
+        return self._add(_OperationType.Read, item=item, **kwargs)
+
+    def _add(self, operation_type, item=None, resource_body=None, **kwargs):
+        if len(self._operations) >= _MAX_OPERATION_COUNT:
+            raise ValueError("A transactional batch has at most {} operations.".format(_MAX_OPERATION_COUNT))
+        operation = {"operationType": operation_type}
+        if item is not None:
+            operation["id"] = item if isinstance(item, six.string_types) else item["id"]
+        if resource_body is not None:
+            if not isinstance(resource_body, dict):
+                raise TypeError("The body of a {} operation must be a dict.".format(operation_type))
+            operation["resourceBody"] = resource_body
+        if_match, if_none_match = _base._get_match_headers(kwargs)
+        if if_match:
+            operation["ifMatch"] = if_match
+        if if_none_match:
+            operation["ifNoneMatch"] = if_none_match
+        self._operations.append(operation)
+        return self
+
+    def _to_request_body(self):
+        """Serializes the operations of the batch in the batch format of the service.
+
+        :raises ValueError: The batch has no operation or is larger than the service accepts.
+        """
+        if not self._operations:
+            raise ValueError("The transactional batch has no operation.")
+        body = json.dumps(self._operations, separators=(",", ":"))
+        if len(body.encode("utf-8")) > _MAX_PAYLOAD_SIZE:
+            raise ValueError("A transactional batch has at most {} bytes.".format(_MAX_PAYLOAD_SIZE))
+        return body
+
+    def _create_response(self, results, headers):
+        return TransactionalBatchResponse([
+            TransactionalBatchOperationResult(index, operation["operationType"], result)
+            for index, (operation, result) in enumerate(zip(self._operations, results or []))
+        ], headers)
+
+
+class TransactionalBatchOperationResult(object):
+    """The result of one operation of a transactional batch.
+
+    :ivar int index: The position of the operation in the batch.
+    :ivar str operation_type: The type of the operation, like "Create" or "Delete".
+    :ivar int status_code: The HTTP status code of the operation. Operations that were not applied
+        because another operation of the batch failed have status code 424 (failed dependency).
+    :ivar int sub_status: The sub-status code of the operation, or None.
+    :ivar dict resource: The item returned by the operation, None for deletes and failed operations.
+    :ivar str etag: The ETag of the item after the operation, or None.
+    :ivar float request_charge: The request units consumed by the operation.
+    """
+
+    def __init__(self, index, operation_type, result):
+        self.index = index
+        self.operation_type = operation_type
+        self.status_code = result.get("statusCode")
+        self.sub_status = result.get("subStatusCode")
+        self.resource = result.get("resourceBody")
+        self.etag = result.get("eTag")
+        self.request_charge = result.get("requestCharge", 0.0)
+
+    def __repr__(self):
+        return "<TransactionalBatchOperationResult [{}: {} {}]>".format(
+            self.index, self.operation_type, self.status_code)
+
+    @property
+    def succeeded(self):
+        return self.status_code is not None and self.status_code < StatusCodes.BAD_REQUEST
+
+
+class TransactionalBatchResponse(object):
+    """The response of a transactional batch, with the results of its operations in order.
+
+    :ivar list[TransactionalBatchOperationResult] results: The results of the operations of the batch.
+    :ivar dict headers: The response headers of the batch.
+    :ivar float request_charge: The request units consumed by the batch.
+    """
+
+    def __init__(self, results, headers):
+        self.results = results
+        self.headers = headers or {}
+        self.request_charge = float(self.headers.get(HttpHeaders.RequestCharge, 0))
+
+    def __repr__(self):
+        return "<TransactionalBatchResponse [{}: {} operations]>".format(self.status_code, len(self.results))
+
+    def __len__(self):
+        return len(self.results)
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __getitem__(self, index):
+        return self.results[index]
+
+    @property
+    def succeeded(self):
+        """Whether all the operations of the batch were applied."""
+        return all(result.succeeded for result in self.results)
+
+    @property
+    def status_code(self):
+        """The status code of the operation that failed the batch, or 200 if all the operations were applied."""
+        failed = [result.status_code for result in self.results if not result.succeeded]
+        return next((s for s in failed if s != StatusCodes.FAILED_DEPENDENCY), failed[0] if failed else StatusCodes.OK)
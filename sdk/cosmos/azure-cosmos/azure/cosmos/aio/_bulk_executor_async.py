@@ -0,0 +1,105 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Internal class for bulk execution of item operations in the Azure Cosmos
+database service.
+"""
+
+import asyncio
+import time
+
+from .. import exceptions
+from .._bulk_executor import _BulkExecutor as _SyncBulkExecutor, BulkOperationType
+
+# pylint: disable=protected-access
+
+
+class _BulkExecutor(_SyncBulkExecutor):
+    """Executes item operations concurrently on the event loop, grouped by the partition key range
+    they target.
+    """
+
+    async def _operation_call(self, operation, **kwargs):  # pylint: disable=invalid-overridden-method
+        operation_type, item = operation[0], operation[1]
+        container = self._container
+        if operation_type == BulkOperationType.Create:
+            return await container.create_item(item, **kwargs)
+        if operation_type == BulkOperationType.Upsert:
+            return await container.upsert_item(item, **kwargs)
+        if operation_type == BulkOperationType.Replace:
+            return await container.replace_item(item["id"], item, **kwargs)
+        if operation_type == BulkOperationType.Delete:
+            return await container.delete_item(item, operation[2], **kwargs)
+        return await container.read_item(item, operation[2], **kwargs)
+
+    async def _run_operation(self, operation, queue):  # pylint: disable=invalid-overridden-method
+        response = {}
+        kwargs = dict(self._options, raw_response_hook=self._response_hook(queue, response))
+        resource = await self._operation_call(operation, **kwargs)
+        return resource, response
+
+    async def _prepare(self):  # pylint: disable=invalid-overridden-method
+        self._partition_key_definition = (await self._container._get_properties()).get("partitionKey")
+        self._is_system_key = bool((self._partition_key_definition or {}).get("systemKey", False))
+
+    async def _load_routing_map(self):  # pylint: disable=invalid-overridden-method
+        routing_map_provider = self._client_connection._routing_map_provider
+        routing_map = await routing_map_provider.get_routing_map(self._container.container_link)
+        while self._gone_partition_key_range_ids:
+            routing_map = await routing_map_provider.refresh_routing_map(
+                self._container.container_link, self._gone_partition_key_range_ids.pop())
+        with self._lock:
+            self._routing_map = routing_map
+            self._reroute()
+
+    async def execute(self):  # pylint: disable=invalid-overridden-method
+        """Executes the operations and yields their results as they complete."""
+        await self._prepare()
+        pending = {}
+        try:
+            while True:
+                if self._routing_map is None:
+                    await self._load_routing_map()
+                with self._lock:
+                    self._read_ahead()
+                for entry, queue in self._dispatchable():
+                    pending[asyncio.ensure_future(self._run_operation(entry[1], queue))] = (entry, queue)
+                if self._is_done():
+                    return
+                if not pending:
+                    # every queue is paused by a throttled request
+                    await asyncio.sleep(max(0.0, self._next_resume_time() - time.time()))
+                    continue
+                done, _ = await asyncio.wait(
+                    list(pending), timeout=max(0.0, self._next_resume_time() - time.time()) or None,
+                    return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    entry, queue = pending.pop(task)
+                    try:
+                        resource, response = task.result()
+                        result = self._complete(entry, queue, resource, response)
+                    except exceptions.CosmosHttpResponseError as error:
+                        result = self._complete(entry, queue, error=error)
+                    if result is not None:
+                        yield result
+        finally:
+            for task in pending:
+                task.cancel()
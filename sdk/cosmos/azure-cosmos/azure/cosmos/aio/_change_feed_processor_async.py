@@ -0,0 +1,304 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Asyncio change feed processor of the Azure Cosmos database service.
+"""
+
+import asyncio
+import logging
+import time
+
+from azure.core import MatchConditions  # type: ignore
+
+from .. import exceptions
+from .._change_feed_processor import (
+    ChangeFeedProcessor as _SyncChangeFeedProcessor,
+    _LeaseLostError,
+    _START_FROM_NOW,
+    _select_leases_to_take,
+)
+from .._routing import routing_range
+from ..http_constants import HttpHeaders, StatusCodes
+
+# pylint: disable=protected-access,invalid-overridden-method
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeFeedProcessor(_SyncChangeFeedProcessor):
+    """Processes the change feed of a container with one or more instances, each reading the changes
+    of its share of the partition key ranges of the container on the event loop.
+
+    The leases are stored and balanced as by :class:`azure.cosmos.ChangeFeedProcessor`, and the
+    handler is a coroutine function awaited with the list of changes read from a partition key
+    range, and the id of the range.
+
+    :param container: The container whose changes are processed.
+    :type container: ~azure.cosmos.aio.ContainerProxy
+    :param lease_container: The container storing the leases, partitioned on ``/id``.
+    :type lease_container: ~azure.cosmos.aio.ContainerProxy
+    :param handler: Awaited with the list of changes read from a partition key range, and the id
+        of the range.
+    :type handler: Callable[[list[dict[str, Any]], str], Awaitable[None]]
+    :param str instance_name: The name of this instance, unique among the instances sharing the
+        leases. A random name is used by default.
+    :param str lease_prefix: A prefix of the ids of the leases, to run several processors on the
+        same container.
+    :param int max_item_count: The maximum number of changes passed to the handler at once.
+    :param float poll_interval: The seconds to wait before reading a partition key range again,
+        once all its changes are processed.
+    :param bool start_from_beginning: Whether to process the changes made before the leases are
+        created. By default only the changes made after are processed.
+    :param float lease_renew_interval: The seconds between the renewals of the leases.
+    :param float lease_acquire_interval: The seconds between the balancing of the leases.
+    :param float lease_expiration_interval: The seconds after which a lease not renewed by its
+        owner is taken by another instance.
+    """
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.stop()
+
+    async def start(self):
+        """Starts processing the changes of the leases this instance takes."""
+        if self._coordinator is not None:
+            raise RuntimeError("The change feed processor is already started.")
+        self._stopped = asyncio.Event()
+        await self._initialize_leases()
+        self._coordinator = asyncio.ensure_future(self._coordinate())
+
+    async def stop(self):
+        """Stops processing changes, and releases the leases of this instance to the other instances."""
+        if self._coordinator is None:
+            return
+        self._stopped.set()
+        await self._coordinator
+        self._coordinator = None
+        pumps = list(self._pumps.values())
+        for _, stop in pumps:
+            stop.set()
+        await asyncio.gather(*[pump for pump, _ in pumps])
+        for lease_id in list(self._leases):
+            try:
+                await self._update_lease(lease_id, lambda lease: lease.update(owner=None))
+            except (_LeaseLostError, exceptions.CosmosHttpResponseError):
+                pass
+        self._leases.clear()
+        self._pumps.clear()
+
+    async def estimate_lag(self):
+        """Estimates the number of changes not processed yet on each partition key range.
+
+        :returns: The estimated number of pending changes, by partition key range id.
+        :rtype: dict[str, int]
+        """
+        lag = {}
+        for lease in await self._read_leases():
+            range_id = lease["partitionKeyRangeId"]
+            try:
+                changes, _, headers = await self._read_changes(range_id, lease.get("continuationToken"), 1)
+            except exceptions.CosmosHttpResponseError as error:
+                if exceptions._partition_range_is_gone(error):
+                    continue
+                raise
+            lag[range_id] = self._get_lag(changes, headers)
+        return lag
+
+    async def _get_partition_key_ranges(self):
+        full_range = routing_range.Range("", "FF", True, False)
+        return await self._container.client_connection._routing_map_provider.get_overlapping_ranges(
+            self._container.container_link, [full_range])
+
+    async def _get_child_partition_key_ranges(self, range_id):
+        await self._container.client_connection._routing_map_provider.refresh_routing_map(
+            self._container.container_link, range_id)
+        return [r for r in await self._get_partition_key_ranges() if range_id in (r.get("parents") or [])]
+
+    async def _read_leases(self):
+        leases = self._lease_container.query_items(
+            "SELECT * FROM c WHERE STARTSWITH(c.id, @prefix)",
+            parameters=[{"name": "@prefix", "value": self._lease_id_prefix}],
+            enable_cross_partition_query=True)
+        return [lease async for lease in leases]
+
+    async def _create_lease(self, lease):
+        try:
+            return await self._lease_container.create_item(lease)
+        except exceptions.CosmosResourceExistsError:
+            return None
+
+    async def _initialize_leases(self):
+        if await self._read_leases():
+            return
+        for partition_key_range in await self._get_partition_key_ranges():
+            await self._create_lease(self._new_lease(partition_key_range["id"], None))
+
+    async def _acquire_lease(self, lease):
+        lease = dict(lease, owner=self.instance_name, timestamp=time.time())
+        try:
+            return await self._lease_container.replace_item(
+                lease["id"], lease, etag=lease["_etag"], match_condition=MatchConditions.IfNotModified)
+        except exceptions.CosmosHttpResponseError as error:
+            if error.status_code in (StatusCodes.PRECONDITION_FAILED, StatusCodes.NOT_FOUND):
+                return None
+            raise
+
+    async def _update_lease(self, lease_id, update):
+        lease = self._leases.get(lease_id)
+        if lease is None:
+            raise _LeaseLostError(lease_id)
+        while True:
+            updated = dict(lease)
+            update(updated)
+            try:
+                lease = await self._lease_container.replace_item(
+                    lease_id, updated, etag=lease["_etag"], match_condition=MatchConditions.IfNotModified)
+                break
+            except exceptions.CosmosHttpResponseError as error:
+                if error.status_code == StatusCodes.NOT_FOUND:
+                    raise _LeaseLostError(lease_id)
+                if error.status_code != StatusCodes.PRECONDITION_FAILED:
+                    raise
+            lease = await self._lease_container.read_item(lease_id, partition_key=lease_id)
+            if lease.get("owner") != self.instance_name:
+                raise _LeaseLostError(lease_id)
+        if lease_id in self._leases:
+            self._leases[lease_id] = lease
+        return lease
+
+    async def _read_changes(self, range_id, continuation, max_item_count):
+        if continuation is None and not self._start_from_beginning:
+            continuation = _START_FROM_NOW
+        headers = {}
+        options = {"partitionKeyRangeId": range_id, "maxItemCount": max_item_count, "continuation": continuation}
+        pages = self._container.client_connection.QueryItemsChangeFeed(
+            self._container.container_link, options=options,
+            response_hook=lambda response_headers, _: headers.update(response_headers)).by_page()
+        try:
+            changes = [change async for change in await pages.__anext__()]
+        except StopAsyncIteration:
+            changes = []
+        return changes, headers.get(HttpHeaders.ETag) or continuation, headers
+
+    def _start_pump(self, lease):
+        self._leases[lease["id"]] = lease
+        if lease["id"] in self._pumps or self._stopped.is_set():
+            return
+        stop = asyncio.Event()
+        self._pumps[lease["id"]] = (asyncio.ensure_future(self._pump(lease["id"], stop)), stop)
+
+    def _stop_pump(self, lease_id):
+        self._leases.pop(lease_id, None)
+        _, stop = self._pumps.pop(lease_id, (None, None))
+        if stop is not None:
+            stop.set()
+
+    @staticmethod
+    async def _wait(event, timeout):
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _checkpoint(self, lease_id, continuation):
+        await self._update_lease(lease_id, lambda lease: lease.update(continuationToken=continuation))
+
+    async def _pump(self, lease_id, stop):
+        lease = self._leases[lease_id]
+        range_id = lease["partitionKeyRangeId"]
+        continuation = lease.get("continuationToken")
+        try:
+            while not stop.is_set():
+                try:
+                    changes, next_continuation, _ = await self._read_changes(
+                        range_id, continuation, self._max_item_count)
+                except exceptions.CosmosHttpResponseError as error:
+                    if exceptions._partition_range_is_gone(error):
+                        await self._split(lease_id, range_id, continuation)
+                        return
+                    logger.warning("Reading the changes of partition key range %s failed: %s", range_id, error)
+                    await self._wait(stop, self._poll_interval)
+                    continue
+                if changes:
+                    try:
+                        await self._handler(changes, range_id)
+                    except Exception:  # pylint: disable=broad-except
+                        logger.exception("The handler failed on the changes of partition key range %s", range_id)
+                        await self._wait(stop, self._poll_interval)
+                        continue
+                if changes or continuation in (None, _START_FROM_NOW):
+                    await self._checkpoint(lease_id, next_continuation)
+                continuation = next_continuation
+                if not changes:
+                    await self._wait(stop, self._poll_interval)
+        except _LeaseLostError:
+            logger.info("The lease of partition key range %s was taken by another instance", range_id)
+            self._stop_pump(lease_id)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Processing the changes of partition key range %s failed", range_id)
+            self._stop_pump(lease_id)
+
+    async def _split(self, lease_id, range_id, continuation):
+        child_ranges = await self._get_child_partition_key_ranges(range_id)
+        if not child_ranges:
+            raise _LeaseLostError(lease_id)
+        child_leases = []
+        for child_range in child_ranges:
+            child_lease = await self._create_lease(
+                self._new_lease(child_range["id"], continuation, self.instance_name))
+            if child_lease is not None:
+                child_leases.append(child_lease)
+        self._stop_pump(lease_id)
+        await self._lease_container.delete_item(lease_id, partition_key=lease_id)
+        for child_lease in child_leases:
+            self._start_pump(child_lease)
+
+    async def _renew_leases(self):
+        for lease_id in list(self._leases):
+            try:
+                await self._update_lease(lease_id, lambda lease: lease.update(timestamp=time.time()))
+            except _LeaseLostError:
+                logger.info("The lease %s was taken by another instance", lease_id)
+                self._stop_pump(lease_id)
+
+    async def _balance_leases(self):
+        leases = await self._read_leases()
+        for lease in _select_leases_to_take(self.instance_name, leases, time.time(), self._lease_expiration_interval):
+            acquired = await self._acquire_lease(lease)
+            if acquired is not None:
+                self._start_pump(acquired)
+
+    async def _coordinate(self):
+        next_renewal = next_balancing = time.time()
+        while not self._stopped.is_set():
+            try:
+                if time.time() >= next_renewal:
+                    await self._renew_leases()
+                    next_renewal = time.time() + self._lease_renew_interval
+                if time.time() >= next_balancing:
+                    await self._balance_leases()
+                    next_balancing = time.time() + self._lease_acquire_interval
+            except exceptions.CosmosHttpResponseError as error:
+                logger.warning("Updating the leases of the change feed processor failed: %s", error)
+            await self._wait(self._stopped, max(0.0, min(next_renewal, next_balancing) - time.time()))
@@ -0,0 +1,145 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Internal class for global endpoint manager implementation in the Azure Cosmos
+database service, for use with the asyncio client.
+"""
+
+import asyncio
+
+from .. import exceptions
+from .._global_endpoint_manager import _GlobalEndpointManager as _SyncGlobalEndpointManager
+
+# pylint: disable=protected-access
+
+
+class _GlobalEndpointManager(_SyncGlobalEndpointManager):
+    """
+    This internal class implements the logic for endpoint management for
+    geo-replicated database accounts, reading the database account without
+    blocking the event loop.
+    """
+
+    def __init__(self, client):
+        super(_GlobalEndpointManager, self).__init__(client)
+        # created on first use, so that it belongs to the event loop the client is used from
+        self.refresh_lock = None
+        self._latency_probe_task = None
+
+    async def close(self):
+        if self._latency_probe_task is not None:
+            self._latency_probe_task.cancel()
+            self._latency_probe_task = None
+
+    async def force_refresh(self, database_account):
+        self.refresh_needed = True
+        await self.refresh_endpoint_list(database_account)
+
+    async def refresh_endpoint_list(self, database_account, **kwargs):
+        # if refresh is not needed there is no need to wait for the lock
+        if self.refresh_needed:
+            if self.refresh_lock is None:
+                self.refresh_lock = asyncio.Lock()
+            async with self.refresh_lock:
+                # refresh may have been done while waiting for the lock
+                if self.refresh_needed:
+                    await self._refresh_endpoint_list_private(database_account, **kwargs)
+        if self._should_probe_latencies():
+            self._latency_probe_task = asyncio.ensure_future(self._probe_latencies())
+
+    async def _refresh_endpoint_list_private(self, database_account=None, **kwargs):
+        if database_account:
+            self.location_cache.perform_on_database_account_read(database_account)
+            self.refresh_needed = False
+
+        if (
+            self.location_cache.should_refresh_endpoints()
+            and self.location_cache.current_time_millis() - self.last_refresh_time > self.refresh_time_interval_in_ms
+        ):
+            if not database_account:
+                database_account = await self._GetDatabaseAccount(**kwargs)
+                self.location_cache.perform_on_database_account_read(database_account)
+                self.last_refresh_time = self.location_cache.current_time_millis()
+                self.refresh_needed = False
+
+    def _should_probe_latencies(self):
+        # there is nothing to choose from until the database account lists several read locations
+        if (
+            not self.location_cache.latency_tracker
+            or not self.latency_probe_interval_in_ms
+            or len(self.location_cache.preferred_read_endpoints) < 2
+        ):
+            return False
+        now = self.location_cache.current_time_millis()
+        if now - self.last_latency_probe_time < self.latency_probe_interval_in_ms:
+            return False
+        self.last_latency_probe_time = now
+        return True
+
+    async def _probe_latencies(self):
+        for endpoint in self._get_endpoints_to_probe():
+            try:
+                # the latency of the probe is recorded like the latency of any other request
+                await self._ProbeEndpointStub(endpoint)
+            except Exception:  # pylint: disable=broad-except
+                # endpoints that fail are marked unavailable by the requests they fail
+                pass
+
+    async def _ProbeEndpointStub(self, endpoint):
+        """Stub for probing the latency of an endpoint with the client.
+
+        This can be used for mocking purposes as well.
+        """
+        await self.Client.ProbeEndpoint(endpoint)
+
+    async def _GetDatabaseAccount(self, **kwargs):
+        """Gets the database account.
+
+        First tries by using the default endpoint, and if that doesn't work,
+        use the endpoints for the preferred locations in the order they are
+        specified, to get the database account.
+        """
+        try:
+            database_account = await self._GetDatabaseAccountStub(self.DefaultEndpoint, **kwargs)
+            return database_account
+        # If for any reason(non-globaldb related), we are not able to get the database
+        # account from the above call to GetDatabaseAccount, we would try to get this
+        # information from any of the preferred locations that the user might have
+        # specified (by creating a locational endpoint) and keeping eating the exception
+        # until we get the database account and return None at the end, if we are not able
+        # to get that info from any endpoints
+        except exceptions.CosmosHttpResponseError:
+            for location_name in self.PreferredLocations:
+                locational_endpoint = _GlobalEndpointManager.GetLocationalEndpoint(self.DefaultEndpoint, location_name)
+                try:
+                    database_account = await self._GetDatabaseAccountStub(locational_endpoint, **kwargs)
+                    return database_account
+                except exceptions.CosmosHttpResponseError:
+                    pass
+
+            return None
+
+    async def _GetDatabaseAccountStub(self, endpoint, **kwargs):
+        """Stub for getting database account from the client.
+
+        This can be used for mocking purposes as well.
+        """
+        return await self.Client.GetDatabaseAccount(endpoint, **kwargs)
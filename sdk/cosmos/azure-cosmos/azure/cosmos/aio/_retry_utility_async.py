@@ -0,0 +1,222 @@
+# The MIT License (MIT)
+# Copyright (c) 2014 Microsoft Corporation
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Internal methods for executing functions asynchronously in the Azure Cosmos database service.
+"""
+
+import asyncio
+import time
+
+from azure.core.exceptions import AzureError, ClientAuthenticationError
+from azure.core.pipeline.policies import AsyncRetryPolicy
+
+from .. import diagnostics
+from .. import exceptions
+from .. import _endpoint_discovery_retry_policy
+from .. import _resource_throttle_retry_policy
+from .. import _default_retry_policy
+from .. import _session_retry_policy
+from .._retry_utility import _configure_timeout
+from ..http_constants import HttpHeaders, StatusCodes, SubStatusCodes
+
+# pylint: disable=protected-access
+
+
+def _set_throttle_headers(client, resource_throttle_retry_policy):
+    if not client.last_response_headers:
+        client.last_response_headers = {}
+
+    client.last_response_headers[
+        HttpHeaders.ThrottleRetryCount
+    ] = resource_throttle_retry_policy.current_retry_attempt_count
+    client.last_response_headers[
+        HttpHeaders.ThrottleRetryWaitTimeInMs
+    ] = resource_throttle_retry_policy.cummulative_wait_time_in_milliseconds
+
+
+async def ExecuteAsync(client, global_endpoint_manager, function, *args, **kwargs):
+    """Executes the coroutine function with passed parameters applying all retry policies
+
+    :param object client:
+        Document client instance
+    :param object global_endpoint_manager:
+        Instance of _GlobalEndpointManager class
+    :param function function:
+        Coroutine function to be called wrapped with retries
+    :param (non-keyworded, variable number of arguments list) *args:
+    :param (keyworded, variable number of arguments list) **kwargs:
+
+    """
+    # instantiate all retry policies here to be applied for each request execution
+    endpointDiscovery_retry_policy = _endpoint_discovery_retry_policy.EndpointDiscoveryRetryPolicy(
+        client.connection_policy, global_endpoint_manager, *args
+    )
+
+    resourceThrottle_retry_policy = _resource_throttle_retry_policy.ResourceThrottleRetryPolicy(
+        client.connection_policy.RetryOptions.MaxRetryAttemptCount,
+        client.connection_policy.RetryOptions.FixedRetryIntervalInMilliseconds,
+        client.connection_policy.RetryOptions.MaxWaitTimeInSeconds,
+    )
+    defaultRetry_policy = _default_retry_policy.DefaultRetryPolicy(*args)
+
+    sessionRetry_policy = _session_retry_policy._SessionRetryPolicy(
+        client.connection_policy.EnableEndpointDiscovery, global_endpoint_manager, *args
+    )
+    # only the requests to the service are recorded, a single check keeps the overhead negligible without a collector
+    diagnostics_collector = client.connection_policy.DiagnosticsCollector if args else None
+    if diagnostics_collector is not None:
+        operation_start_time = time.time()
+        request_charge = 0.0
+    while True:
+        try:
+            client_timeout = kwargs.get('timeout')
+            start_time = time.time()
+            if args:
+                result = await ExecuteFunctionAsync(function, global_endpoint_manager, *args, **kwargs)
+            else:
+                result = await ExecuteFunctionAsync(function, *args, **kwargs)
+            if diagnostics_collector is not None:
+                request_charge += diagnostics._request_charge(result[1])
+                diagnostics._record_request(
+                    diagnostics_collector, args, operation_start_time, request_charge,
+                    (endpointDiscovery_retry_policy, resourceThrottle_retry_policy, sessionRetry_policy))
+
+            # setting the throttle related response headers before returning the result
+            _set_throttle_headers(client, resourceThrottle_retry_policy)
+            return result
+        except exceptions.CosmosHttpResponseError as e:
+            if diagnostics_collector is not None:
+                request_charge += diagnostics._request_charge(e.headers)
+            retry_policy = None
+            if e.status_code == StatusCodes.FORBIDDEN and e.sub_status == SubStatusCodes.WRITE_FORBIDDEN:
+                retry_policy = endpointDiscovery_retry_policy
+            elif e.status_code == StatusCodes.TOO_MANY_REQUESTS:
+                retry_policy = resourceThrottle_retry_policy
+            elif (
+                e.status_code == StatusCodes.NOT_FOUND
+                and e.sub_status
+                and e.sub_status == SubStatusCodes.READ_SESSION_NOTAVAILABLE
+            ):
+                retry_policy = sessionRetry_policy
+            else:
+                retry_policy = defaultRetry_policy
+
+            # If none of the retry policies applies or there is no retry needed, set the
+            # throttle related response hedaers and re-throw the exception back arg[0]
+            # is the request. It needs to be modified for write forbidden exception
+            if not retry_policy.ShouldRetry(e):
+                _set_throttle_headers(client, resourceThrottle_retry_policy)
+                if args and args[0].should_clear_session_token_on_session_read_failure:
+                    client.session.clear_session_token(client.last_response_headers)
+                if diagnostics_collector is not None:
+                    diagnostics._record_request(
+                        diagnostics_collector, args, operation_start_time, request_charge,
+                        (endpointDiscovery_retry_policy, resourceThrottle_retry_policy, sessionRetry_policy), e)
+                raise
+
+            # Wait for retry_after_in_milliseconds time before the next retry, without blocking the event loop
+            await asyncio.sleep(retry_policy.retry_after_in_milliseconds / 1000.0)
+            if client_timeout:
+                kwargs['timeout'] = client_timeout - (time.time() - start_time)
+                if kwargs['timeout'] <= 0:
+                    timeout_error = exceptions.CosmosClientTimeoutError()
+                    if diagnostics_collector is not None:
+                        diagnostics._record_request(
+                            diagnostics_collector, args, operation_start_time, request_charge,
+                            (endpointDiscovery_retry_policy, resourceThrottle_retry_policy, sessionRetry_policy),
+                            timeout_error)
+                    raise timeout_error
+        except Exception as e:  # pylint: disable=broad-except
+            # errors raised before a response is received, e.g. connection errors and client timeouts
+            if diagnostics_collector is not None:
+                diagnostics._record_request(
+                    diagnostics_collector, args, operation_start_time, request_charge,
+                    (endpointDiscovery_retry_policy, resourceThrottle_retry_policy, sessionRetry_policy), e)
+            raise
+
+
+async def ExecuteFunctionAsync(function, *args, **kwargs):
+    """Stub method so that it can be used for mocking purposes as well.
+    """
+    return await function(*args, **kwargs)
+
+
+class ConnectionRetryPolicy(AsyncRetryPolicy):
+
+    def __init__(self, **kwargs):
+        clean_kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        super(ConnectionRetryPolicy, self).__init__(**clean_kwargs)
+
+    async def send(self, request):
+        """Sends the PipelineRequest object to the next policy. Uses retry settings if necessary.
+        Also enforces an absolute client-side timeout that spans multiple retry attempts.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: Returns the PipelineResponse or raises error if maximum retries exceeded.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        :raises ~azure.core.exceptions.AzureError: Maximum retries exceeded.
+        :raises ~azure.cosmos.exceptions.CosmosClientTimeoutError: Specified timeout exceeded.
+        :raises ~azure.core.exceptions.ClientAuthenticationError: Authentication failed.
+        """
+        absolute_timeout = request.context.options.pop('timeout', None)
+        per_request_timeout = request.context.options.pop('connection_timeout', 0)
+
+        retry_error = None
+        retry_active = True
+        response = None
+        retry_settings = self.configure_retries(request.context.options)
+        while retry_active:
+            try:
+                start_time = time.time()
+                _configure_timeout(request, absolute_timeout, per_request_timeout)
+
+                response = await self.next.send(request)
+                if self.is_retry(retry_settings, response):
+                    retry_active = self.increment(retry_settings, response=response)
+                    if retry_active:
+                        await self.sleep(retry_settings, request.context.transport, response=response)
+                        continue
+                break
+            except ClientAuthenticationError:  # pylint:disable=try-except-raise
+                # the authentication policy failed such that the client's request can't
+                # succeed--we'll never have a response to it, so propagate the exception
+                raise
+            except exceptions.CosmosClientTimeoutError as timeout_error:
+                timeout_error.inner_exception = retry_error
+                timeout_error.response = response
+                timeout_error.history = retry_settings['history']
+                raise
+            except AzureError as err:
+                retry_error = err
+                if self._is_method_retryable(retry_settings, request.http_request):
+                    retry_active = self.increment(retry_settings, response=request, error=err)
+                    if retry_active:
+                        await self.sleep(retry_settings, request.context.transport)
+                        continue
+                raise err
+            finally:
+                end_time = time.time()
+                if absolute_timeout:
+                    absolute_timeout -= (end_time - start_time)
+
+        self.update_context(response.context, retry_settings)
+        return response
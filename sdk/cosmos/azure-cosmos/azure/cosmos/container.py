@@ -22,13 +22,15 @@
 """Create, read, update and delete items in the Azure Cosmos DB SQL API service.
 """
 
-from typing import Any, Dict, List, Optional, Union, Iterable, cast  # pylint: disable=unused-import
+from typing import Any, Dict, List, Optional, Union, Iterable, Iterator, Tuple, cast  # pylint: disable=unused-import
 
 import six
 from azure.core.tracing.decorator import distributed_trace  # type: ignore
 
 from ._cosmos_client_connection import CosmosClientConnection
 from ._base import build_options
+from ._bulk_executor import _BulkExecutor, BulkOperationResult  # pylint: disable=unused-import
+from ._transactional_batch import TransactionalBatch, TransactionalBatchResponse  # pylint: disable=unused-import
 from .exceptions import CosmosResourceNotFoundError
 from .http_constants import StatusCodes
 from .offer import Offer
@@ -310,6 +312,13 @@ class ContainerProxy(object):
         :param populate_query_metrics: Enable returning query metrics in response headers.
         :keyword str session_token: Token for use with Session consistency.
         :keyword dict[str,str] initial_headers: Initial headers to be sent as part of the request.
+        :keyword int max_degree_of_parallelism: The number of partition key ranges a cross partition
+            query reads concurrently. Each partition key range prefetches its next page while the
+            results are being consumed. A negative value reads all partition key ranges concurrently.
+            By default, partition key ranges are read one at a time.
+        :keyword int max_distinct_results_in_memory: The number of results a query with DISTINCT and
+            no ORDER BY keeps in memory to find the duplicates. Beyond it, the digests of the results
+            are moved to a temporary file. By default, all of them are kept in memory.
         :keyword Callable response_hook: A callable invoked with the response metadata.
         :returns: An Iterable of items (dicts).
         :rtype: Iterable[dict[str, Any]]
@@ -354,6 +363,7 @@ class ContainerProxy(object):
             options=feed_options,
             partition_key=partition_key,
             response_hook=response_hook,
+            container_properties_provider=self._get_properties,
             **kwargs
         )
         if response_hook:
@@ -551,6 +561,70 @@ class ContainerProxy(object):
         if response_hook:
             response_hook(self.client_connection.last_response_headers, result)
 
+    @distributed_trace
+    def execute_bulk(
+        self,
+        operations,  # type: Iterable[Tuple[Any, ...]]
+        max_concurrency=None,  # type: Optional[int]
+        **kwargs  # type: Any
+    ):
+        # type: (...) -> Iterator[BulkOperationResult]
+        """Execute item operations in bulk.
+
+        The operations are sent concurrently, grouped by the partition key range they target. Each
+        partition key range adapts the number of operations it is sent at the same time to the
+        throughput of the container: it grows while requests succeed and shrinks when they are
+        throttled. Throttled operations and operations on a partition key range that was split are
+        queued again, until they have been sent `max_attempts` times.
+
+        Each operation is a tuple of its :class:`~azure.cosmos.BulkOperationType` and its arguments:
+        `(BulkOperationType.Create, body)`, `(BulkOperationType.Upsert, body)`,
+        `(BulkOperationType.Replace, body)`, `(BulkOperationType.Delete, item, partition_key)` or
+        `(BulkOperationType.Read, item, partition_key)`.
+
+        :param operations: The operations to execute. They are read from the iterable as they are sent.
+        :param max_concurrency: The maximum number of operations sent at the same time. Default is 32.
+        :keyword int max_attempts: The maximum number of times an operation is sent before its throttling or
+            partition split error is returned in its result. Default is 10.
+        :keyword str session_token: Token for use with Session consistency.
+        :keyword dict[str,str] initial_headers: Initial headers to be sent as part of each request.
+        :returns: An iterator of the results of the operations, in the order they complete.
+        :raises ValueError: An operation is not a supported operation type or has the wrong arguments.
+        :rtype: Iterator[~azure.cosmos.BulkOperationResult]
+        """
+        return _BulkExecutor(self, operations, max_concurrency=max_concurrency, **kwargs).execute()
+
+    @distributed_trace
+    def execute_transactional_batch(self, batch, **kwargs):
+        # type: (TransactionalBatch, Any) -> TransactionalBatchResponse
+        """Execute a transactional batch of item operations on one partition key.
+
+        The operations of the batch are sent in a single request, and either all of them are applied
+        or none of them is. A batch that fails because of one of its operations is not raised: the
+        response tells which operation failed, and the other operations have status code 424.
+
+        :param batch: The operations to execute.
+        :type batch: ~azure.cosmos.TransactionalBatch
+        :keyword str session_token: Token for use with Session consistency.
+        :keyword dict[str,str] initial_headers: Initial headers to be sent as part of the request.
+        :keyword Callable response_hook: A callable invoked with the response metadata.
+        :returns: The response of the batch, with the results of its operations in order.
+        :raises ValueError: The batch has no operation or is larger than the service accepts.
+        :raises ~azure.cosmos.exceptions.CosmosHttpResponseError: The batch request was rejected.
+        :rtype: ~azure.cosmos.TransactionalBatchResponse
+        """
+        request_options = build_options(kwargs)
+        response_hook = kwargs.pop('response_hook', None)
+        request_options["partitionKey"] = self._set_partition_key(batch.partition_key)
+
+        result = self.client_connection.Batch(
+            collection_link=self.container_link, batch_body=batch._to_request_body(), options=request_options, **kwargs
+        )
+        response = batch._create_response(result, self.client_connection.last_response_headers)
+        if response_hook:
+            response_hook(self.client_connection.last_response_headers, response)
+        return response
+
     @distributed_trace
     def read_offer(self, **kwargs):
         # type: (Any) -> Offer
@@ -68,8 +68,8 @@ def _build_auth(credential):
     return auth
 
 
-def _build_connection_policy(kwargs):
-    # type: (Dict[str, Any]) -> ConnectionPolicy
+def _build_connection_policy(kwargs, retry_policy_type=ConnectionRetryPolicy):
+    # type: (Dict[str, Any], Any) -> ConnectionPolicy
     # pylint: disable=protected-access
     policy = kwargs.pop('connection_policy', None) or ConnectionPolicy()
 
@@ -83,6 +83,23 @@ def _build_connection_policy(kwargs):
     policy.PreferredLocations = kwargs.pop('preferred_locations', None) or policy.PreferredLocations
     policy.UseMultipleWriteLocations = kwargs.pop('multiple_write_locations', None) or \
         policy.UseMultipleWriteLocations
+    query_plan_cache_size = kwargs.pop('query_plan_cache_size', None)
+    if query_plan_cache_size is not None:
+        policy.QueryPlanCacheSize = query_plan_cache_size
+    policy.DiagnosticsCollector = kwargs.pop('diagnostics_collector', None) or policy.DiagnosticsCollector
+    policy.EnableLatencyBasedRouting = kwargs.pop('latency_based_routing', None) or policy.EnableLatencyBasedRouting
+    latency_routing_tolerance = kwargs.pop('latency_routing_tolerance', None)
+    if latency_routing_tolerance is not None:
+        policy.LatencyRoutingToleranceInMs = latency_routing_tolerance
+    latency_probe_interval = kwargs.pop('latency_probe_interval', None)
+    if latency_probe_interval is not None:
+        policy.LatencyProbeIntervalInMs = latency_probe_interval * 1000
+    item_cache_size = kwargs.pop('item_cache_size', None)
+    if item_cache_size is not None:
+        policy.ItemCacheSize = item_cache_size
+    item_cache_ttl = kwargs.pop('item_cache_ttl', None)
+    if item_cache_ttl is not None:
+        policy.ItemCacheTtlInMs = item_cache_ttl * 1000
 
     # SSL config
     verify = kwargs.pop('connection_verify', None)
@@ -104,7 +121,7 @@ def _build_connection_policy(kwargs):
     policy.RetryOptions = retry
     connection_retry = kwargs.pop('connection_retry_policy', None) or policy.ConnectionRetryConfiguration
     if not connection_retry:
-        connection_retry = ConnectionRetryPolicy(
+        connection_retry = retry_policy_type(
             retry_total=total_retries,
             retry_connect=kwargs.pop('retry_connect', None),
             retry_read=kwargs.pop('retry_read', None),
@@ -147,6 +164,22 @@ class CosmosClient(object):
     :keyword bool enable_endpoint_discovery: Enable endpoint discovery for
         geo-replicated database accounts. (Default: True)
     :keyword list[str] preferred_locations: The preferred locations for geo-replicated database accounts.
+    :keyword int query_plan_cache_size: The number of query plans of cross partition queries kept by the client.
+        (Default: 1000, 0 disables the cache)
+    :keyword diagnostics_collector: Collects the diagnostics of the requests of the client, like their latency
+        and request charge, per container and operation type. (Default: None, no diagnostics are collected)
+    :paramtype diagnostics_collector: ~azure.cosmos.diagnostics.DiagnosticsCollector
+    :keyword bool latency_based_routing: Route reads to the preferred location with the lowest measured latency,
+        instead of the first available one. (Default: False)
+    :keyword int latency_routing_tolerance: The latency in milliseconds by which a location must be faster to be
+        preferred over a location that comes before it in `preferred_locations`. (Default: 20)
+    :keyword int latency_probe_interval: How often in seconds the read locations without recent reads are probed
+        to measure their latency, 0 disables the probes. (Default: 30)
+    :keyword int item_cache_size: The number of items of point reads kept by the client, so that repeated reads
+        of an item are served without a request, or with a read conditional on its etag. Only used with Session
+        consistency. (Default: 0, the cache is disabled)
+    :keyword int item_cache_ttl: How long in seconds a cached item is returned without checking whether it was
+        changed by other clients. (Default: 10)
 
     .. admonition:: Example:
 
@@ -452,3 +485,16 @@ class CosmosClient(object):
         if response_hook:
             response_hook(self.client_connection.last_response_headers)
         return result
+
+    def get_read_endpoint_latencies(self):
+        # type: () -> List[Dict[str, Any]]
+        """Get the endpoints reads are routed to, in the order they are used, with their recent latency.
+
+        The latencies are only measured when the client was created with `latency_based_routing`.
+
+        :returns: A list of dicts with the `endpoint`, the median (`p50`) and 99th percentile (`p99`)
+            of its recent latencies in milliseconds, and the `sampleCount` they were computed from.
+        :rtype: list[dict[str, Any]]
+        """
+        # pylint: disable=protected-access
+        return self.client_connection._global_endpoint_manager.get_read_endpoint_latencies()
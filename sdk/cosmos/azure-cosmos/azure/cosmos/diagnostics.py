@@ -22,7 +22,18 @@
 """Diagnostic tools for Azure Cosmos database service operations.
 """
 
+import copy
+import logging
+import math
+import threading
+import time
+
 from requests.structures import CaseInsensitiveDict
+from six.moves.urllib.parse import urlparse
+
+from .http_constants import HttpHeaders
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class RecordDiagnostics(object):
@@ -84,3 +95,302 @@ class RecordDiagnostics(object):
         if key in self._common:
             return self._headers[key]
         raise AttributeError(name)
+
+
+class DiagnosticsRecord(object):
+    """The diagnostics of one request to the Azure Cosmos database service, including its retries.
+
+    :ivar str resource_type: The type of the resource the request targets, like "docs" or "colls".
+    :ivar str operation_type: The type of the operation, like "Create", "Read" or "Query".
+    :ivar str container_link: The link of the container the request targets, or None for requests
+        outside of a container.
+    :ivar str endpoint: The endpoint of the region the last attempt was sent to.
+    :ivar bool succeeded: Whether the request succeeded.
+    :ivar int status_code: The status code of the failed request, or None if it succeeded or no response was received.
+    :ivar int sub_status: The sub-status code of the failed request, or None.
+    :ivar float request_charge: The request units consumed by all the attempts of the request.
+    :ivar float latency: The time in milliseconds the request took, including its retries.
+    :ivar int throttle_retries: The number of retries after the request was throttled.
+    :ivar int session_retries: The number of retries after the session token wasn't available in a region.
+    :ivar int failovers: The number of retries in another region after a write was forbidden.
+    """
+
+    __slots__ = (
+        "resource_type",
+        "operation_type",
+        "container_link",
+        "endpoint",
+        "succeeded",
+        "status_code",
+        "sub_status",
+        "request_charge",
+        "latency",
+        "throttle_retries",
+        "session_retries",
+        "failovers",
+    )
+
+    def __init__(self, resource_type, operation_type, container_link=None, endpoint=None, **kwargs):
+        self.resource_type = resource_type
+        self.operation_type = operation_type
+        self.container_link = container_link
+        self.endpoint = endpoint
+        self.succeeded = kwargs.get("succeeded", True)
+        self.status_code = kwargs.get("status_code")
+        self.sub_status = kwargs.get("sub_status")
+        self.request_charge = kwargs.get("request_charge", 0.0)
+        self.latency = kwargs.get("latency", 0.0)
+        self.throttle_retries = kwargs.get("throttle_retries", 0)
+        self.session_retries = kwargs.get("session_retries", 0)
+        self.failovers = kwargs.get("failovers", 0)
+
+    def __repr__(self):
+        return "<DiagnosticsRecord {} {} {} {:.2f}ms {:.2f}RU>".format(
+            self.operation_type, self.resource_type, self.container_link, self.latency, self.request_charge)
+
+
+class Histogram(object):
+    """A histogram of positive values, with buckets of exponentially growing widths.
+
+    Percentiles are estimated within the relative error of a bucket, with memory bounded by the
+    logarithm of the range of the values rather than by their number.
+
+    :param float relative_error: The relative error of the estimated percentiles.
+    """
+
+    def __init__(self, relative_error=0.05):
+        self._log_growth = math.log((1 + relative_error) / (1 - relative_error))
+        self._buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """Adds a value to the histogram.
+
+        :param float value: The value, values below zero are counted as zero.
+        """
+        value = max(value, 0.0)
+        bucket = int(math.ceil(math.log(value) / self._log_growth)) if value > 0 else None
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percentile):
+        """Estimates a percentile of the values.
+
+        :param float percentile: The percentile, between 0 and 100.
+        :returns: The estimated value, or None if the histogram is empty.
+        :rtype: float
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError("The percentile must be between 0 and 100.")
+        if not self.count:
+            return None
+        rank = max(int(math.ceil(percentile / 100.0 * self.count)), 1)
+        seen = self._buckets.get(None, 0)
+        if seen >= rank:
+            return 0.0
+        for bucket in sorted(b for b in self._buckets if b is not None):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                # the middle of the bucket is within the relative error of all its values
+                value = 2 * math.exp(bucket * self._log_growth) / (1 + math.exp(self._log_growth))
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class OperationStatistics(object):
+    """The statistics of the requests of one operation type on one container.
+
+    :ivar str container_link: The link of the container, or None for requests outside of a container.
+    :ivar str operation_type: The type of the operation.
+    :ivar int count: The number of requests.
+    :ivar int failures: The number of failed requests.
+    :ivar int throttle_retries: The number of retries after requests were throttled.
+    :ivar int session_retries: The number of retries after session tokens weren't available in a region.
+    :ivar int failovers: The number of retries in another region after writes were forbidden.
+    :ivar Histogram latency: The histogram of the latencies of the requests, in milliseconds.
+    :ivar Histogram request_charge: The histogram of the request units consumed by the requests.
+    """
+
+    def __init__(self, container_link, operation_type):
+        self.container_link = container_link
+        self.operation_type = operation_type
+        self.count = 0
+        self.failures = 0
+        self.throttle_retries = 0
+        self.session_retries = 0
+        self.failovers = 0
+        self.latency = Histogram()
+        self.request_charge = Histogram()
+
+    def add(self, record):
+        self.count += 1
+        self.failures += not record.succeeded
+        self.throttle_retries += record.throttle_retries
+        self.session_retries += record.session_retries
+        self.failovers += record.failovers
+        self.latency.add(record.latency)
+        self.request_charge.add(record.request_charge)
+
+    def __repr__(self):
+        return "<OperationStatistics {} {} count={} p50={}ms p99={}ms RU={:.2f}>".format(
+            self.operation_type, self.container_link, self.count, self.latency.percentile(50),
+            self.latency.percentile(99), self.request_charge.total)
+
+
+class DiagnosticsExporter(object):
+    """Base class of the exporters the diagnostics records of a :class:`DiagnosticsCollector` are sent to.
+
+    Exporters are called synchronously with every record, so they should hand the records off to
+    any slow destination rather than send them inline.
+    """
+
+    def export(self, record):
+        """Exports the diagnostics of one request.
+
+        :param DiagnosticsRecord record: The diagnostics of the request.
+        """
+        raise NotImplementedError
+
+
+class LoggingDiagnosticsExporter(DiagnosticsExporter):
+    """Logs every diagnostics record.
+
+    :param logging.Logger logger: The logger, by default the logger of this module.
+    :param int level: The level of the log messages. (Default: logging.DEBUG)
+    """
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        self._logger = logger or _LOGGER
+        self._level = level
+
+    def export(self, record):
+        if self._logger.isEnabledFor(self._level):
+            self._logger.log(self._level, "%r", record)
+
+
+class DiagnosticsCollector(object):
+    """Collects the diagnostics of the requests of a client, and aggregates them per container and operation type.
+
+    Pass it to the client with the ``diagnostics_collector`` keyword argument. Clients without one
+    don't collect diagnostics at all.
+
+    Examples:
+
+        >>> diagnostics = DiagnosticsCollector()
+
+        >>> client = CosmosClient(url, key, diagnostics_collector=diagnostics)
+
+        >>> stats = diagnostics.get_statistics("dbs/db/colls/coll", "Read")
+        >>> stats.latency.percentile(99), stats.request_charge.total
+        (12.4, 104.0)
+
+    :param list[DiagnosticsExporter] exporters: The exporters every record is sent to.
+    """
+
+    def __init__(self, exporters=None):
+        self._exporters = list(exporters or [])
+        self._statistics = {}
+        self._lock = threading.Lock()
+
+    def add_exporter(self, exporter):
+        """Sends the records to another exporter.
+
+        :param DiagnosticsExporter exporter: The exporter.
+        """
+        self._exporters.append(exporter)
+
+    def record(self, record):
+        """Adds the diagnostics of one request to the statistics, and exports them.
+
+        :param DiagnosticsRecord record: The diagnostics of the request.
+        """
+        key = (record.container_link, record.operation_type)
+        with self._lock:
+            statistics = self._statistics.get(key)
+            if statistics is None:
+                statistics = self._statistics[key] = OperationStatistics(*key)
+            statistics.add(record)
+        for exporter in self._exporters:
+            try:
+                exporter.export(record)
+            except Exception:  # pylint: disable=broad-except
+                # a failing exporter must not fail the request
+                _LOGGER.warning("Failed to export the diagnostics record %r.", record, exc_info=True)
+
+    def get_statistics(self, container_link=None, operation_type=None):
+        """Gets a snapshot of the statistics of an operation type on a container.
+
+        :param str container_link: The link of the container.
+        :param str operation_type: The type of the operation.
+        :returns: The statistics, or None if no such request was recorded.
+        :rtype: OperationStatistics
+        """
+        with self._lock:
+            return copy.deepcopy(self._statistics.get((container_link, operation_type)))
+
+    def list_statistics(self):
+        """Gets a snapshot of the statistics of all the operation types on all the containers.
+
+        :rtype: list[OperationStatistics]
+        """
+        with self._lock:
+            return [copy.deepcopy(s) for s in self._statistics.values()]
+
+    def reset(self):
+        """Clears the statistics."""
+        with self._lock:
+            self._statistics.clear()
+
+
+def _get_container_link(url):
+    segments = urlparse(url).path.strip("/").split("/")
+    if len(segments) >= 4 and segments[0] == "dbs" and segments[2] == "colls":
+        return "/".join(segments[:4])
+    return None
+
+
+def _request_charge(headers):
+    try:
+        return float(headers.get(HttpHeaders.RequestCharge, 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _record_request(collector, args, start_time, request_charge, retry_policies, error=None):
+    """Records the diagnostics of a request executed by the retry utility.
+
+    :param DiagnosticsCollector collector: The collector of the client.
+    :param tuple args: The request object, connection policy, pipeline client and http request the
+        request function was called with.
+    :param float start_time: The time the first attempt of the request was sent.
+    :param float request_charge: The request units consumed by all the attempts.
+    :param tuple retry_policies: The endpoint discovery, resource throttle and session retry policies of the request.
+    :param Exception error: The error the request failed with, only service errors carry a status code.
+    """
+    request_params, request = args[0], args[3]
+    endpoint_discovery_retry_policy, resource_throttle_retry_policy, session_retry_policy = retry_policies
+    parse_result = urlparse(request.url)
+    collector.record(DiagnosticsRecord(
+        request_params.resource_type,
+        request_params.operation_type,
+        container_link=_get_container_link(request.url),
+        endpoint="{}://{}".format(parse_result.scheme, parse_result.netloc),
+        succeeded=error is None,
+        status_code=getattr(error, 'status_code', None),
+        sub_status=getattr(error, 'sub_status', None),
+        request_charge=request_charge,
+        latency=(time.time() - start_time) * 1000.0,
+        throttle_retries=resource_throttle_retry_policy.current_retry_attempt_count,
+        session_retries=session_retry_policy.session_token_retry_count,
+        failovers=endpoint_discovery_retry_policy.failover_retry_count,
+    ))
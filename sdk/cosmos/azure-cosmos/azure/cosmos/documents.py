@@ -356,9 +356,45 @@ class ConnectionPolicy(object):  # pylint: disable=too-many-instance-attributes
         Retry Configuration to be used for connection retries.
     :vartype ConnectionRetryConfiguration:
         int or azure.cosmos.ConnectionRetryPolicy or urllib3.util.retry
+    :ivar int QueryPlanCacheSize:
+        Gets or sets the number of query plans of cross partition queries the
+        client keeps, so that repeated queries don't request their query plan
+        again. Set to 0 to disable the cache.
+    :ivar boolean EnableLatencyBasedRouting:
+        Gets or sets whether reads are routed to the preferred location with
+        the lowest latency. The latency of each read endpoint is measured from
+        the reads sent to it, and from probes of the endpoints without recent
+        reads. A location is only preferred over a location that comes before
+        it in PreferredLocations if it is faster by more than
+        LatencyRoutingToleranceInMs.
+    :ivar int LatencyRoutingToleranceInMs:
+        Gets or sets the latency in milliseconds by which a location must be
+        faster to be preferred over a location that comes before it in
+        PreferredLocations.
+    :ivar int LatencyProbeIntervalInMs:
+        Gets or sets how often in milliseconds the read endpoints without
+        recent reads are probed when EnableLatencyBasedRouting is true. Set
+        to 0 to disable the probes.
+    :ivar int ItemCacheSize:
+        Gets or sets the number of items of point reads the client keeps with
+        Session consistency. A cached item is returned without a request
+        while it is younger than ItemCacheTtlInMs and the session hasn't seen
+        a newer write to its partition key range, and is otherwise
+        revalidated by a read conditional on its etag. The items written by
+        the client are removed from the cache. Set to 0 to disable the cache.
+    :ivar int ItemCacheTtlInMs:
+        Gets or sets how long in milliseconds a cached item is returned
+        without checking whether it was changed by other clients.
+    :ivar diagnostics.DiagnosticsCollector DiagnosticsCollector:
+        Gets or sets the collector of the diagnostics of the requests of the
+        client. No diagnostics are collected when it isn't set.
     """
 
     __defaultRequestTimeout = 60000  # milliseconds
+    __defaultQueryPlanCacheSize = 1000
+    __defaultLatencyRoutingToleranceInMs = 20
+    __defaultLatencyProbeIntervalInMs = 30000
+    __defaultItemCacheTtlInMs = 10000
 
     def __init__(self):
         self.RequestTimeout = self.__defaultRequestTimeout
@@ -371,11 +407,19 @@ class ConnectionPolicy(object):  # pylint: disable=too-many-instance-attributes
         self.DisableSSLVerification = False
         self.UseMultipleWriteLocations = False
         self.ConnectionRetryConfiguration = None
+        self.QueryPlanCacheSize = self.__defaultQueryPlanCacheSize
+        self.DiagnosticsCollector = None
+        self.EnableLatencyBasedRouting = False
+        self.LatencyRoutingToleranceInMs = self.__defaultLatencyRoutingToleranceInMs
+        self.LatencyProbeIntervalInMs = self.__defaultLatencyProbeIntervalInMs
+        self.ItemCacheSize = 0
+        self.ItemCacheTtlInMs = self.__defaultItemCacheTtlInMs
 
 
 class _OperationType(object):
     """Represents the type of the operation
     """
+    Batch = "Batch"
     Create = "Create"
     Delete = "Delete"
     ExecuteJavaScript = "ExecuteJavaScript"
@@ -394,6 +438,7 @@ class _OperationType(object):
     @staticmethod
     def IsWriteOperation(operationType):
         return operationType in (
+            _OperationType.Batch,
             _OperationType.Create,
             _OperationType.Delete,
             _OperationType.Recreate,
@@ -73,3 +73,12 @@ class CosmosClientTimeoutError(AzureError):
         self.response = None
         self.history = None
         super(CosmosClientTimeoutError, self).__init__(message, **kwargs)
+
+
+def _partition_range_is_gone(error):
+    """Whether a request failed because its partition key range was split or merged."""
+    return error.status_code == http_constants.StatusCodes.GONE and error.sub_status in (
+        http_constants.SubStatusCodes.PARTITION_KEY_RANGE_GONE,
+        http_constants.SubStatusCodes.COMPLETING_SPLIT,
+        http_constants.SubStatusCodes.COMPLETING_PARTITION_MIGRATION,
+    )
@@ -180,6 +180,11 @@ class HttpHeaders(object):
     # Upsert header
     IsUpsert = "x-ms-documentdb-is-upsert"
 
+    # Transactional batch headers
+    IsBatchRequest = "x-ms-cosmos-is-batch-request"
+    IsBatchAtomic = "x-ms-cosmos-batch-atomic"
+    ShouldBatchContinueOnError = "x-ms-cosmos-batch-continue-on-error"
+
     # Index progress headers.
     IndexTransformationProgress = "x-ms-documentdb-collection-index-transformation-progress"
     LazyIndexingProgress = "x-ms-documentdb-collection-lazy-indexing-progress"
@@ -327,6 +332,7 @@ class StatusCodes(object):
     CREATED = 201
     ACCEPTED = 202
     NO_CONTENT = 204
+    MULTI_STATUS = 207
 
     NOT_MODIFIED = 304
 
@@ -341,6 +347,7 @@ class StatusCodes(object):
     GONE = 410
     PRECONDITION_FAILED = 412
     REQUEST_ENTITY_TOO_LARGE = 413
+    FAILED_DEPENDENCY = 424
     TOO_MANY_REQUESTS = 429
     RETRY_WITH = 449
 
@@ -22,6 +22,18 @@
 """Create partition keys in the Azure Cosmos DB SQL API service.
 """
 
+import binascii
+import struct
+
+import six
+
+from ._cosmos_murmurhash3 import murmurhash3_32, murmurhash3_128
+
+# Version 1 partition keys hash and encode at most 100 characters of a string
+_MAX_STRING_CHARS = 100
+_MAX_STRING_BYTES_TO_APPEND = 100
+_MASK_64 = 0xFFFFFFFFFFFFFFFF
+
 class NonePartitionKeyValue(object):
     """Represents None value for partitionKey when it's missing in a container.
     """
@@ -85,3 +97,129 @@ class PartitionKey(dict):
     @version.setter
     def version(self, value):
         self["version"] = value
+
+
+class _PartitionKeyComponentType(object):
+    Undefined = 0x0
+    Null = 0x1
+    PFalse = 0x2
+    PTrue = 0x3
+    MinNumber = 0x4
+    Number = 0x5
+    MaxNumber = 0x6
+    MinString = 0x7
+    String = 0x8
+    MaxString = 0x9
+    Infinity = 0xFF
+
+
+def _get_components(partition_key_value):
+    if isinstance(partition_key_value, list):
+        return partition_key_value
+    return [partition_key_value]
+
+
+def _write_for_hashing(value, string_suffix):
+    if value is True:
+        return bytearray([_PartitionKeyComponentType.PTrue])
+    if value is False:
+        return bytearray([_PartitionKeyComponentType.PFalse])
+    if value is None:
+        return bytearray([_PartitionKeyComponentType.Null])
+    if value is _Undefined or isinstance(value, _Undefined):
+        return bytearray([_PartitionKeyComponentType.Undefined])
+    if isinstance(value, six.integer_types + (float,)):
+        return bytearray([_PartitionKeyComponentType.Number]) + bytearray(struct.pack("<d", value))
+    if isinstance(value, six.string_types):
+        encoded = bytearray([_PartitionKeyComponentType.String]) + bytearray(value.encode("utf-8"))
+        encoded.append(string_suffix)
+        return encoded
+    raise TypeError("Unsupported partition key value type: {}".format(type(value).__name__))
+
+
+def _write_string_for_binary_encoding(value):
+    utf8_value = bytearray(value.encode("utf-8"))
+    short_string = len(utf8_value) <= _MAX_STRING_BYTES_TO_APPEND
+    encoded = bytearray([_PartitionKeyComponentType.String])
+    # Each byte is incremented so that the terminating zero sorts before any character
+    for char_byte in utf8_value[:_MAX_STRING_BYTES_TO_APPEND + 1]:
+        encoded.append(char_byte + 1 if char_byte < 0xFF else char_byte)
+    if short_string:
+        encoded.append(0x00)
+    return encoded
+
+
+def _write_number_for_binary_encoding(value):
+    # The number is encoded so that the binary representations sort in the same order as the numbers
+    payload = struct.unpack("<Q", struct.pack("<d", value))[0]
+    if payload & 0x8000000000000000:
+        payload = (~payload + 1) & _MASK_64
+    else:
+        payload ^= 0x8000000000000000
+    encoded = bytearray([_PartitionKeyComponentType.Number, payload >> 56])
+    payload = (payload << 8) & _MASK_64
+    # The remaining chunks carry 7 bits of payload followed by a 1 bit, except for the last one
+    byte_to_write = 0
+    first_iteration = True
+    while payload:
+        if not first_iteration:
+            encoded.append(byte_to_write)
+        first_iteration = False
+        byte_to_write = (payload >> 56) | 0x01
+        payload = (payload << 7) & _MASK_64
+    encoded.append(byte_to_write & 0xFE)
+    return encoded
+
+
+def _write_for_binary_encoding(value):
+    if isinstance(value, six.string_types):
+        return _write_string_for_binary_encoding(value)
+    if isinstance(value, six.integer_types + (float,)) and not isinstance(value, bool):
+        return _write_number_for_binary_encoding(float(value))
+    # Booleans, null and undefined are encoded as their component type only
+    return _write_for_hashing(value, 0x00)
+
+
+def _to_hex(data):
+    return binascii.hexlify(bytes(data)).decode("ascii").upper()
+
+
+def _get_effective_partition_key_for_hash_partitioning(components):
+    truncated = [c[:_MAX_STRING_CHARS] if isinstance(c, six.string_types) else c for c in components]
+    hashed = bytearray()
+    for component in truncated:
+        hashed += _write_for_hashing(component, 0x00)
+    encoded = _write_for_binary_encoding(float(murmurhash3_32(hashed)))
+    for component in truncated:
+        encoded += _write_for_binary_encoding(component)
+    return _to_hex(encoded)
+
+
+def _get_effective_partition_key_for_hash_partitioning_v2(components):
+    hashed = bytearray()
+    for component in components:
+        hashed += _write_for_hashing(component, 0xFF)
+    low, high = murmurhash3_128(hashed)
+    hash_bytes = bytearray(struct.pack("<QQ", low, high))
+    hash_bytes.reverse()
+    # Reset the 2 most significant bits, as the maximum exclusive effective partition key is 'FF'
+    hash_bytes[0] &= 0x3F
+    return _to_hex(hash_bytes)
+
+
+def _get_effective_partition_key_string(partition_key_definition, partition_key_value):
+    """Computes the effective partition key of a partition key value, as the hex encoded string
+    the partition key ranges of a container are defined with.
+
+    :param dict partition_key_definition: The partition key definition of the container.
+    :param partition_key_value: The partition key value, or the list of its components.
+    :return: The effective partition key.
+    :rtype: str
+    """
+    if partition_key_value is _Empty or isinstance(partition_key_value, _Empty) or partition_key_value == []:
+        # The empty partition key of a migrated container is the minimum effective partition key
+        return ""
+    components = _get_components(partition_key_value)
+    if partition_key_definition.get("version", 1) == 2:
+        return _get_effective_partition_key_for_hash_partitioning_v2(components)
+    return _get_effective_partition_key_for_hash_partitioning(components)
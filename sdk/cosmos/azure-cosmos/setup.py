@@ -72,7 +72,7 @@ setup(
     ],
     extras_require={
       ":python_version<'3.4'": ['enum34>=1.0.4'],
-      ":python_version<'3.0'": ["azure-nspkg"],
+      ":python_version<'3.0'": ["azure-nspkg", "futures"],
       ":python_version<'3.5'": ["typing"]
     },
 )
\ No newline at end of file
@@ -21,10 +21,16 @@
 
 # pytest fixture 'teardown' is called at the end of a test run to clean up resources
 
+import sys
 import test_config
 import pytest
 import cleanup
 
+# Ignore async tests for Python < 3.5
+collect_ignore_glob = []
+if sys.version_info < (3, 5):
+    collect_ignore_glob.append("*_async.py")
+
 @pytest.fixture(scope="session")
 def teardown(request):
 
@@ -0,0 +1,116 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import copy
+import datetime
+import hashlib
+import json
+import numbers
+import sys
+import tracemalloc
+
+from azure.cosmos._execution_context.endpoint_component import _DistinctResultSet, _make_hash
+
+# Compares the de-duplication of the results of a DISTINCT query without ORDER BY
+# by the previous deepcopy and JSON based hashing with the canonical encoding.
+# Runs offline against synthetic nested documents, half of them duplicates.
+
+# NAME, DOCUMENTS, NESTING DEPTH, MAXIMUM DIGESTS IN MEMORY
+DOCUMENT_SETS = [
+    ('FLAT-020000', 20000, 0, None),
+    ('NESTED-020000', 20000, 3, None),
+    ('NESTED-020000-SPILL', 20000, 3, 2000),
+]
+
+ITERATIONS = 3
+
+
+def nested_document(index, depth):
+    document = {'id': str(index), 'value': index * 0.5, 'flag': index % 3 == 0, 'tags': ['a', 'b', str(index)]}
+    for level in range(depth):
+        document = {'level': level, 'child': document, 'siblings': [{'n': n, 'name': 'item'} for n in range(3)]}
+    return document
+
+
+def documents(count, depth):
+    # every document is returned twice, the second time with its properties in reverse order
+    unique = [nested_document(i, depth) for i in range(count // 2)]
+    reordered = [json.loads(json.dumps(d, sort_keys=True), object_pairs_hook=lambda p: dict(reversed(p)))
+                 for d in unique]
+    return unique + reordered
+
+
+def previous_make_hash(value):
+    if isinstance(value, (set, tuple, list)):
+        return tuple([previous_make_hash(v) for v in value])
+    if not isinstance(value, dict):
+        if isinstance(value, numbers.Number):
+            return float(value)
+        return value
+    new_value = copy.deepcopy(value)
+    for k, v in new_value.items():
+        new_value[k] = previous_make_hash(v)
+    return tuple(frozenset(sorted(new_value.items())))
+
+
+def previous_distinct(results, max_in_memory):
+    seen = set()
+    for result in results:
+        digest = hashlib.sha1(json.dumps(previous_make_hash(result)).encode('utf-8')).hexdigest()
+        if digest not in seen:
+            seen.add(digest)
+            yield result
+
+
+def canonical_distinct(results, max_in_memory):
+    seen = _DistinctResultSet(max_in_memory)
+    for result in results:
+        digest = _make_hash(result)
+        if digest not in seen:
+            seen.add(digest)
+            yield result
+    seen.close()
+
+
+def measure(distinct, results, max_in_memory):
+    sys.stdout.write('\t{0}:'.format(distinct.__name__))
+    tracemalloc.start()
+    start_time = datetime.datetime.now()
+    for _ in range(ITERATIONS):
+        unique = sum(1 for _ in distinct(results, max_in_memory))
+    elapsed_time = datetime.datetime.now() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert unique == len(results) // 2
+    sys.stdout.write('{0:.0f} results/s, peak {1:.1f}MB'.format(
+        len(results) * ITERATIONS / elapsed_time.total_seconds(), peak / 1048576.0))
+
+
+def main():
+    for name, count, depth, max_in_memory in DOCUMENT_SETS:
+        results = documents(count, depth)
+        sys.stdout.write(name)
+        measure(previous_distinct, results, max_in_memory)
+        measure(canonical_distinct, results, max_in_memory)
+        print('')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import unittest
+import pytest
+from azure.cosmos._cosmos_murmurhash3 import murmurhash3_32, murmurhash3_128
+from azure.cosmos._routing.collection_routing_map import CollectionRoutingMap
+from azure.cosmos.partition_key import _Empty, _Undefined, _get_effective_partition_key_string
+
+pytestmark = pytest.mark.cosmosEmulator
+
+# The values below are hashed to the same effective partition keys by the other Cosmos SDKs
+_NUMBERS = [-128, 127, -2 ** 63, 2 ** 63 - 1, -2 ** 31, 2 ** 31 - 1, 5e-324, 1.7976931348623157e308]
+
+
+class PartitionKeyHashingTests(unittest.TestCase):
+
+    def test_murmurhash3(self):
+        self.assertEqual(murmurhash3_32(b'', 1), 0x514E28B7)
+        self.assertEqual(murmurhash3_32(b'Hello, world!', 1234), 0xFAF6CDB3)
+        fox = b'The quick brown fox jumps over the lazy dog'
+        self.assertEqual(murmurhash3_32(fox), 0x2E4FF723)
+        self.assertEqual(murmurhash3_128(fox), (0xE34BBC7BBC071B6C, 0x7A433CA9C49A9347))
+
+    def test_effective_partition_key_v1(self):
+        definition = {'paths': ['/pk'], 'kind': 'Hash'}
+        expected = [
+            ('', '05C1CF33970FF80800'),
+            (None, '05C1ED45D7475601'),
+            (True, '05C1D7C5A903D803'),
+            (False, '05C1DB857D857C02'),
+            (_Undefined(), '05C1D529E345DC00'),
+        ] + list(zip(_NUMBERS, [
+            '05C1D73349F54C053FA0',
+            '05C1DD539DDFCC05C05FE0',
+            '05C1DB35F33D1C053C20',
+            '05C1B799AB2DD005C3E0',
+            '05C1DFBF252BCC053E20',
+            '05C1E1F503DFB205C1DFFFFFFFFC',
+            '05C1E5C91F4D3005800101010101010102',
+            '05C1CBE367C53005FFEFFFFFFFFFFFFFFE',
+        ]))
+        for value, effective_partition_key in expected:
+            self.assertEqual(_get_effective_partition_key_string(definition, value), effective_partition_key)
+
+    def test_effective_partition_key_v2(self):
+        definition = {'paths': ['/pk'], 'kind': 'Hash', 'version': 2}
+        expected = [
+            ('', '32E9366E637A71B4E710384B2F4970A0'),
+            ('partitionKey', '013AEFCF77FA271571CF665A58C933F1'),
+            ('a' * 1024, '332BDF5512AE49615F32C7D98C2DB86C'),
+            (None, '378867E4430E67857ACE5C908374FE16'),
+            (_Undefined(), '11622DAA78F835834610ABE56EFF5CB5'),
+            (True, '0E711127C5B5A8E4726AC6DD306A3E59'),
+            (False, '2FE1BE91E90A3439635E0E9E37361EF2'),
+        ] + list(zip(_NUMBERS, [
+            '01DAEDABF913540367FE219B2AD06148',
+            '0C507ACAC853ECA7977BF4CEFB562A25',
+            '23D5C6395512BDFEAFADAD15328AD2BB',
+            '2EDB959178DFCCA18983F89384D1629B',
+            '0B1660D5233C3171725B30D4A5F4CC1F',
+            '2D9349D64712AEB5EB1406E2F0BE2725',
+            '0E6CBA63A280927DE485DEF865800139',
+            '31424D996457102634591FF245DBCC4D',
+        ]))
+        for value, effective_partition_key in expected:
+            self.assertEqual(_get_effective_partition_key_string(definition, value), effective_partition_key)
+
+    def test_effective_partition_key_of_special_values(self):
+        definition = {'paths': ['/pk'], 'kind': 'Hash', 'version': 2}
+        # the undefined and empty partition keys are passed as the classes themselves by the client
+        self.assertEqual(_get_effective_partition_key_string(definition, _Undefined),
+                         _get_effective_partition_key_string(definition, _Undefined()))
+        self.assertEqual(_get_effective_partition_key_string(definition, _Empty), '')
+        self.assertEqual(_get_effective_partition_key_string(definition, []), '')
+        # a value is hashed as the single component of a hierarchical partition key
+        self.assertEqual(_get_effective_partition_key_string(definition, ['a']),
+                         _get_effective_partition_key_string(definition, 'a'))
+        # strings are truncated before hashing with the first version only
+        self.assertEqual(_get_effective_partition_key_string({}, 'a' * 100)[:12],
+                         _get_effective_partition_key_string({}, 'a' * 101)[:12])
+        self.assertNotEqual(_get_effective_partition_key_string(definition, 'a' * 100),
+                            _get_effective_partition_key_string(definition, 'a' * 101))
+        with self.assertRaises(TypeError):
+            _get_effective_partition_key_string(definition, {'a': 1})
+
+    def test_range_by_effective_partition_key(self):
+        ranges = [{'id': '0', 'minInclusive': '', 'maxExclusive': '15'},
+                  {'id': '1', 'minInclusive': '15', 'maxExclusive': '2A'},
+                  {'id': '2', 'minInclusive': '2A', 'maxExclusive': 'FF'}]
+        routing_map = CollectionRoutingMap.CompleteRoutingMap([(r, True) for r in ranges], 'coll')
+        definition = {'paths': ['/pk'], 'kind': 'Hash', 'version': 2}
+
+        def range_of(value):
+            effective_partition_key = _get_effective_partition_key_string(definition, value)
+            return routing_map.get_range_by_effective_partition_key(effective_partition_key)['id']
+
+        self.assertEqual(range_of('partitionKey'), '0')
+        self.assertEqual(range_of(True), '0')
+        self.assertEqual(range_of(-2 ** 63), '1')
+        self.assertEqual(range_of(None), '2')
+        self.assertEqual(range_of(_Empty), '0')
+
+
+if __name__ == "__main__":
+    unittest.main()
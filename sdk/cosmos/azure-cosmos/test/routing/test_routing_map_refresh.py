@@ -0,0 +1,103 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+
+import unittest
+import pytest
+from azure.cosmos._routing.routing_map_provider import PartitionKeyRangeCache
+from azure.cosmos.http_constants import HttpHeaders
+
+pytestmark = pytest.mark.cosmosEmulator
+
+
+class RoutingMapRefreshTests(unittest.TestCase):
+    """Tests of the refresh of the cached routing map of a collection from the change feed of its partition key ranges.
+    """
+
+    class MockedCosmosClientConnection(object):
+        """Serves the change feed of the partition key ranges, where the ETag is the number of changes read."""
+
+        def __init__(self):
+            self.changes = [{'id': '0', 'minInclusive': '', 'maxExclusive': '80'},
+                            {'id': '1', 'minInclusive': '80', 'maxExclusive': 'FF'}]
+            self.requests = []
+            # the number of changes returned when reading from an ETag, to read the changes of a split partially
+            self.changes_per_read = None
+
+        def split(self, range_id, middle):
+            parent = [r for r in self.changes if r['id'] == range_id][-1]
+            self.changes.append({'id': range_id + '-0', 'minInclusive': parent['minInclusive'],
+                                 'maxExclusive': middle, 'parents': [range_id]})
+            self.changes.append({'id': range_id + '-1', 'minInclusive': middle,
+                                 'maxExclusive': parent['maxExclusive'], 'parents': [range_id]})
+
+        def _ReadPartitionKeyRanges(self, collection_link, feed_options=None, response_hook=None):
+            self.requests.append(feed_options.get('continuation'))
+            start = int(feed_options.get('continuation') or 0)
+            end = start + self.changes_per_read if start and self.changes_per_read else len(self.changes)
+            response_hook({HttpHeaders.ETag: str(end)}, None)
+            return self.changes[start:end]
+
+    def setUp(self):
+        self.client = self.MockedCosmosClientConnection()
+        self.cache = PartitionKeyRangeCache(self.client)
+
+    def _range_ids(self, routing_map):
+        return [r['id'] for r in routing_map.get_ordered_partition_key_ranges()]
+
+    def test_refresh_reads_changed_ranges(self):
+        routing_map = self.cache.get_routing_map('dbs/db/colls/coll')
+        self.assertEqual(routing_map.change_feed_next_if_none_match, '2')
+
+        self.client.split('0', '40')
+        refreshed = self.cache.refresh_routing_map('dbs/db/colls/coll', '0')
+
+        # only the changes since the routing map was loaded are read
+        self.assertEqual(self.client.requests, [None, '2'])
+        self.assertEqual(self._range_ids(refreshed), ['0-0', '0-1', '1'])
+        self.assertEqual(refreshed.change_feed_next_if_none_match, '4')
+        self.assertIs(self.cache.get_routing_map('dbs/db/colls/coll'), refreshed)
+        self.assertEqual(self._range_ids(routing_map), ['0', '1'])
+
+        # the routing map was already refreshed for the gone range
+        self.assertIs(self.cache.refresh_routing_map('dbs/db/colls/coll', '0'), refreshed)
+        self.assertEqual(len(self.client.requests), 2)
+
+        self.client.split('0-1', '60')
+        self.assertEqual(self._range_ids(self.cache.refresh_routing_map('dbs/db/colls/coll', '0-1')),
+                         ['0-0', '0-1-0', '0-1-1', '1'])
+        self.assertEqual(self.client.requests, [None, '2', '4'])
+
+    def test_refresh_reloads_incomplete_changes(self):
+        self.cache.get_routing_map('dbs/db/colls/coll')
+        self.client.split('1', 'C0')
+        self.client.changes_per_read = 1
+
+        refreshed = self.cache.refresh_routing_map('dbs/db/colls/coll', '1')
+
+        # the first child alone doesn't complete the routing map, so all the ranges are read again
+        self.assertEqual(self.client.requests, [None, '2', None])
+        self.assertEqual(self._range_ids(refreshed), ['0', '1-0', '1-1'])
+        self.assertEqual(refreshed.change_feed_next_if_none_match, '4')
+
+
+if __name__ == "__main__":
+    unittest.main()
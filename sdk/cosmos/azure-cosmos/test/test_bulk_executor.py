@@ -0,0 +1,232 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import threading
+import time
+import unittest
+import pytest
+from azure.cosmos import BulkOperationType
+from azure.cosmos._bulk_executor import _BulkExecutor, _CongestionController
+from azure.cosmos._cosmos_client_connection import CosmosClientConnection
+from azure.cosmos.exceptions import CosmosHttpResponseError
+from azure.cosmos.http_constants import HttpHeaders, StatusCodes, SubStatusCodes
+from azure.cosmos.partition_key import _get_effective_partition_key_string
+from azure.cosmos._routing.collection_routing_map import CollectionRoutingMap
+
+pytestmark = pytest.mark.cosmosEmulator
+
+
+class _Response(object):
+
+    def __init__(self, status_code, headers):
+        self.status_code = status_code
+        self.headers = headers
+        self.reason = None
+
+    def text(self):
+        return ''
+
+
+class _PipelineResponse(object):
+
+    def __init__(self, http_response):
+        self.http_response = http_response
+
+
+class BulkExecutorTests(unittest.TestCase):
+    """Bulk execution tests against a mocked container.
+    """
+
+    class MockedClientConnection(object):
+        _ExtractPartitionKey = CosmosClientConnection._ExtractPartitionKey
+        _retrieve_partition_key = CosmosClientConnection._retrieve_partition_key
+        _return_undefined_or_empty_partition_key = CosmosClientConnection._return_undefined_or_empty_partition_key
+
+        def __init__(self, container):
+            self.container = container
+            self.routing_map_loads = 0
+            self._routing_map_provider = self
+            self._collection_routing_map_by_item = {}
+
+        def get_routing_map(self, collection_link):
+            if collection_link not in self._collection_routing_map_by_item:
+                self.routing_map_loads += 1
+                self._collection_routing_map_by_item[collection_link] = self.container._routing_map()
+            return self._collection_routing_map_by_item[collection_link]
+
+        def refresh_routing_map(self, collection_link, gone_partition_key_range_id=None):
+            self._collection_routing_map_by_item.pop(collection_link, None)
+            return self.get_routing_map(collection_link)
+
+    class MockedContainer(object):
+        """Each partition key range serves a limited number of requests at the same time, and throttles the others."""
+
+        partition_key_definition = {'paths': ['/pk'], 'kind': 'Hash', 'version': 2}
+
+        def __init__(self, range_count, capacity):
+            self.client_connection = BulkExecutorTests.MockedClientConnection(self)
+            self.container_link = 'dbs/db/colls/coll'
+            # the effective partition keys of hash partitioning v2 are below '40'
+            bounds = [''] + ['{:02X}'.format(0x40 * i // range_count) for i in range(1, range_count)] + ['FF']
+            self.ranges = [{'id': str(i), 'minInclusive': bounds[i], 'maxExclusive': bounds[i + 1]}
+                           for i in range(range_count)]
+            self.capacity = capacity
+            self.items = {}
+            self.stale = {}
+            self.throttled = 0
+            self.max_in_flight = 0
+            self._in_flight = {}
+            self._lock = threading.Lock()
+
+        def _get_properties(self):
+            return {'partitionKey': self.partition_key_definition}
+
+        def _routing_map(self):
+            return CollectionRoutingMap.CompleteRoutingMap([(r, True) for r in self.ranges], 'coll')
+
+        def _range_of(self, partition_key):
+            effective_partition_key = _get_effective_partition_key_string(self.partition_key_definition, partition_key)
+            return self._routing_map().get_range_by_effective_partition_key(effective_partition_key)['id']
+
+        def split(self, range_id):
+            index = [r['id'] for r in self.ranges].index(range_id)
+            parent = self.ranges[index]
+            low, high = int(parent['minInclusive'] or '0', 16), min(int(parent['maxExclusive'], 16), 0x40)
+            middle = '{:02X}'.format((low + high) // 2)
+            self.ranges[index:index + 1] = [
+                {'id': range_id + '-0', 'minInclusive': parent['minInclusive'], 'maxExclusive': middle},
+                {'id': range_id + '-1', 'minInclusive': middle, 'maxExclusive': parent['maxExclusive']}]
+
+        def _send(self, partition_key, hook, operation, item_id=None):
+            range_id = self._range_of(partition_key)
+            with self._lock:
+                # the first request of an item sent before the split targets the parent range
+                if self.stale.pop(item_id, range_id) != range_id:
+                    error = _Response(
+                        StatusCodes.GONE, {HttpHeaders.SubStatus: str(SubStatusCodes.PARTITION_KEY_RANGE_GONE)})
+                    raise CosmosHttpResponseError(response=error)
+                in_flight = self._in_flight.get(range_id, 0)
+                self.max_in_flight = max(self.max_in_flight, sum(self._in_flight.values()) + 1)
+                if in_flight >= self.capacity:
+                    self.throttled += 1
+                    response = _Response(StatusCodes.TOO_MANY_REQUESTS, {HttpHeaders.RetryAfterInMilliseconds: '5'})
+                    hook(_PipelineResponse(response))
+                    raise CosmosHttpResponseError(response=response)
+                self._in_flight[range_id] = in_flight + 1
+            try:
+                time.sleep(0.002)
+                result = operation()
+                hook(_PipelineResponse(_Response(200, {HttpHeaders.PartitionKeyRangeID: range_id})))
+                return result
+            finally:
+                with self._lock:
+                    self._in_flight[range_id] -= 1
+
+        def upsert_item(self, body, raw_response_hook=None, **kwargs):
+            def upsert():
+                self.items[body['id']] = body
+                return body
+            return self._send(body['pk'], raw_response_hook, upsert, item_id=body['id'])
+
+        def create_item(self, body, raw_response_hook=None, **kwargs):
+            def create():
+                if body['id'] in self.items:
+                    raise CosmosHttpResponseError(response=_Response(StatusCodes.CONFLICT, {}))
+                self.items[body['id']] = body
+                return body
+            return self._send(body['pk'], raw_response_hook, create)
+
+        def read_item(self, item, partition_key, raw_response_hook=None, **kwargs):
+            return self._send(partition_key, raw_response_hook, lambda: self.items[item])
+
+    def test_bulk_upsert_with_throttling(self):
+        container = self.MockedContainer(range_count=4, capacity=2)
+        operations = ((BulkOperationType.Upsert, {'id': str(i), 'pk': 'key{}'.format(i % 10)}) for i in range(200))
+        executor = _BulkExecutor(container, operations, max_concurrency=16)
+        results = list(executor.execute())
+
+        self.assertTrue(all(r.succeeded for r in results))
+        self.assertEqual(sorted(r.index for r in results), list(range(200)))
+        self.assertEqual(len(container.items), 200)
+        self.assertLessEqual(container.max_in_flight, 16)
+        # every operation was routed to the partition key range of its partition key up front
+        self.assertEqual(container.client_connection.routing_map_loads, 1)
+        self.assertEqual(set(executor._queues), {container._range_of('key{}'.format(i)) for i in range(10)})
+        self.assertEqual(results[0].status_code, 200)
+
+    def test_bulk_partition_split(self):
+        container = self.MockedContainer(range_count=2, capacity=8)
+        list(_BulkExecutor(container, [(BulkOperationType.Upsert, {'id': 'a', 'pk': 'a'})]).execute())
+        range_id = container._range_of('a')
+        container.split(range_id)
+        container.stale['b'] = range_id
+
+        executor = _BulkExecutor(container, [
+            (BulkOperationType.Upsert, {'id': 'b', 'pk': 'a'}),
+            (BulkOperationType.Read, 'a', 'a'),
+        ])
+        results = list(executor.execute())
+
+        # the operation on the split range is retried instead of failing, and the routing map is reloaded
+        self.assertTrue(all(r.succeeded for r in results))
+        self.assertEqual(container.stale, {})
+        self.assertEqual(container.client_connection.routing_map_loads, 2)
+        self.assertEqual(executor._routing_map.get_range_by_partition_key_range_id(range_id), None)
+
+    def test_bulk_failures_and_validation(self):
+        container = self.MockedContainer(range_count=1, capacity=8)
+        results = list(_BulkExecutor(container, [
+            (BulkOperationType.Create, {'id': 'a', 'pk': 'a'}),
+            (BulkOperationType.Create, {'id': 'a', 'pk': 'a'}),
+        ], max_concurrency=1).execute())
+
+        self.assertEqual([r.succeeded for r in results], [True, False])
+        self.assertEqual(results[1].status_code, StatusCodes.CONFLICT)
+        with self.assertRaises(ValueError):
+            list(_BulkExecutor(container, [('patch', {'id': 'a', 'pk': 'a'})]).execute())
+        with self.assertRaises(ValueError):
+            list(_BulkExecutor(container, [(BulkOperationType.Delete, 'a')]).execute())
+
+    def test_bulk_max_attempts(self):
+        container = self.MockedContainer(range_count=1, capacity=0)
+        results = list(_BulkExecutor(
+            container, [(BulkOperationType.Upsert, {'id': 'a', 'pk': 'a'})], max_attempts=3).execute())
+
+        # an operation throttled on every attempt completes with its error
+        self.assertEqual(len(results), 1)
+        self.assertFalse(results[0].succeeded)
+        self.assertEqual(results[0].status_code, StatusCodes.TOO_MANY_REQUESTS)
+        self.assertEqual(container.throttled, 3)
+        self.assertEqual(container.items, {})
+
+    def test_congestion_controller(self):
+        controller = _CongestionController(max_concurrency=4)
+        for _ in range(20):
+            controller.on_success()
+        self.assertEqual(controller.limit, 4.0)
+        controller.on_throttle(1000, now=10.0)
+        self.assertEqual(controller.limit, 2.0)
+        self.assertFalse(controller.can_dispatch(10.5))
+        self.assertTrue(controller.can_dispatch(11.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
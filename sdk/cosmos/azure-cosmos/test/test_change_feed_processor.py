@@ -0,0 +1,287 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import threading
+import time
+import unittest
+import uuid
+import pytest
+from azure.core import MatchConditions
+from azure.cosmos import ChangeFeedProcessor
+from azure.cosmos._change_feed_processor import _get_latest_lsn, _select_leases_to_take
+from azure.cosmos.exceptions import CosmosHttpResponseError, CosmosResourceExistsError, CosmosResourceNotFoundError
+from azure.cosmos.http_constants import HttpHeaders, StatusCodes, SubStatusCodes
+
+pytestmark = pytest.mark.cosmosEmulator
+
+
+class _Response(object):
+
+    def __init__(self, status_code, headers):
+        self.status_code = status_code
+        self.headers = headers
+        self.reason = None
+
+    def text(self):
+        return ''
+
+
+class MockedLeaseContainer(object):
+    """An in-memory container partitioned on /id, with optimistic concurrency on the etag of the items."""
+
+    def __init__(self):
+        self.items = {}
+        self._lock = threading.Lock()
+
+    def _store(self, item):
+        item = dict(item, _etag=str(uuid.uuid4()))
+        self.items[item['id']] = item
+        return dict(item)
+
+    def create_item(self, body, **kwargs):
+        with self._lock:
+            if body['id'] in self.items:
+                raise CosmosResourceExistsError(StatusCodes.CONFLICT, 'Conflict')
+            return self._store(body)
+
+    def read_item(self, item, partition_key, **kwargs):
+        with self._lock:
+            if item not in self.items:
+                raise CosmosResourceNotFoundError(StatusCodes.NOT_FOUND, 'Not found')
+            return dict(self.items[item])
+
+    def replace_item(self, item, body, etag=None, match_condition=None, **kwargs):
+        with self._lock:
+            if item not in self.items:
+                raise CosmosResourceNotFoundError(StatusCodes.NOT_FOUND, 'Not found')
+            if match_condition == MatchConditions.IfNotModified and self.items[item]['_etag'] != etag:
+                raise CosmosHttpResponseError(StatusCodes.PRECONDITION_FAILED, 'Precondition failed')
+            return self._store(body)
+
+    def delete_item(self, item, partition_key, **kwargs):
+        with self._lock:
+            del self.items[item]
+
+    def query_items(self, query, parameters=None, enable_cross_partition_query=None, **kwargs):
+        prefix = parameters[0]['value']
+        with self._lock:
+            return [dict(item) for item in self.items.values() if item['id'].startswith(prefix)]
+
+
+class MockedContainer(object):
+    """A container whose partition key ranges each have their own change feed, numbered by LSN."""
+
+    container_link = 'dbs/db/colls/coll'
+
+    def __init__(self, range_count):
+        self.client_connection = self
+        self._routing_map_provider = self
+        self.refreshed_ranges = []
+        self.ranges = {str(i): {'parents': [], 'changes': [], 'lsn': 0} for i in range(range_count)}
+        self.gone = set()
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def write(self, range_id, count):
+        with self._lock:
+            partition_key_range = self.ranges[range_id]
+            for _ in range(count):
+                partition_key_range['lsn'] += 1
+                partition_key_range['changes'].append({'id': str(self._next_id), '_lsn': partition_key_range['lsn']})
+                self._next_id += 1
+
+    def split(self, range_id):
+        """Splits a range in two, the changes are spread between the children, which continue its LSN."""
+        with self._lock:
+            parent = self.ranges.pop(range_id)
+            self.gone.add(range_id)
+            for index in range(2):
+                child_id = '{}-{}'.format(range_id, index)
+                changes = [c for c in parent['changes'] if int(c['id']) % 2 == index]
+                self.ranges[child_id] = {'parents': parent['parents'] + [range_id], 'changes': changes,
+                                         'lsn': parent['lsn']}
+
+    def refresh_routing_map(self, collection_link, gone_partition_key_range_id=None):
+        self.refreshed_ranges.append(gone_partition_key_range_id)
+
+    def get_overlapping_ranges(self, collection_link, ranges):
+        with self._lock:
+            return [{'id': range_id, 'parents': r['parents']} for range_id, r in sorted(self.ranges.items())]
+
+    def QueryItemsChangeFeed(self, collection_link, options, response_hook):
+        range_id = options['partitionKeyRangeId']
+        continuation = options.get('continuation')
+
+        def pages():
+            with self._lock:
+                if range_id in self.gone:
+                    raise CosmosHttpResponseError(response=_Response(
+                        StatusCodes.GONE, {HttpHeaders.SubStatus: str(SubStatusCodes.PARTITION_KEY_RANGE_GONE)}))
+                changes = self.ranges[range_id]['changes']
+                latest_lsn = self.ranges[range_id]['lsn']
+            if continuation == '*':
+                page, etag = [], str(latest_lsn)
+            else:
+                page = [c for c in changes if c['_lsn'] > int(continuation or 0)][:options['maxItemCount']]
+                etag = str(page[-1]['_lsn']) if page else continuation
+            response_hook({HttpHeaders.ETag: etag, HttpHeaders.SessionToken: '{}:1#{}'.format(range_id, latest_lsn)},
+                          page)
+            if page:
+                yield page
+
+        return _Pages(pages())
+
+
+class _Pages(object):
+
+    def __init__(self, pages):
+        self._pages = pages
+
+    def by_page(self):
+        return self._pages
+
+
+class ChangeFeedProcessorTests(unittest.TestCase):
+    """Change feed processor tests against mocked containers.
+    """
+
+    def setUp(self):
+        self.container = MockedContainer(range_count=4)
+        self.lease_container = MockedLeaseContainer()
+        self.processed = []
+        self._lock = threading.Lock()
+
+    def _handler(self, changes, range_id):
+        with self._lock:
+            self.processed.extend(change['id'] for change in changes)
+
+    def _processor(self, instance_name, **kwargs):
+        options = dict(poll_interval=0.01, lease_renew_interval=0.05, lease_acquire_interval=0.05,
+                       lease_expiration_interval=0.5, max_item_count=10, start_from_beginning=True)
+        options.update(kwargs)
+        return ChangeFeedProcessor(self.container, self.lease_container, self._handler, instance_name, **options)
+
+    def _wait_for(self, condition, timeout=5.0):
+        deadline = time.time() + timeout
+        while not condition():
+            self.assertLess(time.time(), deadline, 'Timed out')
+            time.sleep(0.01)
+
+    def _leases(self):
+        return sorted(self.lease_container.items.values(), key=lambda lease: lease['partitionKeyRangeId'])
+
+    def test_select_leases_to_take(self):
+        now = 100.0
+
+        def lease(owner, timestamp=now):
+            return {'owner': owner, 'timestamp': timestamp}
+
+        # the leases without an owner and the expired leases are taken first
+        leases = [lease(None), lease('a', now - 61), lease('a'), lease('a')]
+        self.assertEqual(_select_leases_to_take('b', leases, now, 60), leases[:2])
+        # a lease is stolen from an instance owning more than its share
+        leases = [lease('a'), lease('a'), lease('a'), lease('b')]
+        self.assertEqual(_select_leases_to_take('b', leases, now, 60), [leases[0]])
+        self.assertEqual(_select_leases_to_take('c', leases, now, 60), [leases[0]])
+        # balanced
+        leases = [lease('a'), lease('a'), lease('b'), lease('b')]
+        self.assertEqual(_select_leases_to_take('b', leases, now, 60), [])
+        self.assertEqual(_select_leases_to_take('a', [lease('a'), lease('b'), lease('b')], now, 60), [])
+
+    def test_get_latest_lsn(self):
+        self.assertEqual(_get_latest_lsn('0:1#25#1=20#2=25'), 25)
+        self.assertEqual(_get_latest_lsn('0:12'), 12)
+
+    def test_process_and_balance(self):
+        for range_id in self.container.ranges:
+            self.container.write(range_id, 25)
+        first = self._processor('first')
+        first.start()
+        try:
+            self._wait_for(lambda: len(self.processed) == 100)
+            self.assertEqual(first.owned_partition_key_range_ids, ['0', '1', '2', '3'])
+
+            second = self._processor('second')
+            with second:
+                # the second instance steals half of the leases
+                self._wait_for(lambda: len(second.owned_partition_key_range_ids) == 2)
+                self._wait_for(lambda: len(first.owned_partition_key_range_ids) == 2)
+                for range_id in self.container.ranges:
+                    self.container.write(range_id, 5)
+                self._wait_for(lambda: len(set(self.processed)) == 120)
+            # the leases released by the second instance are taken back
+            self._wait_for(lambda: len(first.owned_partition_key_range_ids) == 4)
+        finally:
+            first.stop()
+
+        self.assertEqual(sorted(set(self.processed), key=int), [str(i) for i in range(120)])
+        self.assertEqual([lease['continuationToken'] for lease in self._leases()], ['30'] * 4)
+        self.assertTrue(all(lease['owner'] is None for lease in self._leases()))
+
+    def test_start_from_now(self):
+        for range_id in self.container.ranges:
+            self.container.write(range_id, 5)
+        with self._processor('first', start_from_beginning=False) as processor:
+            self._wait_for(lambda: all(lease['continuationToken'] == '5' for lease in self._leases()))
+            self.container.write('2', 3)
+            self._wait_for(lambda: len(self.processed) == 3)
+            self.assertEqual(processor.estimate_lag(), {'0': 0, '1': 0, '2': 0, '3': 0})
+        self.assertEqual(self.processed, ['20', '21', '22'])
+
+    def test_partition_split(self):
+        self.container.write('0', 10)
+        with self._processor('first') as processor:
+            self._wait_for(lambda: len(self.processed) == 10)
+            self.container.split('0')
+            self.container.write('0-0', 2)
+            self.container.write('0-1', 3)
+            self._wait_for(lambda: len(self.processed) == 15)
+            self.assertEqual(processor.owned_partition_key_range_ids, ['0-0', '0-1', '1', '2', '3'])
+
+        # the children continue from the continuation of their parent
+        self.assertEqual(sorted(self.processed, key=int), [str(i) for i in range(15)])
+        self.assertEqual([lease['partitionKeyRangeId'] for lease in self._leases()], ['0-0', '0-1', '1', '2', '3'])
+        self.assertEqual(self.container.refreshed_ranges, ['0'])
+
+    def test_handler_failure_and_lag(self):
+        failures = []
+
+        def handler(changes, range_id):
+            if not failures:
+                failures.append(range_id)
+                raise ValueError('Handler failed')
+            self._handler(changes, range_id)
+
+        self.container.write('1', 30)
+        processor = ChangeFeedProcessor(self.container, self.lease_container, handler, 'first', max_item_count=10,
+                                        poll_interval=0.01, start_from_beginning=True)
+        processor._initialize_leases()
+        self.assertEqual(processor.estimate_lag(), {'0': 0, '1': 30, '2': 0, '3': 0})
+        with processor:
+            self._wait_for(lambda: len(self.processed) == 30)
+            self._wait_for(lambda: processor.estimate_lag()['1'] == 0)
+        # the changes of the failed batch were delivered again
+        self.assertEqual(failures, ['1'])
+        self.assertEqual(self.processed, [str(i) for i in range(30)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import asyncio
+import unittest
+import pytest
+from azure.cosmos.aio import ChangeFeedProcessor
+from test_change_feed_processor import MockedContainer, MockedLeaseContainer
+
+pytestmark = pytest.mark.cosmosEmulator
+
+
+def _run(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+class _AsyncIterable(object):
+
+    def __init__(self, iterable):
+        self._iterator = iter(iterable)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class AsyncMockedLeaseContainer(MockedLeaseContainer):
+
+    async def create_item(self, body, **kwargs):
+        return super(AsyncMockedLeaseContainer, self).create_item(body, **kwargs)
+
+    async def read_item(self, item, partition_key, **kwargs):
+        return super(AsyncMockedLeaseContainer, self).read_item(item, partition_key, **kwargs)
+
+    async def replace_item(self, item, body, **kwargs):
+        return super(AsyncMockedLeaseContainer, self).replace_item(item, body, **kwargs)
+
+    async def delete_item(self, item, partition_key, **kwargs):
+        return super(AsyncMockedLeaseContainer, self).delete_item(item, partition_key, **kwargs)
+
+    def query_items(self, query, **kwargs):
+        return _AsyncIterable(super(AsyncMockedLeaseContainer, self).query_items(query, **kwargs))
+
+
+class AsyncMockedContainer(MockedContainer):
+
+    async def refresh_routing_map(self, collection_link, gone_partition_key_range_id=None):
+        super(AsyncMockedContainer, self).refresh_routing_map(collection_link, gone_partition_key_range_id)
+
+    async def get_overlapping_ranges(self, collection_link, ranges):
+        return super(AsyncMockedContainer, self).get_overlapping_ranges(collection_link, ranges)
+
+    def QueryItemsChangeFeed(self, collection_link, options, response_hook):
+        pages = super(AsyncMockedContainer, self).QueryItemsChangeFeed(collection_link, options, response_hook)
+        return _AsyncPages(pages.by_page())
+
+
+class _AsyncPages(object):
+
+    def __init__(self, pages):
+        self._pages = pages
+
+    def by_page(self):
+        return _AsyncIterable(_AsyncIterable(page) for page in self._pages)
+
+
+class ChangeFeedProcessorAsyncTests(unittest.TestCase):
+    """Asyncio change feed processor tests against mocked containers.
+    """
+
+    def setUp(self):
+        self.container = AsyncMockedContainer(range_count=4)
+        self.lease_container = AsyncMockedLeaseContainer()
+        self.processed = []
+
+    async def _handler(self, changes, range_id):
+        await asyncio.sleep(0)
+        self.processed.extend(change['id'] for change in changes)
+
+    def _processor(self, instance_name):
+        return ChangeFeedProcessor(
+            self.container, self.lease_container, self._handler, instance_name, poll_interval=0.01,
+            lease_renew_interval=0.05, lease_acquire_interval=0.05, lease_expiration_interval=0.5, max_item_count=10,
+            start_from_beginning=True)
+
+    async def _wait_for(self, condition, timeout=5.0):
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        while not condition():
+            self.assertLess(loop.time(), deadline, 'Timed out')
+            await asyncio.sleep(0.01)
+
+    def test_process_balance_and_split(self):
+        for range_id in self.container.ranges:
+            self.container.write(range_id, 25)
+
+        async def process():
+            async with self._processor('first') as first:
+                await self._wait_for(lambda: len(self.processed) == 100)
+                async with self._processor('second') as second:
+                    await self._wait_for(lambda: len(second.owned_partition_key_range_ids) == 2)
+                    await self._wait_for(lambda: len(first.owned_partition_key_range_ids) == 2)
+                    self.assertEqual(await first.estimate_lag(), {'0': 0, '1': 0, '2': 0, '3': 0})
+                    split_range = first.owned_partition_key_range_ids[0]
+                    self.container.split(split_range)
+                    self.container.write(split_range + '-0', 2)
+                    self.container.write(split_range + '-1', 3)
+                    await self._wait_for(lambda: len(set(self.processed)) == 105)
+                    return split_range, first.owned_partition_key_range_ids
+
+        split_range, owned = _run(process())
+
+        self.assertEqual(sorted(set(self.processed), key=int), [str(i) for i in range(105)])
+        self.assertIn(split_range + '-0', owned)
+        self.assertIn(split_range + '-1', owned)
+        self.assertTrue(all(lease['owner'] is None for lease in self.lease_container.items.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,388 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import asyncio
+import json
+import unittest
+import pytest
+from azure.core.pipeline.transport import AsyncHttpTransport, AsyncHttpResponse
+from azure.cosmos import BulkOperationType, TransactionalBatch, documents, exceptions
+from azure.cosmos.aio import CosmosClient
+from azure.cosmos.http_constants import HttpHeaders, StatusCodes, SubStatusCodes
+from azure.cosmos._execution_context.aio.multi_execution_aggregator import _MultiExecutionContextAggregator
+from azure.cosmos._execution_context.query_execution_info import _PartitionedQueryExecutionInfo
+
+pytestmark = pytest.mark.cosmosEmulator
+
+HOST = 'https://localhost:8081/'
+CONTAINER_LINK = 'dbs/db/colls/coll'
+
+
+def _run(coroutine):
+    return asyncio.get_event_loop().run_until_complete(coroutine)
+
+
+class _Response(AsyncHttpResponse):
+
+    def __init__(self, request, status_code, body=None, headers=None):
+        super(_Response, self).__init__(request, None)
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.reason = 'OK'
+        self._body = json.dumps(body).encode('utf-8') if body is not None else b''
+
+    def body(self):
+        return self._body
+
+
+class FakeTransport(AsyncHttpTransport):
+    """Serves the requests of a client from an in-memory container partitioned on /pk."""
+
+    def __init__(self, page_size=2):
+        self.page_size = page_size
+        self.documents = {}
+        self.requests = []
+        self.lsn = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def send(self, request, **kwargs):
+        await asyncio.sleep(0)
+        path = request.url[len(HOST):].strip('/')
+        self.requests.append((request.method, path))
+        if path == '':
+            return _Response(request, 200, {'userConsistencyPolicy': {'defaultConsistencyLevel': 'Session'}})
+        if path == CONTAINER_LINK:
+            return _Response(request, 200, {
+                'id': 'coll', '_rid': 'rid', '_self': CONTAINER_LINK + '/',
+                'partitionKey': {'paths': ['/pk'], 'kind': 'Hash'}})
+        if path == CONTAINER_LINK + '/pkranges':
+            return _Response(request, 200, {'PartitionKeyRanges': [
+                {'id': '0', 'minInclusive': '', 'maxExclusive': 'FF'}]})
+        if path == CONTAINER_LINK + '/docs' and request.headers.get(HttpHeaders.IsQuery) == 'true':
+            start = int(request.headers.get(HttpHeaders.Continuation, 0))
+            end = start + self.page_size
+            documents_ = sorted(self.documents.values(), key=lambda d: d['id'])
+            headers = {HttpHeaders.Continuation: str(end)} if end < len(documents_) else {}
+            return _Response(request, 200, {'Documents': documents_[start:end]}, headers)
+        if path == CONTAINER_LINK + '/docs' and request.headers.get(HttpHeaders.IsBatchRequest) == 'True':
+            operations = json.loads(request.data)
+            if any(o['resourceBody']['id'] in self.documents for o in operations):
+                # a batch failed by one of its operations is returned with multi-status, and nothing is applied
+                results = [{'statusCode': StatusCodes.CONFLICT if o['resourceBody']['id'] in self.documents
+                            else StatusCodes.FAILED_DEPENDENCY} for o in operations]
+                return _Response(request, StatusCodes.MULTI_STATUS, results, {HttpHeaders.RequestCharge: '1.0'})
+            results = []
+            for operation in operations:
+                document = operation['resourceBody']
+                document['_self'] = '{}/docs/{}'.format(CONTAINER_LINK, document['id'])
+                self.documents[document['id']] = document
+                results.append({'statusCode': 201, 'requestCharge': 1.0, 'resourceBody': document})
+            return _Response(request, 200, results, {HttpHeaders.RequestCharge: str(float(len(results)))})
+        if path == CONTAINER_LINK + '/docs':
+            self.lsn += 1
+            document = json.loads(request.data)
+            document['_self'] = '{}/docs/{}'.format(CONTAINER_LINK, document['id'])
+            document['_etag'] = '"{}"'.format(self.lsn)
+            self.documents[document['id']] = document
+            return _Response(request, 201, document)
+        document_id = path.rsplit('/', 1)[-1]
+        if document_id not in self.documents:
+            return _Response(request, 404, {'code': 'NotFound'})
+        if request.method == 'DELETE':
+            del self.documents[document_id]
+            return _Response(request, 204)
+        headers = {HttpHeaders.SessionToken: '0:-1#{}'.format(self.lsn)}
+        if request.headers.get(HttpHeaders.IfNoneMatch) == self.documents[document_id]['_etag']:
+            return _Response(request, StatusCodes.NOT_MODIFIED, headers=headers)
+        return _Response(request, 200, self.documents[document_id], headers)
+
+
+class CosmosClientAsyncTests(unittest.TestCase):
+    """Tests for the asyncio client against an in-memory transport.
+    """
+
+    def test_item_round_trip(self):
+        async def round_trip(transport):
+            async with CosmosClient(HOST, 'a2V5', transport=transport) as client:
+                container = client.get_database_client('db').get_container_client('coll')
+                created = await container.create_item({'id': 'item', 'pk': 'a', 'value': 1})
+                read = await container.read_item('item', partition_key='a')
+                await container.delete_item(read, partition_key='a')
+                with self.assertRaises(exceptions.CosmosResourceNotFoundError):
+                    await container.read_item('item', partition_key='a')
+                return created, read
+
+        transport = FakeTransport()
+        created, read = _run(round_trip(transport))
+
+        self.assertEqual(read, created)
+        self.assertEqual(read['value'], 1)
+        # the database account is read once, when the client is entered
+        self.assertEqual(transport.requests[0], ('GET', ''))
+        self.assertEqual(transport.requests.count(('GET', '')), 1)
+        self.assertEqual(transport.documents, {})
+
+    def test_query_items_by_page(self):
+        async def query(transport):
+            client = CosmosClient(HOST, 'a2V5', transport=transport)
+            container = client.get_database_client('db').get_container_client('coll')
+            for i in range(5):
+                await container.create_item({'id': str(i), 'pk': 'a'})
+            pages = container.query_items('SELECT * FROM c', partition_key='a').by_page()
+            results = [[document['id'] async for document in page] async for page in pages]
+            await client.close()
+            return results
+
+        transport = FakeTransport(page_size=2)
+        pages = _run(query(transport))
+
+        self.assertEqual(pages, [['0', '1'], ['2', '3'], ['4']])
+        # the client was not entered, so the database account was read before the first request
+        self.assertEqual(transport.requests[0], ('GET', ''))
+
+    def test_execute_bulk(self):
+        async def bulk(transport):
+            async with CosmosClient(HOST, 'a2V5', transport=transport) as client:
+                container = client.get_database_client('db').get_container_client('coll')
+                operations = [(BulkOperationType.Upsert, {'id': str(i), 'pk': str(i % 3)}) for i in range(10)]
+                operations.append((BulkOperationType.Read, 'missing', '0'))
+                return [result async for result in container.execute_bulk(operations, max_concurrency=4)]
+
+        transport = FakeTransport()
+        results = _run(bulk(transport))
+
+        self.assertEqual(sorted(r.index for r in results), list(range(11)))
+        self.assertEqual(sorted(transport.documents), [str(i) for i in range(10)])
+        failed = [r for r in results if not r.succeeded]
+        self.assertEqual([(r.index, r.status_code) for r in failed], [(10, 404)])
+
+    def test_execute_transactional_batch(self):
+        async def batch(transport):
+            async with CosmosClient(HOST, 'a2V5', transport=transport) as client:
+                container = client.get_database_client('db').get_container_client('coll')
+                batch_ = TransactionalBatch('a')
+                for i in range(3):
+                    batch_.create_item({'id': str(i), 'pk': 'a'})
+                return await container.execute_transactional_batch(batch_)
+
+        transport = FakeTransport()
+        response = _run(batch(transport))
+
+        self.assertTrue(response.succeeded)
+        self.assertEqual([r.status_code for r in response], [201] * 3)
+        self.assertEqual(response.request_charge, 3.0)
+        self.assertEqual(sorted(transport.documents), ['0', '1', '2'])
+        # the operations were sent in a single request
+        self.assertEqual(transport.requests.count(('POST', CONTAINER_LINK + '/docs')), 1)
+
+    def test_failed_transactional_batch(self):
+        async def batch(transport):
+            async with CosmosClient(HOST, 'a2V5', transport=transport) as client:
+                container = client.get_database_client('db').get_container_client('coll')
+                batch_ = TransactionalBatch('a')
+                for i in range(3):
+                    batch_.create_item({'id': str(i), 'pk': 'a'})
+                return await container.execute_transactional_batch(batch_)
+
+        transport = FakeTransport()
+        transport.documents['1'] = {'id': '1', 'pk': 'a'}
+        response = _run(batch(transport))
+
+        # the multi-status response is not raised, it tells which operation failed the batch
+        self.assertFalse(response.succeeded)
+        self.assertEqual(response.status_code, StatusCodes.CONFLICT)
+        self.assertEqual([r.status_code for r in response], [
+            StatusCodes.FAILED_DEPENDENCY, StatusCodes.CONFLICT, StatusCodes.FAILED_DEPENDENCY])
+        self.assertEqual(response.request_charge, 1.0)
+        self.assertEqual(sorted(transport.documents), ['1'])
+
+    def test_read_latencies_are_recorded(self):
+        async def read(transport):
+            async with CosmosClient(HOST, 'a2V5', transport=transport, latency_based_routing=True) as client:
+                container = client.get_database_client('db').get_container_client('coll')
+                await container.create_item({'id': 'item', 'pk': 'a'})
+                for _ in range(3):
+                    await container.read_item('item', partition_key='a')
+                return client.get_read_endpoint_latencies()
+
+        latencies = _run(read(FakeTransport()))
+
+        # only the reads of the database account, the container and the item are measured,
+        # and the account has no other read location to probe
+        self.assertEqual([l['endpoint'] for l in latencies], [HOST])
+        self.assertEqual(latencies[0]['sampleCount'], 5)
+
+    def test_read_item_cache(self):
+        async def read(transport):
+            async with CosmosClient(HOST, 'a2V5', transport=transport, item_cache_size=10) as client:
+                container = client.get_database_client('db').get_container_client('coll')
+                await container.create_item({'id': 'item', 'pk': 'a', 'value': 1})
+                reads = [await container.read_item('item', partition_key='a') for _ in range(3)]
+                await container.upsert_item({'id': 'item', 'pk': 'a', 'value': 2})
+                reads.append(await container.read_item('item', partition_key='a'))
+                # the cached item expired, and is revalidated
+                for cached_item in client.client_connection._item_cache._items.values():
+                    cached_item.expiry_time = 0
+                reads.append(await container.read_item('item', partition_key='a'))
+                return reads
+
+        transport = FakeTransport()
+        reads = _run(read(transport))
+
+        self.assertEqual([r['value'] for r in reads], [1, 1, 1, 2, 2])
+        # the item was read again after it was written by the client, and then not modified
+        self.assertEqual(transport.requests.count(('GET', CONTAINER_LINK + '/docs/item')), 3)
+
+
+class MultiExecutionContextAggregatorAsyncTests(unittest.TestCase):
+    """Cross partition query execution tests of the asyncio aggregator against a mocked client.
+    """
+
+    class MockedCosmosClientConnection(object):
+
+        def __init__(self, partitions, page_size):
+            self.partitions = partitions
+            self.page_size = page_size
+            self.connection_policy = documents.ConnectionPolicy()
+            self._global_endpoint_manager = None
+            self._routing_map_provider = self
+            self.last_response_headers = None
+            self.requests = []
+            self._in_flight = 0
+            self.max_in_flight = 0
+            # the partitions split in two ranges, holding every other document, once their second page is read
+            self.splitting_partitions = set()
+            self.split_partitions = set()
+            self.refreshed_ranges = []
+
+        async def get_overlapping_ranges(self, collection_link, ranges):
+            partition_key_ranges = []
+            for i in range(len(self.partitions)):
+                bounds = ['{:02X}'.format(i), '{:02X}'.format(i + 1)]
+                if str(i) not in self.split_partitions:
+                    partition_key_ranges.append({'id': str(i), 'minInclusive': bounds[0], 'maxExclusive': bounds[1]})
+                    continue
+                bounds.insert(1, bounds[0] + '80')
+                partition_key_ranges.extend(
+                    {'id': '{}-{}'.format(i, j), 'minInclusive': bounds[j], 'maxExclusive': bounds[j + 1]}
+                    for j in range(2))
+            return partition_key_ranges
+
+        async def refresh_routing_map(self, collection_link, gone_partition_key_range_id=None):
+            self.refreshed_ranges.append(gone_partition_key_range_id)
+
+        async def QueryFeed(self, path, collection_id, query, options, partition_key_range_id):
+            self.requests.append((partition_key_range_id, options.get('continuation')))
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                start = int(options.get('continuation') or 0)
+                partition, _, child = partition_key_range_id.partition('-')
+                if partition in self.splitting_partitions and not child and start > 0:
+                    self.split_partitions.add(partition)
+                    raise exceptions.CosmosHttpResponseError(response=_Response(
+                        None, StatusCodes.GONE, headers={
+                            HttpHeaders.SubStatus: str(SubStatusCodes.PARTITION_KEY_RANGE_GONE)}))
+                documents_ = [(i, d) for i, d in enumerate(self.partitions[int(partition)])
+                              if i >= start and (not child or i % 2 == int(child))]
+                page = documents_[:self.page_size]
+                continuation = str(page[-1][0] + 1) if len(documents_) > self.page_size else None
+                return [d for _, d in page], {HttpHeaders.Continuation: continuation}
+            finally:
+                self._in_flight -= 1
+
+    def test_parallel_order_by(self):
+        partitions = [[{'orderByItems': [{'item': value}], 'payload': {'value': value}}
+                       for value in range(partition, 100, 4)] for partition in range(4)]
+        query_execution_info = _PartitionedQueryExecutionInfo({
+            'queryInfo': {'orderBy': ['Ascending'], 'rewrittenQuery': 'SELECT * FROM r'},
+            'queryRanges': [{'min': '', 'max': 'FF', 'isMinInclusive': True, 'isMaxInclusive': False}]})
+        client = self.MockedCosmosClientConnection(partitions, page_size=5)
+
+        async def aggregate():
+            aggregator = _MultiExecutionContextAggregator(
+                client, CONTAINER_LINK, 'SELECT * FROM r', {'maxDegreeOfParallelism': 2}, query_execution_info)
+            return [result async for result in aggregator]
+
+        results = _run(aggregate())
+
+        self.assertEqual([r['payload']['value'] for r in results], list(range(100)))
+        self.assertEqual(client.max_in_flight, 2)
+        self.assertEqual(len(client.requests), len(set(client.requests)))
+
+    def test_partition_split(self):
+        partitions = [[{'orderByItems': [{'item': value}], 'payload': {'value': value}}
+                       for value in range(partition, 100, 4)] for partition in range(4)]
+        query_execution_info = _PartitionedQueryExecutionInfo({
+            'queryInfo': {'orderBy': ['Ascending'], 'rewrittenQuery': 'SELECT * FROM r'},
+            'queryRanges': [{'min': '', 'max': 'FF', 'isMinInclusive': True, 'isMaxInclusive': False}]})
+        client = self.MockedCosmosClientConnection(partitions, page_size=5)
+        client.splitting_partitions.add('2')
+
+        async def aggregate():
+            aggregator = _MultiExecutionContextAggregator(
+                client, CONTAINER_LINK, 'SELECT * FROM r', {'maxDegreeOfParallelism': -1}, query_execution_info)
+            return [result async for result in aggregator]
+
+        results = _run(aggregate())
+
+        # the query of the split range resumes on its child ranges, from the continuation of its failed page
+        self.assertEqual([r['payload']['value'] for r in results], list(range(100)))
+        self.assertEqual(client.refreshed_ranges, ['2'])
+        self.assertEqual([r for r in client.requests if r[0].startswith('2-')][:2], [('2-0', '5'), ('2-1', '5')])
+
+    def test_close_cancels_prefetch(self):
+        partitions = [[{'orderByItems': [{'item': value}], 'payload': {'value': value}}
+                       for value in range(partition, 100, 4)] for partition in range(4)]
+        query_execution_info = _PartitionedQueryExecutionInfo({
+            'queryInfo': {'orderBy': ['Ascending'], 'rewrittenQuery': 'SELECT * FROM r'},
+            'queryRanges': [{'min': '', 'max': 'FF', 'isMinInclusive': True, 'isMaxInclusive': False}]})
+        client = self.MockedCosmosClientConnection(partitions, page_size=5)
+
+        async def abandon():
+            aggregator = _MultiExecutionContextAggregator(
+                client, CONTAINER_LINK, 'SELECT * FROM r', {'maxDegreeOfParallelism': -1}, query_execution_info)
+            await aggregator.__anext__()
+            prefetched = [p._prefetched_page for p in aggregator._document_producers if p._prefetched_page]
+            aggregator.close()
+            await asyncio.sleep(0.05)
+            return prefetched
+
+        prefetched = _run(abandon())
+
+        self.assertTrue(prefetched)
+        self.assertTrue(all(task.cancelled() for task in prefetched))
+
+
+if __name__ == "__main__":
+    unittest.main()
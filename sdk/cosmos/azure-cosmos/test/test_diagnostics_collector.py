@@ -0,0 +1,224 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import asyncio
+import logging
+import unittest
+from azure.core.exceptions import ServiceRequestError
+from azure.core.pipeline.transport import HttpRequest
+from azure.cosmos import _retry_utility, documents
+from azure.cosmos.aio import _retry_utility_async
+from azure.cosmos.diagnostics import DiagnosticsCollector, DiagnosticsExporter, Histogram, LoggingDiagnosticsExporter
+from azure.cosmos.exceptions import CosmosClientTimeoutError, CosmosHttpResponseError
+from azure.cosmos.http_constants import HttpHeaders, ResourceType, StatusCodes
+from azure.cosmos._request_object import RequestObject
+
+HOST = 'https://localhost:8081/'
+
+
+class _Response(object):
+
+    def __init__(self, status_code, headers):
+        self.status_code = status_code
+        self.headers = headers
+        self.reason = None
+
+    def text(self):
+        return ''
+
+
+class _ListExporter(DiagnosticsExporter):
+
+    def __init__(self):
+        self.records = []
+
+    def export(self, record):
+        self.records.append(record)
+
+
+class _FailingExporter(DiagnosticsExporter):
+
+    def export(self, record):
+        raise RuntimeError("The exporter failed.")
+
+
+class DiagnosticsTests(unittest.TestCase):
+    """Tests of the diagnostics collected by the retry utility against mocked requests.
+    """
+
+    class MockedClientConnection(object):
+
+        def __init__(self, diagnostics_collector=None):
+            self.connection_policy = documents.ConnectionPolicy()
+            self.connection_policy.RetryOptions._fixed_retry_interval_in_milliseconds = 1
+            self.connection_policy.DiagnosticsCollector = diagnostics_collector
+            self.last_response_headers = None
+
+    class MockedGlobalEndpointManager(object):
+
+        def resolve_service_endpoint(self, request):
+            return HOST
+
+        def can_use_multiple_write_locations(self, request):
+            return False
+
+    def _request(self, path, operation_type, responses):
+        """Returns the request arguments and the function serving the responses in order."""
+        request = HttpRequest('GET', HOST + path)
+        args = (RequestObject(ResourceType.Document, operation_type), None, None, request)
+
+        def function(global_endpoint_manager, request_params, connection_policy, pipeline_client, request, **kwargs):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            status_code, headers = response
+            if status_code >= 400:
+                raise CosmosHttpResponseError(response=_Response(status_code, headers))
+            return {}, headers
+
+        return function, args
+
+    def _execute(self, client, path, operation_type, responses, **kwargs):
+        function, args = self._request(path, operation_type, responses)
+        return _retry_utility.Execute(client, self.MockedGlobalEndpointManager(), function, *args, **kwargs)
+
+    def test_records_retries_and_request_charge(self):
+        exporter = _ListExporter()
+        collector = DiagnosticsCollector(exporters=[exporter])
+        client = self.MockedClientConnection(collector)
+        self._execute(client, 'dbs/db/colls/coll/docs/a', documents._OperationType.Read, [
+            (StatusCodes.TOO_MANY_REQUESTS, {HttpHeaders.RequestCharge: '0.5'}),
+            (StatusCodes.TOO_MANY_REQUESTS, {}),
+            (StatusCodes.OK, {HttpHeaders.RequestCharge: '1.5'}),
+        ])
+
+        record, = exporter.records
+        self.assertTrue(record.succeeded)
+        self.assertEqual(record.container_link, 'dbs/db/colls/coll')
+        self.assertEqual(record.endpoint, 'https://localhost:8081')
+        self.assertEqual(record.request_charge, 2.0)
+        self.assertEqual(record.throttle_retries, 2)
+        self.assertGreater(record.latency, 0)
+        statistics = collector.get_statistics('dbs/db/colls/coll', documents._OperationType.Read)
+        self.assertEqual((statistics.count, statistics.failures, statistics.throttle_retries), (1, 0, 2))
+        self.assertEqual(statistics.request_charge.total, 2.0)
+
+    def test_records_failures(self):
+        collector = DiagnosticsCollector(exporters=[_FailingExporter()])
+        client = self.MockedClientConnection(collector)
+        with self.assertRaises(CosmosHttpResponseError):
+            self._execute(client, 'dbs/db/colls/coll/docs', documents._OperationType.Create, [
+                (StatusCodes.CONFLICT, {HttpHeaders.RequestCharge: '1'})])
+        self._execute(client, 'dbs/db', documents._OperationType.Read, [(StatusCodes.OK, {})])
+
+        # a failing exporter doesn't fail the request, and requests outside of a container are recorded without one
+        created = collector.get_statistics('dbs/db/colls/coll', documents._OperationType.Create)
+        self.assertEqual((created.count, created.failures), (1, 1))
+        self.assertEqual(collector.get_statistics(None, documents._OperationType.Read).count, 1)
+        self.assertEqual(len(collector.list_statistics()), 2)
+        collector.reset()
+        self.assertEqual(collector.list_statistics(), [])
+
+    def test_records_errors_without_response(self):
+        exporter = _ListExporter()
+        collector = DiagnosticsCollector(exporters=[exporter])
+        client = self.MockedClientConnection(collector)
+        with self.assertRaises(ServiceRequestError):
+            self._execute(client, 'dbs/db/colls/coll/docs/a', documents._OperationType.Read, [
+                (StatusCodes.TOO_MANY_REQUESTS, {HttpHeaders.RequestCharge: '1'}),
+                ServiceRequestError("Connection reset.")])
+        client.connection_policy.RetryOptions._fixed_retry_interval_in_milliseconds = 20
+        with self.assertRaises(CosmosClientTimeoutError):
+            self._execute(client, 'dbs/db/colls/coll/docs/a', documents._OperationType.Read, [
+                (StatusCodes.TOO_MANY_REQUESTS, {})] * 10, timeout=0.01)
+
+        function, args = self._request('dbs/db/colls/coll/docs/a', documents._OperationType.Read, [
+            ServiceRequestError("Connection reset.")])
+
+        async def function_async(*args):
+            return function(*args)
+
+        with self.assertRaises(ServiceRequestError):
+            asyncio.get_event_loop().run_until_complete(_retry_utility_async.ExecuteAsync(
+                client, self.MockedGlobalEndpointManager(), function_async, *args))
+
+        failed, timed_out, failed_async = exporter.records
+        self.assertFalse(failed_async.succeeded)
+        self.assertFalse(failed.succeeded)
+        self.assertIsNone(failed.status_code)
+        self.assertEqual((failed.request_charge, failed.throttle_retries), (1.0, 1))
+        self.assertFalse(timed_out.succeeded)
+        statistics = collector.get_statistics('dbs/db/colls/coll', documents._OperationType.Read)
+        self.assertEqual((statistics.count, statistics.failures), (3, 3))
+
+    def test_records_async_requests(self):
+        collector = DiagnosticsCollector()
+        client = self.MockedClientConnection(collector)
+        function, args = self._request('dbs/db/colls/coll/docs', documents._OperationType.Query, [
+            (StatusCodes.TOO_MANY_REQUESTS, {}), (StatusCodes.OK, {HttpHeaders.RequestCharge: '3'})])
+
+        async def function_async(*args):
+            return function(*args)
+
+        asyncio.get_event_loop().run_until_complete(_retry_utility_async.ExecuteAsync(
+            client, self.MockedGlobalEndpointManager(), function_async, *args))
+
+        statistics = collector.get_statistics('dbs/db/colls/coll', documents._OperationType.Query)
+        self.assertEqual((statistics.count, statistics.throttle_retries), (1, 1))
+        self.assertEqual(statistics.request_charge.total, 3.0)
+
+    def test_disabled_without_collector(self):
+        client = self.MockedClientConnection()
+        result = self._execute(client, 'dbs/db/colls/coll/docs/a', documents._OperationType.Read, [
+            (StatusCodes.OK, {})])
+
+        self.assertEqual(result, ({}, {}))
+        self.assertIsNone(client.connection_policy.DiagnosticsCollector)
+
+    def test_histogram_percentiles(self):
+        histogram = Histogram(relative_error=0.01)
+        self.assertIsNone(histogram.percentile(50))
+        for value in range(1, 1001):
+            histogram.add(value)
+        histogram.add(0)
+
+        self.assertEqual(histogram.count, 1001)
+        self.assertEqual((histogram.min, histogram.max), (0, 1000))
+        self.assertAlmostEqual(histogram.percentile(50), 500, delta=5)
+        self.assertAlmostEqual(histogram.percentile(99), 990, delta=10)
+        self.assertEqual(histogram.percentile(0), 0)
+        self.assertEqual(histogram.percentile(100), 1000)
+        with self.assertRaises(ValueError):
+            histogram.percentile(101)
+
+    def test_logging_exporter(self):
+        logger = logging.getLogger('test_diagnostics')
+        collector = DiagnosticsCollector(exporters=[LoggingDiagnosticsExporter(logger, logging.INFO)])
+        client = self.MockedClientConnection(collector)
+        with self.assertLogs(logger, logging.INFO) as logs:
+            self._execute(client, 'dbs/db/colls/coll/docs/a', documents._OperationType.Read, [
+                (StatusCodes.OK, {HttpHeaders.RequestCharge: '1'})])
+
+        self.assertIn('Read docs dbs/db/colls/coll', logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import unittest
+import pytest
+from azure.cosmos._execution_context.endpoint_component import (
+    _DistinctResultSet,
+    _QueryExecutionDistinctUnorderedEndpointComponent,
+    _make_hash,
+)
+
+pytestmark = pytest.mark.cosmosEmulator
+
+
+class DistinctEndpointTests(unittest.TestCase):
+    """Tests of the de-duplication of the results of unordered distinct queries.
+    """
+
+    def test_hash_is_canonical(self):
+        self.assertEqual(_make_hash({'a': 1, 'b': {'c': [1, 2], 'd': None}}),
+                         _make_hash({'b': {'d': None, 'c': [1, 2]}, 'a': 1.0}))
+        self.assertEqual(_make_hash(u'café'), _make_hash(u'café'))
+        self.assertNotEqual(_make_hash([1, 2]), _make_hash([2, 1]))
+        self.assertNotEqual(_make_hash(True), _make_hash(1))
+        self.assertNotEqual(_make_hash('1'), _make_hash(1))
+        self.assertNotEqual(_make_hash(None), _make_hash([]))
+        self.assertNotEqual(_make_hash({'a': []}), _make_hash({'a': {}}))
+        self.assertNotEqual(_make_hash(['ab', 'c']), _make_hash(['a', 'bc']))
+        self.assertNotEqual(_make_hash([[1], 2]), _make_hash([1, [2]]))
+
+    def test_result_set_spills(self):
+        results = _DistinctResultSet(max_in_memory=10)
+        digests = [_make_hash(i) for i in range(25)]
+        for digest in digests:
+            self.assertNotIn(digest, results)
+            results.add(digest)
+
+        self.assertEqual(len(results), 25)
+        self.assertLess(len(results._digests), 10)
+        self.assertTrue(all(digest in results for digest in digests))
+        self.assertNotIn(_make_hash(25), results)
+        results.close()
+
+    def test_unordered_distinct(self):
+        documents = [{'a': 1, 'b': [1, {'c': 2}]}, {'b': [1, {'c': 2}], 'a': 1}, {'a': True}, {'a': 1},
+                     {'a': 1.0}, 'a', 'a', None] * 5
+        for max_in_memory in (None, 2):
+            endpoint = _QueryExecutionDistinctUnorderedEndpointComponent(iter(documents), max_in_memory)
+            self.assertEqual(list(endpoint), [{'a': 1, 'b': [1, {'c': 2}]}, {'a': True}, {'a': 1}, 'a', None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import unittest
+import pytest
+from azure.cosmos import documents
+from azure.cosmos.exceptions import CosmosHttpResponseError
+from azure.cosmos.http_constants import HttpHeaders, StatusCodes, SubStatusCodes
+from azure.cosmos._execution_context.execution_dispatcher import (
+    _PipelineExecutionContext,
+    _ProxyQueryExecutionContext,
+)
+from azure.cosmos._execution_context.query_execution_info import _PartitionedQueryExecutionInfo
+
+pytestmark = pytest.mark.cosmosEmulator
+
+
+class _Response(object):
+
+    def __init__(self, status_code, headers):
+        self.status_code = status_code
+        self.headers = headers
+        self.reason = None
+
+    def text(self):
+        return ''
+
+
+class MockedCosmosClientConnection(object):
+    """Serves the query plan of a GROUP BY query and the partial groups of two partition key ranges.
+    """
+
+    def __init__(self, query_plan, partitions):
+        self.query_plan = query_plan
+        self.partitions = partitions
+        self.connection_policy = documents.ConnectionPolicy()
+        self._global_endpoint_manager = None
+        self._routing_map_provider = self
+        self.last_response_headers = None
+
+    def _GetQueryPlanThroughGateway(self, query, resource_link, container_properties=None):
+        return self.query_plan
+
+    def get_overlapping_ranges(self, collection_link, ranges):
+        return [{'id': str(i), 'minInclusive': '{:02X}'.format(i), 'maxExclusive': '{:02X}'.format(i + 1)}
+                for i in range(len(self.partitions))]
+
+    def QueryFeed(self, path, collection_id, query, options, partition_key_range_id):
+        return self.partitions[int(partition_key_range_id)], {}
+
+
+class GroupByEndpointTests(unittest.TestCase):
+    """Tests of the merge of the groups of cross partition GROUP BY queries.
+    """
+
+    def _query(self, results, **query_info):
+        query_info.setdefault('distinctType', 'None')
+        query_execution_info = _PartitionedQueryExecutionInfo({'queryInfo': query_info})
+        return list(_PipelineExecutionContext(None, {}, iter(results), query_execution_info))
+
+    def test_group_by_aggregates(self):
+        # the partial groups of two partition key ranges
+        results = [
+            {'groupByItems': [{'item': 'a'}], 'payload': {
+                'category': 'a', 'total': {'item': 3}, 'count': {'item': 2}, 'low': {'item': 1},
+                'mean': {'item': {'sum': 3, 'count': 2}}}},
+            {'groupByItems': [{'item': 'b'}], 'payload': {
+                'category': 'b', 'total': {'item': 5}, 'count': {'item': 1}, 'low': {'item': 5},
+                'mean': {'item': {'sum': 5, 'count': 1}}}},
+            {'groupByItems': [{'item': 'a'}], 'payload': {
+                'category': 'a', 'total': {'item': 4}, 'count': {'item': 1}, 'low': {'item2': 0},
+                'mean': {'item': {'sum': 4, 'count': 1}}}},
+            {'groupByItems': [{}], 'payload': {'total': {}, 'count': {'item': 1}, 'low': {}, 'mean': {}}},
+        ]
+        groups = self._query(
+            results,
+            groupByExpressions=['c.category'],
+            aggregates=['Sum', 'Count', 'Min', 'Average'],
+            groupByAliasToAggregateType={
+                'category': None, 'total': 'Sum', 'count': 'Count', 'low': 'Min', 'mean': 'Average'})
+
+        self.assertEqual(groups, [
+            {'category': 'a', 'total': 7, 'count': 3, 'low': 0, 'mean': 7.0 / 3},
+            {'category': 'b', 'total': 5, 'count': 1, 'low': 5, 'mean': 5.0},
+            {'count': 1},
+        ])
+
+    def test_group_by_select_value(self):
+        results = [
+            {'groupByItems': [{'item': 1}], 'payload': [{'item': 2}]},
+            {'groupByItems': [{'item': 2}], 'payload': [{'item': 1}]},
+            {'groupByItems': [{'item': 1.0}], 'payload': [{'item': 3}]},
+        ]
+        counts = self._query(
+            results, groupByExpressions=['c.n'], aggregates=['Count'], hasSelectValue=True,
+            groupByAliasToAggregateType={})
+        self.assertEqual(counts, [5, 1])
+
+        keys = self._query(
+            [{'groupByItems': [{'item': key}], 'payload': key} for key in ['x', 'y', 'x', None, None]],
+            groupByExpressions=['c.key'], hasSelectValue=True, groupByAliasToAggregateType={})
+        self.assertEqual(keys, ['x', 'y', None])
+
+    def test_group_by_with_limit(self):
+        results = [{'groupByItems': [{'item': i % 4}], 'payload': {'key': i % 4, 'count': {'item': 1}}}
+                   for i in range(20)]
+        groups = self._query(
+            results, groupByExpressions=['c.key'], aggregates=['Count'],
+            groupByAliasToAggregateType={'key': None, 'count': 'Count'}, offset=1, limit=2)
+        self.assertEqual(groups, [{'key': 1, 'count': 5}, {'key': 2, 'count': 5}])
+
+    def test_cross_partition_group_by_through_proxy(self):
+        query_plan = {
+            'queryInfo': {
+                'distinctType': 'None',
+                'groupByExpressions': ['c.category'],
+                'aggregates': ['Sum'],
+                'groupByAliasToAggregateType': {'category': None, 'total': 'Sum'},
+                'hasSelectValue': False,
+                'rewrittenQuery': 'SELECT * FROM r'},
+            'queryRanges': [{'min': '', 'max': 'FF', 'isMinInclusive': True, 'isMaxInclusive': False}]}
+        partitions = [
+            [{'groupByItems': [{'item': 'a'}], 'payload': {'category': 'a', 'total': {'item': 3}}},
+             {'groupByItems': [{'item': 'b'}], 'payload': {'category': 'b', 'total': {'item': 5}}}],
+            [{'groupByItems': [{'item': 'a'}], 'payload': {'category': 'a', 'total': {'item': 4}}}],
+        ]
+        client = MockedCosmosClientConnection(query_plan, partitions)
+
+        def fetch_function(options):
+            raise CosmosHttpResponseError(response=_Response(
+                StatusCodes.BAD_REQUEST,
+                {HttpHeaders.SubStatus: str(SubStatusCodes.CROSS_PARTITION_QUERY_NOT_SERVABLE)}))
+
+        query = 'SELECT c.category, SUM(c.n) AS total FROM c GROUP BY c.category'
+        context = _ProxyQueryExecutionContext(
+            client, 'dbs/db/colls/coll', query, {'enableCrossPartitionQuery': True}, fetch_function)
+
+        self.assertEqual(list(context), [{'category': 'a', 'total': 7}, {'category': 'b', 'total': 5}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import time
+import unittest
+import pytest
+from azure.cosmos import http_constants
+from azure.cosmos._item_cache import _ItemCache, _can_use_item_cache
+from azure.cosmos._session import Session
+from azure.cosmos.partition_key import _Undefined
+
+pytestmark = pytest.mark.cosmosEmulator
+
+COLLECTION_LINK = 'dbs/db/colls/coll'
+DOCUMENT_LINK = COLLECTION_LINK + '/docs/item'
+RID_DOCUMENT_LINK = 'dbs/qHc7AA==/colls/qHc7AJBaPgE=/docs/qHc7AJBaPgEBAAAAAAAAAA==/'
+
+
+def _headers(session_token, request_charge='1.0'):
+    return {http_constants.HttpHeaders.SessionToken: session_token,
+            http_constants.HttpHeaders.RequestCharge: request_charge}
+
+
+class ItemCacheTests(unittest.TestCase):
+    """Tests of the cache of the items of point reads.
+    """
+
+    def setUp(self):
+        self.session = Session('https://localhost:8081/')
+        self.item = {'id': 'item', 'pk': 'a', '_etag': '"1"', '_self': RID_DOCUMENT_LINK}
+
+    def _write(self, session_token):
+        # a write through the session, which records its session token for the collection
+        self.session.update_session(self.item, {
+            http_constants.HttpHeaders.AlternateContentPath: COLLECTION_LINK,
+            http_constants.HttpHeaders.SessionToken: session_token})
+
+    def test_get_and_set(self):
+        cache = _ItemCache(max_size=10, ttl_in_ms=10000)
+        self.assertIsNone(cache.get(DOCUMENT_LINK, 'a'))
+        cache.set(DOCUMENT_LINK, 'a', self.item, _headers('0:-1#10'))
+
+        cached_item = cache.get(DOCUMENT_LINK, 'a')
+        self.assertEqual(cached_item.get_item(), self.item)
+        self.assertIsNot(cached_item.get_item(), cached_item.item)
+        self.assertEqual(cached_item.etag, '"1"')
+        self.assertEqual(cached_item.get_headers()[http_constants.HttpHeaders.RequestCharge], '0')
+        # the partition key is part of the key
+        self.assertIsNone(cache.get(DOCUMENT_LINK, 'b'))
+        self.assertIsNone(cache.get(DOCUMENT_LINK, _Undefined()))
+        # the items of links that aren't name based aren't cached
+        cache.set(RID_DOCUMENT_LINK, 'a', self.item, _headers('0:-1#10'))
+        self.assertIsNone(cache.get(RID_DOCUMENT_LINK, 'a'))
+
+    def test_disabled(self):
+        cache = _ItemCache(max_size=0, ttl_in_ms=10000)
+        cache.set(DOCUMENT_LINK, 'a', self.item, _headers('0:-1#10'))
+        self.assertFalse(cache.enabled)
+        self.assertIsNone(cache.get(DOCUMENT_LINK, 'a'))
+
+    def test_least_recently_used_item_is_evicted(self):
+        cache = _ItemCache(max_size=2, ttl_in_ms=10000)
+        for item_id in ('a', 'b'):
+            cache.set(COLLECTION_LINK + '/docs/' + item_id, 'a', dict(self.item, id=item_id), _headers('0:-1#10'))
+        cache.get(COLLECTION_LINK + '/docs/a', 'a')
+        cache.set(COLLECTION_LINK + '/docs/c', 'a', dict(self.item, id='c'), _headers('0:-1#10'))
+
+        self.assertIsNotNone(cache.get(COLLECTION_LINK + '/docs/a', 'a'))
+        self.assertIsNone(cache.get(COLLECTION_LINK + '/docs/b', 'a'))
+        self.assertIsNotNone(cache.get(COLLECTION_LINK + '/docs/c', 'a'))
+
+    def test_expired_item_is_not_fresh(self):
+        cache = _ItemCache(max_size=10, ttl_in_ms=10000)
+        cache.set(DOCUMENT_LINK, 'a', self.item, _headers('0:-1#10'))
+        cached_item = cache.get(DOCUMENT_LINK, 'a')
+        self.assertTrue(cache.is_fresh(cached_item, self.session, DOCUMENT_LINK))
+
+        cached_item.expiry_time = time.time() - 1
+        self.assertFalse(cache.is_fresh(cached_item, self.session, DOCUMENT_LINK))
+        # a read conditional on the etag found the item unchanged
+        cache.refresh(cached_item, _headers('0:-1#12'))
+        self.assertTrue(cache.is_fresh(cached_item, self.session, DOCUMENT_LINK))
+        self.assertEqual(cached_item.session_token.global_lsn, 12)
+
+    def test_session_consistency(self):
+        cache = _ItemCache(max_size=10, ttl_in_ms=10000)
+        cache.set(DOCUMENT_LINK, 'a', self.item, _headers('0:-1#10'))
+        cached_item = cache.get(DOCUMENT_LINK, 'a')
+
+        # the session has seen no write to the partition key range after the item was read
+        self._write('0:-1#10,1:-1#50')
+        self.assertTrue(cache.is_fresh(cached_item, self.session, DOCUMENT_LINK))
+        # the session has seen a later write to the partition key range of the item
+        self._write('0:-1#11')
+        self.assertFalse(cache.is_fresh(cached_item, self.session, DOCUMENT_LINK))
+
+    def test_invalidate(self):
+        cache = _ItemCache(max_size=10, ttl_in_ms=10000)
+        for item_id in ('a', 'b', 'c'):
+            cache.set(COLLECTION_LINK + '/docs/' + item_id, 'a', dict(self.item, id=item_id), _headers('0:-1#10'))
+        cache.set('dbs/db/colls/other/docs/a', 'a', self.item, _headers('0:-1#10'))
+
+        cache.invalidate_item(COLLECTION_LINK + '/docs/a')
+        self.assertIsNone(cache.get(COLLECTION_LINK + '/docs/a', 'a'))
+        cache.invalidate_batch(COLLECTION_LINK, '[{"operationType":"Delete","id":"b"}]')
+        self.assertIsNone(cache.get(COLLECTION_LINK + '/docs/b', 'a'))
+        self.assertIsNotNone(cache.get(COLLECTION_LINK + '/docs/c', 'a'))
+        cache.invalidate(COLLECTION_LINK)
+        self.assertIsNone(cache.get(COLLECTION_LINK + '/docs/c', 'a'))
+        self.assertIsNotNone(cache.get('dbs/db/colls/other/docs/a', 'a'))
+        # the container of a link that isn't name based is unknown
+        cache.invalidate_item(RID_DOCUMENT_LINK)
+        self.assertIsNone(cache.get('dbs/db/colls/other/docs/a', 'a'))
+
+    def test_can_use_item_cache(self):
+        self.assertTrue(_can_use_item_cache({'partitionKey': 'a'}, self.session))
+        self.assertFalse(_can_use_item_cache({'partitionKey': 'a'}, None))
+        self.assertFalse(_can_use_item_cache({'sessionToken': '0:-1#10'}, self.session))
+        self.assertFalse(_can_use_item_cache(
+            {'accessCondition': {'type': 'IfNoneMatch', 'condition': '"1"'}}, self.session))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import asyncio
+import time
+import unittest
+import pytest
+from azure.cosmos import documents
+from azure.cosmos._global_endpoint_manager import _GlobalEndpointManager
+from azure.cosmos._location_cache import LocationCache, _EndpointLatencyTracker
+from azure.cosmos._request_object import RequestObject
+from azure.cosmos.aio._global_endpoint_manager_async import _GlobalEndpointManager as _GlobalEndpointManagerAsync
+from azure.cosmos.http_constants import ResourceType
+
+pytestmark = pytest.mark.cosmosEmulator
+
+DEFAULT_ENDPOINT = "https://default.documents.azure.com"
+ENDPOINTS = ["https://location{}.documents.azure.com".format(i) for i in range(3)]
+
+
+def _database_account():
+    database_account = documents.DatabaseAccount()
+    database_account._WritableLocations = [{'name': 'location0', 'databaseAccountEndpoint': ENDPOINTS[0]}]
+    database_account._ReadableLocations = [
+        {'name': 'location{}'.format(i), 'databaseAccountEndpoint': endpoint} for i, endpoint in enumerate(ENDPOINTS)]
+    return database_account
+
+
+class _Clock(object):
+
+    def __init__(self):
+        self.now = 1000000
+
+    def __call__(self):
+        return self.now
+
+
+class LatencyBasedRoutingTests(unittest.TestCase):
+    """Tests of the ordering of the read endpoints by their measured latency.
+    """
+
+    def _location_cache(self, tolerance_in_ms=20):
+        location_cache = LocationCache(
+            ['location0', 'location1', 'location2'], DEFAULT_ENDPOINT, True, False, 1000,
+            latency_tracker=_EndpointLatencyTracker(tolerance_in_ms))
+        location_cache.current_time_millis = self.clock
+        location_cache.perform_on_database_account_read(_database_account())
+        return location_cache
+
+    def _record(self, location_cache, latencies_by_endpoint, count=10):
+        for endpoint, latency in latencies_by_endpoint.items():
+            for _ in range(count):
+                location_cache.record_latency(endpoint, latency)
+        self.clock.now += LocationCache.latency_ordering_interval_in_ms + 1
+
+    def setUp(self):
+        self.clock = _Clock()
+
+    def test_tracker_order(self):
+        tracker = _EndpointLatencyTracker(tolerance_in_ms=10, min_sample_count=3)
+        for latency in (50, 50, 50):
+            tracker.add('a', latency, now=0)
+        for latency in (45, 45, 45):
+            tracker.add('b', latency, now=0)
+        for latency in (10, 10):
+            tracker.add('c', latency, now=0)
+
+        # b is not faster than a by more than the tolerance, and c has too few samples to be scored
+        self.assertEqual(tracker.order(['c', 'a', 'b'], now=0), ['a', 'b', 'c'])
+        tracker.add('c', 10, now=0)
+        self.assertEqual(tracker.order(['a', 'b', 'c'], now=0), ['c', 'a', 'b'])
+        # expired samples don't count
+        self.assertEqual(tracker.order(['a', 'b', 'c'], now=tracker.sample_expiration_in_ms + 1), ['a', 'b', 'c'])
+        self.assertEqual(tracker.get_latency('c', now=0), (10, 10, 3))
+
+    def test_tail_latency_is_scored(self):
+        tracker = _EndpointLatencyTracker(tolerance_in_ms=10, min_sample_count=1)
+        for i in range(100):
+            tracker.add('a', 500 if i >= 95 else 20, now=0)
+            tracker.add('b', 40, now=0)
+
+        # a has the lower median, but its tail latency makes b faster overall
+        self.assertEqual(tracker.get_latency('a', now=0)[:2], (20, 500))
+        self.assertEqual(tracker.order(['a', 'b'], now=0), ['b', 'a'])
+
+    def test_read_endpoints_follow_latency(self):
+        location_cache = self._location_cache()
+        self.assertEqual(location_cache.get_read_endpoints(), ENDPOINTS)
+
+        self._record(location_cache, {ENDPOINTS[0]: 100, ENDPOINTS[1]: 90, ENDPOINTS[2]: 30})
+        self.assertEqual(location_cache.get_read_endpoints(), [ENDPOINTS[2], ENDPOINTS[0], ENDPOINTS[1]])
+        request = RequestObject(ResourceType.Document, documents._OperationType.Read)
+        self.assertEqual(location_cache.resolve_service_endpoint(request), ENDPOINTS[2])
+        # writes still go to the write location
+        request = RequestObject(ResourceType.Document, documents._OperationType.Create)
+        self.assertEqual(location_cache.resolve_service_endpoint(request), ENDPOINTS[0])
+
+        # an unavailable endpoint is used last, however fast it was
+        location_cache.mark_endpoint_unavailable_for_read(ENDPOINTS[2])
+        self.assertEqual(location_cache.get_read_endpoints(), [ENDPOINTS[0], ENDPOINTS[1], ENDPOINTS[2]])
+        latencies = location_cache.get_read_endpoint_latencies()
+        self.assertEqual([l['endpoint'] for l in latencies], location_cache.get_read_endpoints())
+        self.assertEqual((latencies[0]['p50'], latencies[0]['p99'], latencies[0]['sampleCount']), (100, 100, 10))
+
+    def test_latency_ordering_is_disabled_by_default(self):
+        location_cache = LocationCache(['location0', 'location1', 'location2'], DEFAULT_ENDPOINT, True, False, 1000)
+        location_cache.perform_on_database_account_read(_database_account())
+        location_cache.record_latency(ENDPOINTS[0], 1000)
+
+        self.assertEqual(location_cache.get_read_endpoints(), ENDPOINTS)
+        self.assertEqual(location_cache.get_read_endpoint_latencies()[0]['sampleCount'], 0)
+
+    class MockedClientConnection(object):
+
+        def __init__(self, latencies_by_endpoint):
+            self.connection_policy = documents.ConnectionPolicy()
+            self.connection_policy.PreferredLocations = ['location0', 'location1', 'location2']
+            self.connection_policy.EnableLatencyBasedRouting = True
+            self.connection_policy.LatencyProbeIntervalInMs = 60000
+            self.url_connection = DEFAULT_ENDPOINT
+            self.latencies_by_endpoint = latencies_by_endpoint
+            self.probed = []
+
+        def ProbeEndpoint(self, endpoint):
+            self.probed.append(endpoint)
+            if endpoint == ENDPOINTS[1]:
+                raise ValueError("The endpoint is not reachable.")
+            self._global_endpoint_manager.record_latency(endpoint, self.latencies_by_endpoint[endpoint])
+
+    def test_probes(self):
+        client = self.MockedClientConnection({ENDPOINTS[0]: 80, ENDPOINTS[2]: 10})
+        endpoint_manager = client._global_endpoint_manager = _GlobalEndpointManager(client)
+        endpoint_manager.location_cache.latency_tracker.min_sample_count = 1
+        endpoint_manager.record_latency(ENDPOINTS[0], 80)
+        endpoint_manager.force_refresh(_database_account())
+        for _ in range(100):
+            if len(client.probed) == 2:
+                break
+            time.sleep(0.01)
+        # the next refresh is within the probe interval
+        endpoint_manager.refresh_endpoint_list(None)
+        time.sleep(0.01)
+
+        # the endpoint measured by a request is not probed, and a failed probe doesn't fail the client
+        self.assertEqual(client.probed, [ENDPOINTS[1], ENDPOINTS[2]])
+        endpoint_manager.location_cache.last_latency_ordering_time_stamp = 0
+        self.assertEqual(
+            endpoint_manager.location_cache.get_read_endpoints(), [ENDPOINTS[2], ENDPOINTS[0], ENDPOINTS[1]])
+
+    def test_probes_async(self):
+        client = self.MockedClientConnection({ENDPOINTS[0]: 80, ENDPOINTS[1]: 80, ENDPOINTS[2]: 10})
+
+        async def probe():
+            endpoint_manager = client._global_endpoint_manager = _GlobalEndpointManagerAsync(client)
+            await endpoint_manager.force_refresh(_database_account())
+            await endpoint_manager._latency_probe_task
+            await endpoint_manager.close()
+            return endpoint_manager
+
+        async def probe_endpoint(endpoint):
+            self.MockedClientConnection.ProbeEndpoint(client, endpoint)
+
+        client.ProbeEndpoint = probe_endpoint
+        endpoint_manager = asyncio.get_event_loop().run_until_complete(probe())
+
+        self.assertEqual(client.probed, ENDPOINTS)
+        self.assertIsNone(endpoint_manager._latency_probe_task)
+
+
+if __name__ == "__main__":
+    unittest.main()
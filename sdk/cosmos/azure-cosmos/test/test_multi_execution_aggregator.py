@@ -0,0 +1,235 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import threading
+import time
+import unittest
+import pytest
+try:
+    from unittest import mock
+except ImportError:  # python < 3.3
+    import mock  # type: ignore
+from azure.cosmos import documents
+from azure.cosmos.exceptions import CosmosHttpResponseError
+from azure.cosmos.http_constants import HttpHeaders, StatusCodes, SubStatusCodes
+from azure.cosmos._execution_context.multi_execution_aggregator import _MultiExecutionContextAggregator
+from azure.cosmos._execution_context.query_execution_info import _PartitionedQueryExecutionInfo
+
+pytestmark = pytest.mark.cosmosEmulator
+
+
+class _Response(object):
+
+    def __init__(self, status_code, headers):
+        self.status_code = status_code
+        self.headers = headers
+        self.reason = None
+
+    def text(self):
+        return ''
+
+
+class MultiExecutionContextAggregatorTests(unittest.TestCase):
+    """Cross partition query execution tests against a mocked client.
+    """
+
+    class MockedCosmosClientConnection(object):
+
+        def __init__(self, partitions, page_size, latency=0.0):
+            self.partitions = partitions
+            self.page_size = page_size
+            self.latency = latency
+            self.connection_policy = documents.ConnectionPolicy()
+            self._global_endpoint_manager = None
+            self._routing_map_provider = self
+            self.last_response_headers = None
+            self.requests = []
+            self.failing_partition = None
+            # the partition split after its first page is read, into two ranges holding every other document
+            self.splitting_partition = None
+            self.split_partitions = set()
+            self.refreshed_ranges = []
+            self._lock = threading.Lock()
+            self._in_flight = 0
+            self.max_in_flight = 0
+
+        def get_overlapping_ranges(self, collection_link, ranges):
+            partition_key_ranges = []
+            for i in range(len(self.partitions)):
+                if str(i) not in self.split_partitions:
+                    partition_key_ranges.append(
+                        {'id': str(i), 'minInclusive': '{:02X}'.format(i), 'maxExclusive': '{:02X}'.format(i + 1)})
+                    continue
+                partition_key_ranges.append(
+                    {'id': '{}-0'.format(i), 'minInclusive': '{:02X}'.format(i), 'maxExclusive': '{:02X}80'.format(i)})
+                partition_key_ranges.append(
+                    {'id': '{}-1'.format(i), 'minInclusive': '{:02X}80'.format(i),
+                     'maxExclusive': '{:02X}'.format(i + 1)})
+            return partition_key_ranges
+
+        def refresh_routing_map(self, collection_link, gone_partition_key_range_id=None):
+            self.refreshed_ranges.append(gone_partition_key_range_id)
+
+        def QueryFeed(self, path, collection_id, query, options, partition_key_range_id):
+            with self._lock:
+                self.requests.append((partition_key_range_id, options.get('continuation')))
+                self._in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self._in_flight)
+            try:
+                time.sleep(self.latency)
+                if partition_key_range_id == self.failing_partition:
+                    raise CosmosHttpResponseError(StatusCodes.BAD_REQUEST, "Query failed")
+                # the continuation is the index of the next document of the partition before it split
+                start = int(options.get('continuation') or 0)
+                partition, _, child = partition_key_range_id.partition('-')
+                if partition in self.split_partitions and not child:
+                    raise CosmosHttpResponseError(response=_Response(
+                        StatusCodes.GONE, {HttpHeaders.SubStatus: str(SubStatusCodes.PARTITION_KEY_RANGE_GONE)}))
+                if partition == self.splitting_partition and start > 0:
+                    self.split_partitions.add(partition)
+                documents_ = [(i, d) for i, d in enumerate(self.partitions[int(partition)])
+                              if i >= start and (not child or i % 2 == int(child))]
+                page = documents_[:self.page_size]
+                continuation = str(page[-1][0] + 1) if len(documents_) > self.page_size else None
+                return [d for _, d in page], {HttpHeaders.Continuation: continuation}
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+    def setUp(self):
+        # every partition holds the values of a different residue, so the merged result interleaves them
+        self.partitions = [[{'orderByItems': [{'item': value}], 'payload': {'value': value}}
+                            for value in range(partition, 200, 8)] for partition in range(8)]
+
+    def _query_execution_info(self, order_by):
+        return _PartitionedQueryExecutionInfo({
+            'queryInfo': {'orderBy': order_by, 'rewrittenQuery': 'SELECT * FROM r'},
+            'queryRanges': [{'min': '', 'max': 'FF', 'isMinInclusive': True, 'isMaxInclusive': False}]})
+
+    def _aggregate(self, client, order_by, **options):
+        aggregator = _MultiExecutionContextAggregator(
+            client, 'dbs/db/colls/coll', 'SELECT * FROM r', options, self._query_execution_info(order_by))
+        return list(aggregator)
+
+    def test_parallel_order_by(self):
+        client = self.MockedCosmosClientConnection(self.partitions, page_size=5, latency=0.01)
+        results = self._aggregate(client, ['Ascending'], maxDegreeOfParallelism=4)
+
+        self.assertEqual([r['payload']['value'] for r in results], list(range(200)))
+        self.assertGreater(client.max_in_flight, 1)
+        self.assertLessEqual(client.max_in_flight, 4)
+        # every page of every partition is fetched exactly once
+        self.assertEqual(len(client.requests), len(set(client.requests)))
+        self.assertEqual(len(client.requests), sum(-(-len(p) // 5) for p in self.partitions))
+
+    def test_parallel_matches_serial(self):
+        serial_client = self.MockedCosmosClientConnection(self.partitions, page_size=3)
+        serial = self._aggregate(serial_client, ['Descending'])
+        parallel_client = self.MockedCosmosClientConnection(self.partitions, page_size=3)
+        parallel = self._aggregate(parallel_client, ['Descending'], maxDegreeOfParallelism=-1)
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(serial_client.max_in_flight, 1)
+        self.assertEqual(sorted(parallel_client.requests, key=str), sorted(serial_client.requests, key=str))
+
+    def test_parallel_without_order_by(self):
+        client = self.MockedCosmosClientConnection(self.partitions, page_size=4)
+        results = self._aggregate(client, None, maxDegreeOfParallelism=3)
+
+        # results are returned partition by partition, in the order of the partition key ranges
+        self.assertEqual(results, [document for partition in self.partitions for document in partition])
+
+    def test_parallel_prefetch_is_bounded(self):
+        client = self.MockedCosmosClientConnection(self.partitions, page_size=2)
+        aggregator = _MultiExecutionContextAggregator(
+            client, 'dbs/db/colls/coll', 'SELECT * FROM r', {'maxDegreeOfParallelism': 8},
+            self._query_execution_info(['Ascending']))
+        next(aggregator)
+        time.sleep(0.05)
+
+        # each partition has fetched its first page and prefetched at most one more
+        pages_per_partition = [len([r for r in client.requests if r[0] == str(i)]) for i in range(8)]
+        self.assertTrue(all(pages <= 2 for pages in pages_per_partition))
+
+    def test_partition_split(self):
+        for max_degree_of_parallelism in (None, 4):
+            client = self.MockedCosmosClientConnection(self.partitions, page_size=5)
+            client.splitting_partition = '3'
+            results = self._aggregate(client, ['Ascending'], maxDegreeOfParallelism=max_degree_of_parallelism)
+
+            # the query of the split range resumes on its child ranges, from the continuation of its failed page
+            self.assertEqual([r['payload']['value'] for r in results], list(range(200)))
+            self.assertEqual(client.refreshed_ranges, ['3'])
+            self.assertEqual([r for r in client.requests if r[0].startswith('3-')][:2], [('3-0', '10'), ('3-1', '10')])
+
+    def test_parallel_error_is_raised(self):
+        client = self.MockedCosmosClientConnection(self.partitions, page_size=5)
+        client.failing_partition = '3'
+        with self.assertRaises(CosmosHttpResponseError):
+            self._aggregate(client, ['Ascending'], maxDegreeOfParallelism=4)
+
+    def test_executor_is_shut_down(self):
+        query_execution_info = self._query_execution_info(['Ascending'])
+        options = {'maxDegreeOfParallelism': 4}
+
+        # an iterator closed, or abandoned, before its last result
+        client = self.MockedCosmosClientConnection(self.partitions, page_size=5)
+        aggregator = _MultiExecutionContextAggregator(
+            client, 'dbs/db/colls/coll', 'SELECT * FROM r', options, query_execution_info)
+        executor = aggregator._executor
+        next(aggregator)
+        aggregator.close()
+        self.assertTrue(executor._shutdown)
+        aggregator = _MultiExecutionContextAggregator(
+            client, 'dbs/db/colls/coll', 'SELECT * FROM r', options, query_execution_info)
+        executor = aggregator._executor
+        del aggregator
+        self.assertTrue(executor._shutdown)
+
+        # a query failing after its first pages
+        client = self.MockedCosmosClientConnection(self.partitions, page_size=5)
+        aggregator = _MultiExecutionContextAggregator(
+            client, 'dbs/db/colls/coll', 'SELECT * FROM r', options, query_execution_info)
+        executor = aggregator._executor
+        client.failing_partition = '3'
+        with self.assertRaises(CosmosHttpResponseError):
+            list(aggregator)
+        self.assertTrue(executor._shutdown)
+
+        # a document producer failing to be created
+        executors = []
+        create_executor = _MultiExecutionContextAggregator._create_executor
+
+        def _create_executor(aggregator, target_range_count):
+            executors.append(create_executor(aggregator, target_range_count))
+            return executors[-1]
+
+        with mock.patch.object(_MultiExecutionContextAggregator, '_create_executor', _create_executor), \
+                mock.patch.object(_MultiExecutionContextAggregator, '_createTargetPartitionQueryExecutionContext',
+                                  side_effect=ValueError("Invalid query")):
+            with self.assertRaises(ValueError):
+                _MultiExecutionContextAggregator(
+                    client, 'dbs/db/colls/coll', 'SELECT * FROM r', options, query_execution_info)
+        self.assertTrue(executors[0]._shutdown)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import unittest
+import pytest
+from azure.cosmos import documents
+from azure.cosmos.exceptions import CosmosHttpResponseError
+from azure.cosmos.http_constants import HttpHeaders, StatusCodes, SubStatusCodes
+from azure.cosmos._cosmos_client_connection import CosmosClientConnection
+from azure.cosmos._execution_context.execution_dispatcher import _ProxyQueryExecutionContext
+from azure.cosmos._query_plan_cache import _QueryPlanCache, _normalize_query_text
+
+pytestmark = pytest.mark.cosmosEmulator
+
+CONTAINER_LINK = 'dbs/db/colls/coll'
+CONTAINER = {'id': 'coll', '_rid': 'rid1', 'partitionKey': {'paths': ['/pk'], 'kind': 'Hash'}}
+OTHER_CONTAINER = {'id': 'other', '_rid': 'rid2', 'partitionKey': {'paths': ['/pk'], 'kind': 'Hash'}}
+
+
+def _query_plan(query_ranges=None, **query_info):
+    return {
+        'queryInfo': dict(query_info, rewrittenQuery='SELECT * FROM r'),
+        'queryRanges': query_ranges or [{'min': '', 'max': 'FF', 'isMinInclusive': True, 'isMaxInclusive': False}]}
+
+
+class _Response(object):
+
+    def __init__(self, status_code, sub_status):
+        self.status_code = status_code
+        self.headers = {HttpHeaders.SubStatus: str(sub_status)}
+        self.reason = None
+
+    def text(self):
+        return ''
+
+
+class MockedCosmosClientConnection(object):
+    """Serves query plans from the gateway in order, through the query plan cache of the client.
+    """
+
+    _GetQueryPlanThroughGateway = CosmosClientConnection._GetQueryPlanThroughGateway
+
+    def __init__(self, query_plans):
+        self.query_plans = query_plans
+        self.gateway_requests = 0
+        self.connection_policy = documents.ConnectionPolicy()
+        self._global_endpoint_manager = None
+        self._query_plan_cache = _QueryPlanCache(10)
+        self.last_response_headers = None
+
+    def _CosmosClientConnection__QueryFeed(self, path, resource_type, resource_id, result_fn, create_fn, query,
+                                           options, **kwargs):
+        self.gateway_requests += 1
+        return self.query_plans.pop(0)
+
+
+class QueryPlanCacheTests(unittest.TestCase):
+
+    def test_normalize_query_text(self):
+        self.assertEqual(_normalize_query_text('  SELECT *\n\tFROM c   WHERE c.a = 1 '),
+                         'SELECT * FROM c WHERE c.a = 1')
+        # whitespace in string literals is significant
+        self.assertEqual(_normalize_query_text("SELECT * FROM c WHERE c.a =  'x  y'"),
+                         "SELECT * FROM c WHERE c.a = 'x  y'")
+        self.assertEqual(_normalize_query_text('SELECT * FROM c WHERE c.a = "it\\"s  "'),
+                         'SELECT * FROM c WHERE c.a = "it\\"s  "')
+
+    def test_get_and_set(self):
+        cache = _QueryPlanCache(10)
+        plan = _query_plan(orderBy=['Ascending'])
+        cache.set(CONTAINER_LINK, CONTAINER, 'SELECT * FROM c ORDER BY c.a', plan)
+
+        self.assertIs(cache.get(CONTAINER, 'SELECT *  FROM c\nORDER BY c.a'), plan)
+        self.assertIsNone(cache.get(CONTAINER, 'SELECT * FROM c ORDER BY c.b'))
+        self.assertIsNone(cache.get(OTHER_CONTAINER, 'SELECT * FROM c ORDER BY c.a'))
+
+        # plans are not cached without the properties of their container
+        cache.set(CONTAINER_LINK, None, 'SELECT 1', _query_plan())
+        self.assertIsNone(cache.get(None, 'SELECT 1'))
+        self.assertIsNone(cache.get(CONTAINER, 'SELECT 1'))
+
+    def test_parameters(self):
+        cache = _QueryPlanCache(10)
+        query = {'query': 'SELECT * FROM c WHERE c.pk = @pk', 'parameters': [{'name': '@pk', 'value': 'a'}]}
+        other_value = {'query': query['query'], 'parameters': [{'name': '@pk', 'value': 'b'}]}
+        single_range = [{'min': '05C1', 'max': '05C1', 'isMinInclusive': True, 'isMaxInclusive': True}]
+
+        # the ranges of the plan depend on the parameter values
+        cache.set(CONTAINER_LINK, CONTAINER, query, _query_plan(single_range))
+        self.assertIsNotNone(cache.get(CONTAINER, query))
+        self.assertIsNone(cache.get(CONTAINER, other_value))
+
+        # and so does its top
+        top_query = {'query': 'SELECT TOP @n * FROM c', 'parameters': [{'name': '@n', 'value': 1}]}
+        cache.set(CONTAINER_LINK, CONTAINER, top_query, _query_plan(top=1))
+        self.assertIsNone(cache.get(CONTAINER, {'query': top_query['query'], 'parameters': [
+            {'name': '@n', 'value': 2}]}))
+
+        # a plan that targets all the ranges holds for any value
+        range_query = {'query': 'SELECT * FROM c WHERE c.a > @a', 'parameters': [{'name': '@a', 'value': 1}]}
+        plan = _query_plan()
+        cache.set(CONTAINER_LINK, CONTAINER, range_query, plan)
+        self.assertIs(cache.get(CONTAINER, {'query': range_query['query'], 'parameters': [
+            {'name': '@a', 'value': 2}]}), plan)
+
+    def test_least_recently_used_eviction(self):
+        cache = _QueryPlanCache(2)
+        cache.set(CONTAINER_LINK, CONTAINER, 'SELECT 1', _query_plan())
+        cache.set(CONTAINER_LINK, CONTAINER, 'SELECT 2', _query_plan())
+        cache.get(CONTAINER, 'SELECT 1')
+        cache.set(CONTAINER_LINK, CONTAINER, 'SELECT 3', _query_plan())
+
+        self.assertIsNotNone(cache.get(CONTAINER, 'SELECT 1'))
+        self.assertIsNone(cache.get(CONTAINER, 'SELECT 2'))
+        self.assertIsNotNone(cache.get(CONTAINER, 'SELECT 3'))
+
+    def test_changed_partition_key_definition(self):
+        cache = _QueryPlanCache(10)
+        cache.set(CONTAINER_LINK, CONTAINER, 'SELECT 1', _query_plan())
+        changed = dict(CONTAINER, partitionKey={'paths': ['/other'], 'kind': 'Hash'})
+
+        self.assertIsNone(cache.get(changed, 'SELECT 1'))
+        # the plan is dropped, even for the previous definition
+        self.assertIsNone(cache.get(CONTAINER, 'SELECT 1'))
+
+    def test_invalidate_and_disable(self):
+        cache = _QueryPlanCache(10)
+        cache.set(CONTAINER_LINK, CONTAINER, 'SELECT 1', _query_plan())
+        cache.set('dbs/db/colls/other', OTHER_CONTAINER, 'SELECT 1', _query_plan())
+        cache.invalidate('/' + CONTAINER_LINK + '/')
+
+        self.assertIsNone(cache.get(CONTAINER, 'SELECT 1'))
+        self.assertIsNotNone(cache.get(OTHER_CONTAINER, 'SELECT 1'))
+
+        disabled = _QueryPlanCache(0)
+        disabled.set(CONTAINER_LINK, CONTAINER, 'SELECT 1', _query_plan())
+        self.assertIsNone(disabled.get(CONTAINER, 'SELECT 1'))
+
+    def test_container_recreated_with_other_partition_key(self):
+        query = 'SELECT * FROM c ORDER BY c.a'
+        old_plan = _query_plan(orderBy=['Ascending'])
+        new_plan = _query_plan(orderBy=['Ascending'])
+        client = MockedCosmosClientConnection([old_plan, new_plan])
+
+        self.assertIs(client._GetQueryPlanThroughGateway(query, CONTAINER_LINK, container_properties=CONTAINER),
+                      old_plan)
+        self.assertIs(client._GetQueryPlanThroughGateway(query, CONTAINER_LINK, container_properties=CONTAINER),
+                      old_plan)
+        self.assertEqual(client.gateway_requests, 1)
+
+        # another process recreates the container under the same link, with another partition key
+        recreated = {'id': 'coll', '_rid': 'rid3', 'partitionKey': {'paths': ['/other'], 'kind': 'Hash'}}
+        self.assertIs(client._GetQueryPlanThroughGateway(query, CONTAINER_LINK, container_properties=recreated),
+                      new_plan)
+        self.assertEqual(client.gateway_requests, 2)
+
+    def test_stale_container_errors_invalidate_plans(self):
+        for status_code, sub_status in ((StatusCodes.NOT_FOUND, SubStatusCodes.NAME_CACHE_IS_STALE),
+                                        (StatusCodes.GONE, SubStatusCodes.PARTITION_KEY_RANGE_GONE)):
+            client = MockedCosmosClientConnection([])
+            client._query_plan_cache.set(CONTAINER_LINK, CONTAINER, 'SELECT 1', _query_plan())
+
+            def fetch_function(options):
+                raise CosmosHttpResponseError(response=_Response(status_code, sub_status))
+
+            context = _ProxyQueryExecutionContext(client, CONTAINER_LINK, 'SELECT 1', {}, fetch_function,
+                                                  lambda: CONTAINER)
+            with self.assertRaises(CosmosHttpResponseError):
+                context.fetch_next_block()
+            self.assertIsNone(client._query_plan_cache.get(CONTAINER, 'SELECT 1'))
+
+        # other errors keep the plans
+        client = MockedCosmosClientConnection([])
+        client._query_plan_cache.set(CONTAINER_LINK, CONTAINER, 'SELECT 1', _query_plan())
+
+        def fetch_function(options):
+            raise CosmosHttpResponseError(response=_Response(StatusCodes.NOT_FOUND, 0))
+
+        context = _ProxyQueryExecutionContext(client, CONTAINER_LINK, 'SELECT 1', {}, fetch_function,
+                                              lambda: CONTAINER)
+        with self.assertRaises(CosmosHttpResponseError):
+            context.fetch_next_block()
+        self.assertIsNotNone(client._query_plan_cache.get(CONTAINER, 'SELECT 1'))
+
+
+if __name__ == "__main__":
+    unittest.main()
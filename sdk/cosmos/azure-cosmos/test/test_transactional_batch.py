@@ -0,0 +1,147 @@
+#The MIT License (MIT)
+#Copyright (c) 2014 Microsoft Corporation
+
+#Permission is hereby granted, free of charge, to any person obtaining a copy
+#of this software and associated documentation files (the "Software"), to deal
+#in the Software without restriction, including without limitation the rights
+#to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#copies of the Software, and to permit persons to whom the Software is
+#furnished to do so, subject to the following conditions:
+
+#The above copyright notice and this permission notice shall be included in all
+#copies or substantial portions of the Software.
+
+#THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+#SOFTWARE.
+
+import copy
+import json
+import unittest
+import pytest
+from azure.core import MatchConditions
+from azure.cosmos import TransactionalBatch
+from azure.cosmos.container import ContainerProxy
+from azure.cosmos.http_constants import HttpHeaders, StatusCodes
+from azure.cosmos._transactional_batch import _MAX_OPERATION_COUNT
+
+pytestmark = pytest.mark.cosmosEmulator
+
+
+class TransactionalBatchTests(unittest.TestCase):
+    """Transactional batch tests against a mocked client connection.
+    """
+
+    class MockedClientConnection(object):
+        """Applies the operations of a batch to in-memory items, or none of them if one fails."""
+
+        def __init__(self):
+            self.items = {}
+            self.requests = []
+            self.last_response_headers = None
+
+        def Batch(self, collection_link, batch_body, options=None, **kwargs):
+            self.requests.append((collection_link, json.loads(batch_body), options))
+            items = copy.deepcopy(self.items)
+            results = []
+            for operation in json.loads(batch_body):
+                results.append(self._apply(items, operation))
+                if results[-1]['statusCode'] >= 400:
+                    results = [r if r['statusCode'] >= 400 else {'statusCode': StatusCodes.FAILED_DEPENDENCY}
+                               for r in results]
+                    break
+            else:
+                self.items = items
+            results.extend({'statusCode': StatusCodes.FAILED_DEPENDENCY}
+                           for _ in range(len(json.loads(batch_body)) - len(results)))
+            self.last_response_headers = {HttpHeaders.RequestCharge: str(len(results) * 2.0)}
+            return results
+
+        @staticmethod
+        def _apply(items, operation):
+            operation_type = operation['operationType']
+            item_id = operation.get('id') or operation['resourceBody']['id']
+            if operation_type == 'Create' and item_id in items:
+                return {'statusCode': StatusCodes.CONFLICT}
+            if operation_type in ('Replace', 'Delete', 'Read') and item_id not in items:
+                return {'statusCode': StatusCodes.NOT_FOUND}
+            if 'ifMatch' in operation and items[item_id]['_etag'] != operation['ifMatch']:
+                return {'statusCode': StatusCodes.PRECONDITION_FAILED}
+            if operation_type == 'Delete':
+                del items[item_id]
+                return {'statusCode': StatusCodes.NO_CONTENT, 'requestCharge': 1.0}
+            if operation_type != 'Read':
+                items[item_id] = dict(operation['resourceBody'], _etag=str(len(items)))
+            return {'statusCode': StatusCodes.OK, 'requestCharge': 1.0, 'resourceBody': items[item_id],
+                    'eTag': items[item_id]['_etag']}
+
+    def setUp(self):
+        self.client_connection = self.MockedClientConnection()
+        self.container = ContainerProxy(self.client_connection, 'dbs/db', 'coll')
+
+    def test_batch_is_applied(self):
+        batch = TransactionalBatch('order')
+        batch.create_item({'id': 'order', 'pk': 'order'})
+        for i in range(3):
+            batch.create_item({'id': 'line{}'.format(i), 'pk': 'order'})
+        batch.read_item('order')
+        response = self.container.execute_transactional_batch(batch.delete_item('line2'))
+
+        self.assertTrue(response.succeeded)
+        self.assertEqual(response.status_code, StatusCodes.OK)
+        self.assertEqual(len(response), 6)
+        self.assertEqual(response[4].resource['id'], 'order')
+        self.assertEqual(response.request_charge, 12.0)
+        self.assertEqual(sorted(self.client_connection.items), ['line0', 'line1', 'order'])
+        # the whole batch is sent in one request, with the partition key of the batch
+        link, operations, options = self.client_connection.requests[0]
+        self.assertEqual(link, 'dbs/db/colls/coll')
+        self.assertEqual([o['operationType'] for o in operations], ['Create'] * 4 + ['Read', 'Delete'])
+        self.assertEqual(options['partitionKey'], 'order')
+
+    def test_failed_batch_is_not_applied(self):
+        self.container.execute_transactional_batch(TransactionalBatch('a').create_item({'id': 'a', 'pk': 'a'}))
+        etag = self.client_connection.items['a']['_etag']
+        batch = TransactionalBatch('a')
+        batch.create_item({'id': 'b', 'pk': 'a'})
+        batch.replace_item(
+            'a', {'id': 'a', 'pk': 'a', 'value': 1}, etag='other', match_condition=MatchConditions.IfNotModified)
+        batch.upsert_item({'id': 'c', 'pk': 'a'})
+        hook_responses = []
+        response = self.container.execute_transactional_batch(
+            batch, response_hook=lambda headers, result: hook_responses.append(result))
+
+        self.assertFalse(response.succeeded)
+        self.assertEqual(response.status_code, StatusCodes.PRECONDITION_FAILED)
+        self.assertEqual([r.status_code for r in response], [StatusCodes.FAILED_DEPENDENCY,
+                                                              StatusCodes.PRECONDITION_FAILED,
+                                                              StatusCodes.FAILED_DEPENDENCY])
+        self.assertEqual(self.client_connection.items, {'a': {'id': 'a', 'pk': 'a', '_etag': etag}})
+        self.assertEqual(hook_responses, [response])
+        self.assertEqual(self.client_connection.requests[-1][1][1]['ifMatch'], 'other')
+
+    def test_batch_validation(self):
+        with self.assertRaises(ValueError):
+            self.container.execute_transactional_batch(TransactionalBatch('a'))
+        batch = TransactionalBatch('a')
+        for i in range(_MAX_OPERATION_COUNT):
+            batch.read_item(str(i))
+        with self.assertRaises(ValueError):
+            batch.read_item('too many')
+        with self.assertRaises(ValueError):
+            self.container.execute_transactional_batch(
+                TransactionalBatch('a').upsert_item({'id': 'a', 'pk': 'a', 'value': 'x' * 3 * 1024 * 1024}))
+        with self.assertRaises(TypeError):
+            TransactionalBatch('a').create_item('a')
+        with self.assertRaises(ValueError):
+            TransactionalBatch('a').delete_item('a', etag='etag')
+        # nothing invalid was sent
+        self.assertEqual(self.client_connection.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,7 +8,11 @@ from collections import defaultdict
 import asyncio
 from azure.eventhub.exceptions import OwnershipLostError  # type: ignore
 from azure.eventhub.aio import CheckpointStore  # type: ignore  # pylint: disable=no-name-in-module
-from azure.core.exceptions import ResourceModifiedError, ResourceExistsError  # type: ignore
+from azure.core.exceptions import (  # type: ignore
+    ResourceModifiedError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+)
 from ._vendor.storage.blob.aio import ContainerClient, BlobClient
 from ._vendor.storage.blob._shared.base_client import parse_connection_str
 
@@ -220,9 +224,14 @@ class BlobCheckpointStore(CheckpointStore):
             checkpoint["partition_id"],
         )
         blob_name = blob_name.lower()
-        await self._get_blob_client(blob_name).upload_blob(
-            data=UPLOAD_DATA, overwrite=True, metadata=metadata
-        )
+        blob_client = self._get_blob_client(blob_name)
+        try:
+            # A checkpoint only lives in the blob metadata, so a metadata-only write is enough once the blob exists.
+            await blob_client.set_blob_metadata(metadata)
+        except ResourceNotFoundError:
+            await blob_client.upload_blob(
+                data=UPLOAD_DATA, overwrite=True, metadata=metadata
+            )
 
     async def list_checkpoints(
         self, fully_qualified_namespace, eventhub_name, consumer_group
@@ -8,15 +8,21 @@ import time
 import calendar
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from azure.eventhub import CheckpointStore  # type: ignore  # pylint: disable=no-name-in-module
 from azure.eventhub.exceptions import OwnershipLostError  # type: ignore
-from azure.core.exceptions import ResourceModifiedError, ResourceExistsError  # type: ignore
+from azure.core.exceptions import (  # type: ignore
+    ResourceModifiedError,
+    ResourceExistsError,
+    ResourceNotFoundError,
+)
 from ._vendor.storage.blob import BlobClient, ContainerClient
 from ._vendor.storage.blob._shared.base_client import parse_connection_str
 
 logger = logging.getLogger(__name__)
 UPLOAD_DATA = ""
+MAX_CONCURRENT_CLAIMS = 16
 
 
 def _utc_to_local(utc_dt):
@@ -214,14 +220,23 @@ class BlobCheckpointStore(CheckpointStore):
             )
             return ownership  # Keep the ownership if an unexpected error happens
 
+    def _try_claim_one_partition(self, ownership):
+        try:
+            return self._claim_one_partition(ownership)
+        except OwnershipLostError:
+            return None
+
     def claim_ownership(self, ownership_list):
-        gathered_results = []
-        for x in ownership_list:
-            try:
-                gathered_results.append(self._claim_one_partition(x))
-            except OwnershipLostError:
-                pass
-        return gathered_results
+        ownership_list = list(ownership_list)
+        if len(ownership_list) <= 1:
+            results = [self._try_claim_one_partition(x) for x in ownership_list]
+        else:
+            # Each upload is conditional on the etag, so the claims can race each other safely.
+            with ThreadPoolExecutor(
+                max_workers=min(len(ownership_list), MAX_CONCURRENT_CLAIMS)
+            ) as executor:
+                results = list(executor.map(self._try_claim_one_partition, ownership_list))
+        return [ownership for ownership in results if ownership is not None]
 
     def update_checkpoint(self, checkpoint):
         metadata = {
@@ -235,9 +250,14 @@ class BlobCheckpointStore(CheckpointStore):
             checkpoint["partition_id"],
         )
         blob_name = blob_name.lower()
-        self._get_blob_client(blob_name).upload_blob(
-            data=UPLOAD_DATA, overwrite=True, metadata=metadata
-        )
+        blob_client = self._get_blob_client(blob_name)
+        try:
+            # A checkpoint only lives in the blob metadata, so a metadata-only write is enough once the blob exists.
+            blob_client.set_blob_metadata(metadata)
+        except ResourceNotFoundError:
+            blob_client.upload_blob(
+                data=UPLOAD_DATA, overwrite=True, metadata=metadata
+            )
 
     def list_checkpoints(
         self, fully_qualified_namespace, eventhub_name, consumer_group
@@ -6,15 +6,17 @@
 __path__ = __import__("pkgutil").extend_path(__path__, __name__)  # type: ignore
 
 from uamqp import constants
-from ._common import EventData, EventDataBatch
+from ._common import EventData, EventDataBatch, ColumnarEventDataBatch
 from ._version import VERSION
 
 __version__ = VERSION
 
 from ._producer_client import EventHubProducerClient
+from ._buffered_producer_client import EventHubBufferedProducerClient
 from ._consumer_client import EventHubConsumerClient
 from ._client_base import EventHubSharedKeyCredential
 from ._eventprocessor.checkpoint_store import CheckpointStore
+from ._eventprocessor.sqlite_checkpoint_store import SqliteCheckpointStore
 from ._eventprocessor.common import CloseReason
 from ._eventprocessor.partition_context import PartitionContext
 
@@ -23,11 +25,14 @@ TransportType = constants.TransportType
 __all__ = [
     "EventData",
     "EventDataBatch",
+    "ColumnarEventDataBatch",
     "EventHubProducerClient",
+    "EventHubBufferedProducerClient",
     "EventHubConsumerClient",
     "TransportType",
     "EventHubSharedKeyCredential",
     "CheckpointStore",
+    "SqliteCheckpointStore",
     "CloseReason",
     "PartitionContext",
 ]
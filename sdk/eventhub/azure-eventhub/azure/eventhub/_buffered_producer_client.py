@@ -0,0 +1,389 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+import logging
+import threading
+import time
+from collections import deque
+
+from typing import Any, Union, TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Tuple
+
+from .exceptions import ClientClosedError, OperationTimeoutError
+from ._producer_client import EventHubProducerClient
+from ._common import EventDataBatch, EventData
+
+if TYPE_CHECKING:
+    from azure.core.credentials import TokenCredential
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _PartitionBuffer(object):
+    """The events buffered for a partition, or for a partition key, in the batches they will be sent in.
+
+    All but the last batch are full; the last one accepts new events until it is full or sent.
+    """
+
+    def __init__(self, partition_id, partition_key):
+        # type: (Optional[str], Optional[Union[str, bytes]]) -> None
+        self.partition_id = partition_id
+        self.partition_key = partition_key
+        self.batches = deque()  # type: Deque[Tuple[EventDataBatch, List[EventData], float]]
+        self.event_count = 0  # the buffered events, including the ones being sent
+        self.sending = False
+
+
+class EventHubBufferedProducerClient(EventHubProducerClient):  # pylint: disable=too-many-instance-attributes
+    """The EventHubBufferedProducerClient class buffers the events it is given and sends them
+    to the Azure Event Hubs service in batches, in the background.
+
+    The events are buffered per partition ID, or per partition key, and the events of a
+    buffer are added to batches as they arrive. A batch is sent once it is full, or once its
+    first event has waited for `max_wait_time` seconds. At most one batch is sent at a time for
+    each buffer, so that the events of a partition or partition key are sent in order. The
+    outcome of each send is reported to the `on_success` or the `on_error` callback.
+
+    :param str fully_qualified_namespace: The fully qualified host name for the Event Hubs namespace.
+     This is likely to be similar to <yournamespace>.servicebus.windows.net
+    :param str eventhub_name: The path of the specific Event Hub to connect the client to.
+    :param ~azure.core.credentials.TokenCredential credential: The credential object used for authentication which
+     implements a particular interface for getting tokens. It accepts
+     :class:`EventHubSharedKeyCredential<azure.eventhub.EventHubSharedKeyCredential>`, or credential objects generated
+     by the azure-identity library and objects that implement the `get_token(self, *scopes)` method.
+    :keyword callable on_error: The callback called with the events of a batch, the partition ID they were
+     sent to (None when the service picks the partition) and the error when a batch could not be sent.
+    :keyword callable on_success: The callback called with the events of a batch and the partition ID they
+     were sent to (None when the service picks the partition) when a batch was sent.
+    :keyword int max_buffer_length: The maximum number of events buffered for a partition ID or a partition key,
+     including the events being sent. Sending more events blocks until buffered events were sent. Default is 1500.
+    :keyword float max_wait_time: The maximum time in seconds an event waits for its batch to be full before
+     the batch is sent. Default is 1 second. If set to None, batches are only sent once full or flushed.
+    :keyword int max_concurrent_sends: The number of batches of different buffers sent at the same time.
+     Default is 4.
+    :keyword bool logging_enable: Whether to output network trace logs to the logger. Default is `False`.
+    :keyword float auth_timeout: The time in seconds to wait for a token to be authorized by the service.
+     The default value is 60 seconds. If set to 0, no timeout will be enforced from the client.
+    :keyword str user_agent: The user agent that should be appended to the built-in user agent string.
+    :keyword int retry_total: The total number of attempts to redo a failed operation when an error occurs. Default
+     value is 3.
+    :keyword float idle_timeout: Timeout, in seconds, after which this client will close the underlying connection
+     if there is no activity. By default the value is None, meaning that the client will not shutdown due to inactivity
+     unless initiated by the service.
+    :keyword transport_type: The type of transport protocol that will be used for communicating with
+     the Event Hubs service. Default is `TransportType.Amqp`.
+    :paramtype transport_type: ~azure.eventhub.TransportType
+    :keyword dict http_proxy: HTTP proxy settings. This must be a dictionary with the following
+     keys: `'proxy_hostname'` (str value) and `'proxy_port'` (int value).
+     Additionally the following keys may also be present: `'username', 'password'`.
+    """
+
+    def __init__(
+        self,
+        fully_qualified_namespace,  # type: str
+        eventhub_name,  # type: str
+        credential,  # type: TokenCredential
+        **kwargs  # type: Any
+    ):
+        # type:(...) -> None
+        self._on_error = kwargs.pop(
+            "on_error", None
+        )  # type: Callable[[List[EventData], Optional[str], Exception], None]
+        if not self._on_error:
+            raise TypeError("on_error is required to report the events that could not be sent.")
+        self._on_success = kwargs.pop(
+            "on_success", None
+        )  # type: Optional[Callable[[List[EventData], Optional[str]], None]]
+        self._max_buffer_length = kwargs.pop("max_buffer_length", 1500)  # type: int
+        self._max_wait_time = kwargs.pop("max_wait_time", 1)  # type: Optional[float]
+        self._max_concurrent_sends = kwargs.pop("max_concurrent_sends", 4)  # type: int
+        super(EventHubBufferedProducerClient, self).__init__(
+            fully_qualified_namespace=fully_qualified_namespace,
+            eventhub_name=eventhub_name,
+            credential=credential,
+            **kwargs
+        )
+        self._buffers = {}  # type: Dict[Tuple[Optional[str], Optional[Union[str, bytes]]], _PartitionBuffer]
+        self._condition = threading.Condition()
+        self._senders = []  # type: List[threading.Thread]
+        self._flushing = 0
+        self._next_buffer = 0
+        self._closed = False
+
+    @classmethod
+    def from_connection_string(cls, conn_str, **kwargs):
+        # type: (str, Any) -> EventHubBufferedProducerClient
+        """Create an EventHubBufferedProducerClient from a connection string.
+
+        :param str conn_str: The connection string of an Event Hub.
+        :keyword str eventhub_name: The path of the specific Event Hub to connect the client to.
+        :keyword callable on_error: The callback called with the events of a batch, the partition ID they were
+         sent to (None when the service picks the partition) and the error when a batch could not be sent.
+        :keyword callable on_success: The callback called with the events of a batch and the partition ID they
+         were sent to (None when the service picks the partition) when a batch was sent.
+        :keyword int max_buffer_length: The maximum number of events buffered for a partition ID or a partition
+         key, including the events being sent. Default is 1500.
+        :keyword float max_wait_time: The maximum time in seconds an event waits for its batch to be full before
+         the batch is sent. Default is 1 second.
+        :keyword int max_concurrent_sends: The number of batches of different buffers sent at the same time.
+         Default is 4.
+        :keyword bool logging_enable: Whether to output network trace logs to the logger. Default is `False`.
+        :keyword dict http_proxy: HTTP proxy settings. This must be a dictionary with the following
+         keys: `'proxy_hostname'` (str value) and `'proxy_port'` (int value).
+         Additionally the following keys may also be present: `'username', 'password'`.
+        :keyword float auth_timeout: The time in seconds to wait for a token to be authorized by the service.
+         The default value is 60 seconds. If set to 0, no timeout will be enforced from the client.
+        :keyword str user_agent: The user agent that should be appended to the built-in user agent string.
+        :keyword int retry_total: The total number of attempts to redo a failed operation when an error occurs.
+         Default value is 3.
+        :keyword float idle_timeout: Timeout, in seconds, after which this client will close the underlying connection
+         if there is no activity. By default the value is None, meaning that the client will not shutdown due to
+         inactivity unless initiated by the service.
+        :keyword transport_type: The type of transport protocol that will be used for communicating with
+         the Event Hubs service. Default is `TransportType.Amqp`.
+        :paramtype transport_type: ~azure.eventhub.TransportType
+        :rtype: ~azure.eventhub.EventHubBufferedProducerClient
+        """
+        constructor_args = cls._from_connection_string(conn_str, **kwargs)
+        return cls(**constructor_args)
+
+    @property
+    def buffered_event_count(self):
+        # type: () -> int
+        """The number of events buffered by the client, including the events being sent.
+
+        :rtype: int
+        """
+        with self._condition:
+            return sum(buffer.event_count for buffer in self._buffers.values())
+
+    def _start_senders(self):
+        # type: () -> None
+        if self._senders:
+            return
+        for _ in range(self._max_concurrent_sends):
+            sender = threading.Thread(target=self._send_buffered_batches)
+            sender.daemon = True
+            sender.start()
+            self._senders.append(sender)
+
+    def _add_to_buffer(self, buffer, event_data):
+        # type: (_PartitionBuffer, EventData) -> None
+        if buffer.batches:
+            batch, events, _ = buffer.batches[-1]
+            try:
+                batch.add(event_data)
+                events.append(event_data)
+                buffer.event_count += 1
+                return
+            except ValueError:
+                pass
+        # raises a ValueError if the event doesn't fit in an empty batch
+        batch = self.create_batch(partition_id=buffer.partition_id, partition_key=buffer.partition_key)
+        batch.add(event_data)
+        buffer.batches.append((batch, [event_data], time.time()))
+        buffer.event_count += 1
+        # a batch is full, or the senders have to wait for a new batch
+        self._condition.notify_all()
+
+    def _take_due_batch(self):  # pylint: disable=line-too-long
+        # type: () -> Tuple[Optional[_PartitionBuffer], Optional[Tuple[EventDataBatch, List[EventData]]], Optional[float]]
+        """Takes the next batch to send, in turn from each buffer, or returns how long to wait for one."""
+        now = time.time()
+        wait_time = None  # type: Optional[float]
+        buffers = list(self._buffers.values())
+        for i in range(len(buffers)):
+            buffer = buffers[(self._next_buffer + i) % len(buffers)]
+            if buffer.sending or not buffer.batches:
+                continue
+            batch, events, start_time = buffer.batches[0]
+            waited = now - start_time
+            if (
+                len(buffer.batches) > 1
+                or self._flushing
+                or (self._max_wait_time is not None and waited >= self._max_wait_time)
+            ):
+                buffer.batches.popleft()
+                buffer.sending = True
+                self._next_buffer = (self._next_buffer + i + 1) % len(buffers)
+                return buffer, (batch, events), None
+            if self._max_wait_time is not None:
+                remaining = self._max_wait_time - waited
+                wait_time = remaining if wait_time is None else min(wait_time, remaining)
+        return None, None, wait_time
+
+    def _send_buffered_batches(self):
+        # type: () -> None
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        return
+                    buffer, due_batch, wait_time = self._take_due_batch()
+                    if due_batch:
+                        break
+                    self._condition.wait(wait_time)
+            batch, events = due_batch
+            try:
+                super(EventHubBufferedProducerClient, self).send_batch(batch)
+            except Exception as error:  # pylint:disable=broad-except
+                _LOGGER.warning(
+                    "EventHubBufferedProducerClient of eventhub %r failed to send %r events to partition %r. "
+                    "The exception is %r.",
+                    self.eventhub_name,
+                    len(events),
+                    buffer.partition_id,
+                    error,
+                )
+                self._report(self._on_error, events, buffer.partition_id, error)
+            else:
+                if self._on_success:
+                    self._report(self._on_success, events, buffer.partition_id)
+            finally:
+                with self._condition:
+                    buffer.sending = False
+                    buffer.event_count -= len(events)
+                    self._condition.notify_all()
+
+    def _report(self, callback, *args):
+        try:
+            callback(*args)
+        except Exception as error:  # pylint:disable=broad-except
+            _LOGGER.warning(
+                "EventHubBufferedProducerClient of eventhub %r. An error occurred while running %r. "
+                "The exception is %r.",
+                self.eventhub_name,
+                callback,
+                error,
+            )
+
+    def send_event(self, event_data, **kwargs):
+        # type: (EventData, Any) -> None
+        """Adds an event to the buffer of its partition ID or partition key, to be sent in the background.
+
+        Blocks while the buffer already holds `max_buffer_length` events.
+
+        :param event_data: The event to send.
+        :type event_data: ~azure.eventhub.EventData
+        :keyword float timeout: The maximum time in seconds to wait for room in the buffer.
+         If not specified, waits until there is room.
+        :keyword str partition_id: The specific partition ID to send to. Default is None, in which case the service
+         will assign to all partitions using round-robin.
+        :keyword str partition_key: With the given partition_key, event data will be sent to
+         a particular partition of the Event Hub decided by the service.
+         If both partition_id and partition_key are provided, the partition_id will take precedence.
+        :rtype: None
+        :raises: :class:`ClientClosedError<azure.eventhub.exceptions.ClientClosedError>`
+         :class:`OperationTimeoutError<azure.eventhub.exceptions.OperationTimeoutError>`
+         :class:`ValueError`, when the event is too large for a batch.
+        """
+        partition_id = kwargs.get("partition_id")
+        partition_key = None if partition_id else kwargs.get("partition_key")
+        timeout = kwargs.get("timeout")
+        if not self._max_message_size_on_link:
+            self._get_max_mesage_size()
+
+        deadline = time.time() + timeout if timeout is not None else None
+        with self._condition:
+            if self._closed:
+                raise ClientClosedError("The EventHubBufferedProducerClient of eventhub {} is closed.".format(
+                    self.eventhub_name))
+            self._start_senders()
+            key = (partition_id, partition_key)
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = self._buffers[key] = _PartitionBuffer(partition_id, partition_key)
+            while buffer.event_count >= self._max_buffer_length:
+                remaining = deadline - time.time() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    raise OperationTimeoutError(
+                        "The buffer of partition {} is full.".format(partition_id or partition_key))
+                self._condition.wait(remaining)
+            self._add_to_buffer(buffer, event_data)
+
+    def send_batch(self, event_data_batch, **kwargs):
+        # type: (Union[EventDataBatch, List[EventData]], Any) -> None
+        """Adds events to the buffer of their partition ID or partition key, to be sent in the background.
+
+        :param event_data_batch: The `EventDataBatch` object or the list of `EventData` to send.
+        :type event_data_batch: Union[~azure.eventhub.EventDataBatch, List[~azure.eventhub.EventData]]
+        :keyword float timeout: The maximum time in seconds to wait for room in the buffer for each event.
+         If not specified, waits until there is room.
+        :keyword str partition_id: The specific partition ID to send to. Default is None, in which case the service
+         will assign to all partitions using round-robin.
+         A `TypeError` will be raised if partition_id is specified and event_data_batch is an `EventDataBatch` because
+         `EventDataBatch` itself has partition_id.
+        :keyword str partition_key: With the given partition_key, event data will be sent to
+         a particular partition of the Event Hub decided by the service.
+         A `TypeError` will be raised if partition_key is specified and event_data_batch is an `EventDataBatch` because
+         `EventDataBatch` itself has partition_key.
+         If both partition_id and partition_key are provided, the partition_id will take precedence.
+        :rtype: None
+        :raises: :class:`ClientClosedError<azure.eventhub.exceptions.ClientClosedError>`
+         :class:`OperationTimeoutError<azure.eventhub.exceptions.OperationTimeoutError>`
+         :class:`ValueError`
+         :class:`TypeError`
+        """
+        if isinstance(event_data_batch, EventDataBatch):
+            if kwargs.get("partition_id") or kwargs.get("partition_key"):
+                raise TypeError("partition_id and partition_key should be None when sending an EventDataBatch "
+                                "because type EventDataBatch itself may have partition_id or partition_key")
+            # pylint:disable=protected-access
+            kwargs["partition_id"] = event_data_batch._partition_id
+            kwargs["partition_key"] = event_data_batch._partition_key
+            event_data_batch = list(event_data_batch.message._body_gen)
+        for event_data in event_data_batch:
+            self.send_event(event_data, **kwargs)
+
+    def flush(self, **kwargs):
+        # type: (Any) -> None
+        """Sends all the buffered events, and blocks until they were sent.
+
+        :keyword float timeout: The maximum time in seconds to wait for the events to be sent.
+         If not specified, waits until they are sent.
+        :rtype: None
+        :raises: :class:`OperationTimeoutError<azure.eventhub.exceptions.OperationTimeoutError>`
+        """
+        timeout = kwargs.get("timeout")
+        deadline = time.time() + timeout if timeout is not None else None
+        with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                while any(buffer.event_count for buffer in self._buffers.values()):
+                    remaining = deadline - time.time() if deadline is not None else None
+                    if remaining is not None and remaining <= 0:
+                        raise OperationTimeoutError("The buffered events were not sent in time.")
+                    self._condition.wait(remaining)
+            finally:
+                self._flushing -= 1
+
+    def close(self, **kwargs):
+        # type: (Any) -> None
+        """Send the buffered events, then close the Producer client underlying AMQP connection and links.
+
+        :keyword bool flush: Whether to send the buffered events before closing. Default is True.
+         The events that are not sent are reported to the `on_error` callback with a
+         :class:`ClientClosedError<azure.eventhub.exceptions.ClientClosedError>`.
+        :keyword float timeout: The maximum time in seconds to wait for the buffered events to be sent.
+         If not specified, waits until they are sent.
+        :rtype: None
+        """
+        try:
+            if kwargs.get("flush", True):
+                self.flush(timeout=kwargs.get("timeout"))
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            for sender in self._senders:
+                sender.join()
+            with self._condition:
+                buffers = list(self._buffers.values())
+                self._buffers = {}
+            error = ClientClosedError("The EventHubBufferedProducerClient of eventhub {} was closed "
+                                      "before the events were sent.".format(self.eventhub_name))
+            for buffer in buffers:
+                for _, events, _ in buffer.batches:
+                    self._report(self._on_error, events, buffer.partition_id, error)
+            super(EventHubBufferedProducerClient, self).close()
@@ -12,8 +12,10 @@ from typing import (
     Any,
     AnyStr,
     Iterable,
+    Iterator,
     Optional,
     List,
+    Tuple,
     TYPE_CHECKING,
     cast,
 )
@@ -90,6 +92,8 @@ class EventData(object):
         # type: (Union[str, bytes, List[AnyStr]]) -> None
         self._last_enqueued_event_properties = {}  # type: Dict[str, Any]
         self._sys_properties = None  # type: Optional[Dict[bytes, Any]]
+        self._offset = None  # type: Optional[str]
+        self._enqueued_time = None  # type: Optional[datetime.datetime]
         if body and isinstance(body, list):
             self.message = Message(body[0])
             for more in body[1:]:
@@ -163,8 +167,14 @@ class EventData(object):
         :param ~uamqp.Message message: A received uamqp message.
         :rtype: ~azure.eventhub.EventData
         """
-        event_data = cls(body="")
+        # Skip __init__, which would build a throwaway outgoing message. Properties are read from the received
+        # message when they are first accessed.
+        event_data = _ReceivedEventData.__new__(_ReceivedEventData)
         event_data.message = message
+        event_data._last_enqueued_event_properties = {}  # pylint: disable=protected-access
+        event_data._sys_properties = None  # pylint: disable=protected-access
+        event_data._offset = None  # pylint: disable=protected-access
+        event_data._enqueued_time = None  # pylint: disable=protected-access
         return event_data
 
     def _encode_message(self):
@@ -187,10 +197,12 @@ class EventData(object):
 
         :rtype: str
         """
-        try:
-            return self.message.annotations[PROP_OFFSET].decode("UTF-8")
-        except (KeyError, AttributeError):
-            return None
+        if self._offset is None:
+            try:
+                self._offset = self.message.annotations[PROP_OFFSET].decode("UTF-8")
+            except (KeyError, AttributeError):
+                return None
+        return self._offset
 
     @property
     def enqueued_time(self):
@@ -199,10 +211,11 @@ class EventData(object):
 
         :rtype: datetime.datetime
         """
-        timestamp = self.message.annotations.get(PROP_TIMESTAMP, None)
-        if timestamp:
-            return utc_from_timestamp(float(timestamp) / 1000)
-        return None
+        if self._enqueued_time is None:
+            timestamp = self.message.annotations.get(PROP_TIMESTAMP, None)
+            if timestamp:
+                self._enqueued_time = utc_from_timestamp(float(timestamp) / 1000)
+        return self._enqueued_time
 
     @property
     def partition_key(self):
@@ -323,6 +336,80 @@ class EventData(object):
             raise TypeError("Event data is not compatible with JSON type: {}".format(e))
 
 
+class _ReceivedEventData(EventData):
+    """An EventData created from a received message.
+
+    Its attributes are stored in slots, so that receiving large batches of events doesn't create a dictionary
+    per event. Other attributes can still be set on it, as on any EventData.
+    """
+
+    __slots__ = ("message", "_last_enqueued_event_properties", "_sys_properties", "_offset", "_enqueued_time")
+
+
+def _message_body_view(message):
+    # type: (Message) -> memoryview
+    data = message.get_data()
+    if isinstance(data, (bytes, bytearray)):
+        return memoryview(data)
+    try:
+        sections = list(data)
+    except TypeError:  # a value body
+        return memoryview(six.text_type(data).encode("UTF-8"))
+    if len(sections) == 1 and isinstance(sections[0], bytes):
+        return memoryview(sections[0])  # no copy for the usual single data section
+    return memoryview(b"".join(sections))
+
+
+class ColumnarEventDataBatch(object):
+    """A received batch of events laid out column by column.
+
+    `EventHubConsumerClient.receive_batch` passes an instance of this class to the callback instead of a list
+    of `EventData` when it is called with `columnar=True`. The bodies, offsets and sequence numbers of the events
+    are extracted once into tuples, and an `EventData` is only created when an event is indexed or iterated.
+
+    :ivar bodies: The bodies of the events. A body that has a single data section is not copied.
+    :vartype bodies: tuple[memoryview]
+    :ivar offsets: The offsets of the events.
+    :vartype offsets: tuple[str]
+    :ivar sequence_numbers: The sequence numbers of the events.
+    :vartype sequence_numbers: tuple[int]
+    """
+
+    __slots__ = ("bodies", "offsets", "sequence_numbers", "_messages")
+
+    def __init__(self, messages=None):
+        # type: (Optional[List[Message]]) -> None
+        self._messages = messages or []
+        self.bodies = tuple(_message_body_view(message) for message in self._messages)
+        annotations = [message.annotations or {} for message in self._messages]
+        self.offsets = tuple(
+            x[PROP_OFFSET].decode("UTF-8") if PROP_OFFSET in x else None for x in annotations
+        )  # type: Tuple[Optional[str], ...]
+        self.sequence_numbers = tuple(
+            x.get(PROP_SEQ_NUMBER) for x in annotations
+        )  # type: Tuple[Optional[int], ...]
+
+    def __repr__(self):
+        # type: () -> str
+        return "ColumnarEventDataBatch(count={})".format(len(self._messages))
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._messages)
+
+    def __getitem__(self, index):
+        # type: (Union[int, slice]) -> Union[EventData, List[EventData]]
+        # pylint: disable=protected-access
+        if isinstance(index, slice):
+            return [EventData._from_message(message) for message in self._messages[index]]
+        return EventData._from_message(self._messages[index])
+
+    def __iter__(self):
+        # type: () -> Iterator[EventData]
+        for message in self._messages:
+            yield EventData._from_message(message)  # pylint: disable=protected-access
+
+
 class EventDataBatch(object):
     """A batch of events.
 
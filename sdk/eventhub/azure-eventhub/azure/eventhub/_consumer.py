@@ -15,7 +15,7 @@ from uamqp import types, errors, utils
 from uamqp import ReceiveClient, Source, Message
 
 from .exceptions import _error_handler
-from ._common import EventData
+from ._common import EventData, ColumnarEventDataBatch
 from ._client_base import ConsumerProducerMixin
 from ._utils import create_properties, trace_link_message, event_position_selector
 from ._constants import (
@@ -28,11 +28,20 @@ if TYPE_CHECKING:
     from typing import Deque
     from uamqp.authentication import JWTTokenAuth
     from ._consumer_client import EventHubConsumerClient
+    from ._eventprocessor.receive_budget import ReceiveBudget
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _message_body_size(message):
+    # type: (Message) -> int
+    try:
+        return sum(len(data) for data in message.get_data() or ())
+    except TypeError:  # a value body
+        return 0
+
+
 class EventHubConsumer(
     ConsumerProducerMixin
 ):  # pylint:disable=too-many-instance-attributes
@@ -125,6 +134,10 @@ class EventHubConsumer(
         self._message_buffer = deque()  # type: Deque[Message]
         self._last_received_event = None  # type: Optional[EventData]
         self._receive_start_time = None  # type: Optional[float]
+        self._receive_budget = kwargs.get("receive_budget")  # type: Optional[ReceiveBudget]
+        self._columnar = kwargs.get("columnar", False)
+        self._dispatched_events = 0
+        self._dispatched_bytes = 0
 
     def _create_handler(self, auth):
         # type: (JWTTokenAuth) -> None
@@ -171,15 +184,31 @@ class EventHubConsumer(
         # type: (uamqp.Message) -> None
         # pylint:disable=protected-access
         self._message_buffer.appendleft(message)
+        if self._receive_budget:
+            self._receive_budget.acquire(self._partition, 1, _message_body_size(message))
 
     def _next_message_in_buffer(self):
         # pylint:disable=protected-access
         message = self._message_buffer.pop()
+        if self._receive_budget:
+            self._dispatched_events += 1
+            self._dispatched_bytes += _message_body_size(message)
         event_data = EventData._from_message(message)
         trace_link_message(event_data)
         self._last_received_event = event_data
         return event_data
 
+    def _next_columnar_batch(self, max_batch_size):
+        # type: (int) -> ColumnarEventDataBatch
+        messages = [self._message_buffer.pop() for _ in range(min(max_batch_size, len(self._message_buffer)))]
+        if self._receive_budget:
+            self._dispatched_events += len(messages)
+            self._dispatched_bytes += sum(_message_body_size(message) for message in messages)
+        event_batch = ColumnarEventDataBatch(messages)
+        if messages:
+            self._last_received_event = event_batch[-1]  # type: ignore
+        return event_batch
+
     def _open(self):
         # type: () -> bool
         """Open the EventHubConsumer/EventHubProducer using the supplied connection.
@@ -211,7 +240,8 @@ class EventHubConsumer(
         )
         self._receive_start_time = self._receive_start_time or time.time()
         deadline = self._receive_start_time + (max_wait_time or 0)  # max_wait_time can be None
-        if len(self._message_buffer) < max_batch_size:
+        throttled = self._receive_budget is not None and not self._receive_budget.can_receive(self._partition)
+        if len(self._message_buffer) < max_batch_size and not throttled:
             while retried_times <= max_retries:
                 try:
                     if self._open():
@@ -238,14 +268,29 @@ class EventHubConsumer(
                         raise last_exception
         if len(self._message_buffer) >= max_batch_size \
                 or (self._message_buffer and not max_wait_time) \
-                or (deadline <= time.time() and max_wait_time):
-            if batch:
-                events_for_callback = []
-                for _ in range(min(max_batch_size, len(self._message_buffer))):
-                    events_for_callback.append(
-                        self._next_message_in_buffer()  # pylint: disable=protected-access
-                    )
-                self._on_event_received(events_for_callback)
-            else:
-                self._on_event_received(self._next_message_in_buffer() if self._message_buffer else None)
+                or (deadline <= time.time() and max_wait_time) \
+                or (self._message_buffer and throttled):
+            try:
+                if batch and self._columnar:
+                    self._on_event_received(self._next_columnar_batch(max_batch_size))
+                elif batch:
+                    events_for_callback = []
+                    for _ in range(min(max_batch_size, len(self._message_buffer))):
+                        events_for_callback.append(
+                            self._next_message_in_buffer()  # pylint: disable=protected-access
+                        )
+                    self._on_event_received(events_for_callback)
+                else:
+                    self._on_event_received(self._next_message_in_buffer() if self._message_buffer else None)
+            finally:
+                self._release_dispatched()
             self._receive_start_time = None
+
+    def _release_dispatched(self):
+        # type: () -> None
+        if self._dispatched_events:
+            self._receive_budget.release(  # type: ignore
+                self._partition, self._dispatched_events, self._dispatched_bytes
+            )
+        self._dispatched_events = 0
+        self._dispatched_bytes = 0
@@ -86,6 +86,12 @@ class EventHubConsumerClient(ClientBase):
     :paramtype checkpoint_store: ~azure.eventhub.CheckpointStore
     :keyword float load_balancing_interval: When load-balancing kicks in. This is the interval, in seconds,
      between two load-balancing evaluations. Default is 10 seconds.
+    :keyword float checkpoint_flush_interval: If set together with `checkpoint_store`, checkpoints are coalesced
+     in memory and only the latest checkpoint of a partition is written to the checkpoint store, at the latest
+     this many seconds after it was updated. Pending checkpoints are always written when a partition is closed.
+     Default is None, which writes every checkpoint immediately.
+    :keyword int checkpoint_flush_event_count: If set together with `checkpoint_store`, a coalesced checkpoint is
+     written as soon as it has advanced by this many events. Default is None.
 
     .. admonition:: Example:
 
@@ -108,6 +114,8 @@ class EventHubConsumerClient(ClientBase):
         # type: (...) -> None
         self._checkpoint_store = kwargs.pop("checkpoint_store", None)
         self._load_balancing_interval = kwargs.pop("load_balancing_interval", 10)
+        self._checkpoint_flush_interval = kwargs.pop("checkpoint_flush_interval", None)
+        self._checkpoint_flush_event_count = kwargs.pop("checkpoint_flush_event_count", None)
         self._consumer_group = consumer_group
         network_tracing = kwargs.pop("logging_enable", False)
         super(EventHubConsumerClient, self).__init__(
@@ -155,6 +163,8 @@ class EventHubConsumerClient(ClientBase):
             prefetch=prefetch,
             idle_timeout=self._idle_timeout,
             track_last_enqueued_event_properties=track_last_enqueued_event_properties,
+            receive_budget=kwargs.get("receive_budget"),
+            columnar=kwargs.get("columnar", False),
         )
         return handler
 
@@ -195,6 +205,12 @@ class EventHubConsumerClient(ClientBase):
         :paramtype checkpoint_store: ~azure.eventhub.CheckpointStore
         :keyword float load_balancing_interval: When load-balancing kicks in. This is the interval, in seconds,
          between two load-balancing evaluations. Default is 10 seconds.
+        :keyword float checkpoint_flush_interval: If set together with `checkpoint_store`, checkpoints are
+         coalesced in memory and only the latest checkpoint of a partition is written to the checkpoint store, at the
+         latest this many seconds after it was updated. Pending checkpoints are always written when a partition is
+         closed. Default is None, which writes every checkpoint immediately.
+        :keyword int checkpoint_flush_event_count: If set together with `checkpoint_store`, a coalesced checkpoint is
+         written as soon as it has advanced by this many events. Default is None.
         :rtype: ~azure.eventhub.EventHubConsumerClient
 
         .. admonition:: Example:
@@ -251,6 +267,8 @@ class EventHubConsumerClient(ClientBase):
                 on_event,
                 checkpoint_store=self._checkpoint_store,
                 load_balancing_interval=self._load_balancing_interval,
+                checkpoint_flush_interval=self._checkpoint_flush_interval,
+                checkpoint_flush_event_count=self._checkpoint_flush_event_count,
                 initial_event_position=initial_event_position,
                 initial_event_position_inclusive=initial_event_position_inclusive,
                 **kwargs
@@ -291,6 +309,15 @@ class EventHubConsumerClient(ClientBase):
          priority. The owner level is also know as the 'epoch value' of the consumer.
         :keyword int prefetch: The number of events to prefetch from the service
          for processing. Default is 300.
+        :keyword int max_receive_workers: If set, the partitions are received from and their callbacks are run on a
+         pool of this many threads, so a slow callback of one partition doesn't hold up the others.
+         By default all partitions are received from in turn on the calling thread.
+        :keyword int max_buffered_events: The maximum number of events that may be received from all partitions but
+         not yet processed by the callback. A partition that holds more than its share of this budget stops taking
+         events from the service until its events are processed. No limit by default.
+        :keyword int max_buffered_bytes: The maximum total body size in bytes of the events that may be received from
+         all partitions but not yet processed by the callback. It's shared like `max_buffered_events`.
+         No limit by default.
         :keyword bool track_last_enqueued_event_properties: Indicates whether the consumer should request information
          on the last-enqueued event on its associated partition, and track that information as events are received.
          When information about the partitions last-enqueued event is being tracked, each event received from the
@@ -369,6 +396,15 @@ class EventHubConsumerClient(ClientBase):
          priority. The owner level is also know as the 'epoch value' of the consumer.
         :keyword int prefetch: The number of events to prefetch from the service
          for processing. Default is 300.
+        :keyword int max_receive_workers: If set, the partitions are received from and their callbacks are run on a
+         pool of this many threads, so a slow callback of one partition doesn't hold up the others.
+         By default all partitions are received from in turn on the calling thread.
+        :keyword int max_buffered_events: The maximum number of events that may be received from all partitions but
+         not yet processed by the callback. A partition that holds more than its share of this budget stops taking
+         events from the service until its events are processed. No limit by default.
+        :keyword int max_buffered_bytes: The maximum total body size in bytes of the events that may be received from
+         all partitions but not yet processed by the callback. It's shared like `max_buffered_events`.
+         No limit by default.
         :keyword bool track_last_enqueued_event_properties: Indicates whether the consumer should request information
          on the last-enqueued event on its associated partition, and track that information as events are received.
          When information about the partitions last-enqueued event is being tracked, each event received from the
@@ -388,6 +424,10 @@ class EventHubConsumerClient(ClientBase):
          bool as the value indicating whether the starting_position for a specific partition is inclusive or not.
          This can also be a single bool value for all starting_position. The default value is False.
         :paramtype starting_position_inclusive: bool or dict[str,bool]
+        :keyword bool columnar: If True, the callback receives a
+         :class:`ColumnarEventDataBatch<azure.eventhub.ColumnarEventDataBatch>` that exposes the bodies, offsets and
+         sequence numbers of the events as tuples and creates `EventData` objects only on access, instead of a list
+         of `EventData`. Default is False.
         :keyword on_error: The callback function that will be called when an error is raised during receiving
          after retry attempts are exhausted, or during the process of load-balancing.
          The callback takes two parameters: `partition_context` which contains partition information
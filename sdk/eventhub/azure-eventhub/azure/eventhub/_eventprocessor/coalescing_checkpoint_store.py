@@ -0,0 +1,225 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+import time
+import logging
+import threading
+
+from .checkpoint_store import CheckpointStore
+
+_LOGGER = logging.getLogger(__name__)
+_RETRY_INTERVAL = 1.0
+
+
+def _checkpoint_key(checkpoint):
+    # type: (Dict[str, Any]) -> Tuple[str, str, str, str]
+    return (
+        checkpoint["fully_qualified_namespace"],
+        checkpoint["eventhub_name"],
+        checkpoint["consumer_group"],
+        checkpoint["partition_id"],
+    )
+
+
+class _PendingCheckpoint(object):
+    __slots__ = ("checkpoint", "created_time", "base_sequence_number")
+
+    def __init__(self, checkpoint, base_sequence_number):
+        # type: (Dict[str, Any], int) -> None
+        self.checkpoint = checkpoint
+        self.created_time = time.time()
+        self.base_sequence_number = base_sequence_number
+
+    @property
+    def event_count(self):
+        # type: () -> int
+        return self.checkpoint["sequence_number"] - self.base_sequence_number
+
+
+class CoalescingCheckpointStore(CheckpointStore):  # pylint:disable=too-many-instance-attributes
+    """Wraps a CheckpointStore and coalesces the checkpoint updates of each partition.
+
+    Only the latest checkpoint of a partition is kept in memory. A background thread writes it to the
+    wrapped checkpoint store once it is `flush_interval` seconds old or the checkpoint has advanced by
+    `flush_event_count` events, whichever comes first. Ownership calls go straight to the wrapped store.
+
+    :param checkpoint_store: The CheckpointStore that checkpoints are written to.
+    :type checkpoint_store: ~azure.eventhub.CheckpointStore
+    :param float flush_interval: The maximum time in seconds a checkpoint is held before it is written.
+    :param int flush_event_count: The number of events a checkpoint may advance before it is written.
+    """
+
+    def __init__(self, checkpoint_store, flush_interval=None, flush_event_count=None):
+        # type: (CheckpointStore, Optional[float], Optional[int]) -> None
+        if flush_interval is None and flush_event_count is None:
+            raise ValueError("At least one of flush_interval and flush_event_count must be set.")
+        self._checkpoint_store = checkpoint_store
+        self._flush_interval = flush_interval
+        self._flush_event_count = flush_event_count
+        self._pending = {}  # type: Dict[Tuple[str, str, str, str], _PendingCheckpoint]
+        self._flushed_sequence_numbers = {}  # type: Dict[Tuple[str, str, str, str], int]
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()  # keeps the writes of one partition in order
+        self._worker = None  # type: Optional[threading.Thread]
+        self._running = False
+
+    def list_ownership(self, fully_qualified_namespace, eventhub_name, consumer_group):
+        # type: (str, str, str) -> Iterable[Dict[str, Any]]
+        return self._checkpoint_store.list_ownership(fully_qualified_namespace, eventhub_name, consumer_group)
+
+    def claim_ownership(self, ownership_list):
+        # type: (Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]
+        return self._checkpoint_store.claim_ownership(ownership_list)
+
+    def update_checkpoint(self, checkpoint):
+        # type: (Dict[str, Any]) -> None
+        key = _checkpoint_key(checkpoint)
+        with self._condition:
+            pending = self._pending.get(key)
+            due = False
+            if pending:
+                pending.checkpoint = checkpoint
+            else:
+                due = True  # the worker recomputes when the next flush is due
+                base_sequence_number = self._flushed_sequence_numbers.get(
+                    key, checkpoint["sequence_number"] - 1
+                )
+                pending = _PendingCheckpoint(checkpoint, base_sequence_number)
+                self._pending[key] = pending
+            if not self._running:
+                self._start_worker()
+            if self._flush_event_count is not None and pending.event_count >= self._flush_event_count:
+                due = True
+            if due:
+                self._condition.notify()
+
+    def list_checkpoints(self, fully_qualified_namespace, eventhub_name, consumer_group):
+        # type: (str, str, str) -> Iterable[Dict[str, Any]]
+        checkpoints = {
+            x["partition_id"]: x
+            for x in self._checkpoint_store.list_checkpoints(
+                fully_qualified_namespace, eventhub_name, consumer_group
+            )
+        }
+        with self._condition:
+            for key, pending in self._pending.items():
+                if key[:3] == (fully_qualified_namespace, eventhub_name, consumer_group):
+                    checkpoints[key[3]] = pending.checkpoint
+        return list(checkpoints.values())
+
+    def flush(self, partition_id=None):
+        # type: (Optional[str]) -> None
+        """Write the pending checkpoints of a partition, or of all partitions, to the wrapped checkpoint store.
+
+        :param str partition_id: The partition whose checkpoint is written. All partitions if not set.
+        :rtype: None
+        """
+        with self._condition:
+            keys = [key for key in self._pending if partition_id is None or key[3] == partition_id]
+        error = self._flush(keys)
+        if error:
+            raise error
+
+    def close(self):
+        # type: () -> None
+        """Stop the background thread. Checkpoints that are still pending are not written, call `flush()` first.
+
+        The thread is started again by the next `update_checkpoint()`.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+            worker, self._worker = self._worker, None
+        if worker:
+            worker.join()
+
+    def _start_worker(self):
+        # type: () -> None
+        self._running = True
+        self._worker = threading.Thread(target=self._flush_periodically)
+        self._worker.daemon = True
+        self._worker.start()
+
+    def _due_keys(self, now):
+        # type: (float) -> Tuple[List[Tuple[str, str, str, str]], Optional[float]]
+        due_keys = []
+        next_due_time = None  # type: Optional[float]
+        for key, pending in self._pending.items():
+            if self._flush_event_count is not None and pending.event_count >= self._flush_event_count:
+                due_keys.append(key)
+            elif self._flush_interval is not None:
+                due_time = pending.created_time + self._flush_interval
+                if due_time <= now:
+                    due_keys.append(key)
+                elif next_due_time is None or due_time < next_due_time:
+                    next_due_time = due_time
+        return due_keys, next_due_time
+
+    def _flush_periodically(self):
+        # type: () -> None
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                due_keys, next_due_time = self._due_keys(time.time())
+                if not due_keys:
+                    self._condition.wait(
+                        None if next_due_time is None else max(next_due_time - time.time(), 0)
+                    )
+                    continue
+            if self._flush(due_keys):
+                with self._condition:
+                    if self._running:  # back off before retrying the failed writes
+                        self._condition.wait(self._flush_interval or _RETRY_INTERVAL)
+
+    def _flush(self, keys):
+        # type: (List[Tuple[str, str, str, str]]) -> Optional[Exception]
+        error = None
+        with self._flush_lock:
+            with self._condition:
+                to_flush = [(key, self._pending.pop(key)) for key in keys if key in self._pending]
+            update_checkpoints = getattr(self._checkpoint_store, "update_checkpoints", None)
+            if update_checkpoints and len(to_flush) > 1:
+                # The wrapped store writes a batch in one transaction, so it succeeds or fails as a whole.
+                try:
+                    update_checkpoints([pending.checkpoint for _, pending in to_flush])
+                except Exception as err:  # pylint:disable=broad-except
+                    for key, pending in to_flush:
+                        self._flush_failed(key, pending, err)
+                    return err
+                for key, pending in to_flush:
+                    self._flush_succeeded(key, pending)
+                return None
+            for key, pending in to_flush:
+                try:
+                    self._checkpoint_store.update_checkpoint(pending.checkpoint)
+                except Exception as err:  # pylint:disable=broad-except
+                    self._flush_failed(key, pending, err)
+                    error = error or err
+                else:
+                    self._flush_succeeded(key, pending)
+        return error
+
+    def _flush_succeeded(self, key, pending):
+        # type: (Tuple[str, str, str, str], _PendingCheckpoint) -> None
+        with self._condition:
+            self._flushed_sequence_numbers[key] = pending.checkpoint["sequence_number"]
+            newer = self._pending.get(key)
+            if newer:
+                newer.base_sequence_number = pending.checkpoint["sequence_number"]
+
+    def _flush_failed(self, key, pending, error):
+        # type: (Tuple[str, str, str, str], _PendingCheckpoint, Exception) -> None
+        _LOGGER.warning(
+            "namespace %r, eventhub %r, consumer_group %r, partition_id %r. "
+            "An error occurred while writing a coalesced checkpoint. The exception is %r.",
+            key[0],
+            key[1],
+            key[2],
+            key[3],
+            error,
+        )
+        with self._condition:
+            self._pending.setdefault(key, pending)  # retry later unless a newer checkpoint came in
@@ -7,6 +7,7 @@ import uuid
 import logging
 import time
 import threading
+from collections import deque
 from typing import (
     Dict,
     Callable,
@@ -22,11 +23,14 @@ from functools import partial
 
 from .partition_context import PartitionContext
 from .in_memory_checkpoint_store import InMemoryCheckpointStore
+from .coalescing_checkpoint_store import CoalescingCheckpointStore
+from .receive_budget import ReceiveBudget
 from .ownership_manager import OwnershipManager
 from .common import CloseReason
 from ._eventprocessor_mixin import EventProcessorMixin
 
 if TYPE_CHECKING:
+    from typing import Deque
     from datetime import datetime
     from .checkpoint_store import CheckpointStore
     from .._common import EventData
@@ -62,6 +66,7 @@ class EventProcessor(
         self._eventhub_name = eventhub_client.eventhub_name
         self._event_handler = on_event
         self._batch = kwargs.get("batch") or False
+        self._columnar = kwargs.get("columnar", False)
         self._max_batch_size = kwargs.get("max_batch_size") or 300
         self._max_wait_time = kwargs.get("max_wait_time")
         self._partition_id = kwargs.get("partition_id", None)  # type: Optional[str]
@@ -76,6 +81,14 @@ class EventProcessor(
         )  # type: Optional[Callable[[PartitionContext, CloseReason], None]]
         checkpoint_store = kwargs.get("checkpoint_store")  # type: Optional[CheckpointStore]
         self._checkpoint_store = checkpoint_store or InMemoryCheckpointStore()
+        checkpoint_flush_interval = kwargs.get("checkpoint_flush_interval")  # type: Optional[float]
+        checkpoint_flush_event_count = kwargs.get("checkpoint_flush_event_count")  # type: Optional[int]
+        self._coalescing_checkpoint_store = None  # type: Optional[CoalescingCheckpointStore]
+        if checkpoint_store and (checkpoint_flush_interval is not None or checkpoint_flush_event_count is not None):
+            self._coalescing_checkpoint_store = CoalescingCheckpointStore(
+                checkpoint_store, checkpoint_flush_interval, checkpoint_flush_event_count
+            )
+            self._checkpoint_store = self._coalescing_checkpoint_store
         self._initial_event_position = kwargs.get(
             "initial_event_position", "@latest"
         )  # type: Union[str, int, datetime, Dict[str, Any]]
@@ -102,6 +115,21 @@ class EventProcessor(
         self._running = False
         self._lock = threading.RLock()
 
+        # Receive scheduling. Without max_receive_workers all consumers are polled in turn on the thread that
+        # calls start(). With it, a fixed pool of threads takes the partitions from a round-robin queue.
+        self._max_receive_workers = kwargs.get("max_receive_workers")  # type: Optional[int]
+        if self._max_receive_workers is not None and self._max_receive_workers < 1:
+            raise ValueError("max_receive_workers must be a positive integer.")
+        max_buffered_events = kwargs.get("max_buffered_events")  # type: Optional[int]
+        max_buffered_bytes = kwargs.get("max_buffered_bytes")  # type: Optional[int]
+        self._receive_budget = (
+            ReceiveBudget(max_buffered_events, max_buffered_bytes)
+            if max_buffered_events is not None or max_buffered_bytes is not None
+            else None
+        )  # type: Optional[ReceiveBudget]
+        self._scheduler_condition = threading.Condition(self._lock)
+        self._ready_partitions = deque()  # type: Deque[str]
+
         self._consumers = {}  # type: Dict[str, EventHubConsumer]
         self._ownership_manager = OwnershipManager(
             self._eventhub_client,
@@ -200,6 +228,8 @@ class EventProcessor(
                     event_received_callback = partial(
                         self._on_event_received, partition_context
                     )
+                    if self._receive_budget:
+                        self._receive_budget.register(partition_id)
                     self._consumers[partition_id] = cast(
                         "EventHubConsumer",
                         self.create_consumer(
@@ -207,9 +237,14 @@ class EventProcessor(
                             initial_event_position,
                             event_postition_inclusive,
                             event_received_callback,
+                            receive_budget=self._receive_budget,
+                            columnar=self._columnar,
                         ),
                     )
                     self._initialize_partition_consumer(partition_id)
+                    if self._max_receive_workers:
+                        self._ready_partitions.append(partition_id)
+                        self._scheduler_condition.notify()
 
     def _on_event_received(self, partition_context, event):
         # type: (PartitionContext, Union[Optional[EventData], List[EventData]]) -> None
@@ -289,6 +324,8 @@ class EventProcessor(
         consumer.close()
         with self._lock:
             del self._consumers[partition_id]
+        if self._receive_budget:
+            self._receive_budget.unregister(partition_id)
 
         _LOGGER.info(
             "PartitionProcessor of EventProcessor instance %r of eventhub %r partition %r consumer group %r"
@@ -315,8 +352,29 @@ class EventProcessor(
                 )
                 self._process_error(self._partition_contexts[partition_id], err)
 
+        self._flush_checkpoints(partition_id)
         self._ownership_manager.release_ownership(partition_id)
 
+    def _flush_checkpoints(self, partition_id=None):
+        # type: (Optional[str]) -> None
+        """Write the coalesced checkpoints of a partition, or of all partitions, before the ownership is given up.
+        """
+        if not self._coalescing_checkpoint_store:
+            return
+        try:
+            self._coalescing_checkpoint_store.flush(partition_id)
+        except Exception as err:  # pylint:disable=broad-except
+            _LOGGER.warning(
+                "EventProcessor instance %r of eventhub %r consumer group %r. "
+                "An error occurred while flushing the checkpoint of partition %r. The exception is %r.",
+                self._id,
+                self._eventhub_name,
+                self._consumer_group,
+                partition_id,
+                err,
+            )
+            self._process_error(self._partition_contexts.get(partition_id), err)  # type: ignore
+
     def _do_receive(self, partition_id, consumer):
         # type: (str, EventHubConsumer) -> None
         """Call the consumer.receive() and handle exceptions if any after it exhausts retries.
@@ -338,6 +396,66 @@ class EventProcessor(
                 partition_id, consumer, CloseReason.OWNERSHIP_LOST
             )
 
+    def _receive_in_workers(self):
+        # type: () -> None
+        """Multiplex the partition consumers over a fixed number of threads until the EventProcessor is stopped.
+        """
+        with self._lock:
+            self._ready_partitions = deque(self._consumers)
+        workers = []
+        for index in range(self._max_receive_workers):  # type: ignore
+            worker = threading.Thread(
+                target=self._receive_worker,
+                name="EventProcessor-{}-receiver-{}".format(self._id, index),
+            )
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+        for worker in workers:
+            worker.join()
+
+    def _next_ready_partition(self):
+        # type: () -> Optional[str]
+        with self._scheduler_condition:
+            while self._running:
+                while self._ready_partitions:
+                    partition_id = self._ready_partitions.popleft()
+                    if partition_id in self._consumers:
+                        return partition_id
+                self._scheduler_condition.wait(self._load_balancing_interval)
+        return None
+
+    def _receive_worker(self):
+        # type: () -> None
+        while self._running:
+            partition_id = self._next_ready_partition()
+            if partition_id is None:
+                return
+            consumer = self._consumers[partition_id]
+            try:
+                if consumer.stop:
+                    self._close_consumer(
+                        partition_id, consumer, CloseReason.OWNERSHIP_LOST
+                    )
+                else:
+                    self._do_receive(partition_id, consumer)
+            except Exception as err:  # pylint:disable=broad-except
+                _LOGGER.warning(
+                    "EventProcessor instance %r of eventhub %r partition %r consumer group %r. "
+                    "An error occurred in a receive worker. The exception is %r.",
+                    self._id,
+                    self._eventhub_name,
+                    partition_id,
+                    self._consumer_group,
+                    err,
+                )
+                self._process_error(self._partition_contexts.get(partition_id), err)
+            finally:
+                with self._scheduler_condition:
+                    if self._consumers.get(partition_id) is consumer:  # hand the partition to the next free worker
+                        self._ready_partitions.append(partition_id)
+                        self._scheduler_condition.notify()
+
     def start(self):
         # type: () -> None
         if self._running:
@@ -350,6 +468,8 @@ class EventProcessor(
         thread.daemon = True
         thread.start()
 
+        if self._max_receive_workers:
+            self._receive_in_workers()
         while self._running:
             for partition_id, consumer in list(self._consumers.items()):
                 if consumer.stop:
@@ -363,6 +483,9 @@ class EventProcessor(
         with self._lock:
             for partition_id, consumer in list(self._consumers.items()):
                 self._close_consumer(partition_id, consumer, CloseReason.SHUTDOWN)
+        if self._coalescing_checkpoint_store:
+            self._flush_checkpoints()
+            self._coalescing_checkpoint_store.close()
 
     def stop(self):
         # type: () -> None
@@ -382,4 +505,6 @@ class EventProcessor(
             return
 
         self._running = False
+        with self._scheduler_condition:
+            self._scheduler_condition.notify_all()
         _LOGGER.info("EventProcessor %r has been stopped.", self._id)
@@ -0,0 +1,91 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+from typing import Dict, List, Optional
+import threading
+
+
+class ReceiveBudget(object):
+    """Bounds the number and total size of the events that the partition consumers of an EventProcessor
+    have received but not yet passed to the event callback and finished processing.
+
+    A consumer only pulls more messages from its AMQP link while `can_receive()` is True. Once the budget
+    is used up, a partition can still receive as long as it holds less than its fair share, which is the
+    budget divided by the number of partitions. Consumers that hold more stop pumping their link, so its
+    link credit isn't replenished and the service stops delivering to it until events are released.
+
+    :param int max_events: The maximum number of in-flight events. No limit if None.
+    :param int max_bytes: The maximum total body size in bytes of the in-flight events. No limit if None.
+    """
+
+    def __init__(self, max_events=None, max_bytes=None):
+        # type: (Optional[int], Optional[int]) -> None
+        if max_events is not None and max_events <= 0:
+            raise ValueError("max_events must be a positive integer.")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer.")
+        self._max_events = max_events
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._events = 0
+        self._bytes = 0
+        self._partition_usage = {}  # type: Dict[str, List[int]]
+
+    @property
+    def in_flight_events(self):
+        # type: () -> int
+        return self._events
+
+    @property
+    def in_flight_bytes(self):
+        # type: () -> int
+        return self._bytes
+
+    def register(self, partition_id):
+        # type: (str) -> None
+        with self._lock:
+            self._partition_usage.setdefault(partition_id, [0, 0])
+
+    def unregister(self, partition_id):
+        # type: (str) -> None
+        """Give back everything a partition still holds, e.g. the buffered events of a closed consumer."""
+        with self._lock:
+            events, size = self._partition_usage.pop(partition_id, (0, 0))
+            self._events -= events
+            self._bytes -= size
+
+    def can_receive(self, partition_id):
+        # type: (str) -> bool
+        with self._lock:
+            if self._has_room(self._events, self._bytes, 1):
+                return True
+            events, size = self._partition_usage.get(partition_id, (0, 0))
+            return self._has_room(events, size, len(self._partition_usage) or 1)
+
+    def acquire(self, partition_id, events, size):
+        # type: (str, int, int) -> None
+        self._add(partition_id, events, size)
+
+    def release(self, partition_id, events, size):
+        # type: (str, int, int) -> None
+        self._add(partition_id, -events, -size)
+
+    def _has_room(self, events, size, share_count):
+        # type: (int, int, int) -> bool
+        if self._max_events is not None and events >= max(self._max_events // share_count, 1):
+            return False
+        if self._max_bytes is not None and size >= max(self._max_bytes // share_count, 1):
+            return False
+        return True
+
+    def _add(self, partition_id, events, size):
+        # type: (str, int, int) -> None
+        with self._lock:
+            usage = self._partition_usage.get(partition_id)
+            if usage is None:
+                return  # the partition was unregistered and its usage already given back
+            usage[0] += events
+            usage[1] += size
+            self._events += events
+            self._bytes += size
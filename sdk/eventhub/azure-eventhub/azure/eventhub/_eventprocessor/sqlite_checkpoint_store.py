@@ -0,0 +1,245 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+from typing import Any, Dict, Iterable, List, Optional, Union
+import time
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from .checkpoint_store import CheckpointStore
+
+_LOGGER = logging.getLogger(__name__)
+
+_KEY_COLUMNS = ("fully_qualified_namespace", "eventhub_name", "consumer_group", "partition_id")
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS ownership (
+        fully_qualified_namespace TEXT NOT NULL,
+        eventhub_name TEXT NOT NULL,
+        consumer_group TEXT NOT NULL,
+        partition_id TEXT NOT NULL,
+        owner_id TEXT NOT NULL,
+        last_modified_time REAL NOT NULL,
+        version INTEGER NOT NULL,
+        PRIMARY KEY (fully_qualified_namespace, eventhub_name, consumer_group, partition_id)
+    )""",
+    """CREATE TABLE IF NOT EXISTS checkpoint (
+        fully_qualified_namespace TEXT NOT NULL,
+        eventhub_name TEXT NOT NULL,
+        consumer_group TEXT NOT NULL,
+        partition_id TEXT NOT NULL,
+        "offset" TEXT,
+        sequence_number INTEGER,
+        PRIMARY KEY (fully_qualified_namespace, eventhub_name, consumer_group, partition_id)
+    )""",
+)
+
+_LIST_OWNERSHIP = (
+    "SELECT partition_id, owner_id, last_modified_time, version FROM ownership "
+    "WHERE fully_qualified_namespace = ? AND eventhub_name = ? AND consumer_group = ?"
+)
+_INSERT_OWNERSHIP = (
+    "INSERT OR IGNORE INTO ownership (fully_qualified_namespace, eventhub_name, consumer_group, partition_id, "
+    "owner_id, last_modified_time, version) VALUES (?, ?, ?, ?, ?, ?, 1)"
+)
+_UPDATE_OWNERSHIP = (
+    "UPDATE ownership SET owner_id = ?, last_modified_time = ?, version = version + 1 "
+    "WHERE fully_qualified_namespace = ? AND eventhub_name = ? AND consumer_group = ? AND partition_id = ? "
+    "AND version = ?"
+)
+_UPSERT_CHECKPOINT = (
+    'INSERT OR REPLACE INTO checkpoint (fully_qualified_namespace, eventhub_name, consumer_group, partition_id, '
+    '"offset", sequence_number) VALUES (?, ?, ?, ?, ?, ?)'
+)
+_LIST_CHECKPOINTS = (
+    'SELECT partition_id, "offset", sequence_number FROM checkpoint '
+    "WHERE fully_qualified_namespace = ? AND eventhub_name = ? AND consumer_group = ?"
+)
+
+
+class SqliteCheckpointStore(CheckpointStore):
+    """A CheckpointStore that keeps partition ownership and checkpoints in a local SQLite database.
+
+    The database is opened in WAL mode, so the EventProcessors of several processes on the same host can share one
+    database file. Every write runs in its own `BEGIN IMMEDIATE` transaction, and a writer that finds the database
+    locked waits up to `timeout` seconds. Ownership is claimed optimistically: the etag of an ownership is the value
+    of a version column, and a claim only succeeds if the version is still the one the claimer listed.
+
+    SQLite file locking isn't reliable on network file systems, so the database file should be on a local disk.
+
+    :param str path: The path of the database file. It is created if it doesn't exist.
+    :keyword float timeout: The time in seconds to wait for a lock held by another connection. Default is 30 seconds.
+    :keyword str synchronous: The SQLite `synchronous` setting. The default "NORMAL" doesn't lose committed writes
+     when the process crashes, but may lose the latest ones when the host loses power. "FULL" syncs every commit.
+    """
+
+    def __init__(self, path, **kwargs):
+        # type: (str, Any) -> None
+        self._path = path
+        self._timeout = kwargs.get("timeout", 30.0)
+        self._synchronous = kwargs.get("synchronous", "NORMAL")
+        if self._synchronous not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+            raise ValueError("synchronous must be one of 'OFF', 'NORMAL', 'FULL' and 'EXTRA'.")
+        self._local = threading.local()  # one connection per thread, since a connection can only run one transaction
+        self._connections = []  # type: List[sqlite3.Connection]
+        self._lock = threading.Lock()
+        with self._transaction() as connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _connect(self):
+        # type: () -> sqlite3.Connection
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # isolation_level=None leaves transaction control to _transaction(). A connection is only used by the
+            # thread that opened it, but close() may close it from another thread.
+            connection = sqlite3.connect(
+                self._path, timeout=self._timeout, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous={}".format(self._synchronous))
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    @contextmanager
+    def _transaction(self):
+        connection = self._connect()
+        # Take the write lock up front so that two processes can't both read and then fail to upgrade their lock.
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            try:
+                connection.execute("ROLLBACK")
+            except sqlite3.OperationalError:
+                pass  # SQLite rolls back by itself after some errors
+            raise
+        connection.execute("COMMIT")
+
+    def list_ownership(self, fully_qualified_namespace, eventhub_name, consumer_group):
+        # type: (str, str, str) -> Iterable[Dict[str, Any]]
+        rows = self._connect().execute(
+            _LIST_OWNERSHIP, (fully_qualified_namespace, eventhub_name, consumer_group)
+        ).fetchall()
+        return [
+            {
+                "fully_qualified_namespace": fully_qualified_namespace,
+                "eventhub_name": eventhub_name,
+                "consumer_group": consumer_group,
+                "partition_id": partition_id,
+                "owner_id": owner_id,
+                "last_modified_time": last_modified_time,
+                "etag": str(version),
+            }
+            for partition_id, owner_id, last_modified_time, version in rows
+        ]
+
+    def claim_ownership(self, ownership_list):
+        # type: (Iterable[Dict[str, Any]]) -> Iterable[Dict[str, Any]]
+        result = []
+        with self._transaction() as connection:
+            for ownership in ownership_list:
+                claimed = self._try_claim_one_partition(connection, ownership)
+                if claimed:
+                    result.append(claimed)
+        return result
+
+    def _try_claim_one_partition(self, connection, ownership):  # pylint:disable=no-self-use
+        # type: (sqlite3.Connection, Dict[str, Any]) -> Optional[Dict[str, Any]]
+        key = tuple(ownership[x] for x in _KEY_COLUMNS)
+        now = time.time()
+        etag = ownership.get("etag")
+        if etag is None:
+            # A partition that nobody has owned yet. Fails if another processor inserted it first.
+            cursor = connection.execute(_INSERT_OWNERSHIP, key + (ownership["owner_id"], now))
+            version = 1
+        else:
+            try:
+                expected_version = int(etag)
+            except ValueError:  # an etag that this store didn't issue
+                return None
+            cursor = connection.execute(
+                _UPDATE_OWNERSHIP, (ownership["owner_id"], now) + key + (expected_version,)
+            )
+            version = expected_version + 1
+        if cursor.rowcount != 1:
+            _LOGGER.info(
+                "EventProcessor instance %r of namespace %r eventhub %r consumer group %r "
+                "lost ownership to partition %r",
+                ownership["owner_id"],
+                ownership["fully_qualified_namespace"],
+                ownership["eventhub_name"],
+                ownership["consumer_group"],
+                ownership["partition_id"],
+            )
+            return None
+        claimed = dict(ownership)
+        claimed["etag"] = str(version)
+        claimed["last_modified_time"] = now
+        return claimed
+
+    def update_checkpoint(self, checkpoint):
+        # type: (Dict[str, Optional[Union[str, int]]]) -> None
+        self.update_checkpoints([checkpoint])
+
+    def update_checkpoints(self, checkpoints):
+        # type: (Iterable[Dict[str, Optional[Union[str, int]]]]) -> None
+        """Write the checkpoints of several partitions in one transaction.
+
+        Either all of the checkpoints are written or none of them.
+
+        :param checkpoints: The checkpoints, in the format of `update_checkpoint`.
+        :type checkpoints: Iterable[Dict[str, Any]]
+        :rtype: None
+        """
+        rows = [
+            tuple(checkpoint[x] for x in _KEY_COLUMNS) + (
+                None if checkpoint["offset"] is None else str(checkpoint["offset"]),
+                checkpoint["sequence_number"],
+            )
+            for checkpoint in checkpoints
+        ]
+        if not rows:
+            return
+        with self._transaction() as connection:
+            connection.executemany(_UPSERT_CHECKPOINT, rows)
+
+    def list_checkpoints(self, fully_qualified_namespace, eventhub_name, consumer_group):
+        # type: (str, str, str) -> Iterable[Dict[str, Any]]
+        rows = self._connect().execute(
+            _LIST_CHECKPOINTS, (fully_qualified_namespace, eventhub_name, consumer_group)
+        ).fetchall()
+        return [
+            {
+                "fully_qualified_namespace": fully_qualified_namespace,
+                "eventhub_name": eventhub_name,
+                "consumer_group": consumer_group,
+                "partition_id": partition_id,
+                "offset": offset,
+                "sequence_number": sequence_number,
+            }
+            for partition_id, offset, sequence_number in rows
+        ]
+
+    def close(self):
+        # type: () -> None
+        """Close the database connections of all threads.
+
+        :rtype: None
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
@@ -0,0 +1,135 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+"""The partition key hashing of the Event Hubs service.
+
+The service hashes the UTF-8 bytes of a partition key with Bob Jenkins' lookup3 `hashlittle2` function, with both
+seeds set to 0, folds the two 32-bit results into a signed 16-bit integer and takes its absolute remainder by
+the partition count. The partition IDs of an Event Hub are "0" up to the partition count minus one.
+"""
+from __future__ import unicode_literals
+
+import struct
+from typing import List, Sequence, Tuple, Union
+
+import six
+
+_MASK = 0xFFFFFFFF
+
+
+def _rotate(value, count):
+    # type: (int, int) -> int
+    return ((value << count) | (value >> (32 - count))) & _MASK
+
+
+def _mix(a, b, c):
+    # type: (int, int, int) -> Tuple[int, int, int]
+    a = ((a - c) & _MASK) ^ _rotate(c, 4)
+    c = (c + b) & _MASK
+    b = ((b - a) & _MASK) ^ _rotate(a, 6)
+    a = (a + c) & _MASK
+    c = ((c - b) & _MASK) ^ _rotate(b, 8)
+    b = (b + a) & _MASK
+    a = ((a - c) & _MASK) ^ _rotate(c, 16)
+    c = (c + b) & _MASK
+    b = ((b - a) & _MASK) ^ _rotate(a, 19)
+    a = (a + c) & _MASK
+    c = ((c - b) & _MASK) ^ _rotate(b, 4)
+    b = (b + a) & _MASK
+    return a, b, c
+
+
+def _final(a, b, c):
+    # type: (int, int, int) -> Tuple[int, int, int]
+    c = ((c ^ b) - _rotate(b, 14)) & _MASK
+    a = ((a ^ c) - _rotate(c, 11)) & _MASK
+    b = ((b ^ a) - _rotate(a, 25)) & _MASK
+    c = ((c ^ b) - _rotate(b, 16)) & _MASK
+    a = ((a ^ c) - _rotate(c, 4)) & _MASK
+    b = ((b ^ a) - _rotate(a, 14)) & _MASK
+    c = ((c ^ b) - _rotate(b, 24)) & _MASK
+    return a, b, c
+
+
+def compute_hash(data, seed1=0, seed2=0):
+    # type: (bytes, int, int) -> Tuple[int, int]
+    """Bob Jenkins' lookup3 `hashlittle2` of `data`.
+
+    :param bytes data: The bytes to hash.
+    :param int seed1: The primary seed.
+    :param int seed2: The secondary seed.
+    :return: The primary and the secondary 32-bit hash, `c` and `b` of lookup3.
+    :rtype: tuple[int, int]
+    """
+    length = len(data)
+    a = b = c = (0xDEADBEEF + length + seed1) & _MASK
+    c = (c + seed2) & _MASK
+    # Pad the tail with zero bytes. lookup3 adds the tail bytes that exist, and zeros add nothing.
+    padded = data + b"\x00" * (-length % 12)
+    words = struct.unpack("<{}I".format(len(padded) // 4), padded) if padded else ()
+    index = 0
+    remaining = length
+    while remaining > 12:
+        a = (a + words[index]) & _MASK
+        b = (b + words[index + 1]) & _MASK
+        c = (c + words[index + 2]) & _MASK
+        a, b, c = _mix(a, b, c)
+        index += 3
+        remaining -= 12
+    if remaining == 0:
+        return c, b
+    a = (a + words[index]) & _MASK
+    if remaining > 4:
+        b = (b + words[index + 1]) & _MASK
+    if remaining > 8:
+        c = (c + words[index + 2]) & _MASK
+    a, b, c = _final(a, b, c)
+    return c, b
+
+
+def _to_int16(value):
+    # type: (int) -> int
+    value &= 0xFFFF
+    return value - 0x10000 if value & 0x8000 else value
+
+
+def get_partition_index_for_key(partition_key, partition_count):
+    # type: (Union[str, bytes], int) -> int
+    """The index of the partition that the service routes events with the given partition key to.
+
+    :param partition_key: The partition key. A str is encoded with UTF-8.
+    :type partition_key: str or bytes
+    :param int partition_count: The number of partitions of the Event Hub.
+    :rtype: int
+    """
+    if partition_count <= 0:
+        raise ValueError("partition_count must be a positive integer.")
+    if isinstance(partition_key, six.text_type):
+        partition_key = partition_key.encode("utf-8")
+    primary, secondary = compute_hash(partition_key)
+    # The service truncates the hash to a signed 16-bit integer and takes the absolute value of the remainder,
+    # which is the remainder of the absolute value.
+    return abs(_to_int16(primary ^ secondary)) % partition_count
+
+
+def get_partition_for_key(partition_key, partition_ids):
+    # type: (Union[str, bytes], Sequence[str]) -> str
+    """The ID of the partition that the service routes events with the given partition key to.
+
+    :param partition_key: The partition key.
+    :type partition_key: str or bytes
+    :param partition_ids: The partition IDs of the Event Hub, as returned by `get_partition_ids()`.
+    :type partition_ids: list[str]
+    :rtype: str
+    """
+    sorted_ids = _sort_partition_ids(partition_ids)
+    return sorted_ids[get_partition_index_for_key(partition_key, len(sorted_ids))]
+
+
+def _sort_partition_ids(partition_ids):
+    # type: (Sequence[str]) -> List[str]
+    try:
+        return sorted(partition_ids, key=int)
+    except ValueError:
+        return list(partition_ids)
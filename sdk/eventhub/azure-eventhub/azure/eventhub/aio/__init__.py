@@ -5,13 +5,17 @@
 from ._client_base_async import EventHubSharedKeyCredential
 from ._consumer_client_async import EventHubConsumerClient
 from ._producer_client_async import EventHubProducerClient
+from ._buffered_producer_client_async import EventHubBufferedProducerClient
 from ._eventprocessor.checkpoint_store import CheckpointStore
+from ._eventprocessor.sqlite_checkpoint_store import SqliteCheckpointStore
 from ._eventprocessor.partition_context import PartitionContext
 
 __all__ = [
     "EventHubSharedKeyCredential",
     "EventHubConsumerClient",
     "EventHubProducerClient",
+    "EventHubBufferedProducerClient",
     "CheckpointStore",
+    "SqliteCheckpointStore",
     "PartitionContext",
 ]
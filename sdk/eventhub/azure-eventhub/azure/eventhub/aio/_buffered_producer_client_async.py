@@ -0,0 +1,391 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+import asyncio
+import logging
+import time
+
+from typing import Any, Union, TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from ..exceptions import ClientClosedError, OperationTimeoutError
+from .._buffered_producer_client import _PartitionBuffer
+from .._common import EventDataBatch, EventData
+from ._producer_client_async import EventHubProducerClient
+
+if TYPE_CHECKING:
+    from azure.core.credentials import TokenCredential
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EventHubBufferedProducerClient(EventHubProducerClient):  # pylint: disable=too-many-instance-attributes
+    """The EventHubBufferedProducerClient class buffers the events it is given and sends them
+    to the Azure Event Hubs service in batches, in the background.
+
+    The events are buffered per partition ID, or per partition key, and the events of a
+    buffer are added to batches as they arrive. A batch is sent once it is full, or once its
+    first event has waited for `max_wait_time` seconds. At most one batch is sent at a time for
+    each buffer, so that the events of a partition or partition key are sent in order. The
+    outcome of each send is reported to the `on_success` or the `on_error` callback.
+
+    :param str fully_qualified_namespace: The fully qualified host name for the Event Hubs namespace.
+     This is likely to be similar to <yournamespace>.servicebus.windows.net
+    :param str eventhub_name: The path of the specific Event Hub to connect the client to.
+    :param ~azure.core.credentials.TokenCredential credential: The credential object used for authentication which
+     implements a particular interface for getting tokens. It accepts
+     :class:`EventHubSharedKeyCredential<azure.eventhub.aio.EventHubSharedKeyCredential>`, or credential objects
+     generated by the azure-identity library and objects that implement the `get_token(self, *scopes)` method.
+    :keyword on_error: The coroutine function called with the events of a batch, the partition ID they were
+     sent to (None when the service picks the partition) and the error when a batch could not be sent.
+    :keyword on_success: The coroutine function called with the events of a batch and the partition ID they
+     were sent to (None when the service picks the partition) when a batch was sent.
+    :keyword int max_buffer_length: The maximum number of events buffered for a partition ID or a partition key,
+     including the events being sent. Sending more events waits until buffered events were sent. Default is 1500.
+    :keyword float max_wait_time: The maximum time in seconds an event waits for its batch to be full before
+     the batch is sent. Default is 1 second. If set to None, batches are only sent once full or flushed.
+    :keyword int max_concurrent_sends: The number of batches of different buffers sent at the same time.
+     Default is 4.
+    :keyword bool logging_enable: Whether to output network trace logs to the logger. Default is `False`.
+    :keyword float auth_timeout: The time in seconds to wait for a token to be authorized by the service.
+     The default value is 60 seconds. If set to 0, no timeout will be enforced from the client.
+    :keyword str user_agent: The user agent that should be appended to the built-in user agent string.
+    :keyword int retry_total: The total number of attempts to redo a failed operation when an error occurs. Default
+     value is 3.
+    :keyword float idle_timeout: Timeout, in seconds, after which this client will close the underlying connection
+     if there is no activity. By default the value is None, meaning that the client will not shutdown due to inactivity
+     unless initiated by the service.
+    :keyword transport_type: The type of transport protocol that will be used for communicating with
+     the Event Hubs service. Default is `TransportType.Amqp`.
+    :paramtype transport_type: ~azure.eventhub.TransportType
+    :keyword dict http_proxy: HTTP proxy settings. This must be a dictionary with the following
+     keys: `'proxy_hostname'` (str value) and `'proxy_port'` (int value).
+     Additionally the following keys may also be present: `'username', 'password'`.
+    """
+
+    def __init__(
+        self,
+        fully_qualified_namespace: str,
+        eventhub_name: str,
+        credential: "TokenCredential",
+        *,
+        on_error: Callable[[List[EventData], Optional[str], Exception], Awaitable[None]],
+        on_success: Optional[Callable[[List[EventData], Optional[str]], Awaitable[None]]] = None,
+        max_buffer_length: int = 1500,
+        max_wait_time: Optional[float] = 1,
+        max_concurrent_sends: int = 4,
+        **kwargs
+    ) -> None:
+        super(EventHubBufferedProducerClient, self).__init__(
+            fully_qualified_namespace=fully_qualified_namespace,
+            eventhub_name=eventhub_name,
+            credential=credential,
+            **kwargs
+        )
+        self._on_error = on_error
+        self._on_success = on_success
+        self._max_buffer_length = max_buffer_length
+        self._max_wait_time = max_wait_time
+        self._max_concurrent_sends = max_concurrent_sends
+        self._buffers = {}  # type: Dict[Tuple[Optional[str], Optional[Union[str, bytes]]], _PartitionBuffer]
+        self._condition = asyncio.Condition(loop=self._loop)
+        self._senders = []  # type: List[asyncio.Task]
+        self._flushing = 0
+        self._next_buffer = 0
+        self._closed = False
+
+    @classmethod
+    def from_connection_string(  # pylint: disable=arguments-differ
+        cls,
+        conn_str: str,
+        **kwargs: Any
+    ) -> "EventHubBufferedProducerClient":
+        """Create an EventHubBufferedProducerClient from a connection string.
+
+        :param str conn_str: The connection string of an Event Hub.
+        :keyword str eventhub_name: The path of the specific Event Hub to connect the client to.
+        :keyword on_error: The coroutine function called with the events of a batch, the partition ID they were
+         sent to (None when the service picks the partition) and the error when a batch could not be sent.
+        :keyword on_success: The coroutine function called with the events of a batch and the partition ID they
+         were sent to (None when the service picks the partition) when a batch was sent.
+        :keyword int max_buffer_length: The maximum number of events buffered for a partition ID or a partition
+         key, including the events being sent. Default is 1500.
+        :keyword float max_wait_time: The maximum time in seconds an event waits for its batch to be full before
+         the batch is sent. Default is 1 second.
+        :keyword int max_concurrent_sends: The number of batches of different buffers sent at the same time.
+         Default is 4.
+        :keyword bool logging_enable: Whether to output network trace logs to the logger. Default is `False`.
+        :keyword dict http_proxy: HTTP proxy settings. This must be a dictionary with the following
+         keys: `'proxy_hostname'` (str value) and `'proxy_port'` (int value).
+         Additionally the following keys may also be present: `'username', 'password'`.
+        :keyword float auth_timeout: The time in seconds to wait for a token to be authorized by the service.
+         The default value is 60 seconds. If set to 0, no timeout will be enforced from the client.
+        :keyword str user_agent: The user agent that should be appended to the built-in user agent string.
+        :keyword int retry_total: The total number of attempts to redo a failed operation when an error occurs.
+         Default value is 3.
+        :keyword float idle_timeout: Timeout, in seconds, after which this client will close the underlying connection
+         if there is no activity. By default the value is None, meaning that the client will not shutdown due to
+         inactivity unless initiated by the service.
+        :keyword transport_type: The type of transport protocol that will be used for communicating with
+         the Event Hubs service. Default is `TransportType.Amqp`.
+        :paramtype transport_type: ~azure.eventhub.TransportType
+        :rtype: ~azure.eventhub.aio.EventHubBufferedProducerClient
+        """
+        constructor_args = cls._from_connection_string(conn_str, **kwargs)
+        return cls(**constructor_args)
+
+    @property
+    def buffered_event_count(self) -> int:
+        """The number of events buffered by the client, including the events being sent.
+
+        :rtype: int
+        """
+        return sum(buffer.event_count for buffer in self._buffers.values())
+
+    def _start_senders(self) -> None:
+        if self._senders:
+            return
+        loop = self._loop or asyncio.get_event_loop()
+        for _ in range(self._max_concurrent_sends):
+            self._senders.append(loop.create_task(self._send_buffered_batches()))
+
+    async def _add_to_buffer(self, buffer: _PartitionBuffer, event_data: EventData) -> None:
+        if buffer.batches:
+            batch, events, _ = buffer.batches[-1]
+            try:
+                batch.add(event_data)
+                events.append(event_data)
+                buffer.event_count += 1
+                return
+            except ValueError:
+                pass
+        # raises a ValueError if the event doesn't fit in an empty batch
+        batch = await self.create_batch(partition_id=buffer.partition_id, partition_key=buffer.partition_key)
+        batch.add(event_data)
+        buffer.batches.append((batch, [event_data], time.time()))
+        buffer.event_count += 1
+        # a batch is full, or the senders have to wait for a new batch
+        self._condition.notify_all()
+
+    def _take_due_batch(
+        self
+    ) -> Tuple[Optional[_PartitionBuffer], Optional[Tuple[EventDataBatch, List[EventData]]], Optional[float]]:
+        """Takes the next batch to send, in turn from each buffer, or returns how long to wait for one."""
+        now = time.time()
+        wait_time = None  # type: Optional[float]
+        buffers = list(self._buffers.values())
+        for i in range(len(buffers)):
+            buffer = buffers[(self._next_buffer + i) % len(buffers)]
+            if buffer.sending or not buffer.batches:
+                continue
+            batch, events, start_time = buffer.batches[0]
+            waited = now - start_time
+            if (
+                len(buffer.batches) > 1
+                or self._flushing
+                or (self._max_wait_time is not None and waited >= self._max_wait_time)
+            ):
+                buffer.batches.popleft()
+                buffer.sending = True
+                self._next_buffer = (self._next_buffer + i + 1) % len(buffers)
+                return buffer, (batch, events), None
+            if self._max_wait_time is not None:
+                remaining = self._max_wait_time - waited
+                wait_time = remaining if wait_time is None else min(wait_time, remaining)
+        return None, None, wait_time
+
+    async def _wait(self, timeout: Optional[float]) -> None:
+        try:
+            await asyncio.wait_for(self._condition.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _send_buffered_batches(self) -> None:
+        while True:
+            async with self._condition:
+                while True:
+                    if self._closed:
+                        return
+                    buffer, due_batch, wait_time = self._take_due_batch()
+                    if due_batch:
+                        break
+                    await self._wait(wait_time)
+            batch, events = due_batch
+            try:
+                await super(EventHubBufferedProducerClient, self).send_batch(batch)
+            except Exception as error:  # pylint:disable=broad-except
+                _LOGGER.warning(
+                    "EventHubBufferedProducerClient of eventhub %r failed to send %r events to partition %r. "
+                    "The exception is %r.",
+                    self.eventhub_name,
+                    len(events),
+                    buffer.partition_id,
+                    error,
+                )
+                await self._report(self._on_error, events, buffer.partition_id, error)
+            else:
+                if self._on_success:
+                    await self._report(self._on_success, events, buffer.partition_id)
+            finally:
+                async with self._condition:
+                    buffer.sending = False
+                    buffer.event_count -= len(events)
+                    self._condition.notify_all()
+
+    async def _report(self, callback, *args) -> None:
+        try:
+            await callback(*args)
+        except Exception as error:  # pylint:disable=broad-except
+            _LOGGER.warning(
+                "EventHubBufferedProducerClient of eventhub %r. An error occurred while running %r. "
+                "The exception is %r.",
+                self.eventhub_name,
+                callback,
+                error,
+            )
+
+    async def send_event(
+        self,
+        event_data: EventData,
+        *,
+        timeout: Optional[float] = None,
+        partition_id: Optional[str] = None,
+        partition_key: Optional[Union[str, bytes]] = None
+    ) -> None:
+        """Adds an event to the buffer of its partition ID or partition key, to be sent in the background.
+
+        Waits while the buffer already holds `max_buffer_length` events.
+
+        :param event_data: The event to send.
+        :type event_data: ~azure.eventhub.EventData
+        :keyword float timeout: The maximum time in seconds to wait for room in the buffer.
+         If not specified, waits until there is room.
+        :keyword str partition_id: The specific partition ID to send to. Default is None, in which case the service
+         will assign to all partitions using round-robin.
+        :keyword str partition_key: With the given partition_key, event data will be sent to
+         a particular partition of the Event Hub decided by the service.
+         If both partition_id and partition_key are provided, the partition_id will take precedence.
+        :rtype: None
+        :raises: :class:`ClientClosedError<azure.eventhub.exceptions.ClientClosedError>`
+         :class:`OperationTimeoutError<azure.eventhub.exceptions.OperationTimeoutError>`
+         :class:`ValueError`, when the event is too large for a batch.
+        """
+        if partition_id:
+            partition_key = None
+        if not self._max_message_size_on_link:
+            await self._get_max_mesage_size()
+
+        deadline = time.time() + timeout if timeout is not None else None
+        async with self._condition:
+            if self._closed:
+                raise ClientClosedError("The EventHubBufferedProducerClient of eventhub {} is closed.".format(
+                    self.eventhub_name))
+            self._start_senders()
+            key = (partition_id, partition_key)
+            buffer = self._buffers.get(key)
+            if buffer is None:
+                buffer = self._buffers[key] = _PartitionBuffer(partition_id, partition_key)
+            while buffer.event_count >= self._max_buffer_length:
+                remaining = deadline - time.time() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    raise OperationTimeoutError(
+                        "The buffer of partition {} is full.".format(partition_id or partition_key))
+                await self._wait(remaining)
+            await self._add_to_buffer(buffer, event_data)
+
+    async def send_batch(
+        self,
+        event_data_batch: Union[EventDataBatch, List[EventData]],
+        *,
+        timeout: Optional[Union[int, float]] = None,
+        **kwargs
+    ) -> None:
+        """Adds events to the buffer of their partition ID or partition key, to be sent in the background.
+
+        :param event_data_batch: The `EventDataBatch` object or the list of `EventData` to send.
+        :type event_data_batch: Union[~azure.eventhub.EventDataBatch, List[~azure.eventhub.EventData]]
+        :keyword float timeout: The maximum time in seconds to wait for room in the buffer for each event.
+         If not specified, waits until there is room.
+        :keyword str partition_id: The specific partition ID to send to. Default is None, in which case the service
+         will assign to all partitions using round-robin.
+         A `TypeError` will be raised if partition_id is specified and event_data_batch is an `EventDataBatch` because
+         `EventDataBatch` itself has partition_id.
+        :keyword str partition_key: With the given partition_key, event data will be sent to
+         a particular partition of the Event Hub decided by the service.
+         A `TypeError` will be raised if partition_key is specified and event_data_batch is an `EventDataBatch` because
+         `EventDataBatch` itself has partition_key.
+         If both partition_id and partition_key are provided, the partition_id will take precedence.
+        :rtype: None
+        :raises: :class:`ClientClosedError<azure.eventhub.exceptions.ClientClosedError>`
+         :class:`OperationTimeoutError<azure.eventhub.exceptions.OperationTimeoutError>`
+         :class:`ValueError`
+         :class:`TypeError`
+        """
+        partition_id = kwargs.get("partition_id")
+        partition_key = kwargs.get("partition_key")
+        if isinstance(event_data_batch, EventDataBatch):
+            if partition_id or partition_key:
+                raise TypeError("partition_id and partition_key should be None when sending an EventDataBatch "
+                                "because type EventDataBatch itself may have partition_id or partition_key")
+            # pylint:disable=protected-access
+            partition_id = event_data_batch._partition_id
+            partition_key = event_data_batch._partition_key
+            event_data_batch = list(event_data_batch.message._body_gen)
+        for event_data in event_data_batch:
+            await self.send_event(
+                event_data, timeout=timeout, partition_id=partition_id, partition_key=partition_key
+            )
+
+    async def flush(self, *, timeout: Optional[float] = None) -> None:
+        """Sends all the buffered events, and waits until they were sent.
+
+        :keyword float timeout: The maximum time in seconds to wait for the events to be sent.
+         If not specified, waits until they are sent.
+        :rtype: None
+        :raises: :class:`OperationTimeoutError<azure.eventhub.exceptions.OperationTimeoutError>`
+        """
+        deadline = time.time() + timeout if timeout is not None else None
+        async with self._condition:
+            self._flushing += 1
+            self._condition.notify_all()
+            try:
+                while any(buffer.event_count for buffer in self._buffers.values()):
+                    remaining = deadline - time.time() if deadline is not None else None
+                    if remaining is not None and remaining <= 0:
+                        raise OperationTimeoutError("The buffered events were not sent in time.")
+                    await self._wait(remaining)
+            finally:
+                self._flushing -= 1
+
+    async def close(  # pylint: disable=arguments-differ
+        self,
+        *,
+        flush: bool = True,
+        timeout: Optional[float] = None
+    ) -> None:
+        """Send the buffered events, then close the Producer client underlying AMQP connection and links.
+
+        :keyword bool flush: Whether to send the buffered events before closing. Default is True.
+         The events that are not sent are reported to the `on_error` callback with a
+         :class:`ClientClosedError<azure.eventhub.exceptions.ClientClosedError>`.
+        :keyword float timeout: The maximum time in seconds to wait for the buffered events to be sent.
+         If not specified, waits until they are sent.
+        :rtype: None
+        """
+        try:
+            if flush:
+                await self.flush(timeout=timeout)
+        finally:
+            async with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            if self._senders:
+                await asyncio.gather(*self._senders)
+            buffers = list(self._buffers.values())
+            self._buffers = {}
+            error = ClientClosedError("The EventHubBufferedProducerClient of eventhub {} was closed "
+                                      "before the events were sent.".format(self.eventhub_name))
+            for buffer in buffers:
+                for _, events, _ in buffer.batches:
+                    await self._report(self._on_error, events, buffer.partition_id, error)
+            await super(EventHubBufferedProducerClient, self).close()
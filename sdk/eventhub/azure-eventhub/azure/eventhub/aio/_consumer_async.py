@@ -14,7 +14,7 @@ from uamqp import errors, types, utils
 from uamqp import ReceiveClientAsync, Source
 
 from ._client_base_async import ConsumerProducerMixin
-from .._common import EventData
+from .._common import EventData, ColumnarEventDataBatch
 from ..exceptions import _error_handler
 from .._utils import create_properties, trace_link_message, event_position_selector
 from .._constants import EPOCH_SYMBOL, TIMEOUT_SYMBOL, RECEIVER_RUNTIME_METRIC_SYMBOL
@@ -117,6 +117,7 @@ class EventHubConsumer(
         )
         self._message_buffer = deque()  # type: Deque[uamqp.Message]
         self._last_received_event = None  # type: Optional[EventData]
+        self._columnar = kwargs.get("columnar", False)
 
     def _create_handler(self, auth: "JWTTokenAsync") -> None:
         source = Source(self._source)
@@ -169,6 +170,13 @@ class EventHubConsumer(
         self._last_received_event = event_data
         return event_data
 
+    def _next_columnar_batch(self, max_batch_size: int) -> ColumnarEventDataBatch:
+        messages = [self._message_buffer.pop() for _ in range(min(max_batch_size, len(self._message_buffer)))]
+        event_batch = ColumnarEventDataBatch(messages)
+        if messages:
+            self._last_received_event = event_batch[-1]  # type: ignore
+        return event_batch
+
     async def receive(self, batch=False, max_batch_size=300, max_wait_time=None) -> None:
         max_retries = (
             self._client._config.max_retries  # pylint:disable=protected-access
@@ -208,7 +216,9 @@ class EventHubConsumer(
 
         if self._message_buffer:
             while self._message_buffer:
-                if batch:
+                if batch and self._columnar:
+                    await self._on_event_received(self._next_columnar_batch(max_batch_size))
+                elif batch:
                     events_for_callback = []  # type: List[EventData]
                     for _ in range(min(max_batch_size, len(self._message_buffer))):
                         events_for_callback.append(self._next_message_in_buffer())
@@ -216,7 +226,9 @@ class EventHubConsumer(
                 else:
                     await self._on_event_received(self._next_message_in_buffer())
         elif max_wait_time:
-            if batch:
+            if batch and self._columnar:
+                await self._on_event_received(ColumnarEventDataBatch())
+            elif batch:
                 await self._on_event_received([])
             else:
                 await self._on_event_received(None)
@@ -91,6 +91,12 @@ class EventHubConsumerClient(ClientBaseAsync):
     :paramtype checkpoint_store: ~azure.eventhub.aio.CheckpointStore
     :keyword float load_balancing_interval: When load-balancing kicks in. This is the interval, in seconds,
      between two load-balancing evaluations. Default is 10 seconds.
+    :keyword float checkpoint_flush_interval: If set together with `checkpoint_store`, checkpoints are coalesced
+     in memory and only the latest checkpoint of a partition is written to the checkpoint store, at the latest
+     this many seconds after it was updated. Pending checkpoints are always written when a partition is closed.
+     Default is None, which writes every checkpoint immediately.
+    :keyword int checkpoint_flush_event_count: If set together with `checkpoint_store`, a coalesced checkpoint is
+     written as soon as it has advanced by this many events. Default is None.
 
     .. admonition:: Example:
 
@@ -112,6 +118,8 @@ class EventHubConsumerClient(ClientBaseAsync):
     ) -> None:
         self._checkpoint_store = kwargs.pop("checkpoint_store", None)
         self._load_balancing_interval = kwargs.pop("load_balancing_interval", 10)
+        self._checkpoint_flush_interval = kwargs.pop("checkpoint_flush_interval", None)
+        self._checkpoint_flush_event_count = kwargs.pop("checkpoint_flush_event_count", None)
         self._consumer_group = consumer_group
         network_tracing = kwargs.pop("logging_enable", False)
         super(EventHubConsumerClient, self).__init__(
@@ -158,6 +166,7 @@ class EventHubConsumerClient(ClientBaseAsync):
             prefetch=prefetch,
             idle_timeout=self._idle_timeout,
             track_last_enqueued_event_properties=track_last_enqueued_event_properties,
+            columnar=kwargs.get("columnar", False),
             loop=self._loop,
         )
         return handler
@@ -177,6 +186,8 @@ class EventHubConsumerClient(ClientBaseAsync):
         transport_type: Optional["TransportType"] = None,
         checkpoint_store: Optional["CheckpointStore"] = None,
         load_balancing_interval: float = 10,
+        checkpoint_flush_interval: Optional[float] = None,
+        checkpoint_flush_event_count: Optional[int] = None,
         **kwargs: Any
     ) -> "EventHubConsumerClient":
         """Create an EventHubConsumerClient from a connection string.
@@ -213,6 +224,12 @@ class EventHubConsumerClient(ClientBaseAsync):
         :paramtype checkpoint_store: ~azure.eventhub.aio.CheckpointStore
         :keyword float load_balancing_interval: When load-balancing kicks in. This is the interval, in seconds,
          between two load-balancing evaluations. Default is 10 seconds.
+        :keyword float checkpoint_flush_interval: If set together with `checkpoint_store`, checkpoints are
+         coalesced in memory and only the latest checkpoint of a partition is written to the checkpoint store, at the
+         latest this many seconds after it was updated. Pending checkpoints are always written when a partition is
+         closed. Default is None, which writes every checkpoint immediately.
+        :keyword int checkpoint_flush_event_count: If set together with `checkpoint_store`, a coalesced checkpoint is
+         written as soon as it has advanced by this many events. Default is None.
         :rtype: ~azure.eventhub.aio.EventHubConsumerClient
 
         .. admonition:: Example:
@@ -237,6 +254,8 @@ class EventHubConsumerClient(ClientBaseAsync):
             transport_type=transport_type,
             checkpoint_store=checkpoint_store,
             load_balancing_interval=load_balancing_interval,
+            checkpoint_flush_interval=checkpoint_flush_interval,
+            checkpoint_flush_event_count=checkpoint_flush_event_count,
             **kwargs
         )
         return cls(**constructor_args)
@@ -264,7 +283,8 @@ class EventHubConsumerClient(ClientBaseAsync):
             ] = None,
             on_partition_close: Optional[
                 Callable[["PartitionContext", "CloseReason"], Awaitable[None]]
-            ] = None
+            ] = None,
+            columnar: bool = False
     ):
         async with self._lock:
             error = None
@@ -306,11 +326,14 @@ class EventHubConsumerClient(ClientBaseAsync):
                 partition_initialize_handler=on_partition_initialize,
                 partition_close_handler=on_partition_close,
                 load_balancing_interval=self._load_balancing_interval,
+                checkpoint_flush_interval=self._checkpoint_flush_interval,
+                checkpoint_flush_event_count=self._checkpoint_flush_event_count,
                 initial_event_position=starting_position if starting_position is not None else "@latest",
                 initial_event_position_inclusive=starting_position_inclusive or False,
                 owner_level=owner_level,
                 prefetch=prefetch,
                 track_last_enqueued_event_properties=track_last_enqueued_event_properties,
+                columnar=columnar,
                 loop=self._loop,
             )
             self._event_processors[
@@ -459,7 +482,8 @@ class EventHubConsumerClient(ClientBaseAsync):
         ] = None,
         on_partition_close: Optional[
             Callable[["PartitionContext", "CloseReason"], Awaitable[None]]
-        ] = None
+        ] = None,
+        columnar: bool = False
     ) -> None:
         """Receive events from partition(s) in batches, with optional load-balancing and checkpointing.
 
@@ -504,6 +528,10 @@ class EventHubConsumerClient(ClientBaseAsync):
          bool as the value indicating whether the starting_position for a specific partition is inclusive or not.
          This can also be a single bool value for all starting_position. The default value is False.
         :paramtype starting_position_inclusive: bool or dict[str,bool]
+        :keyword bool columnar: If True, the callback receives a
+         :class:`ColumnarEventDataBatch<azure.eventhub.ColumnarEventDataBatch>` that exposes the bodies, offsets and
+         sequence numbers of the events as tuples and creates `EventData` objects only on access, instead of a list
+         of `EventData`. Default is False.
         :keyword on_error: The callback function that will be called when an error is raised during receiving
          after retry attempts are exhausted, or during the process of load-balancing.
          The callback takes two parameters: `partition_context` which contains partition information
@@ -552,7 +580,8 @@ class EventHubConsumerClient(ClientBaseAsync):
             starting_position_inclusive=starting_position_inclusive,
             on_error=on_error,
             on_partition_initialize=on_partition_initialize,
-            on_partition_close=on_partition_close
+            on_partition_close=on_partition_close,
+            columnar=columnar
         )
 
     async def get_eventhub_properties(self) -> Dict[str, Any]:
@@ -5,7 +5,7 @@
 
 import time
 import random
-from collections import Counter, defaultdict
+from collections import defaultdict
 from typing import List, Iterable, Optional, Dict, Any, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -127,79 +127,87 @@ class OwnershipManager(object):  # pylint:disable=too-many-instance-attributes
             for to_claim_item in to_claim:
                 to_claim_item["owner_id"] = self.owner_id
             for pid in unclaimed_partition_ids:
-                to_claim.append(
-                    {
-                        "fully_qualified_namespace": self.fully_qualified_namespace,
-                        "partition_id": pid,
-                        "eventhub_name": self.eventhub_name,
-                        "consumer_group": self.consumer_group,
-                        "owner_id": self.owner_id,
-                    }
-                )
+                to_claim.append(self._new_ownership(pid))
             self._initializing = False
             if (
                 to_claim
             ):  # if no expired, released or unclaimed partitions, go ahead with balancing
                 return to_claim
 
-        released_partition_ids = [
+        released_partition_ids = set(
             ownership["partition_id"] for ownership in released_partitions
-        ]
-        claimable_partition_ids = unclaimed_partition_ids + released_partition_ids
+        )
+        claimable_partition_ids = unclaimed_partition_ids + list(released_partition_ids)
 
-        active_ownership = [o for o in ownership_list if o not in released_partitions]
         active_ownership_by_owner = defaultdict(
             list
         )  # type: Dict[str, List[Dict[str, Any]]]
-        for ownership in active_ownership:
-            active_ownership_by_owner[ownership["owner_id"]].append(ownership)
-        active_ownership_self = active_ownership_by_owner[self.owner_id]
+        for ownership in ownership_list:
+            if ownership["partition_id"] not in released_partition_ids:
+                active_ownership_by_owner[ownership["owner_id"]].append(ownership)
+        active_ownership_self = active_ownership_by_owner.pop(self.owner_id, [])
 
-        # calculate expected count per owner
+        # Compute the target assignment. Every owner, self included, gets all_partition_count // owners_count
+        # partitions and the owners that already hold the most get one of the remaining partitions each.
         all_partition_count = len(all_partition_ids)
-        # owners_count is the number of active owners. If self.owner_id is not yet among the active owners,
-        # then plus 1 to include self. This will make owners_count >= 1.
-        owners_count = len(active_ownership_by_owner) + (
-            0 if self.owner_id in active_ownership_by_owner else 1
+        owners_count = len(active_ownership_by_owner) + 1
+        expected_count_per_owner, extra_count = divmod(
+            all_partition_count, owners_count
+        )
+        other_owners = sorted(
+            active_ownership_by_owner.items(), key=lambda x: len(x[1]), reverse=True
+        )
+        owners_over_expected = sum(
+            1 for _, owned in other_owners if len(owned) > expected_count_per_owner
         )
-        expected_count_per_owner = all_partition_count // owners_count
-        # end of calculating expected count per owner
+        self_extra = (
+            1
+            if len(active_ownership_self) > expected_count_per_owner
+            or owners_over_expected < extra_count
+            else 0
+        )
+        self_extra = min(self_extra, extra_count)
+        # end of computing the target assignment
 
         to_claim = active_ownership_self
-        if len(active_ownership_self) < expected_count_per_owner:
-            # Either claims an inactive partition, or steals from other owners
-            if claimable_partition_ids:  # claim an inactive partition if there is
-                random_partition_id = random.choice(claimable_partition_ids)
-                random_chosen_to_claim = ownership_dict.get(
-                    random_partition_id,
-                    {
-                        "fully_qualified_namespace": self.fully_qualified_namespace,
-                        "partition_id": random_partition_id,
-                        "eventhub_name": self.eventhub_name,
-                        "consumer_group": self.consumer_group,
-                    },
-                )
-                random_chosen_to_claim["owner_id"] = self.owner_id
-                to_claim.append(random_chosen_to_claim)
-            else:  # steal from another owner that has the most count
-                active_ownership_count_group_by_owner = Counter(
-                    dict((x, len(y)) for x, y in active_ownership_by_owner.items())
-                )
-                most_frequent_owner_id = active_ownership_count_group_by_owner.most_common(
-                    1
-                )[
-                    0
-                ][
-                    0
-                ]
-                # randomly choose a partition to steal from the most_frequent_owner
-                to_steal_partition = random.choice(
-                    active_ownership_by_owner[most_frequent_owner_id]
-                )
+        deficit = expected_count_per_owner + self_extra - len(active_ownership_self)
+        if deficit <= 0:
+            return to_claim
+
+        # claim inactive partitions first
+        for partition_id in random.sample(
+            claimable_partition_ids, min(deficit, len(claimable_partition_ids))
+        ):
+            to_claim_item = ownership_dict.get(partition_id) or self._new_ownership(partition_id)
+            to_claim_item["owner_id"] = self.owner_id
+            to_claim.append(to_claim_item)
+            deficit -= 1
+
+        # steal the rest of the deficit from owners that hold more than their target
+        extra_count -= self_extra
+        for _, owned in other_owners:
+            if deficit <= 0:
+                break
+            target = expected_count_per_owner + (1 if extra_count > 0 else 0)
+            extra_count -= 1
+            surplus = len(owned) - target
+            if surplus <= 0:
+                continue
+            for to_steal_partition in random.sample(owned, min(surplus, deficit)):
                 to_steal_partition["owner_id"] = self.owner_id
                 to_claim.append(to_steal_partition)
+                deficit -= 1
         return to_claim
 
+    def _new_ownership(self, partition_id: str) -> Dict[str, Any]:
+        return {
+            "fully_qualified_namespace": self.fully_qualified_namespace,
+            "partition_id": partition_id,
+            "eventhub_name": self.eventhub_name,
+            "consumer_group": self.consumer_group,
+            "owner_id": self.owner_id,
+        }
+
     async def get_checkpoints(self) -> Dict[str, Dict[str, Any]]:
         if self.checkpoint_store:
             checkpoints = await self.checkpoint_store.list_checkpoints(
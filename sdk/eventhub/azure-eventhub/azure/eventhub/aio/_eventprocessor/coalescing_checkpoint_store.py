@@ -0,0 +1,202 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# -----------------------------------------------------------------------------------
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+import time
+import asyncio
+import logging
+
+from azure.eventhub._eventprocessor.coalescing_checkpoint_store import (
+    _checkpoint_key,
+    _PendingCheckpoint,
+    _RETRY_INTERVAL,
+)
+from .checkpoint_store import CheckpointStore
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CoalescingCheckpointStore(CheckpointStore):  # pylint:disable=too-many-instance-attributes
+    """Wraps a CheckpointStore and coalesces the checkpoint updates of each partition.
+
+    Only the latest checkpoint of a partition is kept in memory. A background task writes it to the
+    wrapped checkpoint store once it is `flush_interval` seconds old or the checkpoint has advanced by
+    `flush_event_count` events, whichever comes first. Ownership calls go straight to the wrapped store.
+
+    :param checkpoint_store: The CheckpointStore that checkpoints are written to.
+    :type checkpoint_store: ~azure.eventhub.aio.CheckpointStore
+    :param float flush_interval: The maximum time in seconds a checkpoint is held before it is written.
+    :param int flush_event_count: The number of events a checkpoint may advance before it is written.
+    """
+
+    def __init__(
+        self,
+        checkpoint_store: CheckpointStore,
+        flush_interval: Optional[float] = None,
+        flush_event_count: Optional[int] = None,
+        *,
+        loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> None:
+        if flush_interval is None and flush_event_count is None:
+            raise ValueError("At least one of flush_interval and flush_event_count must be set.")
+        self._checkpoint_store = checkpoint_store
+        self._flush_interval = flush_interval
+        self._flush_event_count = flush_event_count
+        self._pending = {}  # type: Dict[Tuple[str, str, str, str], _PendingCheckpoint]
+        self._flushed_sequence_numbers = {}  # type: Dict[Tuple[str, str, str, str], int]
+        self._loop = loop or asyncio.get_event_loop()
+        self._condition = asyncio.Condition(loop=self._loop)
+        self._flush_lock = asyncio.Lock(loop=self._loop)  # keeps the writes of one partition in order
+        self._worker = None  # type: Optional[asyncio.Task]
+
+    async def list_ownership(
+        self, fully_qualified_namespace: str, eventhub_name: str, consumer_group: str
+    ) -> Iterable[Dict[str, Any]]:
+        return await self._checkpoint_store.list_ownership(fully_qualified_namespace, eventhub_name, consumer_group)
+
+    async def claim_ownership(
+        self, ownership_list: Iterable[Dict[str, Any]]
+    ) -> Iterable[Dict[str, Any]]:
+        return await self._checkpoint_store.claim_ownership(ownership_list)
+
+    async def update_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        key = _checkpoint_key(checkpoint)
+        async with self._condition:
+            pending = self._pending.get(key)
+            due = False
+            if pending:
+                pending.checkpoint = checkpoint
+            else:
+                due = True  # the worker recomputes when the next flush is due
+                base_sequence_number = self._flushed_sequence_numbers.get(
+                    key, checkpoint["sequence_number"] - 1
+                )
+                pending = _PendingCheckpoint(checkpoint, base_sequence_number)
+                self._pending[key] = pending
+            if not self._worker:
+                self._worker = self._loop.create_task(self._flush_periodically())
+            if self._flush_event_count is not None and pending.event_count >= self._flush_event_count:
+                due = True
+            if due:
+                self._condition.notify()
+
+    async def list_checkpoints(
+        self, fully_qualified_namespace: str, eventhub_name: str, consumer_group: str
+    ) -> Iterable[Dict[str, Any]]:
+        checkpoints = {
+            x["partition_id"]: x
+            for x in await self._checkpoint_store.list_checkpoints(
+                fully_qualified_namespace, eventhub_name, consumer_group
+            )
+        }
+        for key, pending in self._pending.items():
+            if key[:3] == (fully_qualified_namespace, eventhub_name, consumer_group):
+                checkpoints[key[3]] = pending.checkpoint
+        return list(checkpoints.values())
+
+    async def flush(self, partition_id: Optional[str] = None) -> None:
+        """Write the pending checkpoints of a partition, or of all partitions, to the wrapped checkpoint store.
+
+        :param str partition_id: The partition whose checkpoint is written. All partitions if not set.
+        :rtype: None
+        """
+        keys = [key for key in self._pending if partition_id is None or key[3] == partition_id]
+        error = await self._flush(keys)
+        if error:
+            raise error
+
+    async def close(self) -> None:
+        """Stop the background task. Checkpoints that are still pending are not written, call `flush()` first.
+
+        The task is started again by the next `update_checkpoint()`.
+        """
+        worker, self._worker = self._worker, None
+        if worker:
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+    def _due_keys(self, now: float) -> Tuple[List[Tuple[str, str, str, str]], Optional[float]]:
+        due_keys = []
+        next_due_time = None  # type: Optional[float]
+        for key, pending in self._pending.items():
+            if self._flush_event_count is not None and pending.event_count >= self._flush_event_count:
+                due_keys.append(key)
+            elif self._flush_interval is not None:
+                due_time = pending.created_time + self._flush_interval
+                if due_time <= now:
+                    due_keys.append(key)
+                elif next_due_time is None or due_time < next_due_time:
+                    next_due_time = due_time
+        return due_keys, next_due_time
+
+    async def _wait(self, timeout: Optional[float]) -> None:
+        async with self._condition:
+            try:
+                await asyncio.wait_for(self._condition.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            due_keys, next_due_time = self._due_keys(time.time())
+            if not due_keys:
+                await self._wait(None if next_due_time is None else max(next_due_time - time.time(), 0))
+                continue
+            if await self._flush(due_keys):
+                await self._wait(self._flush_interval or _RETRY_INTERVAL)  # back off before retrying
+
+    async def _flush(self, keys: List[Tuple[str, str, str, str]]) -> Optional[Exception]:
+        error = None
+        async with self._flush_lock:
+            to_flush = [(key, self._pending.pop(key)) for key in keys if key in self._pending]
+            update_checkpoints = getattr(self._checkpoint_store, "update_checkpoints", None)
+            if update_checkpoints and len(to_flush) > 1:
+                # The wrapped store writes a batch in one transaction, so it succeeds or fails as a whole.
+                try:
+                    await update_checkpoints([pending.checkpoint for _, pending in to_flush])
+                except asyncio.CancelledError:
+                    for key, pending in to_flush:
+                        self._pending.setdefault(key, pending)
+                    raise
+                except Exception as err:  # pylint:disable=broad-except
+                    for key, pending in to_flush:
+                        self._flush_failed(key, pending, err)
+                    return err
+                for key, pending in to_flush:
+                    self._flush_succeeded(key, pending)
+                return None
+            for index, (key, pending) in enumerate(to_flush):
+                try:
+                    await self._checkpoint_store.update_checkpoint(pending.checkpoint)
+                except asyncio.CancelledError:
+                    for not_flushed_key, not_flushed in to_flush[index:]:
+                        self._pending.setdefault(not_flushed_key, not_flushed)
+                    raise
+                except Exception as err:  # pylint:disable=broad-except
+                    self._flush_failed(key, pending, err)
+                    error = error or err
+                else:
+                    self._flush_succeeded(key, pending)
+        return error
+
+    def _flush_succeeded(self, key: Tuple[str, str, str, str], pending: _PendingCheckpoint) -> None:
+        self._flushed_sequence_numbers[key] = pending.checkpoint["sequence_number"]
+        newer = self._pending.get(key)
+        if newer:
+            newer.base_sequence_number = pending.checkpoint["sequence_number"]
+
+    def _flush_failed(self, key: Tuple[str, str, str, str], pending: _PendingCheckpoint, error: Exception) -> None:
+        _LOGGER.warning(
+            "namespace %r, eventhub %r, consumer_group %r, partition_id %r. "
+            "An error occurred while writing a coalesced checkpoint. The exception is %r.",
+            key[0],
+            key[1],
+            key[2],
+            key[3],
+            error,
+        )
+        self._pending.setdefault(key, pending)  # retry later unless a newer checkpoint came in
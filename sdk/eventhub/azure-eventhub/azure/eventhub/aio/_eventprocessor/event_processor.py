@@ -25,6 +25,7 @@ from ..._eventprocessor.common import CloseReason
 from ..._eventprocessor._eventprocessor_mixin import EventProcessorMixin
 from .partition_context import PartitionContext
 from .in_memory_checkpoint_store import InMemoryCheckpointStore
+from .coalescing_checkpoint_store import CoalescingCheckpointStore
 from .checkpoint_store import CheckpointStore
 from ._ownership_manager import OwnershipManager
 from .utils import get_running_loop
@@ -60,9 +61,12 @@ class EventProcessor(
         initial_event_position: Union[str, int, "datetime", Dict[str, Any]] = "@latest",
         initial_event_position_inclusive: Union[bool, Dict[str, bool]] = False,
         load_balancing_interval: float = 10.0,
+        checkpoint_flush_interval: Optional[float] = None,
+        checkpoint_flush_event_count: Optional[int] = None,
         owner_level: Optional[int] = None,
         prefetch: Optional[int] = None,
         track_last_enqueued_event_properties: bool = False,
+        columnar: bool = False,
         error_handler: Optional[
             Callable[[PartitionContext, Exception], Awaitable[None]]
         ] = None,
@@ -102,8 +106,15 @@ class EventProcessor(
         self._track_last_enqueued_event_properties = (
             track_last_enqueued_event_properties
         )
+        self._columnar = columnar
         self._id = str(uuid.uuid4())
         self._loop = loop or get_running_loop()
+        self._coalescing_checkpoint_store = None  # type: Optional[CoalescingCheckpointStore]
+        if checkpoint_store and (checkpoint_flush_interval is not None or checkpoint_flush_event_count is not None):
+            self._coalescing_checkpoint_store = CoalescingCheckpointStore(
+                checkpoint_store, checkpoint_flush_interval, checkpoint_flush_event_count, loop=self._loop
+            )
+            self._checkpoint_store = self._coalescing_checkpoint_store
         self._running = False
 
         self._consumers = {}  # type: Dict[str, EventHubConsumer]
@@ -228,11 +239,31 @@ class EventProcessor(
                 partition_context,
                 CloseReason.OWNERSHIP_LOST if self._running else CloseReason.SHUTDOWN,
             )
+            await self._flush_checkpoints(partition_id)
             await self._ownership_manager.release_ownership(partition_id)
         finally:
             if partition_id in self._tasks:
                 del self._tasks[partition_id]
 
+    async def _flush_checkpoints(self, partition_id: Optional[str] = None) -> None:
+        """Write the coalesced checkpoints of a partition, or of all partitions, before the ownership is given up.
+        """
+        if not self._coalescing_checkpoint_store:
+            return
+        try:
+            await self._coalescing_checkpoint_store.flush(partition_id)
+        except Exception as err:  # pylint:disable=broad-except
+            _LOGGER.warning(
+                "EventProcessor instance %r of eventhub %r consumer group %r. "
+                "An error occurred while flushing the checkpoint of partition %r. The exception is %r.",
+                self._id,
+                self._eventhub_name,
+                self._consumer_group,
+                partition_id,
+                err,
+            )
+            await self._process_error(self._partition_contexts.get(partition_id), err)  # type: ignore
+
     async def _receive(
         self, partition_id: str, checkpoint: Optional[Dict[str, Any]] = None
     ) -> None:  # pylint: disable=too-many-statements
@@ -263,6 +294,7 @@ class EventProcessor(
                 initial_event_position,
                 event_position_inclusive,
                 event_received_callback,  # type: ignore
+                columnar=self._columnar,
             )
 
             if self._partition_initialize_handler:
@@ -394,4 +426,7 @@ class EventProcessor(
         _LOGGER.info("EventProcessor %r tasks have been cancelled.", self._id)
         while self._tasks:
             await asyncio.sleep(1, loop=self._loop)
+        if self._coalescing_checkpoint_store:
+            await self._flush_checkpoints()
+            await self._coalescing_checkpoint_store.close()
         _LOGGER.info("EventProcessor %r has been stopped.", self._id)
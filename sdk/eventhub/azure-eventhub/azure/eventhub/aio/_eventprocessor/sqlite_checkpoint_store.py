@@ -0,0 +1,84 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+import functools
+
+from azure.eventhub._eventprocessor.sqlite_checkpoint_store import SqliteCheckpointStore as CheckPointStoreImpl
+from .checkpoint_store import CheckpointStore
+from .utils import get_running_loop
+
+
+class SqliteCheckpointStore(CheckpointStore):
+    """A CheckpointStore that keeps partition ownership and checkpoints in a local SQLite database.
+
+    The database is opened in WAL mode, so the EventProcessors of several processes on the same host can share one
+    database file. Every write runs in its own `BEGIN IMMEDIATE` transaction, and a writer that finds the database
+    locked waits up to `timeout` seconds. Ownership is claimed optimistically: the etag of an ownership is the value
+    of a version column, and a claim only succeeds if the version is still the one the claimer listed.
+    The database calls run in the default executor of the event loop.
+
+    SQLite file locking isn't reliable on network file systems, so the database file should be on a local disk.
+
+    :param str path: The path of the database file. It is created if it doesn't exist.
+    :keyword float timeout: The time in seconds to wait for a lock held by another connection. Default is 30 seconds.
+    :keyword str synchronous: The SQLite `synchronous` setting. The default "NORMAL" doesn't lose committed writes
+     when the process crashes, but may lose the latest ones when the host loses power. "FULL" syncs every commit.
+    """
+
+    def __init__(self, path: str, **kwargs: Any) -> None:
+        self._checkpoint_store_impl = CheckPointStoreImpl(path, **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def _run(self, func: Callable, *args: Any) -> Any:
+        return await get_running_loop().run_in_executor(None, functools.partial(func, *args))
+
+    async def list_ownership(
+        self, fully_qualified_namespace: str, eventhub_name: str, consumer_group: str
+    ) -> Iterable[Dict[str, Any]]:
+        return await self._run(
+            self._checkpoint_store_impl.list_ownership, fully_qualified_namespace, eventhub_name, consumer_group
+        )
+
+    async def claim_ownership(
+        self, ownership_list: Iterable[Dict[str, Any]]
+    ) -> Iterable[Dict[str, Any]]:
+        return await self._run(self._checkpoint_store_impl.claim_ownership, list(ownership_list))
+
+    async def update_checkpoint(
+        self, checkpoint: Dict[str, Optional[Union[str, int]]]
+    ) -> None:
+        await self._run(self._checkpoint_store_impl.update_checkpoint, checkpoint)
+
+    async def update_checkpoints(
+        self, checkpoints: Iterable[Dict[str, Optional[Union[str, int]]]]
+    ) -> None:
+        """Write the checkpoints of several partitions in one transaction.
+
+        Either all of the checkpoints are written or none of them.
+
+        :param checkpoints: The checkpoints, in the format of `update_checkpoint`.
+        :type checkpoints: Iterable[Dict[str, Any]]
+        :rtype: None
+        """
+        await self._run(self._checkpoint_store_impl.update_checkpoints, list(checkpoints))
+
+    async def list_checkpoints(
+        self, fully_qualified_namespace: str, eventhub_name: str, consumer_group: str
+    ) -> Iterable[Dict[str, Any]]:
+        return await self._run(
+            self._checkpoint_store_impl.list_checkpoints, fully_qualified_namespace, eventhub_name, consumer_group
+        )
+
+    async def close(self) -> None:
+        """Close the database connections.
+
+        :rtype: None
+        """
+        self._checkpoint_store_impl.close()
@@ -13,6 +13,7 @@ from ._client_base_async import ClientBaseAsync
 from ._producer_async import EventHubProducer
 from .._constants import ALL_PARTITIONS
 from .._common import EventDataBatch, EventData
+from .._partition_resolver import get_partition_for_key
 
 if TYPE_CHECKING:
     from uamqp.constants import TransportType
@@ -375,6 +376,21 @@ class EventHubProducerClient(ClientBaseAsync):
             EventHubProducerClient, self
         )._get_partition_properties_async(partition_id)
 
+    async def get_partition_for_key(self, partition_key: str) -> str:
+        """Get the ID of the partition that the service sends events with the given partition key to.
+
+        The partition is computed on the client with the same hashing as the Event Hubs service, so events
+        that share a partition key can be grouped and sent to the partition with `partition_id` instead. The partition
+        IDs are retrieved from the service on the first call and cached.
+
+        :param str partition_key: The partition key.
+        :rtype: str
+        :raises: :class:`EventHubError<azure.eventhub.exceptions.EventHubError>`
+        """
+        async with self._lock:
+            await self._get_partitions()
+        return get_partition_for_key(partition_key, cast(List[str], self._partition_ids))
+
     async def close(self) -> None:
         """Close the Producer client underlying AMQP connection and links.
 
@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""
+Example to show sending single events that are batched and sent in the background by a buffered producer.
+"""
+
+# pylint: disable=C0111
+
+import time
+import os
+from azure.eventhub import EventHubBufferedProducerClient, EventData
+
+CONNECTION_STR = os.environ['EVENT_HUB_CONN_STR']
+EVENTHUB_NAME = os.environ['EVENT_HUB_NAME']
+
+
+def on_success(events, partition_id):
+    print("{} events were sent to partition {}.".format(len(events), partition_id))
+
+
+def on_error(events, partition_id, error):
+    print("{} events could not be sent to partition {}: {!r}".format(len(events), partition_id, error))
+
+
+producer = EventHubBufferedProducerClient.from_connection_string(
+    conn_str=CONNECTION_STR,
+    eventhub_name=EVENTHUB_NAME,
+    on_success=on_success,
+    on_error=on_error,
+    max_wait_time=0.5,
+)
+
+start_time = time.time()
+with producer:
+    for i in range(1000):
+        # The events of a partition key are sent in order, in batches as large as possible.
+        producer.send_event(EventData('Message {}'.format(i)), partition_key='device{}'.format(i % 4))
+    # The buffered events are sent before the producer is closed.
+print("Send messages in {} seconds.".format(time.time() - start_time))
@@ -0,0 +1,133 @@
+# --------------------------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for license information.
+# --------------------------------------------------------------------------------------------
+
+"""Simulates EventProcessor load balancing against an in-memory checkpoint store and reports
+how long it takes a group of processors to converge to a balanced partition assignment.
+
+No Event Hub or storage account is needed. Each round every processor runs one load-balancing
+pass in random order, so the convergence time is the number of rounds multiplied by the
+load-balancing interval.
+"""
+
+import argparse
+import copy
+import random
+import time
+from collections import Counter
+
+from azure.eventhub._eventprocessor.ownership_manager import OwnershipManager
+from azure.eventhub._eventprocessor.in_memory_checkpoint_store import InMemoryCheckpointStore
+
+NAMESPACE = "simulated.servicebus.windows.net"
+EVENTHUB_NAME = "simulated"
+CONSUMER_GROUP = "$default"
+
+
+class SimulatedAddress(object):
+    hostname = NAMESPACE
+
+
+class SimulatedEventHubClient(object):
+    def __init__(self, partition_count):
+        self._address = SimulatedAddress()
+        self.eventhub_name = EVENTHUB_NAME
+        self._partition_ids = [str(i) for i in range(partition_count)]
+
+    def get_partition_ids(self):
+        return self._partition_ids
+
+
+class SimulatedCheckpointStore(InMemoryCheckpointStore):
+    """Returns copies of the stored ownership like a remote store would and counts the claim requests."""
+
+    def __init__(self):
+        super(SimulatedCheckpointStore, self).__init__()
+        self.claim_requests = 0
+
+    def list_ownership(self, fully_qualified_namespace, eventhub_name, consumer_group):
+        return copy.deepcopy(
+            super(SimulatedCheckpointStore, self).list_ownership(
+                fully_qualified_namespace, eventhub_name, consumer_group
+            )
+        )
+
+    def claim_ownership(self, ownership_list):
+        ownership_list = list(ownership_list)
+        self.claim_requests += len(ownership_list)
+        return copy.deepcopy(super(SimulatedCheckpointStore, self).claim_ownership(ownership_list))
+
+
+def is_balanced(checkpoint_store, partition_count, owner_ids):
+    ownership_list = checkpoint_store.list_ownership(NAMESPACE, EVENTHUB_NAME, CONSUMER_GROUP)
+    owned = Counter(o["owner_id"] for o in ownership_list if o["owner_id"])
+    if sum(owned.values()) != partition_count or set(owned) != set(owner_ids):
+        return False
+    return max(owned.values()) - min(owned.values()) <= 1
+
+
+def simulate(partition_count, initial_instances, total_instances, ownership_timeout, max_rounds):
+    checkpoint_store = SimulatedCheckpointStore()
+    client = SimulatedEventHubClient(partition_count)
+    managers = []
+
+    def add_managers(count):
+        for _ in range(count):
+            owner_id = "processor-{}".format(len(managers))
+            managers.append(
+                OwnershipManager(client, CONSUMER_GROUP, owner_id, checkpoint_store, ownership_timeout, None)
+            )
+
+    add_managers(initial_instances)
+    for _ in range(max_rounds):
+        for manager in random.sample(managers, len(managers)):
+            manager.claim_ownership()
+        if is_balanced(checkpoint_store, partition_count, [m.owner_id for m in managers]):
+            break
+    add_managers(total_instances - initial_instances)  # a deploy scales the group out
+
+    checkpoint_store.claim_requests = 0
+    start = time.time()
+    for rounds in range(1, max_rounds + 1):
+        for manager in random.sample(managers, len(managers)):
+            manager.claim_ownership()
+        if is_balanced(checkpoint_store, partition_count, [m.owner_id for m in managers]):
+            return rounds, checkpoint_store.claim_requests, time.time() - start
+    return None, checkpoint_store.claim_requests, time.time() - start
+
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--partitions", help="Number of partitions of the event hub", type=int, default=32)
+parser.add_argument("--initial_instances", help="Number of processors before scaling out", type=int, default=1)
+parser.add_argument("--instances", help="Number of processors after scaling out", type=int, default=8)
+parser.add_argument("--load_balancing_interval", help="Seconds between load-balancing passes", type=float,
+                    default=10)
+parser.add_argument("--ownership_timeout", type=float, default=60)
+parser.add_argument("--max_rounds", type=int, default=1000)
+parser.add_argument("--runs", help="Number of simulations to average", type=int, default=20)
+
+args = parser.parse_args()
+
+
+def run():
+    results = [
+        simulate(args.partitions, args.initial_instances, args.instances, args.ownership_timeout, args.max_rounds)
+        for _ in range(args.runs)
+    ]
+    converged = [r for r in results if r[0] is not None]
+    print("{} of {} simulations converged within {} rounds".format(len(converged), args.runs, args.max_rounds))
+    if converged:
+        rounds = [r[0] for r in converged]
+        print("rounds to converge: avg {:.2f}, max {}".format(sum(rounds) / float(len(rounds)), max(rounds)))
+        print("simulated convergence time: avg {:.1f}s, max {:.1f}s".format(
+            args.load_balancing_interval * sum(rounds) / float(len(rounds)),
+            args.load_balancing_interval * max(rounds)))
+        print("ownership claims per simulation: avg {:.1f}".format(
+            sum(r[1] for r in converged) / float(len(converged))))
+        print("computation time per simulation: avg {:.4f}s".format(
+            sum(r[2] for r in converged) / float(len(converged))))
+
+
+if __name__ == '__main__':
+    run()
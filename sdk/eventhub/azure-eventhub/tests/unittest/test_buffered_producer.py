@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+
+from azure.eventhub import EventData
+from azure.eventhub import EventHubBufferedProducerClient
+from azure.eventhub._constants import ALL_PARTITIONS
+from azure.eventhub.exceptions import ClientClosedError, EventDataSendError, OperationTimeoutError
+
+CONN_STR = "Endpoint=sb://test.servicebus.windows.net/;SharedAccessKeyName=key;SharedAccessKey=secret;EntityPath=hub"
+
+
+class MockProducer(object):
+
+    def __init__(self, sent, partition_id, latency=0.0, error=None):
+        self.sent = sent
+        self.partition_id = partition_id
+        self.latency = latency
+        self.error = error
+        self.closed = False
+
+    def send(self, batch, timeout=None):
+        time.sleep(self.latency)
+        if self.error:
+            raise self.error
+        self.sent.append((self.partition_id, batch._partition_key, [e.body_as_str() for e in batch.message._body_gen]))
+
+    def close(self):
+        self.closed = True
+
+
+class Callbacks(object):
+
+    def __init__(self):
+        self.succeeded = []
+        self.failed = []
+        self._lock = threading.Lock()
+
+    def on_success(self, events, partition_id):
+        with self._lock:
+            self.succeeded.append((partition_id, [e.body_as_str() for e in events]))
+
+    def on_error(self, events, partition_id, error):
+        with self._lock:
+            self.failed.append((partition_id, [e.body_as_str() for e in events], error))
+
+
+def _create_client(callbacks, max_message_size=1024, latency=0.0, error=None, **kwargs):
+    client = EventHubBufferedProducerClient.from_connection_string(
+        CONN_STR, on_success=callbacks.on_success, on_error=callbacks.on_error, **kwargs)
+    client._max_message_size_on_link = max_message_size
+    client.sent = []
+    client._producers = {
+        pid: MockProducer(client.sent, pid, latency, error) for pid in (ALL_PARTITIONS, "0", "1")
+    }
+    client._partition_ids = ["0", "1"]
+    return client
+
+
+def test_buffered_send_flushes_full_and_due_batches():
+    callbacks = Callbacks()
+    client = _create_client(callbacks, max_message_size=128, max_wait_time=0.1)
+    for i in range(10):
+        client.send_event(EventData("event{}".format(i)), partition_id="0")
+    client.send_event(EventData("keyed"), partition_key="key")
+
+    deadline = time.time() + 5
+    while client.buffered_event_count and time.time() < deadline:
+        time.sleep(0.01)
+    client.close()
+
+    events = [e for pid, _, batch in client.sent if pid == "0" for e in batch]
+    assert events == ["event{}".format(i) for i in range(10)]
+    # the events were sent in several batches of the size limit
+    assert len([s for s in client.sent if s[0] == "0"]) > 1
+    assert (ALL_PARTITIONS, "key", ["keyed"]) in client.sent
+    assert sorted(e for _, batch in callbacks.succeeded for e in batch) == sorted(
+        ["event{}".format(i) for i in range(10)] + ["keyed"])
+    assert not callbacks.failed
+
+
+def test_buffered_send_flush_and_close():
+    callbacks = Callbacks()
+    client = _create_client(callbacks, max_wait_time=None)
+    client.send_batch([EventData("a"), EventData("b")], partition_id="1")
+    time.sleep(0.05)
+    # without max_wait_time, the batch isn't full so it waits for a flush
+    assert client.sent == []
+    assert client.buffered_event_count == 2
+
+    client.flush(timeout=5)
+    assert client.sent == [("1", None, ["a", "b"])]
+    assert client.buffered_event_count == 0
+
+    client.send_event(EventData("c"), partition_id="1")
+    client.close(flush=False)
+    assert callbacks.failed[0][:2] == ("1", ["c"])
+    assert isinstance(callbacks.failed[0][2], ClientClosedError)
+    with pytest.raises(ClientClosedError):
+        client.send_event(EventData("d"))
+
+
+def test_buffered_send_backpressure_and_errors():
+    callbacks = Callbacks()
+    error = EventDataSendError("send failed")
+    client = _create_client(callbacks, latency=0.2, error=error, max_buffer_length=1, max_wait_time=0)
+    client.send_event(EventData("a"), partition_id="0")
+    # the buffer is full until the first event was sent
+    with pytest.raises(OperationTimeoutError):
+        client.send_event(EventData("b"), partition_id="0", timeout=0.05)
+    client.close()
+
+    assert callbacks.failed == [("0", ["a"], error)]
+    assert not callbacks.succeeded
+
+
+def test_on_error_is_required():
+    with pytest.raises(TypeError):
+        EventHubBufferedProducerClient.from_connection_string(CONN_STR)
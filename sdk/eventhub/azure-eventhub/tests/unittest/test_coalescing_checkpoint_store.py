@@ -0,0 +1,121 @@
+import time
+import pytest
+
+from azure.eventhub._eventprocessor.in_memory_checkpoint_store import InMemoryCheckpointStore
+from azure.eventhub._eventprocessor.coalescing_checkpoint_store import CoalescingCheckpointStore
+
+TEST_NAMESPACE = "test_namespace"
+TEST_EVENTHUB = "test_eventhub"
+TEST_CONSUMER_GROUP = "test_consumer_group"
+
+
+class RecordingCheckpointStore(InMemoryCheckpointStore):
+    def __init__(self):
+        super(RecordingCheckpointStore, self).__init__()
+        self.updates = []
+        self.error = None
+
+    def update_checkpoint(self, checkpoint):
+        if self.error:
+            raise self.error
+        self.updates.append((checkpoint["partition_id"], checkpoint["sequence_number"]))
+        return super(RecordingCheckpointStore, self).update_checkpoint(checkpoint)
+
+
+def _checkpoint(partition_id, sequence_number):
+    return {
+        "fully_qualified_namespace": TEST_NAMESPACE,
+        "eventhub_name": TEST_EVENTHUB,
+        "consumer_group": TEST_CONSUMER_GROUP,
+        "partition_id": partition_id,
+        "offset": str(sequence_number * 100),
+        "sequence_number": sequence_number,
+    }
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_coalescing_requires_a_flush_policy():
+    with pytest.raises(ValueError):
+        CoalescingCheckpointStore(RecordingCheckpointStore())
+
+
+def test_coalescing_flush_on_event_count():
+    store = RecordingCheckpointStore()
+    coalescing_store = CoalescingCheckpointStore(store, flush_event_count=10)
+    try:
+        for sequence_number in range(9):
+            coalescing_store.update_checkpoint(_checkpoint("0", sequence_number))
+        time.sleep(0.1)
+        assert store.updates == []
+        coalescing_store.update_checkpoint(_checkpoint("0", 9))
+        assert _wait_for(lambda: store.updates == [("0", 9)])
+        coalescing_store.update_checkpoint(_checkpoint("0", 15))
+        time.sleep(0.1)
+        assert store.updates == [("0", 9)]
+    finally:
+        coalescing_store.close()
+
+
+def test_coalescing_flush_on_interval():
+    store = RecordingCheckpointStore()
+    coalescing_store = CoalescingCheckpointStore(store, flush_interval=0.2)
+    try:
+        coalescing_store.update_checkpoint(_checkpoint("0", 1))
+        coalescing_store.update_checkpoint(_checkpoint("0", 2))
+        coalescing_store.update_checkpoint(_checkpoint("1", 5))
+        assert store.updates == []
+        assert _wait_for(lambda: len(store.updates) == 2)
+        assert sorted(store.updates) == [("0", 2), ("1", 5)]
+    finally:
+        coalescing_store.close()
+
+
+def test_coalescing_list_checkpoints_and_flush_partition():
+    store = RecordingCheckpointStore()
+    coalescing_store = CoalescingCheckpointStore(store, flush_interval=60)
+    try:
+        store.update_checkpoint(_checkpoint("0", 1))
+        coalescing_store.update_checkpoint(_checkpoint("1", 7))
+        checkpoints = coalescing_store.list_checkpoints(TEST_NAMESPACE, TEST_EVENTHUB, TEST_CONSUMER_GROUP)
+        assert sorted((x["partition_id"], x["sequence_number"]) for x in checkpoints) == [("0", 1), ("1", 7)]
+
+        coalescing_store.update_checkpoint(_checkpoint("0", 3))
+        coalescing_store.flush("1")
+        assert store.updates == [("0", 1), ("1", 7)]
+        coalescing_store.flush()
+        assert store.updates == [("0", 1), ("1", 7), ("0", 3)]
+    finally:
+        coalescing_store.close()
+
+
+def test_coalescing_keeps_checkpoint_when_flush_fails():
+    store = RecordingCheckpointStore()
+    coalescing_store = CoalescingCheckpointStore(store, flush_interval=60)
+    try:
+        coalescing_store.update_checkpoint(_checkpoint("0", 1))
+        store.error = ValueError("storage unavailable")
+        with pytest.raises(ValueError):
+            coalescing_store.flush("0")
+        store.error = None
+        coalescing_store.flush("0")
+        assert store.updates == [("0", 1)]
+    finally:
+        coalescing_store.close()
+
+
+def test_coalescing_flush_on_interval_after_idle():
+    store = RecordingCheckpointStore()
+    coalescing_store = CoalescingCheckpointStore(store, flush_interval=0.2, flush_event_count=5)
+    try:
+        coalescing_store.update_checkpoint(_checkpoint("0", 4))
+        assert _wait_for(lambda: store.updates == [("0", 4)])
+        coalescing_store.update_checkpoint(_checkpoint("0", 6))
+        assert _wait_for(lambda: store.updates == [("0", 4), ("0", 6)])
+    finally:
+        coalescing_store.close()
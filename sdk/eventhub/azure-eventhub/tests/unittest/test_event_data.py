@@ -7,7 +7,7 @@ from azure.eventhub import _common
 pytestmark = pytest.mark.skipif(platform.python_implementation() == "PyPy", reason="This is ignored for PyPy")
 
 
-from azure.eventhub import EventData, EventDataBatch
+from azure.eventhub import EventData, EventDataBatch, ColumnarEventDataBatch
 
 
 @pytest.mark.parametrize("test_input, expected_result",
@@ -105,3 +105,49 @@ def test_event_data_batch():
         assert batch.size_in_bytes == 89 and len(batch) == 1
     with pytest.raises(ValueError):
         batch.add(EventData("A"))
+
+
+def test_event_data_from_message_is_lazy():
+    message = uamqp.Message(b"body")
+    message.annotations = {_common.PROP_OFFSET: b"100", _common.PROP_SEQ_NUMBER: 5, _common.PROP_TIMESTAMP: 1000}
+    ed = EventData._from_message(message)
+    assert ed.message is message
+    assert ed.body_as_str() == "body"
+    assert ed.offset == "100"
+    assert ed.sequence_number == 5
+    assert ed.enqueued_time == _common.utc_from_timestamp(1)
+    message.annotations = {}
+    assert ed.offset == "100"  # cached on first access
+    assert isinstance(ed, EventData)
+    ed.custom_attribute = 1  # received events stay as open as EventData
+    assert ed.custom_attribute == 1
+    assert "message" not in vars(ed)
+
+
+def test_columnar_event_data_batch():
+    messages = []
+    for i in range(3):
+        message = uamqp.Message(b"body" + str(i).encode())
+        message.annotations = {_common.PROP_OFFSET: str(i * 10).encode(), _common.PROP_SEQ_NUMBER: i}
+        messages.append(message)
+    batch = ColumnarEventDataBatch(messages)
+    assert len(batch) == 3
+    assert repr(batch) == "ColumnarEventDataBatch(count=3)"
+    assert [bytes(body) for body in batch.bodies] == [b"body0", b"body1", b"body2"]
+    assert all(isinstance(body, memoryview) for body in batch.bodies)
+    assert batch.offsets == ("0", "10", "20")
+    assert batch.sequence_numbers == (0, 1, 2)
+    assert batch[1].body_as_str() == "body1"
+    assert [ed.sequence_number for ed in batch[1:]] == [1, 2]
+    assert [ed.offset for ed in batch] == ["0", "10", "20"]
+
+    empty = ColumnarEventDataBatch()
+    assert len(empty) == 0 and empty.bodies == () and list(empty) == []
+
+
+def test_columnar_event_data_batch_multiple_data_sections():
+    message = uamqp.Message(b"a")
+    message._body.append(b"b")  # pylint: disable=protected-access
+    batch = ColumnarEventDataBatch([message])
+    assert bytes(batch.bodies[0]) == b"ab"
+    assert batch.offsets == (None,)
@@ -0,0 +1,94 @@
+import time
+from collections import Counter
+
+from azure.eventhub._eventprocessor.ownership_manager import OwnershipManager
+from azure.eventhub._eventprocessor.in_memory_checkpoint_store import InMemoryCheckpointStore
+
+TEST_NAMESPACE = "test_namespace"
+TEST_EVENTHUB = "test_eventhub"
+TEST_CONSUMER_GROUP = "test_consumer_group"
+
+
+class MockAddress(object):
+    hostname = TEST_NAMESPACE
+
+
+class MockEventHubClient(object):
+    def __init__(self, partition_count):
+        self._address = MockAddress()
+        self.eventhub_name = TEST_EVENTHUB
+        self._partition_ids = [str(i) for i in range(partition_count)]
+
+    def get_partition_ids(self):
+        return self._partition_ids
+
+
+def _ownership(partition_id, owner_id, last_modified_time=None):
+    return {
+        "fully_qualified_namespace": TEST_NAMESPACE,
+        "eventhub_name": TEST_EVENTHUB,
+        "consumer_group": TEST_CONSUMER_GROUP,
+        "partition_id": partition_id,
+        "owner_id": owner_id,
+        "etag": "etag-{}".format(partition_id),
+        "last_modified_time": time.time() if last_modified_time is None else last_modified_time,
+    }
+
+
+def _ownership_manager(owner_id, partition_count=32, checkpoint_store=None):
+    manager = OwnershipManager(
+        MockEventHubClient(partition_count), TEST_CONSUMER_GROUP, owner_id, checkpoint_store, 60, None
+    )
+    manager._initializing = False
+    return manager
+
+
+def test_balance_claims_whole_deficit_by_stealing():
+    manager = _ownership_manager("new")
+    all_partition_ids = [str(i) for i in range(32)]
+    ownership_list = [_ownership(pid, "owner_{}".format(int(pid) % 7)) for pid in all_partition_ids]
+
+    to_claim = manager._balance_ownership(ownership_list, all_partition_ids)
+
+    assert len(to_claim) == 4
+    assert all(o["owner_id"] == "new" for o in to_claim)
+    remaining = Counter(o["owner_id"] for o in ownership_list if o["owner_id"] != "new")
+    assert sorted(remaining.values()) == [4, 4, 4, 4, 4, 4, 4]
+
+
+def test_balance_prefers_released_and_expired_partitions():
+    manager = _ownership_manager("new", partition_count=8)
+    all_partition_ids = [str(i) for i in range(8)]
+    ownership_list = [_ownership(pid, "old") for pid in all_partition_ids[:4]]
+    ownership_list += [_ownership(pid, "gone", last_modified_time=0) for pid in all_partition_ids[4:6]]
+    ownership_list += [_ownership(pid, "") for pid in all_partition_ids[6:]]
+
+    to_claim = manager._balance_ownership(ownership_list, all_partition_ids)
+
+    assert sorted(o["partition_id"] for o in to_claim) == all_partition_ids[4:]
+    assert all(o["owner_id"] == "old" for o in ownership_list[:4])
+
+
+def test_balance_keeps_balanced_ownership():
+    manager = _ownership_manager("owner_0", partition_count=10)
+    all_partition_ids = [str(i) for i in range(10)]
+    ownership_list = [_ownership(pid, "owner_{}".format(int(pid) % 3)) for pid in all_partition_ids]
+
+    to_claim = manager._balance_ownership(ownership_list, all_partition_ids)
+
+    assert sorted(o["partition_id"] for o in to_claim) == ["0", "3", "6", "9"]
+    assert Counter(o["owner_id"] for o in ownership_list) == Counter(owner_0=4, owner_1=3, owner_2=3)
+
+
+def test_load_balancing_converges_in_one_round_per_instance():
+    checkpoint_store = InMemoryCheckpointStore()
+    first = _ownership_manager("owner_0", checkpoint_store=checkpoint_store)
+    first._initializing = True
+    assert len(first.claim_ownership()) == 32
+
+    managers = [first] + [_ownership_manager("owner_{}".format(i), checkpoint_store=checkpoint_store)
+                          for i in range(1, 8)]
+    for manager in managers[1:]:
+        manager.claim_ownership()
+    for manager in managers:
+        assert len(manager.claim_ownership()) == 4
@@ -0,0 +1,74 @@
+import pytest
+
+from azure.eventhub import EventHubProducerClient
+from azure.eventhub._partition_resolver import compute_hash, get_partition_index_for_key, get_partition_for_key
+
+CONN_STR = "Endpoint=sb://test.servicebus.windows.net/;SharedAccessKeyName=key;SharedAccessKey=secret;EntityPath=hub"
+
+
+@pytest.mark.parametrize("data, seed1, seed2, expected", [
+    # The self-test vectors of lookup3.c
+    (b"", 0, 0, (0xdeadbeef, 0xdeadbeef)),
+    (b"", 0, 0xdeadbeef, (0xbd5b7dde, 0xdeadbeef)),
+    (b"", 0xdeadbeef, 0xdeadbeef, (0x9c093ccd, 0xbd5b7dde)),
+])
+def test_compute_hash(data, seed1, seed2, expected):
+    assert compute_hash(data, seed1, seed2) == expected
+
+
+@pytest.mark.parametrize("seed, expected", [(0, 0x17770551), (1, 0xcd628161)])
+def test_compute_hash_primary(seed, expected):
+    assert compute_hash(b"Four score and seven years ago", seed)[0] == expected
+
+
+@pytest.mark.parametrize("length", range(0, 30))
+def test_compute_hash_every_tail_length(length):
+    # The tail is zero padded internally, but the length is part of the hash
+    data = bytes(bytearray(range(1, length + 1)))
+    assert compute_hash(data) != compute_hash(data + b"\x00")
+
+
+@pytest.mark.parametrize("partition_key, partition_count, expected", [
+    ("7", 32, 15263 % 32),  # the service hashes "7" to -15263
+    ("7", 4, 15263 % 4),
+    ("", 32, 0),
+])
+def test_partition_index_for_key(partition_key, partition_count, expected):
+    assert get_partition_index_for_key(partition_key, partition_count) == expected
+    assert get_partition_index_for_key(partition_key.encode("utf-8"), partition_count) == expected
+
+
+def test_partition_index_for_key_distribution():
+    counts = [0] * 8
+    for i in range(8000):
+        counts[get_partition_index_for_key("key-{}".format(i), 8)] += 1
+    assert min(counts) > 800
+
+
+def test_partition_index_for_key_invalid_count():
+    with pytest.raises(ValueError):
+        get_partition_index_for_key("key", 0)
+
+
+def test_partition_for_key_sorts_partition_ids():
+    partition_ids = [str(i) for i in range(12)]
+    expected = str(get_partition_index_for_key("7", 12))
+    assert get_partition_for_key("7", partition_ids) == expected
+    assert get_partition_for_key("7", sorted(partition_ids)) == expected
+
+
+def test_producer_client_get_partition_for_key():
+    client = EventHubProducerClient.from_connection_string(CONN_STR)
+    calls = []
+
+    def get_partition_ids():
+        calls.append(1)
+        return [str(i) for i in range(32)]
+
+    client.get_partition_ids = get_partition_ids
+    try:
+        assert client.get_partition_for_key("7") == str(15263 % 32)
+        assert client.get_partition_for_key("") == "0"
+        assert len(calls) == 1
+    finally:
+        client.close()
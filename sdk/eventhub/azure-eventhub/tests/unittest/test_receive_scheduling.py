@@ -0,0 +1,142 @@
+import time
+import threading
+from collections import defaultdict
+
+import pytest
+
+from azure.eventhub._eventprocessor.event_processor import EventProcessor
+from azure.eventhub._eventprocessor.receive_budget import ReceiveBudget
+
+
+def test_receive_budget_global_limit():
+    budget = ReceiveBudget(max_events=4)
+    budget.register("0")
+    budget.register("1")
+    budget.acquire("0", 2, 0)
+    budget.acquire("1", 1, 0)
+    assert budget.can_receive("0")
+    budget.acquire("1", 1, 0)
+    assert budget.in_flight_events == 4
+    assert not budget.can_receive("0")
+    assert not budget.can_receive("1")
+    budget.release("0", 1, 0)
+    assert budget.can_receive("0")
+    assert budget.can_receive("1")
+
+
+def test_receive_budget_fair_share():
+    budget = ReceiveBudget(max_events=8, max_bytes=800)
+    for partition_id in ("0", "1", "2", "3"):
+        budget.register(partition_id)
+    budget.acquire("0", 8, 100)
+    assert not budget.can_receive("0")
+    assert budget.can_receive("1")  # below its share of 2 events
+    budget.acquire("1", 1, 700)
+    assert not budget.can_receive("1")  # above its share of 200 bytes
+    assert budget.can_receive("2")
+
+
+def test_receive_budget_unregister_gives_back_usage():
+    budget = ReceiveBudget(max_bytes=100)
+    budget.register("0")
+    budget.acquire("0", 3, 150)
+    budget.unregister("0")
+    assert budget.in_flight_events == 0
+    assert budget.in_flight_bytes == 0
+    budget.release("0", 3, 150)  # late release of a closed consumer is ignored
+    assert budget.in_flight_bytes == 0
+
+
+def test_receive_budget_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        ReceiveBudget(max_events=0)
+    with pytest.raises(ValueError):
+        ReceiveBudget(max_bytes=-1)
+
+
+class MockAddress(object):
+    hostname = "test_namespace"
+
+
+class MockConsumer(object):
+    def __init__(self, partition_id, on_event_received, tracker):
+        self.stop = False
+        self._partition_id = partition_id
+        self._on_event_received = on_event_received
+        self._tracker = tracker
+
+    def receive(self, batch, max_batch_size, max_wait_time):
+        self._tracker.enter(self._partition_id)
+        try:
+            time.sleep(0.01)
+            self._on_event_received(None)
+        finally:
+            self._tracker.exit(self._partition_id)
+
+    def close(self):
+        pass
+
+
+class ReceiveTracker(object):
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = set()
+        self.overlapped = False
+        self.threads = set()
+        self.receive_count = defaultdict(int)
+        self.max_concurrency = 0
+
+    def enter(self, partition_id):
+        with self.lock:
+            if partition_id in self.active:
+                self.overlapped = True
+            self.active.add(partition_id)
+            self.threads.add(threading.current_thread().name)
+            self.receive_count[partition_id] += 1
+            self.max_concurrency = max(self.max_concurrency, len(self.active))
+
+    def exit(self, partition_id):
+        with self.lock:
+            self.active.discard(partition_id)
+
+
+class MockEventHubClient(object):
+    def __init__(self, partition_count, tracker):
+        self._address = MockAddress()
+        self.eventhub_name = "test_eventhub"
+        self._partition_count = partition_count
+        self._tracker = tracker
+
+    def get_partition_ids(self):
+        return [str(i) for i in range(self._partition_count)]
+
+    def _create_consumer(self, consumer_group, partition_id, event_position, on_event_received, **kwargs):
+        return MockConsumer(partition_id, on_event_received, self._tracker)
+
+
+def test_event_processor_receive_workers():
+    tracker = ReceiveTracker()
+    event_processor = EventProcessor(
+        MockEventHubClient(8, tracker),
+        "$default",
+        lambda partition_context, event: None,
+        max_receive_workers=3,
+        load_balancing_interval=0.1,
+    )
+    thread = threading.Thread(target=event_processor.start)
+    thread.start()
+    time.sleep(1)
+    event_processor.stop()
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert not tracker.overlapped
+    assert len(tracker.threads) == 3
+    assert tracker.max_concurrency <= 3
+    assert sorted(tracker.receive_count) == [str(i) for i in range(8)]
+    assert min(tracker.receive_count.values()) >= max(tracker.receive_count.values()) // 2
+
+
+def test_event_processor_rejects_invalid_receive_workers():
+    with pytest.raises(ValueError):
+        EventProcessor(MockEventHubClient(1, ReceiveTracker()), "$default", lambda *args: None, max_receive_workers=0)
@@ -0,0 +1,166 @@
+import multiprocessing
+import sqlite3
+import threading
+
+import pytest
+
+from azure.eventhub import SqliteCheckpointStore
+from azure.eventhub._eventprocessor.coalescing_checkpoint_store import CoalescingCheckpointStore
+
+TEST_NAMESPACE = "test_namespace"
+TEST_EVENTHUB = "test_eventhub"
+TEST_CONSUMER_GROUP = "test_consumer_group"
+
+
+def _ownership(partition_id, owner_id, etag=None):
+    ownership = {
+        "fully_qualified_namespace": TEST_NAMESPACE,
+        "eventhub_name": TEST_EVENTHUB,
+        "consumer_group": TEST_CONSUMER_GROUP,
+        "partition_id": partition_id,
+        "owner_id": owner_id,
+    }
+    if etag is not None:
+        ownership["etag"] = etag
+    return ownership
+
+
+def _checkpoint(partition_id, sequence_number):
+    return {
+        "fully_qualified_namespace": TEST_NAMESPACE,
+        "eventhub_name": TEST_EVENTHUB,
+        "consumer_group": TEST_CONSUMER_GROUP,
+        "partition_id": partition_id,
+        "offset": str(sequence_number * 100),
+        "sequence_number": sequence_number,
+    }
+
+
+def _list_ownership(store):
+    return {x["partition_id"]: x for x in store.list_ownership(TEST_NAMESPACE, TEST_EVENTHUB, TEST_CONSUMER_GROUP)}
+
+
+def _claim_all(args):
+    path, owner_id, partition_count = args
+    with SqliteCheckpointStore(path) as store:
+        claimed = store.claim_ownership([_ownership(str(i), owner_id) for i in range(partition_count)])
+        return [x["partition_id"] for x in claimed]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "checkpoints.db")
+
+
+def test_database_is_in_wal_mode(db_path):
+    SqliteCheckpointStore(db_path).close()
+    connection = sqlite3.connect(db_path)
+    try:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    finally:
+        connection.close()
+
+
+def test_claim_ownership(db_path):
+    with SqliteCheckpointStore(db_path) as store:
+        claimed = store.claim_ownership([_ownership("0", "owner1"), _ownership("1", "owner1")])
+        assert sorted(x["partition_id"] for x in claimed) == ["0", "1"]
+        assert all(x["etag"] == "1" and x["last_modified_time"] for x in claimed)
+
+        # Claiming a partition without an etag fails once somebody owns it.
+        assert store.claim_ownership([_ownership("0", "owner2")]) == []
+
+        ownership = _list_ownership(store)
+        assert ownership["0"]["owner_id"] == "owner1"
+        claimed = store.claim_ownership([_ownership("0", "owner2", etag=ownership["0"]["etag"])])
+        assert [(x["owner_id"], x["etag"]) for x in claimed] == [("owner2", "2")]
+
+        # The etag that owner1 listed before is stale now.
+        assert store.claim_ownership([_ownership("0", "owner1", etag="1")]) == []
+        assert store.claim_ownership([_ownership("0", "owner1", etag="not-a-version")]) == []
+        assert _list_ownership(store)["0"]["owner_id"] == "owner2"
+
+
+def test_state_survives_reopening(db_path):
+    with SqliteCheckpointStore(db_path) as store:
+        store.claim_ownership([_ownership("0", "owner1")])
+        store.update_checkpoint(_checkpoint("0", 10))
+    with SqliteCheckpointStore(db_path) as store:
+        assert _list_ownership(store)["0"]["owner_id"] == "owner1"
+        assert list(store.list_checkpoints(TEST_NAMESPACE, TEST_EVENTHUB, TEST_CONSUMER_GROUP)) == [
+            _checkpoint("0", 10)
+        ]
+
+
+def test_update_checkpoints_is_transactional(db_path):
+    with SqliteCheckpointStore(db_path) as store:
+        store.update_checkpoints([_checkpoint("0", 1), _checkpoint("1", 2)])
+        store.update_checkpoint(_checkpoint("0", 3))
+        bad_checkpoint = _checkpoint("2", 4)
+        del bad_checkpoint["sequence_number"]
+        with pytest.raises(KeyError):
+            store.update_checkpoints([_checkpoint("1", 5), bad_checkpoint])
+        with pytest.raises(sqlite3.IntegrityError):
+            store.update_checkpoints([_checkpoint("1", 5), dict(_checkpoint("2", 4), partition_id=None)])
+        checkpoints = store.list_checkpoints(TEST_NAMESPACE, TEST_EVENTHUB, TEST_CONSUMER_GROUP)
+        assert sorted((x["partition_id"], x["sequence_number"]) for x in checkpoints) == [("0", 3), ("1", 2)]
+        assert store.list_checkpoints(TEST_NAMESPACE, TEST_EVENTHUB, "other_consumer_group") == []
+
+
+def test_error_raised_after_rollback_by_sqlite(db_path):
+    with SqliteCheckpointStore(db_path) as store:
+        # SQLite ends the transaction by itself after some errors, the original error is still raised
+        with pytest.raises(ValueError):
+            with store._transaction() as connection:
+                connection.execute("ROLLBACK")
+                raise ValueError("failed in the transaction")
+        store.update_checkpoint(_checkpoint("0", 1))
+        assert len(store.list_checkpoints(TEST_NAMESPACE, TEST_EVENTHUB, TEST_CONSUMER_GROUP)) == 1
+
+
+def test_concurrent_claims_from_threads(db_path):
+    stores = [SqliteCheckpointStore(db_path) for _ in range(4)]
+    results = {}
+
+    def claim(index):
+        claimed = stores[index].claim_ownership([_ownership(str(i), "owner{}".format(index)) for i in range(8)])
+        results[index] = [x["partition_id"] for x in claimed]
+
+    threads = [threading.Thread(target=claim, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for store in stores:
+        store.close()
+    # Every partition is claimed by exactly one of the processors.
+    assert sorted(sum(results.values(), [])) == sorted(str(i) for i in range(8))
+
+
+def test_concurrent_claims_from_processes(db_path):
+    SqliteCheckpointStore(db_path).close()
+    pool = multiprocessing.Pool(3)
+    try:
+        results = pool.map(_claim_all, [(db_path, "owner{}".format(i), 8) for i in range(3)])
+    finally:
+        pool.close()
+        pool.join()
+    assert sorted(sum(results, [])) == sorted(str(i) for i in range(8))
+
+
+def test_coalescing_store_writes_one_transaction(db_path):
+    updates = []
+
+    class RecordingSqliteCheckpointStore(SqliteCheckpointStore):
+        def update_checkpoints(self, checkpoints):
+            updates.append([x["partition_id"] for x in checkpoints])
+            return super(RecordingSqliteCheckpointStore, self).update_checkpoints(checkpoints)
+
+    with RecordingSqliteCheckpointStore(db_path) as store:
+        coalescing_store = CoalescingCheckpointStore(store, flush_interval=60)
+        for partition_id in ("0", "1", "2"):
+            coalescing_store.update_checkpoint(_checkpoint(partition_id, 1))
+        coalescing_store.flush()
+        coalescing_store.close()
+        assert [sorted(x) for x in updates] == [["0", "1", "2"]]
+        assert len(store.list_checkpoints(TEST_NAMESPACE, TEST_EVENTHUB, TEST_CONSUMER_GROUP)) == 3
@@ -13,6 +13,7 @@ from ._container_client import ContainerClient
 from ._blob_service_client import BlobServiceClient
 from ._lease import BlobLeaseClient
 from ._download import StorageStreamDownloader
+from ._blob_cache import BlobCache
 from ._shared_access_signature import generate_account_sas, generate_container_sas, generate_blob_sas
 from ._shared.policies import ExponentialRetry, LinearRetry
 from ._shared.response_handlers import PartialBatchErrorException
@@ -200,6 +201,7 @@ __all__ = [
     'ResourceTypes',
     'AccountSasPermissions',
     'StorageStreamDownloader',
+    'BlobCache',
     'CustomerProvidedEncryptionKey',
     'RehydratePriority',
     'generate_account_sas',
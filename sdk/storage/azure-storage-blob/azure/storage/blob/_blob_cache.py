@@ -0,0 +1,338 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import (  # pylint: disable=unused-import
+    Optional, Any, Dict, List, Tuple,
+    TYPE_CHECKING
+)
+
+from azure.core import MatchConditions
+from azure.core.exceptions import HttpResponseError, ResourceModifiedError
+
+from ._shared.response_handlers import parse_length_from_content_range
+
+if TYPE_CHECKING:
+    from ._blob_client import BlobClient
+
+
+# os.replace is not available on Python 2, where os.rename already replaces the target on POSIX.
+_replace = getattr(os, 'replace', os.rename)
+
+
+def _contiguous_runs(indexes):
+    # type: (List[int]) -> List[Tuple[int, int]]
+    """Group sorted block indexes into (first, count) runs of adjacent blocks."""
+    runs = []  # type: List[Tuple[int, int]]
+    for index in indexes:
+        if runs and runs[-1][0] + runs[-1][1] == index:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((index, 1))
+    return runs
+
+
+class BlobCache(object):
+    """A read-through cache of blob content on the local disk.
+
+    Blob content is stored in blocks that are named by the SHA-256 of their content,
+    so identical blocks are stored once, and a small entry per blob records its ETag,
+    size and blocks. All files are written atomically, so one cache directory can be
+    shared by every process on a machine. When the cache grows over its size limit,
+    the least recently used files are evicted.
+
+    A cached blob is revalidated with a conditional (If-None-Match) GET of the first
+    block being read, which refreshes the cache when the blob has changed. Within
+    `max_age` seconds of the last validation, the cached content is used without
+    contacting the service. Missing blocks are downloaded with If-Match on the cached
+    ETag, so cached and downloaded blocks always belong to the same version of the blob.
+
+    Client-side encryption is not supported.
+
+    :param str path:
+        The directory holding the cache. It will be created if it does not exist.
+    :param int max_size:
+        The maximum size in bytes of the cached data. Defaults to 1 GiB.
+    :param int block_size:
+        The size in bytes of the cached blocks. Range reads download and cache
+        only the blocks they overlap. Defaults to 4 MiB.
+    :param int max_age:
+        The number of seconds after a validation during which the cached content
+        of a blob is used without being revalidated. By default, the cached content
+        is revalidated on every read.
+
+    .. admonition:: Example:
+
+        .. code-block:: python
+
+            cache = BlobCache('/mnt/blob-cache', max_size=10 * 1024 ** 3, max_age=60)
+            blob_client = BlobClient.from_blob_url(blob_url, credential=credential)
+            model = cache.download_blob(blob_client)
+            header = cache.download_blob(blob_client, offset=0, length=512)
+    """
+
+    def __init__(self, path, max_size=1024 * 1024 * 1024, block_size=4 * 1024 * 1024, max_age=None):
+        # type: (str, int, int, Optional[int]) -> None
+        if block_size <= 0:
+            raise ValueError("block_size must be a positive integer.")
+        self.path = path
+        self.max_size = max_size
+        self.block_size = block_size
+        self.max_age = max_age
+        self._blocks_path = os.path.join(path, 'blocks')
+        self._entries_path = os.path.join(path, 'entries')
+        for directory in (self._blocks_path, self._entries_path):
+            try:
+                os.makedirs(directory)
+            except OSError:
+                if not os.path.isdir(directory):
+                    raise
+
+    def download_blob(self, blob_client, offset=None, length=None, **kwargs):
+        # type: (BlobClient, Optional[int], Optional[int], **Any) -> bytes
+        """Read the content of a blob through the cache.
+
+        :param blob_client: The client of the blob to read.
+        :type blob_client: ~azure.storage.blob.BlobClient
+        :param int offset:
+            Start of byte range to read. Must be set if length is provided.
+        :param int length:
+            Number of bytes to read.
+        :keyword int max_concurrency:
+            The number of parallel connections used to download the blocks missing from the cache.
+        :keyword ~azure.storage.blob.CustomerProvidedEncryptionKey cpk:
+            Encrypts the data on the service-side with the given key.
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds.
+        :returns: The requested content of the blob.
+        :rtype: bytes
+        """
+        start, entry_key = self._validate_download(blob_client, offset, length)
+        for _ in range(2):
+            entry = self._load_entry(entry_key)
+            if entry is None or not self._is_fresh(entry):
+                entry = self._revalidate(blob_client, entry_key, entry, start, **kwargs)
+            indexes, end = self._block_indexes(entry, start, length)
+            blocks = self._read_blocks(entry, indexes)
+            missing = [index for index in indexes if index not in blocks]
+            try:
+                for first, count in _contiguous_runs(missing):
+                    downloader = blob_client.download_blob(
+                        offset=first * self.block_size,
+                        length=count * self.block_size,
+                        etag=entry['etag'],
+                        match_condition=MatchConditions.IfNotModified,
+                        **kwargs)
+                    blocks.update(self._store_blocks(entry, first, downloader.readall()))
+            except ResourceModifiedError:
+                # The blob changed after it was validated, start again from a fresh entry
+                self._remove(self._entry_file(entry_key))
+                continue
+            if missing:
+                self._save_entry(entry_key, entry)
+                self._evict()
+            return self._assemble(blocks, indexes, start, end)
+        raise ResourceModifiedError("The blob was modified while it was being read.")
+
+    def invalidate(self, blob_client):
+        # type: (BlobClient) -> None
+        """Drop the cached entry of a blob, so the next read downloads it again.
+
+        :param blob_client: The client of the blob to drop from the cache.
+        :type blob_client: ~azure.storage.blob.BlobClient
+        :rtype: None
+        """
+        self._remove(self._entry_file(self._get_entry_key(blob_client)))
+
+    def clear(self):
+        # type: () -> None
+        """Remove all cached blobs.
+
+        :rtype: None
+        """
+        for directory in (self._entries_path, self._blocks_path):
+            for name in os.listdir(directory):
+                self._remove(os.path.join(directory, name))
+
+    def _validate_download(self, blob_client, offset, length):
+        if blob_client.require_encryption or blob_client.key_encryption_key or blob_client.key_resolver_function:
+            raise ValueError("Client-side encryption is not supported by BlobCache.")
+        if length is not None and offset is None:
+            raise ValueError("Offset value must not be None if length is set.")
+        return offset or 0, self._get_entry_key(blob_client)
+
+    @staticmethod
+    def _get_entry_key(blob_client):
+        location = u"{}/{}/{}?snapshot={}".format(
+            blob_client.primary_hostname,
+            blob_client.container_name,
+            blob_client.blob_name,
+            blob_client.snapshot or '')
+        return hashlib.sha256(location.encode('utf-8')).hexdigest()
+
+    def _is_fresh(self, entry):
+        return self.max_age is not None and time.time() - entry['validated'] < self.max_age
+
+    def _block_indexes(self, entry, start, length):
+        end = entry['size'] if length is None else min(start + length, entry['size'])
+        if start >= end:
+            return [], start
+        return list(range(start // self.block_size, (end - 1) // self.block_size + 1)), end
+
+    def _revalidation_options(self, entry, start, **kwargs):
+        """The conditional GET of the first block being read, which also returns that block."""
+        first = start // self.block_size
+        options = dict(kwargs, offset=first * self.block_size, length=self.block_size)
+        if entry is not None:
+            options.update(etag=entry['etag'], match_condition=MatchConditions.IfModified)
+        return first, options
+
+    def _validated_entry(self, entry_key, entry):
+        entry['validated'] = time.time()
+        self._save_entry(entry_key, entry)
+        return entry
+
+    def _new_entry(self, entry_key, etag, size, first, content):
+        entry = {
+            'etag': etag,
+            'size': size,
+            'validated': time.time(),
+            'blocks': {}
+        }
+        self._store_blocks(entry, first, content)
+        self._save_entry(entry_key, entry)
+        self._evict()
+        return entry
+
+    def _revalidate(self, blob_client, entry_key, entry, start, **kwargs):
+        first, options = self._revalidation_options(entry, start, **kwargs)
+        try:
+            downloader = blob_client.download_blob(**options)
+        except ResourceModifiedError as error:
+            if entry is not None and error.status_code == 304:
+                return self._validated_entry(entry_key, entry)
+            raise
+        except HttpResponseError as error:
+            # A range request on an empty blob is not satisfiable
+            if first != 0 or error.status_code != 416:
+                raise
+            properties = blob_client.get_blob_properties(**kwargs)
+            return self._new_entry(entry_key, properties.etag, properties.size, first, b"")
+        return self._new_entry(
+            entry_key,
+            downloader.properties.etag,
+            parse_length_from_content_range(downloader.properties.content_range),
+            first,
+            downloader.readall())
+
+    def _block_file(self, digest):
+        return os.path.join(self._blocks_path, digest)
+
+    def _entry_file(self, entry_key):
+        return os.path.join(self._entries_path, entry_key + '.json')
+
+    def _expected_block_size(self, entry, index):
+        return min(self.block_size, entry['size'] - index * self.block_size)
+
+    def _read_blocks(self, entry, indexes):
+        # type: (Dict[str, Any], List[int]) -> Dict[int, bytes]
+        blocks = {}
+        for index in indexes:
+            digest = entry['blocks'].get(str(index))
+            if not digest:
+                continue
+            try:
+                with open(self._block_file(digest), 'rb') as block:
+                    content = block.read()
+                os.utime(self._block_file(digest), None)
+            except (IOError, OSError):
+                # Evicted, possibly by another process
+                continue
+            if len(content) == self._expected_block_size(entry, index):
+                blocks[index] = content
+        return blocks
+
+    def _store_blocks(self, entry, first, content):
+        # type: (Dict[str, Any], int, bytes) -> Dict[int, bytes]
+        blocks = {}
+        for position in range(0, len(content), self.block_size):
+            index = first + position // self.block_size
+            block = content[position:position + self.block_size]
+            if len(block) != self._expected_block_size(entry, index):
+                continue
+            digest = hashlib.sha256(block).hexdigest()
+            path = self._block_file(digest)
+            if os.path.exists(path):
+                os.utime(path, None)
+            else:
+                self._write_file(path, block)
+            entry['blocks'][str(index)] = digest
+            blocks[index] = block
+        return blocks
+
+    def _assemble(self, blocks, indexes, start, end):
+        if not indexes:
+            return b""
+        content = b"".join(blocks[index] for index in indexes)
+        skip = start - indexes[0] * self.block_size
+        return content[skip:skip + end - start]
+
+    def _load_entry(self, entry_key):
+        path = self._entry_file(entry_key)
+        try:
+            with open(path, 'r') as entry_file:
+                entry = json.load(entry_file)
+            os.utime(path, None)
+        except (IOError, OSError, ValueError):
+            return None
+        return entry
+
+    def _save_entry(self, entry_key, entry):
+        self._write_file(self._entry_file(entry_key), json.dumps(entry).encode('utf-8'))
+
+    def _write_file(self, path, content):
+        handle, temp_path = tempfile.mkstemp(prefix='.', dir=os.path.dirname(path))
+        try:
+            with os.fdopen(handle, 'wb') as temp_file:
+                temp_file.write(content)
+            _replace(temp_path, path)
+        except BaseException:
+            self._remove(temp_path)
+            raise
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except (IOError, OSError):
+            pass
+
+    def _evict(self):
+        """Remove the least recently used files until the cache fits in max_size."""
+        files = []
+        total = 0
+        for directory in (self._blocks_path, self._entries_path):
+            for name in os.listdir(directory):
+                if name.startswith('.'):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except (IOError, OSError):
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+        if total <= self.max_size:
+            return
+        for _, size, path in sorted(files):
+            self._remove(path)
+            total -= size
+            if total <= self.max_size:
+                break
@@ -20,7 +20,7 @@ import six
 from azure.core.tracing.decorator import distributed_trace
 
 from ._shared import encode_base64
-from ._shared.base_client import StorageAccountHostsMixin, parse_connection_str, parse_query
+from ._shared.base_client import StorageAccountHostsMixin, TransportWrapper, parse_connection_str, parse_query
 from ._shared.encryption import generate_blob_encryption_data
 from ._shared.uploads import IterStreamer
 from ._shared.request_handlers import (
@@ -44,6 +44,13 @@ from ._upload_helpers import (
     upload_append_blob,
     upload_page_blob)
 from ._models import BlobType, BlobBlock
+from ._copy_helpers import (
+    CopyProgress,
+    split_request_options,
+    get_copy_ranges,
+    copy_block_blob_from_url,
+    copy_page_blob_from_url,
+    copy_append_blob_from_url)
 from ._download import StorageStreamDownloader
 from ._lease import BlobLeaseClient, get_access_conditions
 
@@ -1449,6 +1456,123 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
         except StorageErrorException as error:
             process_storage_error(error)
 
+    def _get_copy_source_client(self, source_url):
+        # type: (str) -> BlobClient
+        # The source is authorized by its URL, so it must not be signed with this client's credential
+        return BlobClient.from_blob_url(
+            source_url,
+            transport=TransportWrapper(self._pipeline._transport),  # pylint: disable = protected-access
+            api_version=self.api_version)
+
+    def _copy_from_url_parallel_options(self, source_url, metadata=None, **kwargs):
+        # type: (str, Optional[Dict[str, str]], **Any) -> Dict[str, Any]
+        if self.require_encryption or (self.key_encryption_key is not None):
+            raise ValueError(_ERROR_UNSUPPORTED_METHOD_FOR_ENCRYPTION)
+        blob_type = kwargs.pop('blob_type', None)
+        options = {
+            'source_url': source_url,
+            'blob_type': BlobType(blob_type) if blob_type else None,
+            'source_length': kwargs.pop('source_length', None),
+            'chunk_size': kwargs.pop('chunk_size', None),
+            'max_concurrency': kwargs.pop('max_concurrency', 8),
+            'progress_hook': kwargs.pop('progress_hook', None)}
+        kwargs['metadata'] = metadata
+        options['request_options'], options['create_options'] = split_request_options(kwargs)
+        return options
+
+    def _copy_from_url_parallel_plan(self, options, source_properties=None, source_page_ranges=None):
+        # type: (Dict[str, Any], Optional[BlobProperties], Optional[List[Dict[str, int]]]) -> Tuple[BlobType, Dict[str, Any]]
+        blob_type = options['blob_type'] or source_properties.blob_type
+        source_length = options['source_length']
+        if source_length is None:
+            source_length = source_properties.size
+        ranges = get_copy_ranges(
+            blob_type,
+            source_length,
+            chunk_size=options['chunk_size'],
+            default_chunk_size=self._config.max_block_size,
+            page_ranges=source_page_ranges)
+        copy_options = dict(
+            options['create_options'],
+            client=self,
+            source_url=options['source_url'],
+            ranges=ranges,
+            progress=CopyProgress(sum(length for _, length in ranges), options['progress_hook']),
+            request_options=options['request_options'])
+        if blob_type != BlobType.AppendBlob:
+            copy_options['max_concurrency'] = options['max_concurrency']
+        if blob_type == BlobType.PageBlob:
+            copy_options['total_size'] = source_length
+        return blob_type, copy_options
+
+    @distributed_trace
+    def copy_from_url_parallel(self, source_url, metadata=None, **kwargs):
+        # type: (str, Optional[Dict[str, str]], **Any) -> Dict[str, Union[str, datetime]]
+        """Copies a blob from a URL by splitting it into ranges that are copied concurrently.
+
+        Unlike :func:`start_copy_from_url`, the copy is complete when this operation returns.
+        Each range is copied synchronously by the service with one request, so the data is
+        not transferred through the client.
+
+        A block blob is copied by staging blocks with :func:`stage_block_from_url` concurrently
+        and committing the block list. A page blob is created with the size of the source and its
+        pages are copied concurrently with :func:`upload_pages_from_url`; when the source is also
+        a page blob only its non-empty pages are copied. An append blob is created and its blocks are
+        appended in order with :func:`append_block_from_url`.
+
+        :param str source_url:
+            A URL of up to 2 KB in length that specifies a file or blob.
+            The source must either be public or must be authenticated via a shared access signature.
+        :param metadata:
+            Name-value pairs associated with the blob as metadata.
+        :type metadata: dict(str, str)
+        :keyword blob_type: The type of the destination blob. Defaults to the type of the source blob.
+            Must be set, along with source_length, when the source is not a blob.
+        :paramtype blob_type: ~azure.storage.blob.BlobType or str
+        :keyword int source_length:
+            The size of the source in bytes. If not set, it is read from the properties of the source blob.
+        :keyword int chunk_size:
+            The size of the ranges copied by each request. Defaults to max_block_size for block blobs,
+            increased when needed to stay within 50,000 blocks, and to 4 MiB, the maximum, for
+            page blobs and append blobs.
+        :keyword int max_concurrency:
+            The number of ranges copied in parallel. Defaults to 8. Append blobs are always
+            copied sequentially.
+        :keyword progress_hook:
+            A callback called with the number of bytes copied so far and the total number
+            of bytes to copy after each range is copied.
+        :paramtype progress_hook: Callable[[int, int], None]
+        :keyword ~azure.storage.blob.ContentSettings content_settings:
+            ContentSettings object used to set blob properties.
+        :keyword lease:
+            Required if the destination blob has an active lease. Value can be a BlobLeaseClient object
+            or the lease ID as a string.
+        :paramtype lease: ~azure.storage.blob.BlobLeaseClient or str
+        :keyword ~azure.storage.blob.CustomerProvidedEncryptionKey cpk:
+            Encrypts the data on the service-side with the given key.
+            Use of customer-provided keys must be done over HTTPS.
+        :keyword str encryption_scope:
+            A predefined encryption scope used to encrypt the data on the service.
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds. This applies to each request.
+        :returns: Blob-updated property dict (Etag and last modified).
+        :rtype: dict[str, Any]
+        """
+        options = self._copy_from_url_parallel_options(source_url, metadata=metadata, **kwargs)
+        source_properties, source_page_ranges = None, None
+        if options['blob_type'] is None or options['source_length'] is None:
+            source = self._get_copy_source_client(source_url)
+            source_properties = source.get_blob_properties(timeout=options['request_options'].get('timeout'))
+            if source_properties.blob_type == BlobType.PageBlob and \
+                    options['blob_type'] in (None, BlobType.PageBlob):
+                source_page_ranges, _ = source.get_page_ranges(timeout=options['request_options'].get('timeout'))
+        blob_type, copy_options = self._copy_from_url_parallel_plan(options, source_properties, source_page_ranges)
+        if blob_type == BlobType.BlockBlob:
+            return copy_block_blob_from_url(**copy_options)
+        if blob_type == BlobType.PageBlob:
+            return copy_page_blob_from_url(**copy_options)
+        return copy_append_blob_from_url(**copy_options)
+
     def _abort_copy_options(self, copy_id, **kwargs):
         # type: (Union[str, Dict[str, Any], BlobProperties], **Any) -> Dict[str, Any]
         access_conditions = get_access_conditions(kwargs.pop('lease', None))
@@ -44,6 +44,7 @@ from ._models import ( # pylint: disable=unused-import
     BlobType,
     BlobPrefix)
 from ._lease import BlobLeaseClient, get_access_conditions
+from ._list_blobs_helper import list_blobs_segment
 from ._blob_client import BlobClient
 
 if TYPE_CHECKING:
@@ -666,7 +667,8 @@ class ContainerClient(StorageAccountHostsMixin):
         results_per_page = kwargs.pop('results_per_page', None)
         timeout = kwargs.pop('timeout', None)
         command = functools.partial(
-            self._client.container.list_blob_flat_segment,
+            list_blobs_segment,
+            self._client.container,
             include=include,
             timeout=timeout,
             **kwargs)
@@ -709,7 +711,8 @@ class ContainerClient(StorageAccountHostsMixin):
         results_per_page = kwargs.pop('results_per_page', None)
         timeout = kwargs.pop('timeout', None)
         command = functools.partial(
-            self._client.container.list_blob_hierarchy_segment,
+            list_blobs_segment,
+            self._client.container,
             delimiter=delimiter,
             include=include,
             timeout=timeout,
@@ -0,0 +1,158 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import threading
+from concurrent import futures
+from typing import Any, Dict, List, Optional, Tuple  # pylint: disable=unused-import
+
+from azure.core.tracing.common import with_current_context
+
+from ._models import BlobType
+
+# The service allows at most 50,000 blocks in a block blob.
+_MAX_BLOCK_COUNT = 50000
+# Put Page From URL and Append Block From URL copy at most 4 MiB per request.
+_MAX_FROM_URL_CHUNK_SIZE = 4 * 1024 * 1024
+_PAGE_SIZE = 512
+
+# Keywords sent with every request of a copy; all others only apply to the request creating the blob.
+_PER_REQUEST_KEYWORDS = ('timeout', 'lease', 'cpk', 'encryption_scope')
+
+
+class CopyProgress(object):
+    """Tracks the number of bytes copied and reports it to the progress hook."""
+
+    def __init__(self, total, progress_hook=None):
+        self.total = total
+        self.copied = 0
+        self.progress_hook = progress_hook
+        self._lock = threading.Lock()
+
+    def add(self, length):
+        with self._lock:
+            self.copied += length
+            copied = self.copied
+        if self.progress_hook:
+            self.progress_hook(copied, self.total)
+
+
+def split_request_options(kwargs):
+    # type: (Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]
+    """Split the keywords into those sent with every request and those only used to create the blob."""
+    request_options = {key: kwargs.pop(key) for key in _PER_REQUEST_KEYWORDS if key in kwargs}
+    create_options = dict(kwargs, **request_options)
+    return request_options, create_options
+
+
+def get_block_ranges(total_size, chunk_size=None, default_chunk_size=None):
+    # type: (int, Optional[int], Optional[int]) -> List[Tuple[int, int]]
+    if not chunk_size:
+        # Grow the default block size when the blob would not fit in the maximum number of blocks
+        chunk_size = max(default_chunk_size, -(-total_size // _MAX_BLOCK_COUNT))
+    elif -(-total_size // chunk_size) > _MAX_BLOCK_COUNT:
+        raise ValueError("chunk_size is too small to copy {} bytes in {} blocks.".format(total_size, _MAX_BLOCK_COUNT))
+    return [(offset, min(chunk_size, total_size - offset)) for offset in range(0, total_size, chunk_size)]
+
+
+def get_page_ranges(total_size, chunk_size=None, page_ranges=None):
+    # type: (int, Optional[int], Optional[List[Dict[str, int]]]) -> List[Tuple[int, int]]
+    """Split the non-empty pages of the source into ranges that can be copied in one request."""
+    if total_size % _PAGE_SIZE != 0:
+        raise ValueError("The source size must be aligned to the 512 byte page size to be copied to a page blob.")
+    chunk_size = min(chunk_size or _MAX_FROM_URL_CHUNK_SIZE, _MAX_FROM_URL_CHUNK_SIZE)
+    if chunk_size % _PAGE_SIZE != 0:
+        raise ValueError("chunk_size must be aligned to the 512 byte page size.")
+    if page_ranges is None:
+        page_ranges = [{'start': 0, 'end': total_size - 1}] if total_size else []
+    ranges = []
+    for page_range in page_ranges:
+        end = page_range['end'] + 1
+        ranges.extend((offset, min(chunk_size, end - offset)) for offset in range(page_range['start'], end, chunk_size))
+    return ranges
+
+
+def get_append_ranges(total_size, chunk_size=None):
+    # type: (int, Optional[int]) -> List[Tuple[int, int]]
+    chunk_size = min(chunk_size or _MAX_FROM_URL_CHUNK_SIZE, _MAX_FROM_URL_CHUNK_SIZE)
+    return [(offset, min(chunk_size, total_size - offset)) for offset in range(0, total_size, chunk_size)]
+
+
+def get_block_id(offset):
+    return '{0:032d}'.format(offset)
+
+
+def _run_parallel(operation, ranges, max_concurrency):
+    if max_concurrency <= 1 or len(ranges) <= 1:
+        return [operation(copy_range) for copy_range in ranges]
+    with futures.ThreadPoolExecutor(max_concurrency) as executor:
+        return list(executor.map(with_current_context(operation), ranges))
+
+
+def copy_block_blob_from_url(
+        client=None,
+        source_url=None,
+        ranges=None,
+        max_concurrency=None,
+        progress=None,
+        request_options=None,
+        **kwargs):
+    def stage_block(block_range):
+        offset, length = block_range
+        block_id = get_block_id(offset)
+        client.stage_block_from_url(
+            block_id, source_url, source_offset=offset, source_length=length, **request_options)
+        progress.add(length)
+        return block_id
+
+    block_ids = _run_parallel(stage_block, ranges, max_concurrency)
+    return client.commit_block_list(block_ids, **kwargs)
+
+
+def copy_page_blob_from_url(
+        client=None,
+        source_url=None,
+        total_size=None,
+        ranges=None,
+        max_concurrency=None,
+        progress=None,
+        request_options=None,
+        **kwargs):
+    # Parallel requests finish in any order, the properties of the last one to complete are returned
+    responses = [client.create_page_blob(total_size, **kwargs)]
+
+    def upload_pages(page_range):
+        offset, length = page_range
+        responses.append(client.upload_pages_from_url(source_url, offset, length, offset, **request_options))
+        progress.add(length)
+
+    _run_parallel(upload_pages, ranges, max_concurrency)
+    return responses[-1]
+
+
+def copy_append_blob_from_url(
+        client=None,
+        source_url=None,
+        ranges=None,
+        progress=None,
+        request_options=None,
+        **kwargs):
+    response = client.create_append_blob(**kwargs)
+    # Appended blocks must arrive in order, so they are copied one at a time
+    for offset, length in ranges:
+        response = client.append_block_from_url(
+            source_url, source_offset=offset, source_length=length, appendpos_condition=offset, **request_options)
+        progress.add(length)
+    return response
+
+
+def get_copy_ranges(blob_type, total_size, chunk_size=None, default_chunk_size=None, page_ranges=None):
+    if blob_type == BlobType.BlockBlob:
+        return get_block_ranges(total_size, chunk_size, default_chunk_size)
+    if blob_type == BlobType.PageBlob:
+        return get_page_ranges(total_size, chunk_size, page_ranges)
+    if blob_type == BlobType.AppendBlob:
+        return get_append_ranges(total_size, chunk_size)
+    raise ValueError("Unsupported BlobType: {}".format(blob_type))
@@ -0,0 +1,259 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+# pylint: disable=too-few-public-methods, too-many-instance-attributes
+
+from io import BytesIO
+from xml.etree.ElementTree import iterparse  # nosec
+
+from azure.core.exceptions import map_error
+from msrest.serialization import Deserializer
+
+from ._models import BlobProperties
+from ._generated.models import BlobPrefix as GenBlobPrefix
+from ._generated.models import StorageErrorException
+
+
+def _to_bool(value):
+    return value.lower() == 'true'
+
+
+def _to_enum_value(value):
+    # Enum values are left as strings, BlobProperties converts them with get_enum_value
+    return value
+
+
+_PROPERTY_CONVERTERS = {
+    'Creation-Time': ('creation_time', Deserializer.deserialize_rfc),
+    'Last-Modified': ('last_modified', Deserializer.deserialize_rfc),
+    'Etag': ('etag', str),
+    'Content-Length': ('content_length', int),
+    'Content-Type': ('content_type', str),
+    'Content-Encoding': ('content_encoding', str),
+    'Content-Language': ('content_language', str),
+    'Content-MD5': ('content_md5', Deserializer.deserialize_bytearray),
+    'Content-Disposition': ('content_disposition', str),
+    'Cache-Control': ('cache_control', str),
+    'x-ms-blob-sequence-number': ('blob_sequence_number', int),
+    'BlobType': ('blob_type', _to_enum_value),
+    'LeaseStatus': ('lease_status', _to_enum_value),
+    'LeaseState': ('lease_state', _to_enum_value),
+    'LeaseDuration': ('lease_duration', _to_enum_value),
+    'CopyId': ('copy_id', str),
+    'CopyStatus': ('copy_status', _to_enum_value),
+    'CopySource': ('copy_source', str),
+    'CopyProgress': ('copy_progress', str),
+    'CopyCompletionTime': ('copy_completion_time', Deserializer.deserialize_rfc),
+    'CopyStatusDescription': ('copy_status_description', str),
+    'ServerEncrypted': ('server_encrypted', _to_bool),
+    'IncrementalCopy': ('incremental_copy', _to_bool),
+    'DestinationSnapshot': ('destination_snapshot', str),
+    'DeletedTime': ('deleted_time', Deserializer.deserialize_rfc),
+    'RemainingRetentionDays': ('remaining_retention_days', int),
+    'AccessTier': ('access_tier', str),
+    'AccessTierInferred': ('access_tier_inferred', _to_bool),
+    'ArchiveStatus': ('archive_status', str),
+    'CustomerProvidedKeySha256': ('customer_provided_key_sha256', str),
+    'EncryptionScope': ('encryption_scope', str),
+    'AccessTierChangeTime': ('access_tier_change_time', Deserializer.deserialize_rfc),
+}
+
+_PROPERTY_DEFAULTS = {attr: None for attr, _ in _PROPERTY_CONVERTERS.values()}
+
+
+class _BlobItemProperties(object):
+    """The properties of a listed blob, shaped like the generated model they replace."""
+
+    def __init__(self):
+        self.__dict__.update(_PROPERTY_DEFAULTS)
+
+
+class _BlobItemMetadata(object):
+    def __init__(self, additional_properties, encrypted):
+        self.additional_properties = additional_properties
+        self.encrypted = encrypted
+
+
+class _BlobItem(object):
+    """A listed blob, shaped like the generated BlobItem so BlobProperties can be built from it."""
+
+    def __init__(self):
+        self.name = None
+        self.deleted = None
+        self.snapshot = None
+        self.properties = _BlobItemProperties()
+        self.metadata = None
+
+
+class ListBlobsSegment(object):
+    def __init__(self):
+        self.blob_items = []
+        self.blob_prefixes = []
+
+
+class ListBlobsSegmentResponse(object):
+    """A page of listed blobs, exposing the same attributes as the generated list segment responses."""
+
+    def __init__(self):
+        self.service_endpoint = None
+        self.container_name = None
+        self.prefix = None
+        self.marker = None
+        self.max_results = None
+        self.delimiter = None
+        self.next_marker = None
+        self.segment = ListBlobsSegment()
+
+
+def _convert(text, convert):
+    # Match the generated deserializer: an empty element is '' for strings and None otherwise
+    if not text:
+        return '' if convert is str else None
+    return convert(text)
+
+
+def _build_blob_properties(element, container_name):
+    item = _BlobItem()
+    for child in element:
+        tag = child.tag
+        if tag == 'Properties':
+            properties = item.properties
+            for prop in child:
+                attr, convert = _PROPERTY_CONVERTERS.get(prop.tag, (None, None))
+                if attr:
+                    setattr(properties, attr, _convert(prop.text, convert))
+        elif tag == 'Name':
+            item.name = _convert(child.text, str)
+        elif tag == 'Metadata':
+            item.metadata = _BlobItemMetadata(
+                {meta.tag: meta.text for meta in child} or None,
+                child.get('Encrypted'))
+        elif tag == 'Deleted':
+            item.deleted = _convert(child.text, _to_bool)
+        elif tag == 'Snapshot':
+            item.snapshot = _convert(child.text, str)
+
+    blob = BlobProperties._from_generated(item)  # pylint: disable=protected-access
+    blob.container = container_name
+    return blob
+
+
+def deserialize_list_blobs(body):
+    """Parse a List Blobs response into public BlobProperties without building the whole XML tree.
+
+    Each Blob element is converted as soon as it has been parsed and then discarded,
+    so only the page's BlobProperties and the raw body are held in memory.
+
+    :param bytes body: The body of a List Blobs response.
+    :rtype: ListBlobsSegmentResponse
+    """
+    response = ListBlobsSegmentResponse()
+    segment = response.segment
+    depth = 0
+    blobs = None
+    for event, element in iterparse(BytesIO(body), events=('start', 'end')):  # nosec
+        if event == 'start':
+            depth += 1
+            if depth == 1:
+                response.service_endpoint = element.get('ServiceEndpoint')
+                response.container_name = element.get('ContainerName')
+            elif depth == 2 and element.tag == 'Blobs':
+                blobs = element
+            continue
+
+        depth -= 1
+        if depth == 2 and blobs is not None:
+            if element.tag == 'Blob':
+                segment.blob_items.append(_build_blob_properties(element, response.container_name))
+            elif element.tag == 'BlobPrefix':
+                segment.blob_prefixes.append(GenBlobPrefix(name=element.findtext('Name')))
+            blobs.remove(element)
+        elif depth == 1:
+            tag, text = element.tag, element.text
+            if tag == 'Prefix':
+                response.prefix = _convert(text, str)
+            elif tag == 'Marker':
+                response.marker = _convert(text, str)
+            elif tag == 'MaxResults':
+                response.max_results = _convert(text, int)
+            elif tag == 'Delimiter':
+                response.delimiter = _convert(text, str)
+            elif tag == 'NextMarker':
+                response.next_marker = _convert(text, str)
+    return response
+
+
+def build_list_blobs_request(operations, delimiter=None, **kwargs):
+    """Build the List Blobs request the same way as the generated container operations."""
+    prefix = kwargs.pop('prefix', None)
+    marker = kwargs.pop('marker', None)
+    maxresults = kwargs.pop('maxresults', None)
+    include = kwargs.pop('include', None)
+    timeout = kwargs.pop('timeout', None)
+    request_id = kwargs.pop('request_id', None)
+    serialize = operations._serialize  # pylint: disable=protected-access
+    client = operations._client  # pylint: disable=protected-access
+    config = operations._config  # pylint: disable=protected-access
+
+    url = operations.list_blob_flat_segment.metadata['url']
+    url = client.format_url(url, url=serialize.url("self._config.url", config.url, 'str', skip_quote=True))
+
+    query_parameters = {}
+    if prefix is not None:
+        query_parameters['prefix'] = serialize.query("prefix", prefix, 'str')
+    if delimiter is not None:
+        query_parameters['delimiter'] = serialize.query("delimiter", delimiter, 'str')
+    if marker is not None:
+        query_parameters['marker'] = serialize.query("marker", marker, 'str')
+    if maxresults is not None:
+        query_parameters['maxresults'] = serialize.query("maxresults", maxresults, 'int', minimum=1)
+    if include is not None:
+        query_parameters['include'] = serialize.query("include", include, '[ListBlobsIncludeItem]', div=',')
+    if timeout is not None:
+        query_parameters['timeout'] = serialize.query("timeout", timeout, 'int', minimum=0)
+    query_parameters['restype'] = serialize.query("restype", "container", 'str')
+    query_parameters['comp'] = serialize.query("comp", "list", 'str')
+
+    header_parameters = {}
+    header_parameters['Accept'] = 'application/xml'
+    header_parameters['x-ms-version'] = serialize.header("self._config.version", config.version, 'str')
+    if request_id is not None:
+        header_parameters['x-ms-client-request-id'] = serialize.header("request_id", request_id, 'str')
+
+    return client.get(url, query_parameters, header_parameters), kwargs
+
+
+def process_list_blobs_response(operations, pipeline_response, error_map=None, cls=None):
+    response = pipeline_response.http_response
+    if response.status_code not in [200]:
+        map_error(status_code=response.status_code, response=response, error_map=error_map)
+        raise StorageErrorException(response, operations._deserialize)  # pylint: disable=protected-access
+
+    deserialized = deserialize_list_blobs(response.body())
+    if cls:
+        deserialize = operations._deserialize  # pylint: disable=protected-access
+        header_dict = {
+            'Content-Type': deserialize('str', response.headers.get('Content-Type')),
+            'x-ms-client-request-id': deserialize('str', response.headers.get('x-ms-client-request-id')),
+            'x-ms-request-id': deserialize('str', response.headers.get('x-ms-request-id')),
+            'x-ms-version': deserialize('str', response.headers.get('x-ms-version')),
+            'Date': deserialize('rfc-1123', response.headers.get('Date')),
+            'x-ms-error-code': deserialize('str', response.headers.get('x-ms-error-code')),
+        }
+        return cls(response, deserialized, header_dict)
+    return deserialized
+
+
+def list_blobs_segment(operations, delimiter=None, **kwargs):
+    """List a page of blobs with the streaming listing parser.
+
+    Takes the same arguments as the generated list_blob_flat_segment and list_blob_hierarchy_segment
+    operations, and returns BlobProperties instead of generated models.
+    """
+    error_map = kwargs.pop('error_map', None)
+    cls = kwargs.pop('cls', None)
+    request, kwargs = build_list_blobs_request(operations, delimiter=delimiter, **kwargs)
+    pipeline_response = operations._client._pipeline.run(request, stream=False, **kwargs)  # pylint: disable=protected-access
+    return process_list_blobs_response(operations, pipeline_response, error_map=error_map, cls=cls)
@@ -13,6 +13,7 @@ from ._container_client_async import ContainerClient
 from ._blob_service_client_async import BlobServiceClient
 from ._lease_async import BlobLeaseClient
 from ._download_async import StorageStreamDownloader
+from ._blob_cache_async import BlobCache
 
 
 async def upload_blob_to_url(
@@ -133,5 +134,6 @@ __all__ = [
     'BlobLeaseClient',
     'ExponentialRetry',
     'LinearRetry',
-    'StorageStreamDownloader'
+    'StorageStreamDownloader',
+    'BlobCache'
 ]
@@ -0,0 +1,117 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+from typing import (  # pylint: disable=unused-import
+    Optional, Any,
+    TYPE_CHECKING
+)
+
+from azure.core import MatchConditions
+from azure.core.exceptions import HttpResponseError, ResourceModifiedError
+
+from .._shared.response_handlers import parse_length_from_content_range
+from .._blob_cache import BlobCache as BlobCacheBase, _contiguous_runs
+
+if TYPE_CHECKING:
+    from ._blob_client_async import BlobClient
+
+
+class BlobCache(BlobCacheBase):
+    """A read-through cache of blob content on the local disk.
+
+    Blob content is stored in blocks that are named by the SHA-256 of their content,
+    so identical blocks are stored once, and a small entry per blob records its ETag,
+    size and blocks. All files are written atomically, so one cache directory can be
+    shared by every process on a machine, including processes using the synchronous
+    cache. When the cache grows over its size limit, the least recently used files are evicted.
+
+    A cached blob is revalidated with a conditional (If-None-Match) GET of the first
+    block being read, which refreshes the cache when the blob has changed. Within
+    `max_age` seconds of the last validation, the cached content is used without
+    contacting the service. Missing blocks are downloaded with If-Match on the cached
+    ETag, so cached and downloaded blocks always belong to the same version of the blob.
+
+    Client-side encryption is not supported.
+
+    :param str path:
+        The directory holding the cache. It will be created if it does not exist.
+    :param int max_size:
+        The maximum size in bytes of the cached data. Defaults to 1 GiB.
+    :param int block_size:
+        The size in bytes of the cached blocks. Range reads download and cache
+        only the blocks they overlap. Defaults to 4 MiB.
+    :param int max_age:
+        The number of seconds after a validation during which the cached content
+        of a blob is used without being revalidated. By default, the cached content
+        is revalidated on every read.
+    """
+
+    async def download_blob(self, blob_client, offset=None, length=None, **kwargs):  # pylint: disable=invalid-overridden-method
+        # type: (BlobClient, Optional[int], Optional[int], **Any) -> bytes
+        """Read the content of a blob through the cache.
+
+        :param blob_client: The client of the blob to read.
+        :type blob_client: ~azure.storage.blob.aio.BlobClient
+        :param int offset:
+            Start of byte range to read. Must be set if length is provided.
+        :param int length:
+            Number of bytes to read.
+        :keyword int max_concurrency:
+            The number of parallel connections used to download the blocks missing from the cache.
+        :keyword ~azure.storage.blob.CustomerProvidedEncryptionKey cpk:
+            Encrypts the data on the service-side with the given key.
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds.
+        :returns: The requested content of the blob.
+        :rtype: bytes
+        """
+        start, entry_key = self._validate_download(blob_client, offset, length)
+        for _ in range(2):
+            entry = self._load_entry(entry_key)
+            if entry is None or not self._is_fresh(entry):
+                entry = await self._revalidate(blob_client, entry_key, entry, start, **kwargs)
+            indexes, end = self._block_indexes(entry, start, length)
+            blocks = self._read_blocks(entry, indexes)
+            missing = [index for index in indexes if index not in blocks]
+            try:
+                for first, count in _contiguous_runs(missing):
+                    downloader = await blob_client.download_blob(
+                        offset=first * self.block_size,
+                        length=count * self.block_size,
+                        etag=entry['etag'],
+                        match_condition=MatchConditions.IfNotModified,
+                        **kwargs)
+                    blocks.update(self._store_blocks(entry, first, await downloader.readall()))
+            except ResourceModifiedError:
+                # The blob changed after it was validated, start again from a fresh entry
+                self._remove(self._entry_file(entry_key))
+                continue
+            if missing:
+                self._save_entry(entry_key, entry)
+                self._evict()
+            return self._assemble(blocks, indexes, start, end)
+        raise ResourceModifiedError("The blob was modified while it was being read.")
+
+    async def _revalidate(self, blob_client, entry_key, entry, start, **kwargs):  # pylint: disable=invalid-overridden-method
+        first, options = self._revalidation_options(entry, start, **kwargs)
+        try:
+            downloader = await blob_client.download_blob(**options)
+        except ResourceModifiedError as error:
+            if entry is not None and error.status_code == 304:
+                return self._validated_entry(entry_key, entry)
+            raise
+        except HttpResponseError as error:
+            # A range request on an empty blob is not satisfiable
+            if first != 0 or error.status_code != 416:
+                raise
+            properties = await blob_client.get_blob_properties(**kwargs)
+            return self._new_entry(entry_key, properties.etag, properties.size, first, b"")
+        return self._new_entry(
+            entry_key,
+            downloader.properties.etag,
+            parse_length_from_content_range(downloader.properties.content_range),
+            first,
+            await downloader.readall())
@@ -12,7 +12,7 @@ from typing import (  # pylint: disable=unused-import
 
 from azure.core.tracing.decorator_async import distributed_trace_async
 
-from .._shared.base_client_async import AsyncStorageAccountHostsMixin
+from .._shared.base_client_async import AsyncStorageAccountHostsMixin, AsyncTransportWrapper
 from .._shared.policies_async import ExponentialRetry
 from .._shared.response_handlers import return_response_headers, process_storage_error
 from .._deserialize import get_page_ranges_result
@@ -30,6 +30,10 @@ from .._models import BlobType, BlobBlock
 from .._lease import get_access_conditions
 from ._lease_async import BlobLeaseClient
 from ._download_async import StorageStreamDownloader
+from ._copy_helpers import (
+    copy_block_blob_from_url,
+    copy_page_blob_from_url,
+    copy_append_blob_from_url)
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -938,6 +942,83 @@ class BlobClient(AsyncStorageAccountHostsMixin, BlobClientBase):  # pylint: disa
         except StorageErrorException as error:
             process_storage_error(error)
 
+    def _get_copy_source_client(self, source_url):
+        # type: (str) -> BlobClient
+        # The source is authorized by its URL, so it must not be signed with this client's credential
+        return BlobClient.from_blob_url(
+            source_url,
+            transport=AsyncTransportWrapper(self._pipeline._transport),  # pylint: disable = protected-access
+            api_version=self.api_version)
+
+    @distributed_trace_async
+    async def copy_from_url_parallel(self, source_url, metadata=None, **kwargs):
+        # type: (str, Optional[Dict[str, str]], **Any) -> Dict[str, Union[str, datetime]]
+        """Copies a blob from a URL by splitting it into ranges that are copied concurrently.
+
+        Unlike :func:`start_copy_from_url`, the copy is complete when this operation returns.
+        Each range is copied synchronously by the service with one request, so the data is
+        not transferred through the client.
+
+        A block blob is copied by staging blocks with :func:`stage_block_from_url` concurrently
+        and committing the block list. A page blob is created with the size of the source and its
+        pages are copied concurrently with :func:`upload_pages_from_url`; when the source is also
+        a page blob only its non-empty pages are copied. An append blob is created and its blocks are
+        appended in order with :func:`append_block_from_url`.
+
+        :param str source_url:
+            A URL of up to 2 KB in length that specifies a file or blob.
+            The source must either be public or must be authenticated via a shared access signature.
+        :param metadata:
+            Name-value pairs associated with the blob as metadata.
+        :type metadata: dict(str, str)
+        :keyword blob_type: The type of the destination blob. Defaults to the type of the source blob.
+            Must be set, along with source_length, when the source is not a blob.
+        :paramtype blob_type: ~azure.storage.blob.BlobType or str
+        :keyword int source_length:
+            The size of the source in bytes. If not set, it is read from the properties of the source blob.
+        :keyword int chunk_size:
+            The size of the ranges copied by each request. Defaults to max_block_size for block blobs,
+            increased when needed to stay within 50,000 blocks, and to 4 MiB, the maximum, for
+            page blobs and append blobs.
+        :keyword int max_concurrency:
+            The number of ranges copied in parallel. Defaults to 8. Append blobs are always
+            copied sequentially.
+        :keyword progress_hook:
+            A callback called with the number of bytes copied so far and the total number
+            of bytes to copy after each range is copied.
+        :paramtype progress_hook: Callable[[int, int], None]
+        :keyword ~azure.storage.blob.ContentSettings content_settings:
+            ContentSettings object used to set blob properties.
+        :keyword lease:
+            Required if the destination blob has an active lease. Value can be a BlobLeaseClient object
+            or the lease ID as a string.
+        :paramtype lease: ~azure.storage.blob.aio.BlobLeaseClient or str
+        :keyword ~azure.storage.blob.CustomerProvidedEncryptionKey cpk:
+            Encrypts the data on the service-side with the given key.
+            Use of customer-provided keys must be done over HTTPS.
+        :keyword str encryption_scope:
+            A predefined encryption scope used to encrypt the data on the service.
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds. This applies to each request.
+        :returns: Blob-updated property dict (Etag and last modified).
+        :rtype: dict[str, Any]
+        """
+        options = self._copy_from_url_parallel_options(source_url, metadata=metadata, **kwargs)
+        source_properties, source_page_ranges = None, None
+        if options['blob_type'] is None or options['source_length'] is None:
+            source = self._get_copy_source_client(source_url)
+            source_properties = await source.get_blob_properties(timeout=options['request_options'].get('timeout'))
+            if source_properties.blob_type == BlobType.PageBlob and \
+                    options['blob_type'] in (None, BlobType.PageBlob):
+                source_page_ranges, _ = await source.get_page_ranges(
+                    timeout=options['request_options'].get('timeout'))
+        blob_type, copy_options = self._copy_from_url_parallel_plan(options, source_properties, source_page_ranges)
+        if blob_type == BlobType.BlockBlob:
+            return await copy_block_blob_from_url(**copy_options)
+        if blob_type == BlobType.PageBlob:
+            return await copy_page_blob_from_url(**copy_options)
+        return await copy_append_blob_from_url(**copy_options)
+
     @distributed_trace_async
     async def abort_copy(self, copy_id, **kwargs):
         # type: (Union[str, Dict[str, Any], BlobProperties], Any) -> None
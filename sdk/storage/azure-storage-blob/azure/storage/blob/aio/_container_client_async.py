@@ -36,6 +36,7 @@ from .._lease import get_access_conditions
 from .._models import ContainerProperties, BlobProperties, BlobType  # pylint: disable=unused-import
 from ._models import BlobPropertiesPaged, BlobPrefix
 from ._lease_async import BlobLeaseClient
+from ._list_blobs_helper import list_blobs_segment
 from ._blob_client_async import BlobClient
 
 if TYPE_CHECKING:
@@ -538,7 +539,8 @@ class ContainerClient(AsyncStorageAccountHostsMixin, ContainerClientBase):
         results_per_page = kwargs.pop('results_per_page', None)
         timeout = kwargs.pop('timeout', None)
         command = functools.partial(
-            self._client.container.list_blob_flat_segment,
+            list_blobs_segment,
+            self._client.container,
             include=include,
             timeout=timeout,
             **kwargs)
@@ -584,7 +586,8 @@ class ContainerClient(AsyncStorageAccountHostsMixin, ContainerClientBase):
         results_per_page = kwargs.pop('results_per_page', None)
         timeout = kwargs.pop('timeout', None)
         command = functools.partial(
-            self._client.container.list_blob_hierarchy_segment,
+            list_blobs_segment,
+            self._client.container,
             delimiter=delimiter,
             include=include,
             timeout=timeout,
@@ -0,0 +1,78 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+
+from .._copy_helpers import get_block_id
+
+
+async def _run_parallel(operation, ranges, max_concurrency):
+    if max_concurrency <= 1 or len(ranges) <= 1:
+        return [await operation(copy_range) for copy_range in ranges]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run(copy_range):
+        async with semaphore:
+            return await operation(copy_range)
+
+    return await asyncio.gather(*[_run(copy_range) for copy_range in ranges])
+
+
+async def copy_block_blob_from_url(
+        client=None,
+        source_url=None,
+        ranges=None,
+        max_concurrency=None,
+        progress=None,
+        request_options=None,
+        **kwargs):
+    async def stage_block(block_range):
+        offset, length = block_range
+        block_id = get_block_id(offset)
+        await client.stage_block_from_url(
+            block_id, source_url, source_offset=offset, source_length=length, **request_options)
+        progress.add(length)
+        return block_id
+
+    block_ids = await _run_parallel(stage_block, ranges, max_concurrency)
+    return await client.commit_block_list(block_ids, **kwargs)
+
+
+async def copy_page_blob_from_url(
+        client=None,
+        source_url=None,
+        total_size=None,
+        ranges=None,
+        max_concurrency=None,
+        progress=None,
+        request_options=None,
+        **kwargs):
+    # Parallel requests finish in any order, the properties of the last one to complete are returned
+    responses = [await client.create_page_blob(total_size, **kwargs)]
+
+    async def upload_pages(page_range):
+        offset, length = page_range
+        responses.append(await client.upload_pages_from_url(source_url, offset, length, offset, **request_options))
+        progress.add(length)
+
+    await _run_parallel(upload_pages, ranges, max_concurrency)
+    return responses[-1]
+
+
+async def copy_append_blob_from_url(
+        client=None,
+        source_url=None,
+        ranges=None,
+        progress=None,
+        request_options=None,
+        **kwargs):
+    response = await client.create_append_blob(**kwargs)
+    # Appended blocks must arrive in order, so they are copied one at a time
+    for offset, length in ranges:
+        response = await client.append_block_from_url(
+            source_url, source_offset=offset, source_length=length, appendpos_condition=offset, **request_options)
+        progress.add(length)
+    return response
@@ -0,0 +1,21 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+from .._list_blobs_helper import build_list_blobs_request, process_list_blobs_response
+
+
+async def list_blobs_segment(operations, delimiter=None, **kwargs):
+    """List a page of blobs with the streaming listing parser.
+
+    Takes the same arguments as the generated list_blob_flat_segment and list_blob_hierarchy_segment
+    operations, and returns BlobProperties instead of generated models.
+    """
+    error_map = kwargs.pop('error_map', None)
+    cls = kwargs.pop('cls', None)
+    request, kwargs = build_list_blobs_request(operations, delimiter=delimiter, **kwargs)
+    pipeline_response = await operations._client._pipeline.run(  # pylint: disable=protected-access
+        request, stream=False, **kwargs)
+    return process_list_blobs_response(operations, pipeline_response, error_map=error_map, cls=cls)
@@ -0,0 +1,91 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import datetime
+import sys
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+from msrest import Deserializer
+
+from azure.storage.blob._generated import models
+from azure.storage.blob._models import BlobProperties
+from azure.storage.blob._list_blobs_helper import deserialize_list_blobs
+
+# Compares the generated msrest deserialization of List Blobs pages with the
+# streaming listing parser. Runs offline against synthetic responses.
+
+# NAME, BLOBS PER PAGE, INCLUDE METADATA
+LIST_PAGES = [
+    ('LIST-00500', 500, False),
+    ('LIST-05000', 5000, False),
+    ('LIST-05000+META', 5000, True),
+]
+
+ITERATIONS = 5
+
+BLOB_TEMPLATE = (
+    '<Blob><Name>folder/blob-{0:08d}.txt</Name><Properties>'
+    '<Creation-Time>Tue, 05 May 2020 18:32:10 GMT</Creation-Time>'
+    '<Last-Modified>Tue, 05 May 2020 18:32:10 GMT</Last-Modified>'
+    '<Etag>0x8D7F1274E{0:07X}</Etag><Content-Length>{1}</Content-Length>'
+    '<Content-Type>application/octet-stream</Content-Type><Content-Encoding /><Content-Language />'
+    '<Content-MD5>1B2M2Y8AsgTpgAmY7PhCfg==</Content-MD5><Cache-Control /><Content-Disposition />'
+    '<BlobType>BlockBlob</BlobType><AccessTier>Hot</AccessTier><AccessTierInferred>true</AccessTierInferred>'
+    '<LeaseStatus>unlocked</LeaseStatus><LeaseState>available</LeaseState>'
+    '<ServerEncrypted>true</ServerEncrypted></Properties>{2}</Blob>')
+
+
+def list_response(count, include_metadata):
+    metadata = '<Metadata><owner>perf</owner><index>{0}</index></Metadata>'
+    blobs = ''.join(
+        BLOB_TEMPLATE.format(i, i * 512, metadata.format(i) if include_metadata else '') for i in range(count))
+    body = (
+        '﻿<?xml version="1.0" encoding="utf-8"?>'
+        '<EnumerationResults ServiceEndpoint="https://account.blob.core.windows.net/" ContainerName="performance">'
+        '<MaxResults>{0}</MaxResults><Blobs>{1}</Blobs><NextMarker>2!100!MDAwMDE1IWZvbGRlci9ibG9i</NextMarker>'
+        '</EnumerationResults>').format(count, blobs)
+    return body.encode('utf-8')
+
+
+def generated_list(body):
+    deserialize = Deserializer({k: v for k, v in models.__dict__.items() if isinstance(v, type)})
+    response = deserialize('ListBlobsFlatSegmentResponse', ET.fromstring(body.lstrip(b'\xef\xbb\xbf')))
+    blobs = []
+    for item in response.segment.blob_items:
+        blob = BlobProperties._from_generated(item)  # pylint: disable=protected-access
+        blob.container = response.container_name
+        blobs.append(blob)
+    return blobs
+
+
+def streaming_list(body):
+    return deserialize_list_blobs(body).segment.blob_items
+
+
+def measure(parse, body, count):
+    sys.stdout.write('\t{0}:'.format(parse.__name__))
+    tracemalloc.start()
+    start_time = datetime.datetime.now()
+    for _ in range(ITERATIONS):
+        blobs = parse(body)
+    elapsed_time = datetime.datetime.now() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(blobs) == count
+    sys.stdout.write('{0:.0f} items/s, peak {1:.1f}MB'.format(
+        count * ITERATIONS / elapsed_time.total_seconds(), peak / 1048576.0))
+
+
+def main():
+    for name, count, include_metadata in LIST_PAGES:
+        body = list_response(count, include_metadata)
+        sys.stdout.write(name)
+        measure(generated_list, body, count)
+        measure(streaming_list, body, count)
+        print('')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+# coding: utf-8
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import asyncio
+import os
+import shutil
+import tempfile
+import unittest
+
+from azure.core import MatchConditions
+from azure.core.exceptions import HttpResponseError, ResourceModifiedError
+
+from azure.storage.blob import BlobCache, BlobProperties
+from azure.storage.blob.aio import BlobCache as AsyncBlobCache
+
+
+class _FakeResponse(object):
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.reason = None
+
+
+class FakeDownloader(object):
+    def __init__(self, content, properties):
+        self._content = content
+        self.properties = properties
+
+    def readall(self):
+        return self._content
+
+
+class FakeBlobClient(object):
+    """Serves ranged, conditional downloads of an in-memory blob and records the requests."""
+
+    primary_hostname = 'account.blob.core.windows.net'
+    container_name = 'container'
+    blob_name = 'model.bin'
+    snapshot = None
+    require_encryption = False
+    key_encryption_key = None
+    key_resolver_function = None
+
+    def __init__(self, content):
+        self.requests = []
+        self.set_content(content)
+
+    def set_content(self, content):
+        self.content = content
+        self.etag = '"0x{}"'.format(len(self.requests) + len(content))
+
+    def _properties(self, start, end):
+        properties = BlobProperties()
+        properties.etag = self.etag
+        properties.size = len(self.content)
+        properties.content_range = "bytes {}-{}/{}".format(start, end, len(self.content))
+        return properties
+
+    def download_blob(self, offset=None, length=None, etag=None, match_condition=None, **kwargs):
+        self.requests.append((offset, length, match_condition))
+        if match_condition == MatchConditions.IfModified and etag == self.etag:
+            raise ResourceModifiedError("Not modified", response=_FakeResponse(304))
+        if match_condition == MatchConditions.IfNotModified and etag != self.etag:
+            raise ResourceModifiedError("Condition not met", response=_FakeResponse(412))
+        if offset >= len(self.content):
+            raise HttpResponseError("Range not satisfiable", response=_FakeResponse(416))
+        end = min(offset + length, len(self.content))
+        return FakeDownloader(self.content[offset:end], self._properties(offset, end - 1))
+
+    def get_blob_properties(self, **kwargs):
+        return self._properties(0, 0)
+
+
+class AsyncFakeDownloader(FakeDownloader):
+    async def readall(self):
+        return self._content
+
+
+class AsyncFakeBlobClient(FakeBlobClient):
+    async def download_blob(self, **kwargs):
+        downloader = super(AsyncFakeBlobClient, self).download_blob(**kwargs)
+        return AsyncFakeDownloader(downloader.readall(), downloader.properties)
+
+    async def get_blob_properties(self, **kwargs):
+        return super(AsyncFakeBlobClient, self).get_blob_properties(**kwargs)
+
+
+class BlobCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.content = os.urandom(10 * 1024 + 100)
+        self.blob = FakeBlobClient(self.content)
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_download_blob_read_through(self):
+        cache = BlobCache(self.path, block_size=1024)
+
+        self.assertEqual(cache.download_blob(self.blob), self.content)
+        self.assertEqual(len(self.blob.requests), 2)
+
+        # A second read only revalidates the first block
+        self.assertEqual(cache.download_blob(self.blob), self.content)
+        self.assertEqual(len(self.blob.requests), 3)
+        self.assertEqual(self.blob.requests[-1], (0, 1024, MatchConditions.IfModified))
+
+    def test_download_blob_within_max_age(self):
+        cache = BlobCache(self.path, block_size=1024, max_age=60)
+        cache.download_blob(self.blob)
+        requests = len(self.blob.requests)
+
+        self.assertEqual(cache.download_blob(self.blob, offset=3000, length=10), self.content[3000:3010])
+        self.assertEqual(len(self.blob.requests), requests)
+
+    def test_download_blob_shared_between_caches(self):
+        BlobCache(self.path, block_size=1024).download_blob(self.blob)
+        requests = len(self.blob.requests)
+
+        other = BlobCache(self.path, block_size=1024, max_age=60)
+        self.assertEqual(other.download_blob(self.blob), self.content)
+        self.assertEqual(len(self.blob.requests), requests)
+
+    def test_download_blob_range_reads_cached_blocks(self):
+        cache = BlobCache(self.path, block_size=1024)
+
+        self.assertEqual(cache.download_blob(self.blob, offset=2000, length=1500), self.content[2000:3500])
+        # The first block is fetched by the validating GET, the next two in a single request
+        self.assertEqual(self.blob.requests, [(1024, 1024, None), (2048, 2048, MatchConditions.IfNotModified)])
+
+        self.assertEqual(cache.download_blob(self.blob, offset=1024, length=2048), self.content[1024:3072])
+        self.assertEqual(len(self.blob.requests), 3)
+
+        self.assertEqual(cache.download_blob(self.blob, offset=10 * 1024), self.content[10 * 1024:])
+        self.assertEqual(cache.download_blob(self.blob, offset=len(self.content) + 5, length=1), b"")
+
+    def test_download_blob_refreshes_modified_blob(self):
+        cache = BlobCache(self.path, block_size=1024)
+        cache.download_blob(self.blob)
+
+        updated = os.urandom(3000)
+        self.blob.set_content(updated)
+        self.assertEqual(cache.download_blob(self.blob), updated)
+
+    def test_download_blob_modified_during_read(self):
+        cache = BlobCache(self.path, block_size=1024, max_age=60)
+        cache.download_blob(self.blob, offset=0, length=10)
+
+        # The cached entry is still fresh, but missing blocks can no longer be read with its ETag
+        updated = os.urandom(5000)
+        self.blob.set_content(updated)
+        self.assertEqual(cache.download_blob(self.blob), updated)
+
+    def test_download_empty_blob(self):
+        cache = BlobCache(self.path, block_size=1024)
+        self.blob.set_content(b"")
+        self.assertEqual(cache.download_blob(self.blob), b"")
+
+    def test_eviction(self):
+        cache = BlobCache(self.path, block_size=1024, max_size=4 * 1024)
+        self.assertEqual(cache.download_blob(self.blob), self.content)
+
+        blocks = os.listdir(os.path.join(self.path, 'blocks'))
+        self.assertLessEqual(len(blocks), 4)
+        self.assertEqual(cache.download_blob(self.blob), self.content)
+
+    def test_invalidate_and_clear(self):
+        cache = BlobCache(self.path, block_size=1024, max_age=60)
+        cache.download_blob(self.blob)
+        cache.invalidate(self.blob)
+        requests = len(self.blob.requests)
+        cache.download_blob(self.blob)
+        self.assertEqual(self.blob.requests[requests], (0, 1024, None))
+
+        cache.clear()
+        self.assertEqual(os.listdir(os.path.join(self.path, 'blocks')), [])
+
+    def test_client_side_encryption_not_supported(self):
+        self.blob.require_encryption = True
+        with self.assertRaises(ValueError):
+            BlobCache(self.path).download_blob(self.blob)
+
+    def test_download_blob_async(self):
+        blob = AsyncFakeBlobClient(self.content)
+        cache = AsyncBlobCache(self.path, block_size=1024)
+
+        async def _download():
+            first = await cache.download_blob(blob, offset=100, length=3000)
+            second = await cache.download_blob(blob)
+            return first, second
+
+        first, second = asyncio.get_event_loop().run_until_complete(_download())
+        self.assertEqual(first, self.content[100:3100])
+        self.assertEqual(second, self.content)
+        self.assertEqual(blob.requests[2:], [
+            (0, 1024, MatchConditions.IfModified), (4096, 7168, MatchConditions.IfNotModified)])
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+# coding: utf-8
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import asyncio
+import base64
+import threading
+import unittest
+
+from azure.core.pipeline.transport import HttpTransport, HttpResponse
+from requests.structures import CaseInsensitiveDict
+try:
+    from urllib.parse import urlparse, parse_qs
+except ImportError:
+    from urlparse import urlparse, parse_qs  # type: ignore
+
+from azure.storage.blob import BlobClient, BlobType
+from azure.storage.blob._copy_helpers import CopyProgress, get_copy_ranges
+from azure.storage.blob.aio._copy_helpers import copy_block_blob_from_url
+
+SOURCE_URL = 'https://source.blob.core.windows.net/container/source?sv=2019-07-07&sig=fake'
+DESTINATION_URL = 'https://destination.blob.core.windows.net/container/destination'
+
+
+class _Response(HttpResponse):
+    def __init__(self, request, status_code, headers=None, body=b''):
+        super(_Response, self).__init__(request, None)
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict({
+            'ETag': '"0x8D7F1274E7A5B9C"',
+            'Last-Modified': 'Tue, 05 May 2020 18:32:11 GMT',
+            'Content-Length': str(len(body))})
+        self.headers.update(headers or {})
+        self.content_type = self.headers.get('Content-Type')
+        self.reason = 'OK'
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class FakeTransport(HttpTransport):
+    """Answers the blob requests made by a copy and records them."""
+
+    def __init__(self, source_size, source_type='BlockBlob', page_ranges=None):
+        self.source_size = source_size
+        self.source_type = source_type
+        self.page_ranges = page_ranges or []
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, request, **kwargs):
+        url = urlparse(request.url)
+        query = parse_qs(url.query)
+        with self.lock:
+            self.requests.append((request.method, url.netloc, query.get('comp', [None])[0], request.headers))
+        if request.method == 'HEAD':
+            return _Response(request, 200, {
+                'x-ms-blob-type': self.source_type,
+                'Content-Length': str(self.source_size)})
+        if query.get('comp') == ['pagelist']:
+            ranges = ''.join('<PageRange><Start>{}</Start><End>{}</End></PageRange>'.format(*r) for r in self.page_ranges)
+            body = '<?xml version="1.0" encoding="utf-8"?><PageList>{}</PageList>'.format(ranges).encode('utf-8')
+            return _Response(request, 200, {'Content-Type': 'application/xml'}, body)
+        return _Response(request, 201)
+
+
+class CopyFromUrlParallelTest(unittest.TestCase):
+    def _client(self, transport):
+        credential = {'account_name': 'destination', 'account_key': base64.b64encode(b'fakekey').decode()}
+        return BlobClient.from_blob_url(DESTINATION_URL, credential=credential, transport=transport, max_block_size=1024)
+
+    def _destination_requests(self, transport, comp):
+        return [r for r in transport.requests if r[1].startswith('destination') and r[2] == comp]
+
+    def test_copy_block_blob(self):
+        transport = FakeTransport(5000)
+        progress = []
+        blob = self._client(transport)
+
+        response = blob.copy_from_url_parallel(
+            SOURCE_URL, metadata={'copied': 'true'}, max_concurrency=3,
+            progress_hook=lambda current, total: progress.append((current, total)))
+
+        self.assertEqual(response['etag'], '"0x8D7F1274E7A5B9C"')
+        source_requests = [r for r in transport.requests if r[1].startswith('source')]
+        self.assertEqual([r[0] for r in source_requests], ['HEAD'])
+        # The source is authorized by its SAS, not by the destination credential
+        self.assertNotIn('Authorization', source_requests[0][3])
+
+        staged = self._destination_requests(transport, 'block')
+        self.assertEqual(sorted(r[3]['x-ms-source-range'] for r in staged), [
+            'bytes=0-1023', 'bytes=1024-2047', 'bytes=2048-3071', 'bytes=3072-4095', 'bytes=4096-4999'])
+        self.assertTrue(all(r[3]['x-ms-copy-source'] == SOURCE_URL for r in staged))
+
+        commit = self._destination_requests(transport, 'blocklist')
+        self.assertEqual(len(commit), 1)
+        self.assertEqual(commit[0][3]['x-ms-meta-copied'], 'true')
+        self.assertEqual(sorted(progress)[-1], (5000, 5000))
+        self.assertEqual(len(progress), 5)
+
+    def test_copy_sparse_page_blob(self):
+        transport = FakeTransport(16 * 1024, 'PageBlob', page_ranges=[(0, 511), (8192, 9215)])
+        blob = self._client(transport)
+
+        blob.copy_from_url_parallel(SOURCE_URL, chunk_size=512)
+
+        create = [r for r in transport.requests if r[1].startswith('destination') and r[2] is None]
+        self.assertEqual(create[0][3]['x-ms-blob-type'], 'PageBlob')
+        self.assertEqual(create[0][3]['x-ms-blob-content-length'], str(16 * 1024))
+        pages = self._destination_requests(transport, 'page')
+        self.assertEqual(sorted(r[3]['x-ms-range'] for r in pages), [
+            'bytes=0-511', 'bytes=8192-8703', 'bytes=8704-9215'])
+
+    def test_copy_append_blob_without_source_lookup(self):
+        transport = FakeTransport(0)
+        blob = self._client(transport)
+
+        blob.copy_from_url_parallel(
+            SOURCE_URL, blob_type=BlobType.AppendBlob, source_length=9 * 1024 * 1024)
+
+        self.assertFalse([r for r in transport.requests if r[1].startswith('source')])
+        appended = self._destination_requests(transport, 'appendblock')
+        self.assertEqual([r[3]['x-ms-blob-condition-appendpos'] for r in appended], ['0', '4194304', '8388608'])
+        self.assertEqual(appended[-1][3]['x-ms-source-range'], 'bytes=8388608-9437183')
+
+    def test_get_copy_ranges(self):
+        # The default block size grows to keep within the service limit of 50,000 blocks
+        ranges = get_copy_ranges(BlobType.BlockBlob, 50000 * 4 + 1, default_chunk_size=4)
+        self.assertEqual(len(ranges), 40001)
+        self.assertEqual(ranges[1], (5, 5))
+        with self.assertRaises(ValueError):
+            get_copy_ranges(BlobType.BlockBlob, 200 * 1024, chunk_size=1)
+        with self.assertRaises(ValueError):
+            get_copy_ranges(BlobType.PageBlob, 1000)
+        self.assertEqual(get_copy_ranges(BlobType.AppendBlob, 0), [])
+
+    def test_copy_block_blob_async(self):
+        class AsyncFakeBlobClient(object):
+            def __init__(self):
+                self.staged = []
+
+            async def stage_block_from_url(self, block_id, source_url, source_offset=None, source_length=None):
+                await asyncio.sleep(0)
+                self.staged.append((block_id, source_offset, source_length))
+
+            async def commit_block_list(self, block_list, **kwargs):
+                return {'block_list': block_list, 'metadata': kwargs.get('metadata')}
+
+        blob = AsyncFakeBlobClient()
+        ranges = get_copy_ranges(BlobType.BlockBlob, 2500, chunk_size=1000)
+        response = asyncio.get_event_loop().run_until_complete(copy_block_blob_from_url(
+            client=blob, source_url=SOURCE_URL, ranges=ranges, max_concurrency=2,
+            progress=CopyProgress(2500), request_options={}, metadata={'a': 'b'}))
+
+        self.assertEqual(response['block_list'], ['{0:032d}'.format(offset) for offset in (0, 1000, 2000)])
+        self.assertEqual(sorted(s[1:] for s in blob.staged), [(0, 1000), (1000, 1000), (2000, 500)])
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
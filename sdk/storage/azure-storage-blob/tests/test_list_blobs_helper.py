@@ -0,0 +1,98 @@
+# coding: utf-8
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import unittest
+import xml.etree.ElementTree as ET
+
+from msrest import Deserializer
+
+from azure.storage.blob import BlobProperties, BlobType
+from azure.storage.blob._generated import models
+from azure.storage.blob._list_blobs_helper import deserialize_list_blobs
+
+LIST_BLOBS_RESPONSE = (
+    b'\xef\xbb\xbf<?xml version="1.0" encoding="utf-8"?>'
+    b'<EnumerationResults ServiceEndpoint="https://account.blob.core.windows.net/" ContainerName="container">'
+    b'<Prefix>dir</Prefix><MaxResults>3</MaxResults><Delimiter>/</Delimiter><Blobs>'
+    b'<Blob><Name>dir1</Name><Snapshot>2020-05-05T18:32:10.1234567Z</Snapshot><Properties>'
+    b'<Creation-Time>Tue, 05 May 2020 18:32:10 GMT</Creation-Time>'
+    b'<Last-Modified>Tue, 05 May 2020 18:32:11 GMT</Last-Modified><Etag>0x8D7F1274E7A5B9C</Etag>'
+    b'<Content-Length>1024</Content-Length><Content-Type>text/plain</Content-Type><Content-Encoding />'
+    b'<Content-Language /><Content-MD5>1B2M2Y8AsgTpgAmY7PhCfg==</Content-MD5><Cache-Control />'
+    b'<Content-Disposition /><x-ms-blob-sequence-number>0</x-ms-blob-sequence-number>'
+    b'<BlobType>PageBlob</BlobType><LeaseStatus>locked</LeaseStatus><LeaseState>leased</LeaseState>'
+    b'<LeaseDuration>infinite</LeaseDuration><CopyId>abc</CopyId><CopyStatus>success</CopyStatus>'
+    b'<CopySource>https://account.blob.core.windows.net/src</CopySource><CopyProgress>1024/1024</CopyProgress>'
+    b'<CopyCompletionTime>Tue, 05 May 2020 18:32:12 GMT</CopyCompletionTime>'
+    b'<ServerEncrypted>true</ServerEncrypted><AccessTier>P10</AccessTier>'
+    b'<AccessTierInferred>false</AccessTierInferred></Properties>'
+    b'<Metadata Encrypted="owner"><owner>storage</owner><empty /></Metadata></Blob>'
+    b'<BlobPrefix><Name>dir2/</Name></BlobPrefix>'
+    b'<Blob><Name>dir3</Name><Deleted>true</Deleted><Properties>'
+    b'<Last-Modified>Tue, 05 May 2020 18:32:11 GMT</Last-Modified><Etag>0x8D7F1274E7A5B9D</Etag>'
+    b'<Content-Length>0</Content-Length><BlobType>AppendBlob</BlobType>'
+    b'<DeletedTime>Wed, 06 May 2020 18:32:11 GMT</DeletedTime><RemainingRetentionDays>6</RemainingRetentionDays>'
+    b'<ServerEncrypted>false</ServerEncrypted></Properties><Metadata /></Blob>'
+    b'</Blobs><NextMarker>2!88!MDAwMDE</NextMarker></EnumerationResults>')
+
+
+class ListBlobsHelperTest(unittest.TestCase):
+    def _generated_response(self, body):
+        deserialize = Deserializer({k: v for k, v in models.__dict__.items() if isinstance(v, type)})
+        return deserialize('ListBlobsHierarchySegmentResponse', ET.fromstring(body[3:]))
+
+    def test_deserialize_list_blobs_matches_generated(self):
+        expected = self._generated_response(LIST_BLOBS_RESPONSE)
+        response = deserialize_list_blobs(LIST_BLOBS_RESPONSE)
+
+        for attr in ['service_endpoint', 'container_name', 'prefix', 'marker',
+                     'max_results', 'delimiter', 'next_marker']:
+            self.assertEqual(getattr(response, attr), getattr(expected, attr))
+        self.assertEqual([p.name for p in response.segment.blob_prefixes], ['dir2/'])
+        self.assertEqual(len(response.segment.blob_items), len(expected.segment.blob_items))
+
+        for blob, item in zip(response.segment.blob_items, expected.segment.blob_items):
+            expected_blob = BlobProperties._from_generated(item)  # pylint: disable=protected-access
+            expected_blob.container = expected.container_name
+            self.assertIsInstance(blob, BlobProperties)
+            for key, value in expected_blob.items():
+                if key in ['lease', 'copy', 'content_settings']:
+                    self.assertEqual(dict(blob[key]), dict(value))
+                else:
+                    self.assertEqual(blob[key], value)
+
+    def test_deserialize_list_blobs_values(self):
+        response = deserialize_list_blobs(LIST_BLOBS_RESPONSE)
+        first, second = response.segment.blob_items
+
+        self.assertEqual(first.name, 'dir1')
+        self.assertEqual(first.container, 'container')
+        self.assertEqual(first.blob_type, BlobType.PageBlob)
+        self.assertEqual(first.size, 1024)
+        self.assertEqual(first.page_blob_sequence_number, 0)
+        self.assertEqual(first.metadata, {'owner': 'storage', 'empty': None})
+        self.assertEqual(first.encrypted_metadata, 'owner')
+        self.assertEqual(first.content_settings.content_md5, bytearray(b'\xd4\x1d\x8c\xd9\x8f\x00\xb2\x04\xe9\x80\t\x98\xec\xf8B~'))
+        self.assertEqual(first.lease.status, 'locked')
+        self.assertEqual(first.copy.status, 'success')
+        self.assertFalse(first.blob_tier_inferred)
+        self.assertTrue(second.deleted)
+        self.assertEqual(second.remaining_retention_days, 6)
+        self.assertIsNone(second.metadata)
+        self.assertEqual(response.next_marker, '2!88!MDAwMDE')
+
+    def test_deserialize_list_blobs_empty(self):
+        body = (b'<?xml version="1.0" encoding="utf-8"?>'
+                b'<EnumerationResults ServiceEndpoint="https://account.blob.core.windows.net/" ContainerName="c">'
+                b'<Blobs /><NextMarker /></EnumerationResults>')
+        response = deserialize_list_blobs(body)
+        self.assertEqual(response.segment.blob_items, [])
+        self.assertEqual(response.next_marker, '')
+        self.assertIsNone(response.max_results)
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -28,6 +28,10 @@ from ._models import (
     UserDelegationKey,
     PublicAccess,
     AccessPolicy,
+    RecursiveChangeCounters,
+    RecursiveChangeFailure,
+    RecursiveChanges,
+    RecursiveChangeResult,
 )
 from ._shared_access_signature import generate_account_sas, generate_file_system_sas, generate_directory_sas, \
     generate_file_sas
@@ -60,6 +64,10 @@ __all__ = [
     'PathPropertiesPaged',
     'LeaseProperties',
     'ContentSettings',
+    'RecursiveChangeCounters',
+    'RecursiveChangeFailure',
+    'RecursiveChanges',
+    'RecursiveChangeResult',
     'AccountSasPermissions',
     'FileSystemSasPermissions',
     'DirectorySasPermissions',
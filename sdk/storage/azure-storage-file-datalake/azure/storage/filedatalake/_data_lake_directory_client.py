@@ -3,10 +3,22 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
+import functools
+
+try:
+    from urllib.parse import quote
+except ImportError:
+    from urllib2 import quote  # type: ignore
+
+import six
+
+from azure.core.paging import ItemPaged
 from ._shared.base_client import parse_connection_str
 from ._data_lake_file_client import DataLakeFileClient
-from ._models import DirectoryProperties
+from ._generated import DataLakeStorageClient
+from ._models import DirectoryProperties, PathProperties, PathPropertiesPaged
 from ._path_client import PathClient
+from ._recursive_helper import PathChangeApplier, apply_paths_recursive
 
 
 class DataLakeDirectoryClient(PathClient):
@@ -312,6 +324,173 @@ class DataLakeDirectoryClient(PathClient):
                                           **kwargs)
         return new_directory_client
 
+    def set_access_control_recursive(self, owner=None,  # type: Optional[str]
+                                     group=None,  # type: Optional[str]
+                                     permissions=None,  # type: Optional[str]
+                                     acl=None,  # type: Optional[str]
+                                     **kwargs):
+        # type: (...) -> RecursiveChangeResult
+        """
+        Set the owner, group, permissions, or access control list for the directory
+        and every file and directory under it.
+
+        The paths are listed page by page and changed concurrently, so the operation can be
+        applied to directories of any size. Paths that cannot be changed are collected in the result
+        rather than aborting the operation, and an interrupted operation can be resumed
+        with the returned continuation token.
+
+        :param owner:
+            Optional. The owner of the files and directories.
+        :type owner: str
+        :param group:
+            Optional. The owning group of the files and directories.
+        :type group: str
+        :param permissions:
+            Optional and only valid if Hierarchical Namespace
+            is enabled for the account. Sets POSIX access permissions for the file
+            owner, the file owning group, and others. Each class may be granted
+            read, write, or execute permission.  The sticky bit is also supported.
+            Both symbolic (rwxrw-rw-) and 4-digit octal notation (e.g. 0766) are
+            supported.
+            permissions and acl are mutually exclusive.
+        :type permissions: str
+        :param acl:
+            Sets POSIX access control rights on files and directories.
+            The value is a comma-separated list of access control entries. Each
+            access control entry (ACE) consists of a scope, a type, a user or
+            group identifier, and permissions in the format
+            "[scope:][type]:[id]:[permissions]".
+            permissions and acl are mutually exclusive.
+        :type acl: str
+        :keyword int max_concurrency:
+            The number of paths to change in parallel. Defaults to 1.
+        :keyword int batch_size:
+            The maximum number of paths listed and changed per batch.
+        :keyword int max_batches:
+            The maximum number of batches to process before returning. The returned continuation
+            token can be used to resume the operation. By default every batch is processed.
+        :keyword str continuation:
+            A continuation token returned by a previous call, to resume the operation from
+            the batch after the last one processed.
+        :keyword bool continue_on_failure:
+            If False, the operation stops after the first batch containing a path that could not
+            be changed. Defaults to True.
+        :keyword progress_hook:
+            A callback invoked after every batch with a
+            :class:`~azure.storage.filedatalake.RecursiveChanges` describing the progress so far.
+        :paramtype progress_hook: Callable[[~azure.storage.filedatalake.RecursiveChanges], None]
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds, per request.
+        :return: The counters, failed paths and continuation token of the operation.
+        :rtype: ~azure.storage.filedatalake.RecursiveChangeResult
+        :raises ~azure.core.exceptions.AzureError:
+            If the operation is interrupted by an error other than an error response for a path.
+            Its `continuation_token` attribute resumes the operation from the interrupted batch.
+        """
+        if not any([owner, group, permissions, acl]):
+            raise ValueError("At least one parameter should be set for set_access_control_recursive API")
+        timeout = kwargs.get('timeout', None)
+        operation = functools.partial(
+            self._set_path_access_control, owner=owner, group=group, permissions=permissions, acl=acl, timeout=timeout)
+        return self._apply_recursive(operation, **kwargs)
+
+    def set_metadata_recursive(self, metadata,  # type: Dict[str, str]
+                               **kwargs):
+        # type: (...) -> RecursiveChangeResult
+        """
+        Set the metadata of the directory and every file and directory under it.
+
+        Each call replaces the existing metadata of every path.
+        The paths are listed page by page and changed concurrently; failures are collected in
+        the result and an interrupted operation can be resumed with the returned continuation token.
+
+        :param metadata:
+            A dict containing name-value pairs to associate with every path as
+            metadata. Example: {'category':'test'}
+        :type metadata: dict[str, str]
+        :keyword int max_concurrency:
+            The number of paths to change in parallel. Defaults to 1.
+        :keyword int batch_size:
+            The maximum number of paths listed and changed per batch.
+        :keyword int max_batches:
+            The maximum number of batches to process before returning. The returned continuation
+            token can be used to resume the operation. By default every batch is processed.
+        :keyword str continuation:
+            A continuation token returned by a previous call, to resume the operation from
+            the batch after the last one processed.
+        :keyword bool continue_on_failure:
+            If False, the operation stops after the first batch containing a path that could not
+            be changed. Defaults to True.
+        :keyword progress_hook:
+            A callback invoked after every batch with a
+            :class:`~azure.storage.filedatalake.RecursiveChanges` describing the progress so far.
+        :paramtype progress_hook: Callable[[~azure.storage.filedatalake.RecursiveChanges], None]
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds, per request.
+        :return: The counters, failed paths and continuation token of the operation.
+        :rtype: ~azure.storage.filedatalake.RecursiveChangeResult
+        :raises ~azure.core.exceptions.AzureError:
+            If the operation is interrupted by an error other than an error response for a path.
+            Its `continuation_token` attribute resumes the operation from the interrupted batch.
+        """
+        timeout = kwargs.get('timeout', None)
+        operation = functools.partial(self._set_path_metadata, metadata=metadata, timeout=timeout)
+        return self._apply_recursive(operation, **kwargs)
+
+    @staticmethod
+    def _set_path_access_control(path_client, **kwargs):
+        return path_client.set_access_control(**kwargs)
+
+    @staticmethod
+    def _set_path_metadata(path_client, metadata, **kwargs):
+        return path_client.set_metadata(metadata, **kwargs)
+
+    def _format_file_system_url(self):
+        file_system_name = self.file_system_name
+        if isinstance(file_system_name, six.text_type):
+            file_system_name = file_system_name.encode('UTF-8')
+        return "{}://{}/{}{}".format(
+            self.scheme,
+            self.primary_hostname,
+            quote(file_system_name),
+            self._query_str)
+
+    def _get_path_client(self, path):
+        if path.is_directory:
+            return self.get_sub_directory_client(path)
+        return self.get_file_client(path)
+
+    def _apply_recursive(self, operation, **kwargs):
+        # type: (Callable, **Any) -> RecursiveChangeResult
+        continuation = kwargs.pop('continuation', None)
+        root = None
+        if not continuation:
+            # the directory itself is changed as part of the first batch
+            root = PathProperties()
+            root.name = self.path_name
+            root.is_directory = True
+        applier = PathChangeApplier(
+            operation,
+            self._get_path_client,
+            max_batches=kwargs.pop('max_batches', None),
+            continue_on_failure=kwargs.pop('continue_on_failure', True),
+            progress_hook=kwargs.pop('progress_hook', None))
+
+        file_system = DataLakeStorageClient(
+            self._format_file_system_url(), self.file_system_name, None, pipeline=self._pipeline)
+        command = functools.partial(
+            file_system.file_system.list_paths,
+            path=self.path_name,
+            timeout=kwargs.pop('timeout', None))
+        pages = ItemPaged(
+            command, True, path=self.path_name, max_results=kwargs.pop('batch_size', None),
+            page_iterator_class=PathPropertiesPaged).by_page(continuation_token=continuation)
+        return apply_paths_recursive(
+            applier=applier,
+            pages=pages,
+            root=root,
+            max_concurrency=kwargs.pop('max_concurrency', 1))
+
     def create_sub_directory(self, sub_directory,  # type: Union[DirectoryProperties, str]
                              metadata=None,  # type: Optional[Dict[str, str]]
                              **kwargs):
@@ -270,6 +270,7 @@ class DataLakeFileClient(PathClient):
         content_settings = kwargs.pop('content_settings', None)
         metadata = kwargs.pop('metadata', None)
         max_concurrency = kwargs.pop('max_concurrency', 1)
+        chunk_size = kwargs.pop('chunk_size', 100 * 1024 * 1024)
 
         kwargs['properties'] = add_metadata_headers(metadata)
         kwargs['lease_access_conditions'] = get_access_conditions(kwargs.pop('lease', None))
@@ -282,6 +283,7 @@ class DataLakeFileClient(PathClient):
         kwargs['length'] = length
         kwargs['validate_content'] = validate_content
         kwargs['max_concurrency'] = max_concurrency
+        kwargs['chunk_size'] = chunk_size
         kwargs['client'] = self._client.path
 
         return kwargs
@@ -318,6 +320,13 @@ class DataLakeFileClient(PathClient):
          read, write, or execute permission.  The sticky bit is also supported.
          Both symbolic (rwxrw-rw-) and 4-digit octal notation (e.g. 0766) are
          supported.
+        :keyword int max_concurrency:
+            Maximum number of parallel connections to use when the data is appended in multiple chunks.
+            When the data is seekable, such as a local file, each connection reads its own range of the data,
+            so only the chunks in flight are buffered. The file is flushed once, after all chunks are appended.
+        :keyword int chunk_size:
+            The size of each chunk appended to the file, in bytes. Defaults to 100MB.
+            Smaller chunks allow more appends to be in flight for a given file size.
         :keyword ~datetime.datetime if_modified_since:
             A DateTime value. Azure expects the date value passed in to be UTC.
             If timezone is included, any non-UTC datetimes will be converted to UTC.
@@ -589,6 +589,72 @@ class PublicAccess(str, Enum):
         return None
 
 
+class RecursiveChangeCounters(DictMixin):
+    """Counters of the paths processed by a recursive directory operation.
+
+    :ivar int directories_successful:
+        Number of directories where the change was successfully applied.
+    :ivar int files_successful:
+        Number of files where the change was successfully applied.
+    :ivar int failure_count:
+        Number of paths where the change could not be applied.
+    """
+    def __init__(self, directories_successful=0, files_successful=0, failure_count=0):
+        self.directories_successful = directories_successful
+        self.files_successful = files_successful
+        self.failure_count = failure_count
+
+
+class RecursiveChangeFailure(DictMixin):
+    """A path where a recursive directory operation could not be applied.
+
+    :ivar str name: The full path of the file or directory.
+    :ivar bool is_directory: Whether the path is a directory.
+    :ivar str error_message: The reason why the change failed.
+    """
+    def __init__(self, **kwargs):
+        self.name = kwargs.get('name', None)
+        self.is_directory = kwargs.get('is_directory', False)
+        self.error_message = kwargs.get('error_message', None)
+
+
+class RecursiveChanges(DictMixin):
+    """Progress of a recursive directory operation, reported after every batch.
+
+    :ivar ~azure.storage.filedatalake.RecursiveChangeCounters batch_counters:
+        Counters of the paths processed in the last batch.
+    :ivar ~azure.storage.filedatalake.RecursiveChangeCounters aggregate_counters:
+        Counters of the paths processed since the operation started.
+    :ivar list(~azure.storage.filedatalake.RecursiveChangeFailure) batch_failures:
+        The paths that failed in the last batch.
+    :ivar str continuation:
+        An opaque continuation token that can be used to resume the operation after the last batch.
+        None if every path has been processed.
+    """
+    def __init__(self, batch_counters, aggregate_counters, batch_failures, continuation):
+        self.batch_counters = batch_counters
+        self.aggregate_counters = aggregate_counters
+        self.batch_failures = batch_failures
+        self.continuation = continuation
+
+
+class RecursiveChangeResult(DictMixin):
+    """The result of a recursive directory operation.
+
+    :ivar ~azure.storage.filedatalake.RecursiveChangeCounters counters:
+        Counters of the paths processed by the operation.
+    :ivar list(~azure.storage.filedatalake.RecursiveChangeFailure) failed_entries:
+        Every path where the change could not be applied.
+    :ivar str continuation:
+        An opaque continuation token that can be used to resume the operation.
+        None if every path has been processed.
+    """
+    def __init__(self, counters, failed_entries, continuation):
+        self.counters = counters
+        self.failed_entries = failed_entries
+        self.continuation = continuation
+
+
 class LocationMode(object):
     """
     Specifies the location the request should be sent to. This mode only applies
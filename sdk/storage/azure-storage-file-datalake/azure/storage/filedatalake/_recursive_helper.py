@@ -0,0 +1,156 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+# pylint: disable=no-self-use
+
+from concurrent import futures
+
+from azure.core.exceptions import AzureError, HttpResponseError
+from azure.core.tracing.common import with_current_context
+
+from ._models import RecursiveChangeCounters, RecursiveChangeFailure, RecursiveChanges, RecursiveChangeResult
+
+
+class PathChangeApplier(object):  # pylint: disable=too-many-instance-attributes
+    """Applies a single path operation to every entry streamed from a recursive path listing.
+
+    :param callable operation: Called with the path client of every path to change.
+    :param callable get_path_client: Called with a PathProperties to get the client the operation is applied to.
+    :param int max_batches: Stop after this many batches, returning the continuation token.
+    :param bool continue_on_failure: If False, stop after the first batch that contains a failure.
+    :param callable progress_hook: Called with a RecursiveChanges after every batch.
+    """
+
+    def __init__(
+            self, operation,
+            get_path_client,
+            max_batches=None,
+            continue_on_failure=True,
+            progress_hook=None):
+        self.operation = operation
+        self.get_path_client = get_path_client
+        self.max_batches = max_batches
+        self.continue_on_failure = continue_on_failure
+        self.progress_hook = progress_hook
+
+        self.counters = RecursiveChangeCounters()
+        self.failed_entries = []
+        self.batch_count = 0
+
+    def apply(self, path):
+        try:
+            self.operation(self.get_path_client(path))
+        except HttpResponseError as error:
+            return RecursiveChangeFailure(
+                name=path.name,
+                is_directory=path.is_directory,
+                error_message=error.message)
+        return None
+
+    def should_continue(self, continuation, batch_failures):
+        if not continuation:
+            return False
+        if batch_failures and not self.continue_on_failure:
+            return False
+        return self.max_batches is None or self.batch_count < self.max_batches
+
+    def record_batch(self, batch, results, continuation):
+        batch_counters = RecursiveChangeCounters()
+        batch_failures = []
+        for path, failure in zip(batch, results):
+            if failure is not None:
+                batch_failures.append(failure)
+                batch_counters.failure_count += 1
+            elif path.is_directory:
+                batch_counters.directories_successful += 1
+            else:
+                batch_counters.files_successful += 1
+
+        self.batch_count += 1
+        self.counters.directories_successful += batch_counters.directories_successful
+        self.counters.files_successful += batch_counters.files_successful
+        self.counters.failure_count += batch_counters.failure_count
+        self.failed_entries.extend(batch_failures)
+
+        if self.progress_hook:
+            aggregate_counters = RecursiveChangeCounters(
+                directories_successful=self.counters.directories_successful,
+                files_successful=self.counters.files_successful,
+                failure_count=self.counters.failure_count)
+            self.progress_hook(RecursiveChanges(
+                batch_counters=batch_counters,
+                aggregate_counters=aggregate_counters,
+                batch_failures=batch_failures,
+                continuation=continuation))
+        return batch_failures
+
+    def get_result(self, continuation):
+        return RecursiveChangeResult(
+            counters=self.counters,
+            failed_entries=self.failed_entries,
+            continuation=continuation)
+
+
+def _next_batch(pages):
+    try:
+        return list(next(pages))
+    except StopIteration:
+        return None
+
+
+def apply_paths_recursive(
+        applier=None,
+        pages=None,
+        root=None,
+        max_concurrency=1):
+    """Stream the pages of a recursive listing and apply the change to every path.
+
+    The listing of the next page overlaps with the changes being applied to the current one,
+    so at most two pages of paths are held in memory at any time.
+
+    :param applier: The PathChangeApplier holding the operation and progress state.
+    :param pages: The page iterator of the recursive listing, positioned at the page to resume from.
+    :param root: PathProperties of the directory itself, applied as part of the first batch.
+    :param int max_concurrency: The number of paths changed in parallel.
+    :rtype: ~azure.storage.filedatalake.RecursiveChangeResult
+    :raises ~azure.core.exceptions.AzureError:
+        If a path could not be listed or changed for another reason than an error response. The
+        error has a `continuation_token` attribute to resume the operation from the interrupted batch.
+    """
+    executor = futures.ThreadPoolExecutor(max_concurrency) if max_concurrency > 1 else None
+    # The continuation token the batch being changed was listed with
+    resume_continuation = pages.continuation_token
+    try:
+        batch = _next_batch(pages) or []
+        if root is not None:
+            batch.insert(0, root)
+        continuation = pages.continuation_token
+        while batch is not None:
+            if executor:
+                running = [executor.submit(with_current_context(applier.apply), path) for path in batch]
+            else:
+                running = None
+                results = [applier.apply(path) for path in batch]
+
+            # Prefetch the next page while the current one is being changed
+            next_batch = None
+            if continuation and (applier.max_batches is None or applier.batch_count + 1 < applier.max_batches):
+                next_batch = _next_batch(pages)
+
+            if running is not None:
+                results = [f.result() for f in running]
+            batch_failures = applier.record_batch(batch, results, continuation)
+            if not applier.should_continue(continuation, batch_failures):
+                break
+            batch = next_batch
+            resume_continuation = continuation
+            continuation = pages.continuation_token
+    except AzureError as error:
+        error.continuation_token = resume_continuation or None
+        raise
+    finally:
+        if executor:
+            executor.shutdown(wait=True)
+    return applier.get_result(continuation or None)
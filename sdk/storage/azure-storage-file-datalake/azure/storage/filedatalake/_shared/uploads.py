@@ -5,6 +5,7 @@
 # --------------------------------------------------------------------------
 # pylint: disable=no-self-use
 
+import os
 from concurrent import futures
 from io import (BytesIO, IOBase, SEEK_CUR, SEEK_END, SEEK_SET, UnsupportedOperation)
 from threading import Lock
@@ -124,6 +125,82 @@ def upload_substream_blocks(
     return sorted(range_ids)
 
 
+def upload_positional_chunks(
+        service=None,
+        uploader_class=None,
+        total_size=None,
+        chunk_size=None,
+        max_concurrency=None,
+        stream=None,
+        **kwargs):
+    """Upload a seekable stream of known size, each chunk being read at its offset by the worker uploading it.
+
+    Only the chunks being uploaded are buffered, and no chunk is read before a worker is free to upload it.
+    Returns the end of the contiguous range of the stream uploaded from its current position.
+    """
+    parallel = max_concurrency > 1
+    if parallel and 'modified_access_conditions' in kwargs:
+        # Access conditions do not work with parallelism
+        kwargs['modified_access_conditions'] = None
+    uploader = uploader_class(
+        service=service,
+        total_size=total_size,
+        chunk_size=chunk_size,
+        stream=stream,
+        parallel=parallel,
+        **kwargs)
+
+    if parallel:
+        executor = futures.ThreadPoolExecutor(max_concurrency)
+        upload_tasks = uploader.get_positional_chunks()
+        running_futures = [
+            executor.submit(with_current_context(uploader.process_positional_chunk), u)
+            for u in islice(upload_tasks, 0, max_concurrency)
+        ]
+        _parallel_uploads(executor, uploader.process_positional_chunk, upload_tasks, running_futures)
+    else:
+        for chunk in uploader.get_positional_chunks():
+            uploader.process_positional_chunk(chunk)
+    return uploader.committed_offset
+
+
+def read_stream_at(stream, position, length, fileno=None, lock=None):
+    """Read exactly length bytes of a seekable stream at the given position."""
+    if fileno is not None and hasattr(os, 'pread'):
+        # Local files are read without moving the shared file pointer, so no lock is needed
+        data = b""
+        while len(data) < length:
+            temp = os.pread(fileno, length - len(data), position + len(data))
+            if not temp:
+                break
+            data += temp
+    else:
+        with lock:
+            stream.seek(position)
+            data = stream.read(length)
+    if not isinstance(data, six.binary_type):
+        raise TypeError("Blob data should be of type bytes.")
+    if len(data) != length:
+        raise ValueError("The stream ended before the expected upload length was read.")
+    return data
+
+
+class _CommittedRanges(object):
+    """Tracks the uploaded ranges of a stream and the end of their contiguous prefix."""
+
+    def __init__(self):
+        self.offset = 0
+        self._pending = {}
+        self._lock = Lock()
+
+    def add(self, start, length):
+        with self._lock:
+            self._pending[start] = start + length
+            # Advance over every range that is now contiguous with the committed prefix
+            while self.offset in self._pending:
+                self.offset = self._pending.pop(self.offset)
+
+
 class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
 
     def __init__(self, service, total_size, chunk_size, stream, parallel, encryptor=None, padder=None, **kwargs):
@@ -149,6 +226,15 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
         self.last_modified = None
         self.request_options = kwargs
 
+        # Positional reads
+        self.committed_ranges = _CommittedRanges()
+        self.positional_start = None
+        self.fileno = None
+
+    @property
+    def committed_offset(self):
+        return self.committed_ranges.offset
+
     def get_chunk_streams(self):
         index = 0
         while True:
@@ -205,6 +291,35 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
         self._update_progress(len(chunk_data))
         return range_id
 
+    def get_positional_chunks(self):
+        assert self.chunk_size is not None
+        total_size = self.total_size
+        if total_size is None:
+            total_size = get_length(self.stream)
+            if total_size is None:
+                raise ValueError("Unable to determine content length of upload data.")
+
+        self.positional_start = self.stream.tell()
+        try:
+            self.fileno = self.stream.fileno()
+        except (AttributeError, UnsupportedOperation, OSError):
+            self.fileno = None
+        if self.stream_lock is None:
+            self.stream_lock = Lock()
+
+        for offset in range(0, total_size, self.chunk_size):
+            yield offset, min(self.chunk_size, total_size - offset)
+
+    def process_positional_chunk(self, chunk):
+        chunk_offset, length = chunk
+        chunk_data = self._read_at(chunk_offset, length)
+        range_id = self._upload_chunk_with_progress(chunk_offset, chunk_data)
+        self.committed_ranges.add(chunk_offset, length)
+        return range_id
+
+    def _read_at(self, offset, length):
+        return read_stream_at(self.stream, self.positional_start + offset, length, self.fileno, self.stream_lock)
+
     def get_substream_blocks(self):
         assert self.chunk_size is not None
         lock = self.stream_lock
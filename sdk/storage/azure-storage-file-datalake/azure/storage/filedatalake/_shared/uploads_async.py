@@ -7,6 +7,7 @@
 
 import asyncio
 from asyncio import Lock
+from io import UnsupportedOperation
 from itertools import islice
 import threading
 
@@ -18,7 +19,7 @@ from . import encode_base64, url_quote
 from .request_handlers import get_length
 from .response_handlers import return_response_headers
 from .encryption import get_blob_encryptor_and_padder
-from .uploads import SubStream, IterStreamer  # pylint: disable=unused-import
+from .uploads import SubStream, IterStreamer, read_stream_at, _CommittedRanges  # pylint: disable=unused-import
 
 
 _LARGE_BLOB_UPLOAD_MAX_READ_BUFFER_SIZE = 4 * 1024 * 1024
@@ -127,6 +128,44 @@ async def upload_substream_blocks(
     return sorted(range_ids)
 
 
+async def upload_positional_chunks(
+        service=None,
+        uploader_class=None,
+        total_size=None,
+        chunk_size=None,
+        max_concurrency=None,
+        stream=None,
+        **kwargs):
+    """Upload a seekable stream of known size, each chunk being read at its offset by the task uploading it.
+
+    Only the chunks being uploaded are buffered, and no chunk is read before a task is free to upload it.
+    Returns the end of the contiguous range of the stream uploaded from its current position.
+    """
+    parallel = max_concurrency > 1
+    if parallel and 'modified_access_conditions' in kwargs:
+        # Access conditions do not work with parallelism
+        kwargs['modified_access_conditions'] = None
+    uploader = uploader_class(
+        service=service,
+        total_size=total_size,
+        chunk_size=chunk_size,
+        stream=stream,
+        parallel=parallel,
+        **kwargs)
+
+    if parallel:
+        upload_tasks = uploader.get_positional_chunks()
+        running_futures = [
+            asyncio.ensure_future(uploader.process_positional_chunk(u))
+            for u in islice(upload_tasks, 0, max_concurrency)
+        ]
+        await _parallel_uploads(uploader.process_positional_chunk, upload_tasks, running_futures)
+    else:
+        for chunk in uploader.get_positional_chunks():
+            await uploader.process_positional_chunk(chunk)
+    return uploader.committed_offset
+
+
 class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
 
     def __init__(self, service, total_size, chunk_size, stream, parallel, encryptor=None, padder=None, **kwargs):
@@ -152,6 +191,15 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
         self.last_modified = None
         self.request_options = kwargs
 
+        # Positional reads
+        self.committed_ranges = _CommittedRanges()
+        self.positional_start = None
+        self.fileno = None
+
+    @property
+    def committed_offset(self):
+        return self.committed_ranges.offset
+
     def get_chunk_streams(self):
         index = 0
         while True:
@@ -208,6 +256,33 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
         await self._update_progress(len(chunk_data))
         return range_id
 
+    def get_positional_chunks(self):
+        assert self.chunk_size is not None
+        total_size = self.total_size
+        if total_size is None:
+            total_size = get_length(self.stream)
+            if total_size is None:
+                raise ValueError("Unable to determine content length of upload data.")
+
+        self.positional_start = self.stream.tell()
+        try:
+            self.fileno = self.stream.fileno()
+        except (AttributeError, UnsupportedOperation, OSError):
+            self.fileno = None
+        if self.stream_lock is None:
+            self.stream_lock = threading.Lock()
+
+        for offset in range(0, total_size, self.chunk_size):
+            yield offset, min(self.chunk_size, total_size - offset)
+
+    async def process_positional_chunk(self, chunk):
+        chunk_offset, length = chunk
+        chunk_data = read_stream_at(
+            self.stream, self.positional_start + chunk_offset, length, self.fileno, self.stream_lock)
+        range_id = await self._upload_chunk_with_progress(chunk_offset, chunk_data)
+        self.committed_ranges.add(chunk_offset, length)
+        return range_id
+
     def get_substream_blocks(self):
         assert self.chunk_size is not None
         lock = self.stream_lock
@@ -236,6 +236,13 @@ class DataLakeFileClient(PathClient, DataLakeFileClientBase):
          read, write, or execute permission.  The sticky bit is also supported.
          Both symbolic (rwxrw-rw-) and 4-digit octal notation (e.g. 0766) are
          supported.
+        :keyword int max_concurrency:
+            Maximum number of parallel connections to use when the data is appended in multiple chunks.
+            When the data is seekable, such as a local file, each connection reads its own range of the data,
+            so only the chunks in flight are buffered. The file is flushed once, after all chunks are appended.
+        :keyword int chunk_size:
+            The size of each chunk appended to the file, in bytes. Defaults to 100MB.
+            Smaller chunks allow more appends to be in flight for a given file size.
         :keyword ~datetime.datetime if_modified_since:
             A DateTime value. Azure expects the date value passed in to be UTC.
             If timezone is included, any non-UTC datetimes will be converted to UTC.
@@ -0,0 +1,96 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+# pylint: disable=no-self-use
+
+import asyncio
+
+from azure.core.exceptions import AzureError, HttpResponseError
+
+from .._models import RecursiveChangeFailure
+from .._recursive_helper import PathChangeApplier
+
+
+class AsyncPathChangeApplier(PathChangeApplier):
+    """Applies a single async path operation to every entry streamed from a recursive path listing."""
+
+    async def apply(self, path):  # pylint: disable=invalid-overridden-method
+        try:
+            await self.operation(self.get_path_client(path))
+        except HttpResponseError as error:
+            return RecursiveChangeFailure(
+                name=path.name,
+                is_directory=path.is_directory,
+                error_message=error.message)
+        return None
+
+
+async def _next_batch(pages):
+    try:
+        page = await pages.__anext__()
+    except StopAsyncIteration:
+        return None
+    return [path async for path in page]
+
+
+async def _apply_batch(applier, batch, max_concurrency):
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _apply(path):
+        async with semaphore:
+            return await applier.apply(path)
+
+    return await asyncio.gather(*[_apply(path) for path in batch])
+
+
+async def apply_paths_recursive(
+        applier=None,
+        pages=None,
+        root=None,
+        max_concurrency=1):
+    """Stream the pages of a recursive listing and apply the change to every path.
+
+    The listing of the next page overlaps with the changes being applied to the current one,
+    so at most two pages of paths are held in memory at any time.
+
+    :param applier: The AsyncPathChangeApplier holding the operation and progress state.
+    :param pages: The async page iterator of the recursive listing, positioned at the page to resume from.
+    :param root: PathProperties of the directory itself, applied as part of the first batch.
+    :param int max_concurrency: The number of paths changed in parallel.
+    :rtype: ~azure.storage.filedatalake.RecursiveChangeResult
+    :raises ~azure.core.exceptions.AzureError:
+        If a path could not be listed or changed for another reason than an error response. The
+        error has a `continuation_token` attribute to resume the operation from the interrupted batch.
+    """
+    # The continuation token the batch being changed was listed with
+    resume_continuation = pages.continuation_token
+    try:
+        batch = await _next_batch(pages) or []
+        if root is not None:
+            batch.insert(0, root)
+        continuation = pages.continuation_token
+        while batch is not None:
+            running = asyncio.ensure_future(_apply_batch(applier, batch, max_concurrency))
+
+            # Prefetch the next page while the current one is being changed
+            next_batch = None
+            try:
+                if continuation and (applier.max_batches is None or applier.batch_count + 1 < applier.max_batches):
+                    next_batch = await _next_batch(pages)
+            except BaseException:
+                running.cancel()
+                raise
+
+            results = await running
+            batch_failures = applier.record_batch(batch, results, continuation)
+            if not applier.should_continue(continuation, batch_failures):
+                break
+            batch = next_batch
+            resume_continuation = continuation
+            continuation = pages.continuation_token
+    except AzureError as error:
+        error.continuation_token = resume_continuation or None
+        raise
+    return applier.get_result(continuation or None)
@@ -13,6 +13,7 @@ from .._generated.models import (
 from .._shared.response_handlers import return_response_headers
 from .._shared.uploads_async import (
     upload_data_chunks,
+    upload_positional_chunks,
     DataLakeFileChunkUploader)
 
 
@@ -25,6 +26,13 @@ def _any_conditions(modified_access_conditions=None, **kwargs):  # pylint: disab
     ])
 
 
+def _is_seekable(stream):
+    try:
+        return stream.seekable()
+    except (AttributeError, ValueError):
+        return False
+
+
 async def upload_datalake_file(  # pylint: disable=unused-argument
         client=None,
         stream=None,
@@ -32,6 +40,7 @@ async def upload_datalake_file(  # pylint: disable=unused-argument
         overwrite=None,
         validate_content=None,
         max_concurrency=None,
+        chunk_size=None,
         **kwargs):
     try:
         if length == 0:
@@ -67,15 +76,30 @@ async def upload_datalake_file(  # pylint: disable=unused-argument
             modified_access_conditions.if_modified_since = None
             modified_access_conditions.if_unmodified_since = None
 
-        await upload_data_chunks(
-            service=client,
-            uploader_class=DataLakeFileChunkUploader,
-            total_size=length,
-            chunk_size=100 * 1024 * 1024,
-            stream=stream,
-            max_concurrency=max_concurrency,
-            validate_content=validate_content,
-            **kwargs)
+        if max_concurrency > 1 and _is_seekable(stream):
+            # appends are issued in parallel, each worker reading its own range of the stream,
+            # and the file is flushed once every byte up to length has been appended
+            committed_offset = await upload_positional_chunks(
+                service=client,
+                uploader_class=DataLakeFileChunkUploader,
+                total_size=length,
+                chunk_size=chunk_size,
+                stream=stream,
+                max_concurrency=max_concurrency,
+                validate_content=validate_content,
+                **kwargs)
+            if committed_offset != length:
+                raise ValueError("Data appended up to offset {} instead of {}.".format(committed_offset, length))
+        else:
+            await upload_data_chunks(
+                service=client,
+                uploader_class=DataLakeFileChunkUploader,
+                total_size=length,
+                chunk_size=chunk_size,
+                stream=stream,
+                max_concurrency=max_concurrency,
+                validate_content=validate_content,
+                **kwargs)
 
         return await client.flush_data(position=length,
                                        path_http_headers=path_http_headers,
@@ -0,0 +1,98 @@
+# coding: utf-8
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import os
+import tempfile
+import threading
+import unittest
+from io import BytesIO
+
+from azure.storage.filedatalake._shared.uploads import (
+    _CommittedRanges,
+    upload_positional_chunks,
+    DataLakeFileChunkUploader)
+
+
+class FakePathOperations(object):
+    """Records the append_data calls made by the uploader."""
+
+    def __init__(self):
+        self.appended = {}
+        self.lock = threading.Lock()
+
+    def append_data(self, body, position, content_length, **kwargs):
+        assert len(body) == content_length
+        with self.lock:
+            self.appended[position] = body
+        return {'etag': '"0x1"'}
+
+
+class PositionalUploadTest(unittest.TestCase):
+    def setUp(self):
+        self.data = os.urandom(10 * 1024 + 17)
+
+    def _assert_appended(self, service, chunk_size):
+        self.assertEqual(sorted(service.appended), list(range(0, len(self.data), chunk_size)))
+        self.assertEqual(b"".join(service.appended[k] for k in sorted(service.appended)), self.data)
+
+    def test_upload_positional_chunks_from_local_file(self):
+        temp_file = tempfile.NamedTemporaryFile(delete=False)
+        try:
+            temp_file.write(b"header" + self.data)
+            temp_file.close()
+
+            service = FakePathOperations()
+            with open(temp_file.name, 'rb') as stream:
+                stream.read(6)
+                committed_offset = upload_positional_chunks(
+                    service=service,
+                    uploader_class=DataLakeFileChunkUploader,
+                    total_size=len(self.data),
+                    chunk_size=1024,
+                    stream=stream,
+                    max_concurrency=4)
+        finally:
+            os.remove(temp_file.name)
+
+        self.assertEqual(committed_offset, len(self.data))
+        self._assert_appended(service, 1024)
+
+    def test_upload_positional_chunks_from_memory(self):
+        service = FakePathOperations()
+        committed_offset = upload_positional_chunks(
+            service=service,
+            uploader_class=DataLakeFileChunkUploader,
+            total_size=len(self.data),
+            chunk_size=4096,
+            stream=BytesIO(self.data),
+            max_concurrency=2)
+
+        self.assertEqual(committed_offset, len(self.data))
+        self._assert_appended(service, 4096)
+
+    def test_upload_positional_chunks_stream_too_short(self):
+        with self.assertRaises(ValueError):
+            upload_positional_chunks(
+                service=FakePathOperations(),
+                uploader_class=DataLakeFileChunkUploader,
+                total_size=len(self.data) + 1,
+                chunk_size=4096,
+                stream=BytesIO(self.data),
+                max_concurrency=1)
+
+    def test_committed_ranges(self):
+        ranges = _CommittedRanges()
+        ranges.add(10, 10)
+        self.assertEqual(ranges.offset, 0)
+        ranges.add(0, 10)
+        self.assertEqual(ranges.offset, 20)
+        ranges.add(30, 5)
+        ranges.add(20, 10)
+        self.assertEqual(ranges.offset, 35)
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# coding: utf-8
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import asyncio
+import os
+import unittest
+from io import BytesIO
+
+from azure.storage.filedatalake._generated.models import ModifiedAccessConditions
+from azure.storage.filedatalake._shared.uploads_async import upload_positional_chunks, DataLakeFileChunkUploader
+from azure.storage.filedatalake.aio._upload_helper import upload_datalake_file
+
+
+class AsyncFakePathOperations(object):
+    """Records the append_data and flush_data calls made by the async upload helper."""
+
+    def __init__(self, failing_position=None):
+        self.appended = {}
+        self.flushes = []
+        self.failing_position = failing_position
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **kwargs):
+        return {'etag': '"0x1"'}
+
+    async def append_data(self, body, position, content_length, **kwargs):
+        assert len(body) == content_length
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if position == self.failing_position:
+                raise ValueError("The append failed.")
+            self.appended[position] = body
+        finally:
+            self.in_flight -= 1
+        return {'etag': '"0x1"'}
+
+    async def flush_data(self, position, **kwargs):
+        # every byte up to the flushed position has been appended
+        assert sum(len(body) for body in self.appended.values()) == position
+        self.flushes.append(position)
+        return {'etag': '"0x2"'}
+
+
+class PositionalUploadAsyncTest(unittest.TestCase):
+    def setUp(self):
+        self.data = os.urandom(10 * 1024 + 17)
+
+    def _upload(self, service, chunk_size, max_concurrency):
+        return upload_datalake_file(
+            client=service,
+            stream=BytesIO(self.data),
+            length=len(self.data),
+            overwrite=True,
+            validate_content=False,
+            max_concurrency=max_concurrency,
+            chunk_size=chunk_size,
+            modified_access_conditions=ModifiedAccessConditions())
+
+    def test_upload_positional_chunks_async(self):
+        service = AsyncFakePathOperations()
+        loop = asyncio.get_event_loop()
+        committed_offset = loop.run_until_complete(upload_positional_chunks(
+            service=service,
+            uploader_class=DataLakeFileChunkUploader,
+            total_size=len(self.data),
+            chunk_size=1024,
+            stream=BytesIO(self.data),
+            max_concurrency=4))
+
+        # the appended ranges are contiguous up to the end of the data
+        self.assertEqual(committed_offset, len(self.data))
+        self.assertEqual(sorted(service.appended), list(range(0, len(self.data), 1024)))
+        self.assertEqual(b"".join(service.appended[k] for k in sorted(service.appended)), self.data)
+        self.assertGreater(service.max_in_flight, 1)
+
+    def test_upload_datalake_file_flushes_once_async(self):
+        service = AsyncFakePathOperations()
+        loop = asyncio.get_event_loop()
+        response = loop.run_until_complete(self._upload(service, chunk_size=1024, max_concurrency=4))
+
+        self.assertEqual(response, {'etag': '"0x2"'})
+        self.assertEqual(service.flushes, [len(self.data)])
+        self.assertGreater(service.max_in_flight, 1)
+
+    def test_upload_datalake_file_failed_append_async(self):
+        service = AsyncFakePathOperations(failing_position=4096)
+        loop = asyncio.get_event_loop()
+        with self.assertRaises(ValueError):
+            loop.run_until_complete(self._upload(service, chunk_size=1024, max_concurrency=4))
+
+        # the file is not flushed when a range is missing
+        self.assertEqual(service.flushes, [])
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+# coding: utf-8
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import threading
+import unittest
+
+from azure.core.exceptions import HttpResponseError, ServiceRequestError
+from azure.storage.filedatalake import PathProperties
+from azure.storage.filedatalake._recursive_helper import PathChangeApplier, apply_paths_recursive
+
+
+def _path(name, is_directory=False):
+    path = PathProperties()
+    path.name = name
+    path.is_directory = is_directory
+    return path
+
+
+class FakePages(object):
+    """Mimics the page iterator of a recursive listing."""
+
+    def __init__(self, pages, continuation_token=None, failing_index=None):
+        self._pages = pages
+        self._index = int(continuation_token) if continuation_token else 0
+        self._failing_index = failing_index
+        self.continuation_token = continuation_token
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._index >= len(self._pages):
+            raise StopIteration
+        if self._index == self._failing_index:
+            raise ServiceRequestError("The connection was reset.")
+        page = self._pages[self._index]
+        self._index += 1
+        self.continuation_token = str(self._index) if self._index < len(self._pages) else None
+        return iter(page)
+
+    next = __next__
+
+
+class RecursiveHelperTest(unittest.TestCase):
+    def setUp(self):
+        self.pages = [
+            [_path('dir/a'), _path('dir/sub', True), _path('dir/sub/b')],
+            [_path('dir/c'), _path('dir/d')],
+            [_path('dir/e', True)],
+        ]
+        self.changed = []
+        self.lock = threading.Lock()
+        self.unreachable = set()
+
+    def _operation(self, name):
+        if name in self.unreachable:
+            self.unreachable.discard(name)
+            raise ServiceRequestError("The connection was reset.")
+        if name.endswith('/d'):
+            raise HttpResponseError(message="This request is not authorized to perform this operation.")
+        with self.lock:
+            self.changed.append(name)
+
+    def test_apply_paths_recursive(self):
+        progress = []
+        applier = PathChangeApplier(self._operation, lambda path: path.name, progress_hook=progress.append)
+
+        result = apply_paths_recursive(
+            applier=applier, pages=FakePages(self.pages), root=_path('dir', True), max_concurrency=3)
+
+        self.assertIsNone(result.continuation)
+        self.assertEqual(result.counters.directories_successful, 3)
+        self.assertEqual(result.counters.files_successful, 3)
+        self.assertEqual(result.counters.failure_count, 1)
+        self.assertEqual([f.name for f in result.failed_entries], ['dir/d'])
+        self.assertEqual(len(self.changed), 6)
+        self.assertIn('dir', self.changed)
+
+        self.assertEqual(len(progress), 3)
+        self.assertEqual(progress[0].batch_counters.files_successful, 2)
+        self.assertEqual(progress[0].continuation, '1')
+        self.assertEqual(progress[1].batch_failures[0].name, 'dir/d')
+        self.assertEqual(progress[2].aggregate_counters.failure_count, 1)
+        self.assertIsNone(progress[2].continuation)
+
+    def test_apply_paths_recursive_resume_with_continuation(self):
+        applier = PathChangeApplier(self._operation, lambda path: path.name, max_batches=1)
+        result = apply_paths_recursive(applier=applier, pages=FakePages(self.pages), root=_path('dir', True))
+        self.assertEqual(result.continuation, '1')
+        self.assertEqual(result.counters.files_successful, 2)
+
+        applier = PathChangeApplier(self._operation, lambda path: path.name)
+        result = apply_paths_recursive(applier=applier, pages=FakePages(self.pages, result.continuation))
+        self.assertIsNone(result.continuation)
+        self.assertEqual(result.counters.directories_successful, 1)
+        self.assertEqual(result.counters.files_successful, 1)
+        self.assertEqual(sorted(self.changed), ['dir', 'dir/a', 'dir/c', 'dir/e', 'dir/sub', 'dir/sub/b'])
+
+    def test_apply_paths_recursive_stop_on_failure(self):
+        applier = PathChangeApplier(self._operation, lambda path: path.name, continue_on_failure=False)
+        result = apply_paths_recursive(applier=applier, pages=FakePages(self.pages), max_concurrency=2)
+
+        self.assertEqual(result.continuation, '2')
+        self.assertEqual(result.counters.failure_count, 1)
+        self.assertNotIn('dir/e', self.changed)
+
+    def test_apply_paths_recursive_resume_after_connection_error(self):
+        self.unreachable.add('dir/c')
+        applier = PathChangeApplier(self._operation, lambda path: path.name)
+        with self.assertRaises(ServiceRequestError) as context:
+            apply_paths_recursive(
+                applier=applier, pages=FakePages(self.pages), root=_path('dir', True), max_concurrency=2)
+
+        # the interrupted batch is changed again
+        self.assertEqual(context.exception.continuation_token, '1')
+        applier = PathChangeApplier(self._operation, lambda path: path.name)
+        result = apply_paths_recursive(
+            applier=applier, pages=FakePages(self.pages, context.exception.continuation_token))
+        self.assertIsNone(result.continuation)
+        self.assertEqual([f.name for f in result.failed_entries], ['dir/d'])
+        self.assertEqual(sorted(self.changed), ['dir', 'dir/a', 'dir/c', 'dir/e', 'dir/sub', 'dir/sub/b'])
+
+    def test_apply_paths_recursive_listing_error(self):
+        applier = PathChangeApplier(self._operation, lambda path: path.name)
+        with self.assertRaises(ServiceRequestError) as context:
+            apply_paths_recursive(applier=applier, pages=FakePages(self.pages, failing_index=0))
+        self.assertIsNone(context.exception.continuation_token)
+
+        applier = PathChangeApplier(self._operation, lambda path: path.name)
+        with self.assertRaises(ServiceRequestError) as context:
+            apply_paths_recursive(applier=applier, pages=FakePages(self.pages, failing_index=2))
+        self.assertEqual(context.exception.continuation_token, '1')
+
+    def test_apply_paths_recursive_empty_directory(self):
+        applier = PathChangeApplier(self._operation, lambda path: path.name)
+        result = apply_paths_recursive(applier=applier, pages=FakePages([[]]), root=_path('dir', True))
+
+        self.assertIsNone(result.continuation)
+        self.assertEqual(result.counters.directories_successful, 1)
+        self.assertEqual(self.changed, ['dir'])
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
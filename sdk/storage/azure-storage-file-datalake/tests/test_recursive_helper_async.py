@@ -0,0 +1,121 @@
+# coding: utf-8
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import asyncio
+import unittest
+
+from azure.core.exceptions import HttpResponseError, ServiceRequestError
+from azure.storage.filedatalake import PathProperties
+from azure.storage.filedatalake.aio._recursive_helper import AsyncPathChangeApplier, apply_paths_recursive
+
+
+def _path(name, is_directory=False):
+    path = PathProperties()
+    path.name = name
+    path.is_directory = is_directory
+    return path
+
+
+class AsyncFakePages(object):
+    """Mimics the async page iterator of a recursive listing."""
+
+    def __init__(self, pages, continuation_token=None):
+        self._pages = pages
+        self._index = int(continuation_token) if continuation_token else 0
+        self.continuation_token = continuation_token
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._index >= len(self._pages):
+            raise StopAsyncIteration
+        page = self._pages[self._index]
+        self._index += 1
+        self.continuation_token = str(self._index) if self._index < len(self._pages) else None
+        return self._iterate(page)
+
+    @staticmethod
+    async def _iterate(page):
+        for path in page:
+            yield path
+
+
+class RecursiveHelperAsyncTest(unittest.TestCase):
+    def setUp(self):
+        self.pages = [
+            [_path('dir/a'), _path('dir/sub', True), _path('dir/sub/b')],
+            [_path('dir/c'), _path('dir/d')],
+            [_path('dir/e', True)],
+        ]
+        self.changed = []
+        self.unreachable = set()
+
+    async def _operation(self, name):
+        await asyncio.sleep(0)
+        if name in self.unreachable:
+            self.unreachable.discard(name)
+            raise ServiceRequestError("The connection was reset.")
+        if name.endswith('/d'):
+            raise HttpResponseError(message="This request is not authorized to perform this operation.")
+        self.changed.append(name)
+
+    async def _test_apply_paths_recursive_async(self):
+        progress = []
+        applier = AsyncPathChangeApplier(self._operation, lambda path: path.name, progress_hook=progress.append)
+
+        result = await apply_paths_recursive(
+            applier=applier, pages=AsyncFakePages(self.pages), root=_path('dir', True), max_concurrency=3)
+
+        self.assertIsNone(result.continuation)
+        self.assertEqual(result.counters.directories_successful, 3)
+        self.assertEqual(result.counters.files_successful, 3)
+        self.assertEqual(result.counters.failure_count, 1)
+        self.assertEqual([f.name for f in result.failed_entries], ['dir/d'])
+        self.assertEqual(len(progress), 3)
+        self.assertEqual(progress[1].continuation, '2')
+
+    def test_apply_paths_recursive_async(self):
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(self._test_apply_paths_recursive_async())
+
+    async def _test_apply_paths_recursive_resume_with_continuation_async(self):
+        applier = AsyncPathChangeApplier(self._operation, lambda path: path.name, max_batches=2)
+        result = await apply_paths_recursive(applier=applier, pages=AsyncFakePages(self.pages))
+        self.assertEqual(result.continuation, '2')
+
+        applier = AsyncPathChangeApplier(self._operation, lambda path: path.name)
+        result = await apply_paths_recursive(applier=applier, pages=AsyncFakePages(self.pages, result.continuation))
+        self.assertIsNone(result.continuation)
+        self.assertEqual(sorted(self.changed), ['dir/a', 'dir/c', 'dir/e', 'dir/sub', 'dir/sub/b'])
+
+    def test_apply_paths_recursive_resume_with_continuation_async(self):
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(self._test_apply_paths_recursive_resume_with_continuation_async())
+
+    async def _test_apply_paths_recursive_resume_after_connection_error_async(self):
+        self.unreachable.add('dir/c')
+        applier = AsyncPathChangeApplier(self._operation, lambda path: path.name)
+        with self.assertRaises(ServiceRequestError) as context:
+            await apply_paths_recursive(
+                applier=applier, pages=AsyncFakePages(self.pages), root=_path('dir', True), max_concurrency=2)
+
+        # the interrupted batch is changed again
+        self.assertEqual(context.exception.continuation_token, '1')
+        applier = AsyncPathChangeApplier(self._operation, lambda path: path.name)
+        result = await apply_paths_recursive(
+            applier=applier, pages=AsyncFakePages(self.pages, context.exception.continuation_token))
+        self.assertIsNone(result.continuation)
+        self.assertEqual([f.name for f in result.failed_entries], ['dir/d'])
+        self.assertEqual(sorted(self.changed), ['dir', 'dir/a', 'dir/c', 'dir/e', 'dir/sub', 'dir/sub/b'])
+
+    def test_apply_paths_recursive_resume_after_connection_error_async(self):
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(self._test_apply_paths_recursive_resume_after_connection_error_async())
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()